@@ -0,0 +1,9 @@
+"""
+Wall-clock benchmarks for the client CLI.
+
+Benchmarks are kept out of the test suite as their results depend on the machine they run on; each
+`benchmark_*` function in this package's modules performs its measurements and returns a summary of them.
+
+To run all benchmarks, execute `python -m benchmarks`; to run only some of them, provide (part of) their names
+as arguments (ex: `python -m benchmarks metadata_cache path_index`).
+"""
@@ -0,0 +1,19 @@
+import importlib
+import pkgutil
+import sys
+
+import benchmarks
+
+
+def main(filters):
+    for module_info in pkgutil.iter_modules(benchmarks.__path__):
+        module = importlib.import_module('benchmarks.{}'.format(module_info.name))
+
+        for name in sorted(dir(module)):
+            qualified_name = '{}.{}'.format(module_info.name, name)
+            if name.startswith('benchmark_') and (not filters or any(f in qualified_name for f in filters)):
+                print('>: [{}] {}'.format(qualified_name, getattr(module, name)()))
+
+
+if __name__ == '__main__':
+    main(filters=sys.argv[1:])
@@ -0,0 +1,31 @@
+import os
+import tempfile
+import time
+
+from client_cli.cli import load_config_from_file
+from client_cli.cli.config_cache import cache_path
+from tests.cli.test_config_cache import create_config
+
+
+def benchmark_cached_configs():
+    iterations = 20
+
+    with tempfile.TemporaryDirectory() as directory:
+        config_path = create_config(directory=directory)
+
+        start = time.perf_counter()
+        for _ in range(iterations):
+            if os.path.isfile(cache_path(config_path)):
+                os.remove(cache_path(config_path))
+            load_config_from_file(config_file_path=config_path)
+        uncached_duration = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(iterations):
+            load_config_from_file(config_file_path=config_path)
+        cached_duration = time.perf_counter() - start
+
+    return 'uncached: [{:.3f} ms/config], cached: [{:.3f} ms/config]'.format(
+        uncached_duration / iterations * 1000,
+        cached_duration / iterations * 1000
+    )
@@ -0,0 +1,87 @@
+import time
+from uuid import uuid4
+
+import requests
+
+from client_cli.api.default_client_api import DefaultClientApi
+from client_cli.api.endpoint_context import DefaultHttpsContext
+from tests.api import ConditionalStubServer, StubServer
+from tests.mocks import mock_data
+
+TOKEN = 'test-token'
+
+
+def benchmark_pooled_connections():
+    requests_count = 50
+
+    with StubServer() as server:
+        client = DefaultClientApi(
+            api_url=server.url,
+            api_token=TOKEN,
+            context=DefaultHttpsContext(verify=False),
+            timeout=10
+        )
+
+        start = time.perf_counter()
+        for _ in range(requests_count):
+            client.is_active()
+        pooled_duration = time.perf_counter() - start
+
+        client.close()
+
+        start = time.perf_counter()
+        for _ in range(requests_count):
+            requests.request(
+                method='get',
+                url='{}/service/ping'.format(server.url),
+                headers={'Authorization': 'Bearer {}'.format(TOKEN)},
+                timeout=10
+            )
+        unpooled_duration = time.perf_counter() - start
+
+    return 'pooled: [{:.3f} ms/call], unpooled: [{:.3f} ms/call]'.format(
+        pooled_duration / requests_count * 1000,
+        unpooled_duration / requests_count * 1000
+    )
+
+
+def benchmark_revalidated_listings():
+    definitions = [
+        dict(mock_data.DEFINITIONS[0], id=str(uuid4()), info='test-definition-{}'.format(i)) for i in range(5000)
+    ]
+    requests_count = 20
+
+    with ConditionalStubServer(contents={'/datasets/definitions': definitions}) as server:
+        uncached = DefaultClientApi(
+            api_url=server.url,
+            api_token=TOKEN,
+            context=DefaultHttpsContext(verify=False),
+            timeout=10
+        )
+
+        start = time.perf_counter()
+        for _ in range(requests_count):
+            uncached.responses.clear()
+            uncached.dataset_definitions()
+        uncached_duration = time.perf_counter() - start
+        uncached.close()
+
+        revalidated = DefaultClientApi(
+            api_url=server.url,
+            api_token=TOKEN,
+            context=DefaultHttpsContext(verify=False),
+            timeout=10,
+            cache_ttls={'dataset_definitions': 0}
+        )
+
+        start = time.perf_counter()
+        for _ in range(requests_count):
+            revalidated.dataset_definitions()
+        revalidated_duration = time.perf_counter() - start
+        revalidated.close()
+
+    return 'definitions: [{}]; uncached: [{:.3f} ms/call], revalidated (304): [{:.3f} ms/call]'.format(
+        len(definitions),
+        uncached_duration / requests_count * 1000,
+        revalidated_duration / requests_count * 1000
+    )
@@ -0,0 +1,33 @@
+import os
+import tempfile
+import time
+
+from client_cli.api.endpoint_context import CustomHttpsContext
+from tests.api.test_endpoint_context import create_pkcs12_certificate
+
+
+def benchmark_cached_fingerprints():
+    iterations = 20
+
+    with tempfile.TemporaryDirectory() as directory:
+        pkcs12_path = create_pkcs12_certificate(directory=directory, password='test-password')
+        fingerprint_path = CustomHttpsContext.fingerprint_path('{}.as.pem'.format(pkcs12_path))
+
+        start = time.perf_counter()
+        for _ in range(iterations):
+            if os.path.isfile(fingerprint_path):
+                os.remove(fingerprint_path)
+            CustomHttpsContext(certificate_type='pkcs12', certificate_path=pkcs12_path,
+                               certificate_password='test-password')
+        uncached_duration = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(iterations):
+            CustomHttpsContext(certificate_type='pkcs12', certificate_path=pkcs12_path,
+                               certificate_password='test-password')
+        cached_duration = time.perf_counter() - start
+
+    return 'uncached: [{:.3f} ms/context], cached: [{:.3f} ms/context]'.format(
+        uncached_duration / iterations * 1000,
+        cached_duration / iterations * 1000
+    )
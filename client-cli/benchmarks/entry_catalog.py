@@ -0,0 +1,71 @@
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta
+from unittest.mock import patch
+from uuid import uuid4
+
+from client_cli.cli.entry_catalog import EntryCatalog, catalog_entries, select_entries, get_catalog_path
+from tests.mocks import mock_data
+from tests.mocks.mock_client_api import MockClientApi
+
+
+def benchmark_cataloged_entries():
+    definitions = [str(uuid4()) for _ in range(20)]
+    start_time = datetime(2020, 1, 1)
+    entries = [
+        dict(
+            mock_data.ENTRIES[1],
+            id=str(uuid4()),
+            definition=definitions[i % len(definitions)],
+            created=(start_time + timedelta(hours=i)).isoformat()
+        )
+        for i in range(50000)
+    ]
+
+    with tempfile.TemporaryDirectory() as directory:
+        catalog = EntryCatalog(path=get_catalog_path(os.path.join(directory, 'app')))
+        catalog.sync(entries)
+
+        start = time.perf_counter()
+        catalog.sync(entries)
+        sync_duration = time.perf_counter() - start
+
+        api = MockClientApi()
+        api.dataset_entries = lambda: entries
+
+        with patch('client_cli.cli.entry_catalog.SYNC_MAX_AGE', -1):
+            start = time.perf_counter()
+            catalog_entries(api=api, catalog=catalog, latest=1)
+            stale_duration = time.perf_counter() - start
+
+        results = {}
+        for name, kwargs in [
+            ('latest', {'latest': 1}),
+            ('range', {'since': datetime(2024, 1, 1), 'until': datetime(2024, 1, 8)}),
+        ]:
+            start = time.perf_counter()
+            select_entries(entries, **kwargs)
+            selected_duration = time.perf_counter() - start
+
+            start = time.perf_counter()
+            catalog.entries(**kwargs)
+            cataloged_duration = time.perf_counter() - start
+
+            results[name] = (selected_duration, cataloged_duration)
+
+        catalog.close()
+
+    return (
+        'entries: [{}]; sync (unchanged): [{:.3f} s]; '
+        'latest 1: client-side=[{:.3f} s], catalog=[{:.4f} s], stale catalog (sync + catalog)=[{:.3f} s]; '
+        '7-day range: client-side=[{:.3f} s], catalog=[{:.4f} s]'.format(
+            len(entries),
+            sync_duration,
+            results['latest'][0],
+            results['latest'][1],
+            stale_duration,
+            results['range'][0],
+            results['range'][1]
+        )
+    )
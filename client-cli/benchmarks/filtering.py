@@ -0,0 +1,118 @@
+import time
+
+from client_cli.cli.common.filtering import FilterParser, Filtering
+
+
+def benchmark_compiled_filters():
+    spec = {'test_field': int, 'other_field': str, 'third_field': bool}
+    raw_filter = '(other_field like test-1 OR third_field == true) AND test_field >= 1kb AND test_field < 1mb'
+
+    unique_entries = [
+        {'test_field': i * 64, 'other_field': 'some-test-{}'.format(i), 'third_field': i % 3 == 0}
+        for i in range(1000)
+    ]
+
+    entries = unique_entries * 1000
+    parsed_filter = FilterParser().parse(raw_filter=raw_filter)
+
+    interpreted_entries = entries[:100000]
+    start = time.perf_counter()
+    _ = [entry for entry in interpreted_entries if parsed_filter.apply(entry=entry, spec=spec)]
+    interpreted_duration = (time.perf_counter() - start) / len(interpreted_entries)
+
+    start = time.perf_counter()
+    _ = list(Filtering(parsed_filter=parsed_filter).apply(entries=entries, spec=spec))
+    compiled_duration = (time.perf_counter() - start) / len(entries)
+
+    return 'entries: [{}], per-entry: [{:.3f} µs/entry], compiled: [{:.3f} µs/entry]'.format(
+        len(entries),
+        interpreted_duration * 1000 * 1000,
+        compiled_duration * 1000 * 1000
+    )
+
+
+def benchmark_long_filter_strings():
+    parser = FilterParser()
+
+    def parse(clauses):
+        raw_filter = ' OR '.join(
+            '(test_field == {0} AND other_field like test-{0})'.format(i) for i in range(clauses)
+        )
+
+        durations = []
+        for _ in range(3):
+            start = time.perf_counter()
+            parser.parse(raw_filter=raw_filter)
+            durations.append(time.perf_counter() - start)
+
+        return min(durations)
+
+    return '100 clauses: [{:.3f} ms], 2000 clauses: [{:.3f} ms]'.format(
+        parse(clauses=100) * 1000,
+        parse(clauses=2000) * 1000
+    )
+
+
+def benchmark_lists_of_values():
+    spec = {'test_field': int, 'other_field': str}
+    values = list(range(0, 1000, 2))
+
+    entries = [{'test_field': i, 'other_field': str(i)} for i in range(1000)] * 10
+
+    parser = FilterParser()
+
+    start = time.perf_counter()
+    _ = list(
+        Filtering(
+            parsed_filter=parser.parse(raw_filter=' or '.join('test_field == {}'.format(i) for i in values))
+        ).apply(entries=entries, spec=spec)
+    )
+    chained_duration = time.perf_counter() - start
+
+    start = time.perf_counter()
+    _ = list(
+        Filtering(
+            parsed_filter=parser.parse(raw_filter='test_field in ({})'.format(', '.join(map(str, values))))
+        ).apply(entries=entries, spec=spec)
+    )
+    membership_duration = time.perf_counter() - start
+
+    return 'entries: [{}], values: [{}], chained: [{:.3f} ms], in: [{:.3f} ms]'.format(
+        len(entries),
+        len(values),
+        chained_duration * 1000,
+        membership_duration * 1000
+    )
+
+
+def benchmark_glob_patterns():
+    spec = {'entity': str}
+
+    entries = [
+        {'entity': '/home/user-{}/documents/{}/file-{}.txt'.format(i % 10, i % 100, i)}
+        for i in range(100000)
+    ]
+
+    parser = FilterParser()
+
+    start = time.perf_counter()
+    _ = list(
+        Filtering(
+            parsed_filter=parser.parse(raw_filter='entity matches \'^/home/user-1/.*\\.txt$\'')
+        ).apply(entries=entries, spec=spec)
+    )
+    matches_duration = time.perf_counter() - start
+
+    start = time.perf_counter()
+    _ = list(
+        Filtering(
+            parsed_filter=parser.parse(raw_filter='entity glob /home/user-1/**/*.txt')
+        ).apply(entries=entries, spec=spec)
+    )
+    glob_duration = time.perf_counter() - start
+
+    return 'entries: [{}], matches: [{:.3f} ms], glob: [{:.3f} ms]'.format(
+        len(entries),
+        matches_duration * 1000,
+        glob_duration * 1000
+    )
@@ -0,0 +1,43 @@
+import json
+import time
+from unittest.mock import patch
+
+from client_cli.json_codec import OrjsonCodec, StdlibJsonCodec
+from client_cli.render.json_writer import JsonWriter
+from tests.mocks import mock_data
+
+
+def benchmark_codecs():
+    entity = mock_data.METADATA['content_changed']['/some/path/01']
+    metadata = {
+        'content_changed': {
+            '/some/path/{}'.format(i): dict(entity, path='/some/path/{}'.format(i), size=i) for i in range(50000)
+        },
+        'metadata_changed': {},
+        'filesystem': {'entities': {}},
+    }
+    document = json.dumps(metadata).encode('utf-8')
+
+    try:
+        codecs = [StdlibJsonCodec(), OrjsonCodec()]
+    except ImportError:
+        codecs = [StdlibJsonCodec()]
+
+    results = []
+    for codec in codecs:
+        start = time.perf_counter()
+        decoded = codec.loads(document)
+        decode_duration = time.perf_counter() - start
+
+        with patch('client_cli.json_codec.CODEC', codec):
+            start = time.perf_counter()
+            JsonWriter().render_dataset_metadata_changes(metadata=decoded)
+            render_duration = time.perf_counter() - start
+
+        results.append('{}=[decode: {:.3f} s, render (--json): {:.3f} s]'.format(
+            codec.name,
+            decode_duration,
+            render_duration
+        ))
+
+    return 'metadata: [{:.1f} MB]; {}'.format(len(document) / 1024 / 1024, ', '.join(results))
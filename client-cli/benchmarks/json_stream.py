@@ -0,0 +1,57 @@
+import io
+import json
+import time
+import tracemalloc
+
+from client_cli import json_codec, json_stream
+from client_cli.render.flatten import dataset_metadata
+from tests.mocks import mock_data
+
+
+def benchmark_incremental_decoding():
+    if not json_stream.is_available():
+        return 'skipped; ijson is not available'
+
+    entity = mock_data.METADATA['content_changed']['/some/path/01']
+    metadata = {
+        'content_changed': {
+            '/some/path/{}'.format(i): dict(entity, path='/some/path/{}'.format(i), size=i) for i in range(20000)
+        },
+        'metadata_changed': {},
+        'filesystem': {
+            'entities': {'/some/path/{}'.format(i): {'entity_state': 'new'} for i in range(20000)}
+        },
+    }
+    document = json.dumps(metadata).encode('utf-8')
+    del metadata
+
+    def decoded():
+        return dataset_metadata.filesystem(json_codec.loads(document))
+
+    def streamed():
+        return dataset_metadata.stream_filesystem(
+            json_stream.iter_items(source=io.BytesIO(document), subtrees=dataset_metadata.SUBTREES_FILESYSTEM)
+        )
+
+    results = {}
+    for name, items in [('decoded', decoded), ('streamed', streamed)]:
+        tracemalloc.start()
+        start = time.perf_counter()
+        for _ in items():
+            pass
+        duration = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        results[name] = (duration, peak)
+
+    return (
+        'metadata: [{:.1f} MB]; fs entities: decoded=[{:.3f} s / {:.1f} MB peak], '
+        'streamed=[{:.3f} s / {:.1f} MB peak]'.format(
+            len(document) / 1024 / 1024,
+            results['decoded'][0],
+            results['decoded'][1] / 1024 / 1024,
+            results['streamed'][0],
+            results['streamed'][1] / 1024 / 1024
+        )
+    )
@@ -0,0 +1,57 @@
+import json
+import os
+import tempfile
+import time
+
+from client_cli import json_codec, json_stream
+from client_cli.cli.metadata_cache import MetadataCache, get_cache_path, CACHED_SUBTREES
+from client_cli.render.flatten import dataset_metadata
+from tests.mocks import mock_data
+
+
+def benchmark_cached_metadata():
+    entity = mock_data.METADATA['content_changed']['/some/path/01']
+    metadata = {
+        'content_changed': {
+            '/some/path/{}'.format(i): dict(entity, path='/some/path/{}'.format(i), size=i) for i in range(20000)
+        },
+        'metadata_changed': {},
+        'filesystem': {
+            'entities': {'/some/path/{}'.format(i): {'entity_state': 'new'} for i in range(20000)}
+        },
+    }
+    document = json.dumps(metadata).encode('utf-8')
+
+    with tempfile.TemporaryDirectory() as directory:
+        cache = MetadataCache(path=get_cache_path(os.path.join(directory, 'app')), max_size=1024 * 1024 * 1024)
+
+        start = time.perf_counter()
+        list(cache.store('entry', items=json_stream.document_items(document=metadata, subtrees=CACHED_SUBTREES)))
+        store_duration = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in json_stream.document_items(
+                document=json_codec.loads(document),
+                subtrees=dataset_metadata.SUBTREES_FILESYSTEM
+        ):
+            pass
+        decode_duration = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in cache.load('entry', subtrees=dataset_metadata.SUBTREES_FILESYSTEM):
+            pass
+        cache_duration = time.perf_counter() - start
+
+        file_size = cache.stats()['file_size']
+        cache.close()
+
+    return (
+        'metadata: [{:.1f} MB]; cache file: [{:.1f} MB]; store: [{:.3f} s]; fs entities: '
+        'decoded=[{:.3f} s], cached=[{:.3f} s]'.format(
+            len(document) / 1024 / 1024,
+            file_size / 1024 / 1024,
+            store_duration,
+            decode_duration,
+            cache_duration
+        )
+    )
@@ -0,0 +1,61 @@
+import os
+import tempfile
+import time
+
+from client_cli.cli.path_index import PathIndex, compile_query, get_index_path
+from tests.mocks import mock_data
+
+
+def benchmark_indexed_search():
+    paths = [
+        '/home/user/{}/project-{}/src/module_{}/file-{}.{}'.format(
+            ['documents', 'photos', 'music', 'code'][i % 4],
+            i % 97,
+            i % 13,
+            i,
+            ['txt', 'jpg', 'py', 'md'][i % 7 % 4]
+        )
+        for i in range(100000)
+    ]
+
+    with tempfile.TemporaryDirectory() as directory:
+        index = PathIndex(path=get_index_path(os.path.join(directory, 'app')))
+
+        start = time.perf_counter()
+        index.update(
+            definitions=mock_data.DEFINITIONS[:1],
+            entries=[dict(mock_data.ENTRIES[0])],
+            entities=lambda _: ((path, {'entity_state': 'new'}) for path in paths)
+        )
+        index_duration = time.perf_counter() - start
+
+        results = []
+        for query in ['file-4242', '.*/photos/project-42/.*\\.jpg', '.*(two|four)$']:
+            pattern, _ = compile_query(query)
+
+            start = time.perf_counter()
+            scanned = [path for path in paths if pattern.fullmatch(path)]
+            scan_duration = time.perf_counter() - start
+
+            start = time.perf_counter()
+            index.search(query)
+            index_search_duration = time.perf_counter() - start
+
+            results.append(
+                '[{}] ({} matches): scan=[{:.3f} s], index=[{:.3f} s]'.format(
+                    query,
+                    len(scanned),
+                    scan_duration,
+                    index_search_duration
+                )
+            )
+
+        file_size = index.stats()['file_size']
+        index.close()
+
+    return 'paths: [{}]; index: [{:.2f} s / {:.1f} MB]; {}'.format(
+        len(paths),
+        index_duration,
+        file_size / 1024 / 1024,
+        '; '.join(results)
+    )
@@ -0,0 +1,43 @@
+import tracemalloc
+
+from client_cli.cli.common.query import Query
+from client_cli.cli.common.sorting import Sorting, Paging
+from client_cli.render.flatten import dataset_metadata
+from tests.mocks import mock_data
+
+
+def benchmark_query_memory_usage():
+    spec = dataset_metadata.get_spec_changes()
+    extractors = dataset_metadata.get_extractors_changes()
+
+    entity = mock_data.METADATA['content_changed']['/some/path/01']
+    metadata = {
+        'content_changed': {
+            '/some/path/{}'.format(i): dict(entity, path='/some/path/{}'.format(i), size=i) for i in range(50000)
+        },
+        'metadata_changed': {},
+    }
+
+    tracemalloc.start()
+    try:
+        _ = Sorting(field='size', ordering='desc').apply(
+            dataset_metadata.flatten_changes(metadata), spec['fields']
+        )[:10]
+        _, eager_peak = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+
+        _ = Query(
+            spec=spec,
+            extractors=extractors,
+            sorting=Sorting(field='size', ordering='desc'),
+            paging=Paging(limit=10)
+        ).apply(dataset_metadata.changes(metadata))
+        _, lazy_peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return 'entries: [{}], eager peak: [{:.1f} MB], query peak: [{:.1f} MB]'.format(
+        len(metadata['content_changed']),
+        eager_peak / 1024 / 1024,
+        lazy_peak / 1024 / 1024
+    )
@@ -0,0 +1,51 @@
+import time
+import tracemalloc
+
+from client_cli.render.default import dataset_metadata, stream_columns_as_table
+from client_cli.render.flatten.dataset_metadata import flatten_changes
+from tests.mocks import mock_data
+from tests.render.default.test_package import render_with_ascii_table
+
+
+def benchmark_streamed_tables():
+    columns = dataset_metadata.CHANGES_COLUMNS
+    entity = flatten_changes(mock_data.METADATA)[0]
+    rows = [dict(entity, entity='/some/path/{}'.format(i), size=i) for i in range(10000)]
+
+    start = time.perf_counter()
+    render_with_ascii_table(rows, columns)
+    full_duration = time.perf_counter() - start
+
+    start = time.perf_counter()
+    lines = stream_columns_as_table(rows=rows, columns=columns)
+    next(lines)
+    first_line_duration = time.perf_counter() - start
+    for _ in lines:
+        pass
+    stream_duration = time.perf_counter() - start
+
+    sampled_rows = rows[:1000]
+    tracemalloc.start()
+    try:
+        render_with_ascii_table(sampled_rows, columns)
+        _, full_peak = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+
+        for _ in stream_columns_as_table(rows=sampled_rows, columns=columns):
+            pass
+        _, stream_peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return (
+        'rows: [{}], full table: [{:.2f} s], streamed table: [first line: {:.2f} s, total: {:.2f} s]; '
+        'rows: [{}], full table peak: [{:.1f} MB], streamed table peak: [{:.1f} MB]'.format(
+            len(rows),
+            full_duration,
+            first_line_duration,
+            stream_duration,
+            len(sampled_rows),
+            full_peak / 1024 / 1024,
+            stream_peak / 1024 / 1024
+        )
+    )
@@ -0,0 +1,25 @@
+import random
+import time
+
+from client_cli.cli.common.sorting import Sorting, Paging
+
+
+def benchmark_top_entries():
+    spec = {'id': int, 'test_field': int}
+
+    entries = [{'id': i, 'test_field': random.randint(0, 1000000)} for i in range(200000)]
+    sorting = Sorting(field='test_field', ordering='desc')
+
+    start = time.perf_counter()
+    _ = sorting.apply(entries=entries, spec=spec)[:20]
+    sorted_duration = time.perf_counter() - start
+
+    start = time.perf_counter()
+    _ = sorting.apply(entries=entries, spec=spec, paging=Paging(limit=20))
+    selected_duration = time.perf_counter() - start
+
+    return 'entries: [{}], sorted: [{:.3f} ms], top-20: [{:.3f} ms]'.format(
+        len(entries),
+        sorted_duration * 1000,
+        selected_duration * 1000
+    )
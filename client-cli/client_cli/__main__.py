@@ -7,8 +7,9 @@ import click
 import urllib3
 
 from client_cli.api import create_client_api, create_init_api
-from client_cli.cli import backup, bootstrap, logs, maintenance, operations, recover, schedules, service
+from client_cli.api.lazy_api import LazyApi, LazyClientApi
 from client_cli.cli import (
+    get_app_dir,
     load_api_token,
     load_client_config,
     capture_failures,
@@ -16,18 +17,45 @@ from client_cli.cli import (
     is_client_configured
 )
 from client_cli.cli.context import Context
-from client_cli.render.default_writer import DefaultWriter
-from client_cli.render.json_writer import JsonWriter
-
-
-@click.group()
+from client_cli.cli.lazy_group import LazyGroup
+from client_cli.lazy import Lazy
+
+OUTPUT_FORMATS = ['table', 'json', 'ndjson', 'csv', 'tsv']
+
+
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        'service': 'client_cli.cli.service:cli',
+        'operations': 'client_cli.cli.operations:cli',
+        'backup': 'client_cli.cli.backup:cli',
+        'recover': 'client_cli.cli.recover:cli',
+        'schedules': 'client_cli.cli.schedules:cli',
+        'bootstrap': 'client_cli.cli.bootstrap:bootstrap',
+        'maintenance': 'client_cli.cli.maintenance:cli',
+        'logs': 'client_cli.cli.logs:cli',
+        'cache': 'client_cli.cli.cache:cli',
+        'shell': 'client_cli.cli.shell:shell',
+    }
+)
 @click.pass_context
 @click.option('-v', '--verbose', is_flag=True, help='Enable verbose logging.')
 @click.option('--insecure', is_flag=True, help='Enable insecure TLS connections to client API.')
-@click.option('--json', is_flag=True, help='Output all responses as JSON.')
+@click.option('--json', is_flag=True, help='Output all responses as JSON (same as `--output json`).')
+@click.option('--output', type=click.Choice(OUTPUT_FORMATS, case_sensitive=False),
+              help='Output format for all responses (default is `table`); `ndjson` outputs one JSON object per line '
+                   'and `csv`/`tsv` output one row per line, with raw (bytes, seconds) values.')
 @click.option('--timeout', type=int, default=30, help='API request timeout')
-def cli(ctx, verbose, insecure, json, timeout):
+@click.option('--no-cache', is_flag=True,
+              help='Always retrieve dataset entries and metadata from the API (bypass the local cache and catalog).')
+@click.option('--cache-size', type=click.IntRange(min=0), default=512, show_default=True,
+              help='Maximum size (in MB) of the local dataset metadata cache.')
+def cli(ctx, verbose, insecure, json, output, timeout, no_cache, cache_size):
     """Stasis command-line client."""
+    # pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals
+    if json and output not in (None, 'json'):
+        raise click.UsageError('Specifying "--json" with "--output {}" is not supported'.format(output))
+
     logging.basicConfig(
         format='[%(asctime)-15s] [%(levelname)s] [%(name)-5s]: %(message)s',
         level=logging.getLevelName(logging.DEBUG if verbose else logging.INFO)
@@ -49,8 +77,8 @@ def cli(ctx, verbose, insecure, json, timeout):
     context.service_binary = application_name
     context.service_main_class = application_main_class
 
-    command = get_top_level_command(sys.argv, cli.commands)
-    if command in ('bootstrap', 'maintenance', 'logs'):
+    command = get_top_level_command(sys.argv, cli.lazy_subcommands)
+    if command in ('bootstrap', 'maintenance', 'logs', 'cache'):
         context.is_configured = is_client_configured(
             application_name=application_name,
             config_file_name=config_file_name
@@ -61,37 +89,89 @@ def cli(ctx, verbose, insecure, json, timeout):
         context.is_configured = True
 
         def regenerate_api_certificate():
+            from client_cli.cli import maintenance  # pylint: disable=import-outside-toplevel
+
             logging.warning('Invalid or expired API certificate found; re-generating...')
             process = maintenance.spawn_regenerate_api_certificate(service_binary=context.service_binary)
             maintenance.handle_regenerate_api_certificate_result(process)
 
-        context.api = create_client_api(
+        context.api = LazyClientApi(
+            factory=lambda: create_client_api(
+                config=config,
+                timeout=timeout,
+                api_token=api_token,
+                insecure=insecure,
+                on_custom_cert_expired=regenerate_api_certificate
+            )
+        )
+
+        context.create_async_api = lambda: create_client_api(
             config=config,
             timeout=timeout,
             api_token=api_token,
             insecure=insecure,
-            on_custom_cert_expired=regenerate_api_certificate
+            on_custom_cert_expired=regenerate_api_certificate,
+            asynchronous=True
         )
 
-        context.init = create_init_api(
-            config=config,
-            timeout=timeout,
-            insecure=insecure,
-            client_api=context.api,
-            on_custom_cert_expired=regenerate_api_certificate
+        context.init = LazyApi(
+            factory=lambda: create_init_api(
+                config=config,
+                timeout=timeout,
+                insecure=insecure,
+                client_api=context.api,
+                on_custom_cert_expired=regenerate_api_certificate
+            )
+        )
+
+    context.rendering = _create_writer(output=output or ('json' if json else 'table'))
+
+    context.metadata_cache = Lazy(
+        factory=lambda: _create_metadata_cache(
+            app_dir=get_app_dir(application_name),
+            max_size=cache_size * 1024 * 1024,
+            enabled=not no_cache
         )
+    )
+
+    context.entry_catalog = Lazy(
+        factory=lambda: _create_entry_catalog(app_dir=get_app_dir(application_name), enabled=not no_cache)
+    )
+
+    context.path_index = Lazy(
+        factory=lambda: _create_path_index(app_dir=get_app_dir(application_name))
+    )
 
-    context.rendering = JsonWriter() if json else DefaultWriter()
 
+def _create_metadata_cache(app_dir, max_size, enabled):
+    from client_cli.cli.metadata_cache import MetadataCache, get_cache_path  # pylint: disable=import-outside-toplevel
+    return MetadataCache(path=get_cache_path(app_dir), max_size=max_size, enabled=enabled)
 
-cli.add_command(service.cli)
-cli.add_command(operations.cli)
-cli.add_command(backup.cli)
-cli.add_command(recover.cli)
-cli.add_command(schedules.cli)
-cli.add_command(bootstrap.bootstrap)
-cli.add_command(maintenance.cli)
-cli.add_command(logs.cli)
+
+def _create_entry_catalog(app_dir, enabled):
+    from client_cli.cli.entry_catalog import EntryCatalog, get_catalog_path  # pylint: disable=import-outside-toplevel
+    return EntryCatalog(path=get_catalog_path(app_dir), enabled=enabled)
+
+
+def _create_path_index(app_dir):
+    from client_cli.cli.path_index import PathIndex, get_index_path  # pylint: disable=import-outside-toplevel
+    return PathIndex(path=get_index_path(app_dir))
+
+
+def _create_writer(output):
+    # pylint: disable=import-outside-toplevel
+    if output == 'json':
+        from client_cli.render.json_writer import JsonWriter
+        return JsonWriter()
+    elif output == 'ndjson':
+        from client_cli.render.ndjson_writer import NdjsonWriter
+        return NdjsonWriter()
+    elif output in ('csv', 'tsv'):
+        from client_cli.render.csv_writer import CsvWriter
+        return CsvWriter(dialect='excel' if output == 'csv' else 'excel-tab')
+    else:
+        from client_cli.render.default_writer import DefaultWriter
+        return DefaultWriter()
 
 
 def main():
@@ -1,6 +1,7 @@
 """Common functions used for API operations such as creating client APIs."""
 
 import logging
+from typing import TYPE_CHECKING, Union
 
 from click import Abort
 
@@ -8,18 +9,49 @@ from client_cli.api.client_api import ClientApi
 from client_cli.api.default_client_api import DefaultClientApi
 from client_cli.api.default_init_api import DefaultInitApi
 from client_cli.api.endpoint_context import CustomHttpsContext, DefaultHttpsContext, InvalidCertificateFailure
+from client_cli.api.inactive_async_client_api import InactiveAsyncClientApi
 from client_cli.api.inactive_client_api import InactiveClientApi
 from client_cli.api.inactive_init_api import InactiveInitApi
 from client_cli.api.init_api import InitApi
 
+if TYPE_CHECKING:
+    from client_cli.api.async_client_api import AsyncClientApi
 
-def create_client_api(config, timeout, api_token, insecure, on_custom_cert_expired) -> ClientApi:
+
+def is_asynchronous_api_available() -> bool:
+    """
+    Checks if the asynchronous client API is available (if `httpx` is installed).
+
+    :return: True, if `create_client_api(..., asynchronous=True)` can be used
+    """
+    try:
+        import httpx  # pylint: disable=import-outside-toplevel,unused-import
+        return True
+    except ImportError:
+        return False
+
+
+def create_client_api(
+        config,
+        timeout,
+        api_token,
+        insecure,
+        on_custom_cert_expired,
+        asynchronous=False
+) -> Union[ClientApi, 'AsyncClientApi', InactiveAsyncClientApi]:
     """
     Creates a new client API with the provided configuration.
 
     If the default client API cannot be created (API token is missing) then an
     instance of :class:`InactiveClientApi` is returned instead.
 
+    If `asynchronous` is set, an :class:`AsyncClientApi` (or an :class:`InactiveAsyncClientApi`, if the API token
+    is missing) is created instead of the default (blocking) client API; as its methods are coroutines, the API is
+    not checked for activity here and callers are expected to `await api.is_active()` themselves, if needed.
+    The asynchronous client API requires the optional `httpx` dependency (`pip install stasis-client-cli[async]`)
+    and is used by commands that make many concurrent requests (ex: `backup index`); see :class:`AsyncClientApi`
+    for its limitations.
+
     If an invalid certificate is encountered, `on_custom_cert_expired` is called and certificate
     loading is retried; the expectation is that the handler will attempt to rotate the certificate.
 
@@ -28,7 +60,8 @@ def create_client_api(config, timeout, api_token, insecure, on_custom_cert_expir
     :param api_token: API token string or None if it is not available
     :param insecure: set to `True` to not verify TLS certificate when making requests to API
     :param on_custom_cert_expired: called when a certificate is found to be expired/invalid
-    :return: the client API or InactiveClientApi if it is not available
+    :param asynchronous: set to `True` to create an :class:`AsyncClientApi`
+    :return: the client API or InactiveClientApi (or InactiveAsyncClientApi) if it is not available
     """
 
     if api_token:
@@ -62,6 +95,20 @@ def create_client_api(config, timeout, api_token, insecure, on_custom_cert_expir
         else:
             api_context = DefaultHttpsContext(verify=not insecure)
 
+        if asynchronous:
+            try:
+                from client_cli.api.async_client_api import AsyncClientApi  # pylint: disable=import-outside-toplevel
+            except ImportError:
+                logging.error('Asynchronous client API requires [httpx]; install it with [stasis-client-cli[async]]')
+                raise Abort() from None
+
+            return AsyncClientApi(
+                api_url=api_url,
+                api_token=api_token,
+                context=api_context,
+                timeout=timeout
+            )
+
         default_client = DefaultClientApi(
             api_url=api_url,
             api_token=api_token,
@@ -73,6 +120,8 @@ def create_client_api(config, timeout, api_token, insecure, on_custom_cert_expir
             api = default_client
         else:
             api = InactiveClientApi()
+    elif asynchronous:
+        api = InactiveAsyncClientApi()
     else:
         api = InactiveClientApi()
 
@@ -0,0 +1,508 @@
+"""Asynchronous, HTTP/2 capable counterpart of :class:`ClientApi`."""
+
+import json
+import logging
+import ssl
+
+import click
+import httpx
+
+from client_cli import json_codec
+from client_cli.api.endpoint_context import EndpointContext
+
+
+class AsyncClientApi:
+    """
+    Asynchronous, HTTP/JSON based client API.
+
+    Provides the same operations as :class:`ClientApi` but as coroutines, all of them sharing
+    a single :class:`httpx.AsyncClient`; when the API is served over TLS, HTTP/2 is negotiated
+    and concurrent requests (ex: via `asyncio.gather`) are multiplexed over one connection.
+
+    This API is meant for making many concurrent requests (ex: `backup index` retrieving the metadata of
+    multiple dataset entries at the same time) and has the following limitations:
+      - it is not a :class:`ClientApi` and cannot be used in its place (all of its operations are coroutines)
+      - it does not provide the streaming (`*_stream`) operations of :class:`ClientApi`
+      - it does not cache responses and its activity is not checked when it is created
+      - an instance is bound to the event loop it is first used in so a new one is needed for every `asyncio.run`
+    """
+
+    def __init__(self, api_url: str, api_token: str, context: EndpointContext, timeout: int, transport=None):
+        self.api_url = api_url
+        self.api_token = api_token
+        self.context = context
+        self.timeout = timeout
+        self.client = httpx.AsyncClient(
+            base_url=api_url,
+            headers={'Authorization': 'Bearer {}'.format(api_token)},
+            verify=AsyncClientApi._ssl_verify(context.verify),
+            timeout=timeout,
+            http2=True,
+            transport=transport
+        )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
+    async def aclose(self):
+        """
+        Closes the underlying client and all of its connections.
+        """
+        await self.client.aclose()
+
+    async def is_active(self):
+        """
+        Checks if the API is active.
+
+        :return: True, if the API is running and responding to requests
+        """
+        try:
+            return bool((await self.get(url='/service/ping')).get('id', None))
+        except (click.Abort, httpx.TransportError):
+            return False
+
+    async def stop(self):
+        """
+        Stops the backend service.
+
+        :return: dict with result of action
+        """
+        try:
+            return await self.put(url='/service/stop')
+        except click.Abort:
+            return {'successful': False}
+
+    async def dataset_metadata(self, entry):
+        """
+        Retrieves dataset metadata for the specified entry.
+
+        :param entry: entry associated with requested metadata
+        :return: requested metadata
+        """
+        return await self.get(url='/datasets/metadata/{}'.format(entry))
+
+    async def dataset_metadata_search(self, search_query, until):
+        """
+        Applies the provided search query to the metadata of the client, for all entries until the provided timestamp.
+
+        :param search_query: query to apply
+        :param until: timestamp to use for limiting search
+        :return: search results
+        """
+        return await self.get(url='/datasets/metadata/search', params={'query': search_query, 'until': until})
+
+    async def dataset_definition(self, definition):
+        """
+        Retrieves the dataset definition with the provided ID.
+
+        :param definition: definition to retrieve
+        :return: requested definition
+        """
+        return await self.get(url='/datasets/definitions/{}'.format(definition))
+
+    async def dataset_definitions(self):
+        """
+        Retrieves all dataset definitions for the current user and device.
+
+        :return: requested definitions
+        """
+        return await self.get(url='/datasets/definitions')
+
+    async def dataset_definition_delete(self, definition):
+        """
+        Deletes an existing dataset definition.
+
+        :param definition: definition to delete
+        :return: dict with result of action
+        """
+        return await self.delete(url='/datasets/definitions/{}'.format(definition))
+
+    async def dataset_entries(self):
+        """
+        Retrieves all dataset entries.
+
+        :return: requested entries
+        """
+        return await self.get(url='/datasets/entries')
+
+    async def dataset_entries_for_definition(self, definition):
+        """
+        Retrieves all dataset entries for the provided dataset definition.
+
+        :param definition: definition associated with requested entries
+        :return: requested entries
+        """
+        return await self.get(url='/datasets/entries/for-definition/{}'.format(definition))
+
+    async def dataset_entry_delete(self, entry):
+        """
+        Deletes an existing dataset entry.
+
+        :param entry: entry to delete
+        :return: dict with result of action
+        """
+        return await self.delete(url='/datasets/entries/{}'.format(entry))
+
+    async def user(self):
+        """
+        Retrieves information about the current user.
+
+        :return: current user
+        """
+        return await self.get(url='/user')
+
+    async def user_password_update(self, request):
+        """
+        Updates the current user's password.
+
+        :param request: data to use for password update
+        :return: dict with result of action
+        """
+        return await self.put(url='/user/password', data=request)
+
+    async def user_salt_update(self, request):
+        """
+        Updates the current user's salt.
+
+        :param request: data to use for salt update
+        :return: dict with result of action
+        """
+        return await self.put(url='/user/salt', data=request)
+
+    async def device(self):
+        """
+        Retrieves information about the current device.
+
+        :return: current device
+        """
+        return await self.get(url='/device')
+
+    async def device_connections(self):
+        """
+        Retrieves information about the server connections of the current device.
+
+        :return: active device connections
+        """
+        return await self.get(url='/device/connections')
+
+    async def device_reencrypt_secret(self, request):
+        """
+        Re-encrypts the secret for the current device.
+
+        :param request: data to use for re-encryption
+        :return: dict with result of action
+        """
+        return await self.put(url='/device/key/re-encrypt', data=request)
+
+    async def device_commands(self):
+        """
+        Retrieves all available commands for the current device.
+
+        :return: available device commands
+        """
+        return await self.get(url='/device/commands')
+
+    async def operations(self, state):
+        """
+        Retrieves the currently active operations.
+
+        :param state: operation state to use for limiting search
+        :return: active operations
+        """
+        return await self.get(url='/operations', params={'state': state})
+
+    async def operation_progress(self, operation):
+        """
+        Retrieves the progress of an operation.
+
+        :param operation: operation to follow
+        :return: operation progress
+        """
+        return await self.get(url='/operations/{}/progress'.format(operation))
+
+    async def operation_follow(self, operation):
+        """
+        Follows an operation's progress.
+
+        :param operation: operation to follow
+        :return: async generator of progress updates
+        """
+        async with self.client.stream(method='get', url='/operations/{}/follow'.format(operation)) as response:
+            if not response.is_success:
+                logging.error('Request failed: [{} - {}]'.format(response.status_code, response.reason_phrase))
+                raise click.Abort()
+
+            data = []
+            async for line in response.aiter_lines():
+                if line.startswith('data:'):
+                    data.append(line[5:].lstrip(' '))
+                elif not line and data:
+                    progress = json_codec.loads('\n'.join(data))
+                    data = []
+                    yield progress
+                    if 'completed' in progress and progress['completed']:
+                        return
+
+    async def operation_stop(self, operation):
+        """
+        Stops an active operation.
+
+        :param operation: operation to stop
+        :return: dict with result of action
+        """
+        return await self.put(url='/operations/{}/stop'.format(operation))
+
+    async def operation_resume(self, operation):
+        """
+        Resumes an inactive(stopped/failed) operation.
+
+        :param operation: operation to resume
+        :return: dict with result of action
+        """
+        return await self.put(url='/operations/{}/resume'.format(operation))
+
+    async def operation_remove(self, operation):
+        """
+        Removes an inactive(stopped/failed) operation.
+
+        :param operation: operation to remove
+        :return: dict with result of action
+        """
+        return await self.delete(url='/operations/{}'.format(operation))
+
+    async def backup_rules(self):
+        """
+        Retrieves the current backup rules.
+
+        :return: backup rules
+        """
+        return await self.get(url='/operations/backup/rules')
+
+    async def backup_rules_for_definition(self, definition):
+        """
+        Retrieves the current backup rules for the provided definition
+        (or the default rules, if no definition is provided).
+
+        :param definition: relevant definition or `None` to retrieve the default rules
+        :return: backup rules
+        """
+        return await self.get(url='/operations/backup/rules/{}'.format(definition or 'default'))
+
+    async def backup_specification_for_definition(self, definition):
+        """
+        Retrieves the current backup specification for the provided definition
+        (or the default specification, if no definition is provided).
+
+        :param definition: relevant definition or `None` to retrieve the default specification
+        :return: backup spec
+        """
+        return await self.get(url='/operations/backup/rules/{}/specification'.format(definition or 'default'))
+
+    async def backup_start(self, definition):
+        """
+        Starts a backup for the specified dataset definition.
+
+        :param definition: definition for which to start a backup
+        :return: dict with result of action
+        """
+        return await self.put(url='/operations/backup/{}'.format(definition))
+
+    async def backup_define(self, request):
+        """
+        Creates a new dataset definition with the provided data.
+
+        :param request: data to use for creating a definition
+        :return: dict with result of action
+        """
+        return await self.post(url='/datasets/definitions', data=request)
+
+    async def backup_update(self, definition, request):
+        """
+        Updates an existing dataset definition with the provided data.
+
+        :param definition: definition to update
+        :param request: data to use for updating a definition
+        :return: dict with result of action
+        """
+        return await self.put(url='/datasets/definitions/{}'.format(definition), data=request)
+
+    async def recover_until(self, definition, until, path_query, destination, discard_paths):
+        """
+        Starts a recovery for the specified dataset definition, restricted by the provided timestamp and query.
+
+        :param definition: definition for which to start a recovery
+        :param until: timestamp to use for limiting recovery
+        :param path_query: file/path query to use for limiting recovery
+        :param destination: recovery directory path override
+        :param discard_paths: set to True to discard original file directory structure
+        :return: dict with result of action
+        """
+        params = {'query': path_query, 'destination': destination, 'keep_structure': not discard_paths}
+        return await self.put(url='/operations/recover/{}/until/{}'.format(definition, until), params=params)
+
+    async def recover_from(self, definition, entry, path_query, destination, discard_paths):
+        """
+        Starts a recovery for the specified dataset definition and entry, restricted by the provided query.
+
+        :param definition: definition for which to start a recovery
+        :param entry: entry for which to use for recovery
+        :param path_query: file/path query to use for limiting recovery
+        :param destination: recovery directory path override
+        :param discard_paths: set to True to discard original file directory structure
+        :return: dict with result of action
+        """
+        params = {'query': path_query, 'destination': destination, 'keep_structure': not discard_paths}
+        return await self.put(url='/operations/recover/{}/from/{}'.format(definition, entry), params=params)
+
+    async def recover_from_latest(self, definition, path_query, destination, discard_paths):
+        """
+        Starts a recovery for the specified dataset definition and latest entry, restricted by the provided query.
+
+        :param definition: definition for which to start a recovery
+        :param path_query: file/path query to use for limiting recovery
+        :param destination: recovery directory path override
+        :param discard_paths: set to True to discard original file directory structure
+        :return: dict with result of action
+        """
+        params = {'query': path_query, 'destination': destination, 'keep_structure': not discard_paths}
+        return await self.put(url='/operations/recover/{}/latest'.format(definition), params=params)
+
+    async def schedules_public(self):
+        """
+        Retrieves all available public schedules.
+
+        :return: requested public schedules
+        """
+        return await self.get(url='/schedules/public')
+
+    async def schedules_configured(self):
+        """
+        Retrieves all available configured schedules.
+
+        :return: requested configured schedules
+        """
+        return await self.get(url='/schedules/configured')
+
+    async def schedules_configured_refresh(self):
+        """
+        Refreshes settings for all configured schedules.
+
+        :return: dict with result of action
+        """
+        return await self.put(url='/schedules/configured/refresh')
+
+    async def analytics_state(self):
+        """
+        Retrieves the latest analytics collection state.
+
+        :return: requested analytics state
+        """
+        return await self.get(url='/service/analytics')
+
+    async def analytics_state_send(self):
+        """
+        Sends the latest analytics state remotely.
+
+        :return: dict with result of action
+        """
+        return await self.put(url='/service/analytics/send')
+
+    async def get(self, url, params=None):
+        """
+        Executes a `GET` request for the specified URL with the provided query parameters.
+
+        :param url: URL to use for request (ex: /schedules)
+        :param params: query parameters (if any)
+        :return: endpoint response
+        """
+        return await self.request(method='get', url=url, params=params)
+
+    async def put(self, url, params=None, data=None):
+        """
+        Executes a `PUT` request for the specified URL with the provided query parameters and request data.
+
+        :param url: URL to use for request (ex: /schedules)
+        :param params: query parameters (if any)
+        :param data: request data (if any)
+        :return: endpoint response
+        """
+        return await self.request(method='put', url=url, params=params, data=data)
+
+    async def post(self, url, params=None, data=None):
+        """
+        Executes a `POST` request for the specified URL with the provided query parameters and request data.
+
+        :param url: URL to use for request (ex: /schedules)
+        :param params: query parameters (if any)
+        :param data: request data (if any)
+        :return: endpoint response
+        """
+        return await self.request(method='post', url=url, params=params, data=data)
+
+    async def delete(self, url, params=None, data=None):
+        """
+        Executes a `DELETE` request for the specified URL with the provided query parameters and request data.
+
+        :param url: URL to use for request (ex: /schedules)
+        :param params: query parameters (if any)
+        :param data: request data (if any)
+        :return: endpoint response
+        """
+        return await self.request(method='delete', url=url, params=params, data=data)
+
+    async def request(self, method, url, params=None, data=None):
+        """
+        Executes a request with the specified method for the specified URL with
+        the provided query parameters and request data.
+
+        :param method: HTTP method to use for request
+        :param url: URL to use for request (ex: /schedules)
+        :param params: query parameters (if any)
+        :param data: request data (if any)
+        :return: endpoint response
+        """
+        if params is None:
+            params = {}
+
+        if data is None:
+            data = {}
+
+        response = await self.client.request(
+            method=method,
+            url=url,
+            params={k: v for k, v in params.items() if v is not None},
+            json=data
+        )
+
+        if not response.is_success:
+            logging.error('Request failed: [{} - {}]'.format(response.status_code, response.reason_phrase))
+            if response.text:
+                logging.error(response.text)
+
+            raise click.Abort()
+
+        try:
+            result = json_codec.loads(response.content)
+        except json.JSONDecodeError:
+            logging.debug(
+                'Response was [{}] but content is not JSON: [{}]'.format(response.status_code, response.content)
+            )
+            result = {}
+
+        return result if method == 'get' else {'successful': True, 'operation': result.get('operation', None)}
+
+    @staticmethod
+    def _ssl_verify(verify):
+        """
+        Converts the provided :class:`EndpointContext` verification setting to one supported by `httpx`.
+
+        :param verify: `True`/`False` or path to a PEM certificate
+        :return: bool or SSL context using the provided certificate
+        """
+        if isinstance(verify, str):
+            return ssl.create_default_context(cafile=verify)
+        else:
+            return verify
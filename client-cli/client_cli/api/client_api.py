@@ -2,6 +2,8 @@
 
 from abc import ABC, abstractmethod
 
+from client_cli import json_stream
+
 
 class ClientApi(ABC):
     """Interface for managing interactions between a client frontend (this CLI) and backend (API)."""
@@ -41,6 +43,39 @@ class ClientApi(ABC):
         :return: search results
         """
 
+    def dataset_metadata_stream(self, entry, subtrees):
+        """
+        Retrieves only the requested parts (subtrees) of the dataset metadata for the specified entry.
+
+        By default, the full metadata is retrieved (see :func:`dataset_metadata`) and the requested
+        subtrees are extracted from it; implementations that can decode responses incrementally
+        should override this.
+
+        :param entry: entry associated with requested metadata
+        :param subtrees: dot-separated paths to the metadata objects to retrieve (ex: `filesystem.entities`)
+        :return: iterator of `(subtree, member-key, member-value)` items
+        """
+        return json_stream.document_items(document=self.dataset_metadata(entry), subtrees=subtrees)
+
+    def dataset_metadata_search_stream(self, search_query, until, subtrees):
+        """
+        Applies the provided search query to the metadata of the client, for all entries until the provided timestamp,
+        and retrieves only the requested parts (subtrees) of the search results.
+
+        By default, the full search results are retrieved (see :func:`dataset_metadata_search`) and the
+        requested subtrees are extracted from them; implementations that can decode responses incrementally
+        should override this.
+
+        :param search_query: query to apply
+        :param until: timestamp to use for limiting search
+        :param subtrees: dot-separated paths to the search result objects to retrieve (ex: `definitions`)
+        :return: iterator of `(subtree, member-key, member-value)` items
+        """
+        return json_stream.document_items(
+            document=self.dataset_metadata_search(search_query, until),
+            subtrees=subtrees
+        )
+
     def dataset_definition(self, definition):
         """
         Retrieves the dataset definition with the provided ID.
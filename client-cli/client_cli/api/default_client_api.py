@@ -1,24 +1,63 @@
 """Default :class:`ClientApi` implementation."""
 
 import logging
-from json import JSONDecodeError, loads
+from json import JSONDecodeError
 
 import click
 import requests
-from sseclient import SSEClient
+from requests.adapters import HTTPAdapter
 
+from client_cli import json_codec, json_stream
 from client_cli.api.client_api import ClientApi
 from client_cli.api.endpoint_context import EndpointContext
+from client_cli.api.response_cache import ResponseCache, request_key
 
 
 class DefaultClientApi(ClientApi):
-    """Default, HTTP/JSON based :class:`ClientApi` implementation."""
+    """
+    Default, HTTP/JSON based :class:`ClientApi` implementation.
+
+    All requests are made via a single, persistent :class:`requests.Session` so that
+    connections to the API are kept alive and reused between calls.
+
+    Responses of frequently requested (but mutable) listings are cached in memory, for the lifetime of the client
+    (a single CLI invocation or `shell` session), based on per-endpoint TTLs (see :const:`CACHE_TTLS`); expired
+    responses are revalidated with conditional requests (`If-None-Match` / `If-Modified-Since`), if the API provided
+    an `ETag` or `Last-Modified` header for them. All cached responses are dropped after any modifying (non-`GET`)
+    request.
+    """
+
+    # pylint: disable=too-many-public-methods
+
+    POOL_CONNECTIONS = 1
+    POOL_MAXSIZE = 4
+
+    CACHE_TTLS = {
+        'dataset_definitions': 10,
+        'dataset_entries': 10,
+        'schedules_public': 300,
+        'schedules_configured': 30,
+        'device': 60,
+        'user': 60,
+    }
+
+    def __init__(self, api_url: str, api_token: str, context: EndpointContext, timeout: int, cache_ttls=None):
+        session = requests.Session()
+        session.headers.update({'Authorization': 'Bearer {}'.format(api_token)})
+        session.verify = context.verify
+        adapter = HTTPAdapter(
+            pool_connections=DefaultClientApi.POOL_CONNECTIONS,
+            pool_maxsize=DefaultClientApi.POOL_MAXSIZE
+        )
+        session.mount(api_url, adapter)
 
-    def __init__(self, api_url: str, api_token: str, context: EndpointContext, timeout: int):
         self.api_url = api_url
         self.api_token = api_token
         self.context = context
+        self.session = session
         self.timeout = timeout
+        self.cache_ttls = dict(DefaultClientApi.CACHE_TTLS, **(cache_ttls or {}))
+        self.responses = ResponseCache()
 
     def is_active(self):
         try:
@@ -38,6 +77,22 @@ class DefaultClientApi(ClientApi):
     def dataset_metadata_search(self, search_query, until):
         return self.get(url='/datasets/metadata/search', params={'query': search_query, 'until': until})
 
+    def dataset_metadata_stream(self, entry, subtrees):
+        if json_stream.is_available():
+            return self.get_items_stream(url='/datasets/metadata/{}'.format(entry), subtrees=subtrees)
+        else:
+            return super().dataset_metadata_stream(entry, subtrees)
+
+    def dataset_metadata_search_stream(self, search_query, until, subtrees):
+        if json_stream.is_available():
+            return self.get_items_stream(
+                url='/datasets/metadata/search',
+                subtrees=subtrees,
+                params={'query': search_query, 'until': until}
+            )
+        else:
+            return super().dataset_metadata_search_stream(search_query, until, subtrees)
+
     def dataset_definition(self, definition):
         return self.get(url='/datasets/definitions/{}'.format(definition))
 
@@ -45,19 +100,22 @@ class DefaultClientApi(ClientApi):
         return self.delete(url='/datasets/definitions/{}'.format(definition))
 
     def dataset_definitions(self):
-        return self.get(url='/datasets/definitions')
+        return self.get_cached(url='/datasets/definitions', ttl=self.cache_ttls['dataset_definitions'])
 
     def dataset_entries(self):
-        return self.get(url='/datasets/entries')
+        return self.get_cached(url='/datasets/entries', ttl=self.cache_ttls['dataset_entries'])
 
     def dataset_entries_for_definition(self, definition):
-        return self.get(url='/datasets/entries/for-definition/{}'.format(definition))
+        return self.get_cached(
+            url='/datasets/entries/for-definition/{}'.format(definition),
+            ttl=self.cache_ttls['dataset_entries']
+        )
 
     def dataset_entry_delete(self, entry):
         return self.delete(url='/datasets/entries/{}'.format(entry))
 
     def user(self):
-        return self.get(url='/user')
+        return self.get_cached(url='/user', ttl=self.cache_ttls['user'])
 
     def user_password_update(self, request):
         return self.put(url='/user/password', data=request)
@@ -66,7 +124,7 @@ class DefaultClientApi(ClientApi):
         return self.put(url='/user/salt', data=request)
 
     def device(self):
-        return self.get(url='/device')
+        return self.get_cached(url='/device', ttl=self.cache_ttls['device'])
 
     def device_connections(self):
         return self.get(url='/device/connections')
@@ -84,13 +142,15 @@ class DefaultClientApi(ClientApi):
         return self.get(url='/operations/{}/progress'.format(operation))
 
     def operation_follow(self, operation):
+        from sseclient import SSEClient  # pylint: disable=import-outside-toplevel
+
         response = self.get_stream(url='/operations/{}/follow'.format(operation))
         client = SSEClient(event_source=response)
 
         try:
             for event in client.events():
                 if event.data:
-                    progress = loads(event.data)
+                    progress = json_codec.loads(event.data)
                     yield progress
                     if 'completed' in progress and progress['completed']:
                         return
@@ -137,10 +197,10 @@ class DefaultClientApi(ClientApi):
         return self.put(url='/operations/recover/{}/latest'.format(definition), params=params)
 
     def schedules_public(self):
-        return self.get(url='/schedules/public')
+        return self.get_cached(url='/schedules/public', ttl=self.cache_ttls['schedules_public'])
 
     def schedules_configured(self):
-        return self.get(url='/schedules/configured')
+        return self.get_cached(url='/schedules/configured', ttl=self.cache_ttls['schedules_configured'])
 
     def schedules_configured_refresh(self):
         return self.put(url='/schedules/configured/refresh')
@@ -151,6 +211,12 @@ class DefaultClientApi(ClientApi):
     def analytics_state_send(self):
         return self.put(url='/service/analytics/send')
 
+    def close(self):
+        """
+        Closes the underlying session and all of its pooled connections.
+        """
+        self.session.close()
+
     def get(self, url, params=None):
         """
         Executes a `GET` request for the specified URL with the provided query parameters.
@@ -161,6 +227,48 @@ class DefaultClientApi(ClientApi):
         """
         return self.request(method='get', url=url, params=params)
 
+    def get_cached(self, url, ttl, params=None):
+        """
+        Executes a `GET` request for the specified URL with the provided query parameters, unless
+        a fresh response for it is already cached (see :class:`ResponseCache`).
+
+        Expired responses are revalidated with a conditional request, if possible; if the API responds
+        with `304 Not Modified`, the cached response is used again. Cached responses are not decoded again;
+        callers get their own copy of the response's top two levels (see :func:`CachedResponse.result`).
+
+        :param url: URL to use for request (ex: /schedules)
+        :param ttl: time (in seconds) for which the response can be used without revalidating it
+        :param params: query parameters (if any)
+        :return: endpoint response
+        """
+        key = request_key(url=url, params=params)
+        cached = self.responses.get(key)
+
+        if cached is not None and self.responses.is_fresh(cached):
+            return cached.result()
+
+        response = self.send(
+            method='get',
+            url=url,
+            params=params,
+            headers=cached.validators() if cached is not None else None
+        )
+
+        if cached is not None and response.status_code == 304:
+            self.responses.refresh(key, ttl=ttl)
+            return cached.result()
+
+        result = self.handle_response(method='get', response=response)
+        self.responses.put(
+            key,
+            result=result,
+            ttl=ttl,
+            etag=response.headers.get('ETag', None),
+            last_modified=response.headers.get('Last-Modified', None)
+        )
+
+        return self.responses.get(key).result()
+
     def get_stream(self, url, params=None):
         """
         Executes a `GET` request for the specified URL with the provided query parameters, with streaming enabled.
@@ -171,6 +279,29 @@ class DefaultClientApi(ClientApi):
         """
         return self.request_stream(method='get', url=url, params=params)
 
+    def get_items_stream(self, url, subtrees, params=None):
+        """
+        Executes a streaming `GET` request for the specified URL with the provided query parameters and
+        incrementally decodes only the requested subtrees of the response (see :func:`json_stream.iter_items`).
+
+        The request is made when the first item is requested and the response is closed after the last one.
+
+        :param url: URL to use for request (ex: /datasets/metadata/<entry>)
+        :param subtrees: dot-separated paths to the response objects to decode (ex: `filesystem.entities`)
+        :param params: query parameters (if any)
+        :return: generator of `(subtree, member-key, member-value)` items
+        """
+        response = self.get_stream(url=url, params=params)
+
+        try:
+            response.raw.decode_content = True
+            yield from json_stream.iter_items(source=response.raw, subtrees=subtrees)
+        except JSONDecodeError as e:
+            logging.error('Response could not be decoded: [{}]'.format(e))
+            raise click.Abort() from e
+        finally:
+            response.close()
+
     def put(self, url, params=None, data=None):
         """
         Executes a `PUT` request for the specified URL with the provided query parameters and request data.
@@ -215,26 +346,51 @@ class DefaultClientApi(ClientApi):
         :param data: request data (if any)
         :return: endpoint response
         """
+        if method != 'get':
+            self.responses.clear()
+
+        return self.handle_response(method=method, response=self.send(method=method, url=url, params=params, data=data))
+
+    def send(self, method, url, params=None, data=None, headers=None):
+        """
+        Sends a request with the specified method for the specified URL with
+        the provided query parameters, request data and (additional) headers.
+
+        :param method: HTTP method to use for request
+        :param url: URL to use for request (ex: /schedules)
+        :param params: query parameters (if any)
+        :param data: request data (if any)
+        :param headers: additional request headers (if any)
+        :return: raw endpoint response
+        """
         if params is None:
             params = {}
 
         if data is None:
             data = {}
 
-        response = requests.request(
+        return self.session.request(
             method=method,
             url='{}{}'.format(self.api_url, url),
             params=params,
-            headers={'Authorization': 'Bearer {}'.format(self.api_token)},
             json=data,
             verify=self.context.verify,
-            timeout=self.timeout
+            timeout=self.timeout,
+            **({'headers': headers} if headers else {})
         )
 
+    def handle_response(self, method, response):
+        """
+        Decodes the provided (raw) endpoint response or fails, if the request was not successful.
+
+        :param method: HTTP method used for the request
+        :param response: raw endpoint response
+        :return: endpoint response
+        """
         if response.ok:
             try:
-                result = response.json()
-            except (JSONDecodeError, requests.exceptions.JSONDecodeError):
+                result = json_codec.loads(response.content)
+            except JSONDecodeError:
                 logging.debug(
                     'Response was [{}] but content is not JSON: [{}]'.format(
                         response.status_code,
@@ -271,11 +427,10 @@ class DefaultClientApi(ClientApi):
         if data is None:
             data = {}
 
-        response = requests.request(
+        response = self.session.request(
             method=method,
             url='{}{}'.format(self.api_url, url),
             params=params,
-            headers={'Authorization': 'Bearer {}'.format(self.api_token)},
             json=data,
             verify=self.context.verify,
             stream=True,
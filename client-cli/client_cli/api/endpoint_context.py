@@ -1,13 +1,13 @@
 """Configuration for verifying backend (API) TLS connections."""
 import datetime
+import hashlib
+import json
 import logging
 import os
 from abc import ABC, abstractmethod
+from collections import namedtuple
 
 from click import Abort
-from cryptography.hazmat.backends import default_backend
-from cryptography.hazmat.primitives.serialization import Encoding
-from cryptography.hazmat.primitives.serialization import pkcs12
 
 
 class EndpointContext(ABC):
@@ -34,8 +34,17 @@ class DefaultHttpsContext(EndpointContext):
         return self._verify
 
 
+CertificateValidity = namedtuple('CertificateValidity', ['not_valid_before_utc', 'not_valid_after_utc'])
+
+
 class CustomHttpsContext(EndpointContext):
-    """Custom connection context for use with PKCS#12 files."""
+    """
+    Custom connection context for use with PKCS#12 files.
+
+    Loading a PKCS#12 file is expensive so, once its PEM file is created, a fingerprint of the PKCS#12
+    file (path, size and modification time), the certificate's validity window and a digest of the PEM file
+    are stored alongside the PEM file; as long as none of them change, the PKCS#12 file is not loaded again.
+    """
 
     def __init__(self, certificate_type, certificate_path, certificate_password):
         if certificate_type.lower() != 'pkcs12':
@@ -44,18 +53,95 @@ class CustomHttpsContext(EndpointContext):
 
         self._pem_certificate_path = '{}.as.pem'.format(certificate_path)
 
-        CustomHttpsContext._create_context_pem_file(
-            pkcs12_certificate_path=certificate_path,
-            pkcs12_certificate_password=certificate_password,
-            pem_certificate_path=self._pem_certificate_path
-        )
+        if not CustomHttpsContext._is_context_pem_file_cached(
+                pkcs12_certificate_path=certificate_path,
+                pem_certificate_path=self._pem_certificate_path
+        ):
+            CustomHttpsContext._create_context_pem_file(
+                pkcs12_certificate_path=certificate_path,
+                pkcs12_certificate_password=certificate_password,
+                pem_certificate_path=self._pem_certificate_path
+            )
 
     @property
     def verify(self):
         return self._pem_certificate_path
 
+    @staticmethod
+    def _is_context_pem_file_cached(pkcs12_certificate_path, pem_certificate_path):
+        """
+        Checks if the PEM file was created from the current PKCS#12 file and if it is still valid,
+        based on the stored fingerprint.
+
+        :param pkcs12_certificate_path: path to PKCS#12 certificate file
+        :param pem_certificate_path: path to PEM certificate file
+        :return: True, if the PEM file can be used without loading the PKCS#12 file
+        :raises InvalidCertificateFailure if the cached certificate is not valid
+        """
+        try:
+            with open(CustomHttpsContext.fingerprint_path(pem_certificate_path), 'r', encoding='utf-8') as file:
+                cached = json.load(file)
+
+            keystore = CustomHttpsContext.keystore_fingerprint(certificate_path=pkcs12_certificate_path)
+            pem = hashlib.sha256(
+                CustomHttpsContext.read_pem_certificate_file(certificate_path=pem_certificate_path)
+            ).hexdigest()
+
+            validity = CertificateValidity(
+                not_valid_before_utc=datetime.datetime.fromisoformat(cached['not_valid_before']),
+                not_valid_after_utc=datetime.datetime.fromisoformat(cached['not_valid_after'])
+            )
+        except (OSError, ValueError, TypeError, KeyError):
+            return False
+
+        if cached.get('keystore') != keystore or cached.get('pem') != pem:
+            return False
+
+        CustomHttpsContext.validate_pkcs12_certificate(
+            pkcs12_certificate_path=pkcs12_certificate_path,
+            pkcs12_certificate=validity
+        )
+
+        logging.debug(
+            'PEM file [{}] matches fingerprint of PKCS12 certificate [{}]; skipping certificate loading'.format(
+                pem_certificate_path,
+                pkcs12_certificate_path
+            )
+        )
+
+        return True
+
+    @staticmethod
+    def _store_context_pem_file_fingerprint(pkcs12_certificate_path, pkcs12_certificate, pem_certificate_content,
+                                            pem_certificate_path):
+        """
+        Stores the fingerprint of the provided PKCS#12 certificate and the PEM file created from it.
+
+        :param pkcs12_certificate_path: path to PKCS#12 certificate file
+        :param pkcs12_certificate: actual loaded certificate
+        :param pem_certificate_content: content of PEM certificate file
+        :param pem_certificate_path: path to PEM certificate file
+        """
+        fingerprint_path = CustomHttpsContext.fingerprint_path(pem_certificate_path)
+
+        try:
+            fingerprint = {
+                'keystore': CustomHttpsContext.keystore_fingerprint(certificate_path=pkcs12_certificate_path),
+                'pem': hashlib.sha256(pem_certificate_content).hexdigest(),
+                'not_valid_before': pkcs12_certificate.not_valid_before_utc.isoformat(),
+                'not_valid_after': pkcs12_certificate.not_valid_after_utc.isoformat(),
+            }
+
+            with open(fingerprint_path, 'w', encoding='utf-8') as file:
+                json.dump(fingerprint, file)
+        except OSError as e:
+            logging.debug('Failed to store certificate fingerprint [{}]: [{}]'.format(fingerprint_path, e))
+
     @staticmethod
     def _create_context_pem_file(pkcs12_certificate_path, pkcs12_certificate_password, pem_certificate_path):
+        # pylint: disable=import-outside-toplevel
+        from cryptography.hazmat.primitives.serialization import Encoding
+
         pkcs12_certificate = CustomHttpsContext.load_pkcs12_certificate(
             certificate_path=pkcs12_certificate_path,
             certificate_password=pkcs12_certificate_password
@@ -112,6 +198,13 @@ class CustomHttpsContext(EndpointContext):
                 )
             )
 
+        CustomHttpsContext._store_context_pem_file_fingerprint(
+            pkcs12_certificate_path=pkcs12_certificate_path,
+            pkcs12_certificate=pkcs12_certificate,
+            pem_certificate_content=pem_certificate_content,
+            pem_certificate_path=pem_certificate_path
+        )
+
     @staticmethod
     def load_pkcs12_certificate(certificate_path, certificate_password):
         """
@@ -121,6 +214,9 @@ class CustomHttpsContext(EndpointContext):
         :param certificate_password: certificate password
         :return: certificate object
         """
+        # pylint: disable=import-outside-toplevel
+        from cryptography.hazmat.backends import default_backend
+        from cryptography.hazmat.primitives.serialization import pkcs12
 
         with open(certificate_path, 'rb') as pkcs12_certificate_file:
             (_, pkcs12_certificate, _) = pkcs12.load_key_and_certificates(
@@ -159,6 +255,32 @@ class CustomHttpsContext(EndpointContext):
                 )
             )
 
+    @staticmethod
+    def keystore_fingerprint(certificate_path):
+        """
+        Creates a fingerprint of the specified PKCS#12 certificate file, based on its path, size and modification time.
+
+        :param certificate_path: path to certificate file
+        :return: file fingerprint
+        """
+        stat = os.stat(certificate_path)
+
+        return {
+            'path': os.path.abspath(certificate_path),
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+        }
+
+    @staticmethod
+    def fingerprint_path(pem_certificate_path):
+        """
+        Retrieves the path of the fingerprint file associated with the specified PEM certificate file.
+
+        :param pem_certificate_path: path to PEM certificate file
+        :return: fingerprint file path
+        """
+        return '{}.fingerprint'.format(pem_certificate_path)
+
     @staticmethod
     def read_pem_certificate_file(certificate_path):
         """
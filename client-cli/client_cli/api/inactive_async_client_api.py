@@ -0,0 +1,148 @@
+"""Asynchronous client API implementation for denoting missing/inactive background service."""
+
+import logging
+
+from click import Abort
+
+
+class InactiveAsyncClientApi:
+    """
+    Asynchronous counterpart of :class:`InactiveClientApi`; does not require the optional `httpx` dependency.
+
+    All requests made via this client will always fail, except for `is_active` which will always return `False`.
+    """
+
+    # pylint: disable=missing-function-docstring,unused-argument,too-many-public-methods
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
+    async def aclose(self):
+        """
+        Does nothing; there are no connections to close.
+        """
+
+    async def is_active(self):
+        """
+        Checks if the API is active.
+
+        :return: always False
+        """
+        return False
+
+    async def stop(self):
+        InactiveAsyncClientApi._abort()
+
+    async def dataset_metadata(self, entry):
+        InactiveAsyncClientApi._abort()
+
+    async def dataset_metadata_search(self, search_query, until):
+        InactiveAsyncClientApi._abort()
+
+    async def dataset_definition(self, definition):
+        InactiveAsyncClientApi._abort()
+
+    async def dataset_definitions(self):
+        InactiveAsyncClientApi._abort()
+
+    async def dataset_definition_delete(self, definition):
+        InactiveAsyncClientApi._abort()
+
+    async def dataset_entries(self):
+        InactiveAsyncClientApi._abort()
+
+    async def dataset_entries_for_definition(self, definition):
+        InactiveAsyncClientApi._abort()
+
+    async def dataset_entry_delete(self, entry):
+        InactiveAsyncClientApi._abort()
+
+    async def user(self):
+        InactiveAsyncClientApi._abort()
+
+    async def user_password_update(self, request):
+        InactiveAsyncClientApi._abort()
+
+    async def user_salt_update(self, request):
+        InactiveAsyncClientApi._abort()
+
+    async def device(self):
+        InactiveAsyncClientApi._abort()
+
+    async def device_connections(self):
+        InactiveAsyncClientApi._abort()
+
+    async def device_reencrypt_secret(self, request):
+        InactiveAsyncClientApi._abort()
+
+    async def device_commands(self):
+        InactiveAsyncClientApi._abort()
+
+    async def operations(self, state):
+        InactiveAsyncClientApi._abort()
+
+    async def operation_progress(self, operation):
+        InactiveAsyncClientApi._abort()
+
+    async def operation_follow(self, operation):
+        InactiveAsyncClientApi._abort()
+        yield  # pylint: disable=unreachable
+
+    async def operation_stop(self, operation):
+        InactiveAsyncClientApi._abort()
+
+    async def operation_resume(self, operation):
+        InactiveAsyncClientApi._abort()
+
+    async def operation_remove(self, operation):
+        InactiveAsyncClientApi._abort()
+
+    async def backup_rules(self):
+        InactiveAsyncClientApi._abort()
+
+    async def backup_rules_for_definition(self, definition):
+        InactiveAsyncClientApi._abort()
+
+    async def backup_specification_for_definition(self, definition):
+        InactiveAsyncClientApi._abort()
+
+    async def backup_start(self, definition):
+        InactiveAsyncClientApi._abort()
+
+    async def backup_define(self, request):
+        InactiveAsyncClientApi._abort()
+
+    async def backup_update(self, definition, request):
+        InactiveAsyncClientApi._abort()
+
+    async def recover_until(self, definition, until, path_query, destination, discard_paths):
+        InactiveAsyncClientApi._abort()
+
+    async def recover_from(self, definition, entry, path_query, destination, discard_paths):
+        InactiveAsyncClientApi._abort()
+
+    async def recover_from_latest(self, definition, path_query, destination, discard_paths):
+        InactiveAsyncClientApi._abort()
+
+    async def schedules_public(self):
+        InactiveAsyncClientApi._abort()
+
+    async def schedules_configured(self):
+        InactiveAsyncClientApi._abort()
+
+    async def schedules_configured_refresh(self):
+        InactiveAsyncClientApi._abort()
+
+    async def analytics_state(self):
+        InactiveAsyncClientApi._abort()
+
+    async def analytics_state_send(self):
+        InactiveAsyncClientApi._abort()
+
+    @staticmethod
+    def _abort():
+        logging.error('Client API is required but is not available; ensure background service is running')
+        raise Abort()
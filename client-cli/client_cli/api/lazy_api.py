@@ -0,0 +1,31 @@
+"""Proxies for deferring the creation of APIs until they are actually needed."""
+
+from client_cli.api.inactive_client_api import InactiveClientApi
+from client_cli.lazy import Lazy
+
+
+class LazyApi(Lazy):
+    """
+    Proxy for an API that is created, via the provided factory, on first attribute access.
+
+    Creating an API can be expensive (loading TLS certificates, checking if the API is active, etc.)
+    and not all commands need one, so the cost is only paid by the commands that make use of it.
+    """
+
+
+class LazyClientApi(LazyApi):
+    """
+    :class:`LazyApi` for client APIs, with the result of `is_active` memoised for the lifetime of the proxy.
+
+    The client API factory is expected to already check if the API is active (as `create_client_api` does)
+    and to return an :class:`InactiveClientApi` if it is not, so no additional requests are made to determine
+    the state of the API.
+    """
+
+    def is_active(self):
+        """
+        Checks if the API is active.
+
+        :return: True, if the API was running and responding to requests when it was created
+        """
+        return not isinstance(self.underlying, InactiveClientApi)
@@ -0,0 +1,135 @@
+"""In-memory cache of API responses, with expiration and conditional revalidation."""
+
+import time
+
+
+class CachedResponse:
+    """
+    Decoded API response, together with its expiration time and the validators (`ETag` and `Last-Modified`)
+    provided by the API, if any.
+    """
+
+    def __init__(self, result, expires_at, etag=None, last_modified=None):
+        self._result = result
+        self.expires_at = expires_at
+        self.etag = etag
+        self.last_modified = last_modified
+
+    def result(self):
+        """
+        Provides the cached response, without decoding it again.
+
+        Every call provides a new copy of the response's top-level list or dict and of the objects directly in it
+        (ex: the entries of a listing), which can be safely modified; any objects nested deeper than that are
+        shared by all callers and must not be modified.
+
+        :return: the decoded response
+        """
+        if isinstance(self._result, list):
+            return [_copy(value) for value in self._result]
+        elif isinstance(self._result, dict):
+            return {key: _copy(value) for key, value in self._result.items()}
+        else:
+            return self._result
+
+    def validators(self) -> dict:
+        """
+        Retrieves the request headers to use for conditionally requesting the response again.
+
+        :return: `If-None-Match` and/or `If-Modified-Since` headers (empty if the API provided no validators)
+        """
+        headers = {}
+
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+
+        return headers
+
+
+class ResponseCache:
+    """
+    In-memory cache of decoded API responses, keyed by request (URL and query parameters).
+
+    The cache only exists for the lifetime of its client, so it only avoids repeated requests made by the same
+    process (ex: by the commands of a `shell` session); it is not shared between separate CLI invocations.
+
+    Cached responses are used until they expire (based on the TTL of their endpoint) and are then revalidated
+    with the API, if it provided any validators (the client API currently provides none, so expired responses
+    are always requested again). Responses are decoded only once, when they are cached, and their deeply nested
+    objects are shared by all callers (see :func:`CachedResponse.result`).
+    """
+
+    def __init__(self, clock=time.monotonic):
+        self.clock = clock
+        self.responses = {}
+
+    def get(self, key):
+        """
+        Retrieves the cached response for the provided request key, whether it is fresh or not.
+
+        :param key: request key (see :func:`request_key`)
+        :return: the cached response or None if it is not available
+        """
+        return self.responses.get(key, None)
+
+    def is_fresh(self, response: CachedResponse) -> bool:
+        """
+        Checks if the provided response can still be used without revalidating it with the API.
+
+        :param response: response to check
+        :return: True, if the response has not expired yet
+        """
+        return self.clock() < response.expires_at
+
+    def put(self, key, result, ttl, etag=None, last_modified=None):
+        """
+        Caches the provided (decoded) response.
+
+        :param key: request key (see :func:`request_key`)
+        :param result: decoded response
+        :param ttl: time (in seconds) for which the response can be used without revalidating it
+        :param etag: `ETag` provided by the API, if any
+        :param last_modified: `Last-Modified` timestamp provided by the API, if any
+        """
+        self.responses[key] = CachedResponse(
+            result=result,
+            expires_at=self.clock() + ttl,
+            etag=etag,
+            last_modified=last_modified
+        )
+
+    def refresh(self, key, ttl):
+        """
+        Extends the expiration of the cached response for the provided request key (ex: after the API
+        confirmed that it has not been modified).
+
+        :param key: request key (see :func:`request_key`)
+        :param ttl: time (in seconds) for which the response can be used without revalidating it
+        """
+        response = self.responses.get(key, None)
+        if response is not None:
+            response.expires_at = self.clock() + ttl
+
+    def clear(self):
+        """
+        Removes all cached responses.
+        """
+        self.responses.clear()
+
+
+def _copy(value):
+    return value.copy() if isinstance(value, (dict, list)) else value
+
+
+def request_key(url, params=None):
+    """
+    Creates a cache key for a request with the provided URL and query parameters.
+
+    :param url: request URL (ex: /schedules)
+    :param params: query parameters (if any)
+    :return: the request key
+    """
+    return url, tuple(sorted((params or {}).items()))
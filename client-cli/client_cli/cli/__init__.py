@@ -10,7 +10,8 @@ import sys
 from typing import Optional
 
 import click
-from pyhocon import ConfigFactory
+
+from client_cli.cli.config_cache import load_cached_config, store_cached_config
 
 
 def is_client_configured(application_name, config_file_name):
@@ -41,11 +42,22 @@ def load_config_from_file(config_file_path: str):
     """
     Loads the HOCON config from the specified file.
 
+    The config values needed by the CLI are cached next to the config file so, as long as the file
+    (or any files it includes) does not change, the cached values are used and the file is not parsed.
+
     :param config_file_path: file to load
     :return: loaded config or raises an exception if it does not exist
     """
     if os.path.isfile(config_file_path):
-        return ConfigFactory.parse_file(config_file_path, required=True)
+        cached = load_cached_config(config_file_path=config_file_path)
+        if cached is not None:
+            return cached
+
+        from pyhocon import ConfigFactory  # pylint: disable=import-outside-toplevel
+
+        config = ConfigFactory.parse_file(config_file_path, required=True)
+        store_cached_config(config_file_path=config_file_path, config=config)
+        return config
     else:
         logging.error('Configuration file [{}] not available; client not configured'.format(config_file_path))
         raise click.Abort()
@@ -129,6 +141,36 @@ def capture_failures(f):
         click.echo('Aborted!')
 
 
+def echo_rendered(rendered, buffer_size=None):
+    """
+    Writes the provided render result to stdout.
+
+    Results provided as iterables of lines (ex: by streaming table renderers) are written in chunks of
+    (approximately) `buffer_size` characters, as soon as enough lines are available, instead of waiting
+    for the full result to be rendered.
+
+    :param rendered: render result, as a string or as an iterable of lines
+    :param buffer_size: approximate size of each written chunk (default is :const:`OUTPUT_BUFFER_SIZE`)
+    """
+    if isinstance(rendered, str):
+        click.echo(rendered)
+    else:
+        buffer_size = buffer_size or OUTPUT_BUFFER_SIZE
+        chunk = []
+        chunk_size = 0
+
+        for line in rendered:
+            chunk.append(line)
+            chunk_size += len(line) + 1
+            if chunk_size >= buffer_size:
+                click.echo('\n'.join(chunk))
+                chunk = []
+                chunk_size = 0
+
+        if chunk:
+            click.echo('\n'.join(chunk))
+
+
 def get_app_dir(application_name):
     """Returns the config folder of the application based on the operating system."""
     xdg_config_home = os.environ.get('XDG_CONFIG_HOME')
@@ -154,3 +196,6 @@ def get_top_level_command(args, commands):
         return provided if provided in existing else None
     else:
         return None
+
+
+OUTPUT_BUFFER_SIZE = 64 * 1024
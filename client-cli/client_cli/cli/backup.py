@@ -1,11 +1,22 @@
 """CLI commands for defining and starting backups, and showing backup-related data."""
 
+import asyncio
+import logging
+import os
+
 import click
 
-from client_cli.cli import validate_duration
+from client_cli import json_stream
+from client_cli.api import is_asynchronous_api_available
+from client_cli.cli import echo_rendered, validate_duration
 from client_cli.cli.common.filtering import with_filtering
-from client_cli.cli.common.sorting import with_sorting, Sorting
+from client_cli.cli.common.projection import with_projection
+from client_cli.cli.common.query import Query
+from client_cli.cli.common.sorting import with_sorting
+from client_cli.cli.entry_catalog import catalog_entries
+from client_cli.cli.metadata_cache import metadata_stream, retrieve_metadata
 from client_cli.cli.operations import follow_operation
+from client_cli.render import columnar
 from client_cli.render.flatten import backup_rules, dataset_definitions, dataset_entries, dataset_metadata
 
 
@@ -13,23 +24,17 @@ from client_cli.render.flatten import backup_rules, dataset_definitions, dataset
 @click.pass_context
 @with_filtering
 @with_sorting
+@with_projection
 def show_definitions(ctx):
     """Show available dataset definitions."""
-    spec = dataset_definitions.get_spec()
-
-    fields = spec['fields']
-    default_sorting = spec['sorting']
-    default_sorting = Sorting(field=default_sorting['field'], ordering=default_sorting['ordering'])
-
-    filtering = ctx.obj.filtering
-    sorting = ctx.obj.sorting
-
     definitions = ctx.obj.api.dataset_definitions()
-    definitions = dataset_definitions.flatten(definitions)
-    definitions = filtering.apply(definitions, fields) if filtering else definitions
-    definitions = (sorting or default_sorting).apply(definitions, fields)
+    definitions = Query.from_context(
+        ctx,
+        spec=dataset_definitions.get_spec(),
+        extractors=dataset_definitions.get_extractors()
+    ).apply(definitions)
 
-    click.echo(ctx.obj.rendering.render_dataset_definitions(definitions))
+    echo_rendered(ctx.obj.rendering.render_dataset_definitions(definitions))
 
 
 @click.command(name='entries', short_help='Show available dataset entries.')
@@ -37,23 +42,31 @@ def show_definitions(ctx):
 @click.pass_context
 @with_filtering
 @with_sorting
-def show_entries(ctx, definition):
-    """Show all available dataset entries or only entries for DEFINITION."""
-    spec = dataset_entries.get_spec()
-
-    fields = spec['fields']
-    default_sorting = spec['sorting']
-    default_sorting = Sorting(field=default_sorting['field'], ordering=default_sorting['ordering'])
-
-    filtering = ctx.obj.filtering
-    sorting = ctx.obj.sorting
+@with_projection
+@click.option('--since', type=click.DateTime(), help='Only show entries created at or after this (local) timestamp.')
+@click.option('--until', type=click.DateTime(), help='Only show entries created before this (local) timestamp.')
+@click.option('--latest', type=click.IntRange(min=1), help='Only show the latest N entries of each definition.')
+def show_entries(ctx, definition, since, until, latest):
+    """
+    Show all available dataset entries or only entries for DEFINITION.
 
-    entries = ctx.obj.api.dataset_entries_for_definition(definition) if definition else ctx.obj.api.dataset_entries()
-    entries = dataset_entries.flatten(entries)
-    entries = filtering.apply(entries, fields) if filtering else entries
-    entries = (sorting or default_sorting).apply(entries, fields)
+    Entries retrieved within the last few seconds are shown from the local entry catalog, without using the client API.
+    """
+    entries = catalog_entries(
+        api=ctx.obj.api,
+        catalog=ctx.obj.entry_catalog,
+        definition=definition,
+        since=since,
+        until=until,
+        latest=latest
+    )
+    entries = Query.from_context(
+        ctx,
+        spec=dataset_entries.get_spec(),
+        extractors=dataset_entries.get_extractors()
+    ).apply(entries)
 
-    click.echo(ctx.obj.rendering.render_dataset_entries(entries))
+    echo_rendered(ctx.obj.rendering.render_dataset_entries(entries))
 
 
 @click.command(name='metadata', short_help='Show dataset metadata information.')
@@ -62,51 +75,37 @@ def show_entries(ctx, definition):
 @click.pass_context
 @with_filtering
 @with_sorting
+@with_projection
 def show_metadata(ctx, entry, output):
     """Show metadata information for the specified ENTRY."""
-    metadata = ctx.obj.api.dataset_metadata(entry)
-
-    filtering = ctx.obj.filtering
-    sorting = ctx.obj.sorting
+    items, extractors = _select_metadata(ctx=ctx, output=output, entry=entry)
 
     if output == 'changes':
-        spec = dataset_metadata.get_spec_changes()
-
-        fields = spec['fields']
-        default_sorting = spec['sorting']
-        default_sorting = Sorting(field=default_sorting['field'], ordering=default_sorting['ordering'])
+        metadata_changes = Query.from_context(
+            ctx,
+            spec=dataset_metadata.get_spec_changes(),
+            extractors=extractors
+        ).apply(items)
 
-        metadata_changes = dataset_metadata.flatten_changes(metadata)
-        metadata_changes = filtering.apply(metadata_changes, fields) if filtering else metadata_changes
-        metadata_changes = (sorting or default_sorting).apply(metadata_changes, fields)
-
-        click.echo(ctx.obj.rendering.render_dataset_metadata_changes(metadata_changes))
+        echo_rendered(ctx.obj.rendering.render_dataset_metadata_changes(metadata_changes))
 
     if output == 'fs':
-        spec = dataset_metadata.get_spec_filesystem()
-
-        fields = spec['fields']
-        default_sorting = spec['sorting']
-        default_sorting = Sorting(field=default_sorting['field'], ordering=default_sorting['ordering'])
+        metadata_fs = Query.from_context(
+            ctx,
+            spec=dataset_metadata.get_spec_filesystem(),
+            extractors=extractors
+        ).apply(items)
 
-        metadata_fs = dataset_metadata.flatten_filesystem(entry, metadata)
-        metadata_fs = filtering.apply(metadata_fs, fields) if filtering else metadata_fs
-        metadata_fs = (sorting or default_sorting).apply(metadata_fs, fields)
-
-        click.echo(ctx.obj.rendering.render_dataset_metadata_filesystem(metadata_fs))
+        echo_rendered(ctx.obj.rendering.render_dataset_metadata_filesystem(metadata_fs))
 
     if output == 'crates':
-        spec = dataset_metadata.get_spec_crates()
-
-        fields = spec['fields']
-        default_sorting = spec['sorting']
-        default_sorting = Sorting(field=default_sorting['field'], ordering=default_sorting['ordering'])
-
-        metadata_crates = dataset_metadata.flatten_crates(metadata)
-        metadata_crates = filtering.apply(metadata_crates, fields) if filtering else metadata_crates
-        metadata_crates = (sorting or default_sorting).apply(metadata_crates, fields)
+        metadata_crates = Query.from_context(
+            ctx,
+            spec=dataset_metadata.get_spec_crates(),
+            extractors=extractors
+        ).apply(items)
 
-        click.echo(ctx.obj.rendering.render_dataset_metadata_crates(metadata_crates))
+        echo_rendered(ctx.obj.rendering.render_dataset_metadata_crates(metadata_crates))
 
 
 @click.command(name='list')
@@ -116,20 +115,8 @@ def show_metadata(ctx, entry, output):
 @with_sorting
 def show_rules_for_definition(ctx, definition):
     """Show configured backup rules."""
-    spec = backup_rules.get_spec_rules()
-
-    fields = spec['fields']
-    default_sorting = spec['sorting']
-    default_sorting = Sorting(field=default_sorting['field'], ordering=default_sorting['ordering'])
-
-    filtering = ctx.obj.filtering
-    sorting = ctx.obj.sorting
-
     rules = ctx.obj.api.backup_rules_for_definition(definition=definition)
-
-    rules = backup_rules.flatten_rules(rules)
-    rules = filtering.apply(rules, fields) if filtering else rules
-    rules = (sorting or default_sorting).apply(rules, fields)
+    rules = Query.from_context(ctx, spec=backup_rules.get_spec_rules()).apply(backup_rules.flatten_rules(rules))
 
     click.echo(ctx.obj.rendering.render_backup_rules(rules))
 
@@ -143,27 +130,18 @@ def show_rules_for_definition(ctx, definition):
 @with_sorting
 def show_spec_for_definition(ctx, state, definition):
     """Show backup specification based on configured rules."""
-    spec = backup_rules.get_spec_unmatched() if state == 'unmatched' else backup_rules.get_spec_matched()
-
-    fields = spec['fields']
-    default_sorting = spec['sorting']
-    default_sorting = Sorting(field=default_sorting['field'], ordering=default_sorting['ordering'])
-
-    filtering = ctx.obj.filtering
-    sorting = ctx.obj.sorting
-
     specification = ctx.obj.api.backup_specification_for_definition(definition=definition)
 
     if state == 'unmatched':
-        specification = backup_rules.flatten_specification_unmatched(specification)
-        specification = filtering.apply(specification, fields) if filtering else specification
-        specification = (sorting or default_sorting).apply(specification, fields)
+        specification = Query.from_context(ctx, spec=backup_rules.get_spec_unmatched()).apply(
+            backup_rules.flatten_specification_unmatched(specification)
+        )
 
         click.echo(ctx.obj.rendering.render_backup_specification_unmatched(specification))
     else:
-        specification = backup_rules.flatten_specification_matched(state, specification)
-        specification = filtering.apply(specification, fields) if filtering else specification
-        specification = (sorting or default_sorting).apply(specification, fields)
+        specification = Query.from_context(ctx, spec=backup_rules.get_spec_matched()).apply(
+            backup_rules.flatten_specification_matched(state, specification)
+        )
 
         click.echo(ctx.obj.rendering.render_backup_specification_matched(state, specification))
 
@@ -399,6 +377,10 @@ def delete_entry(ctx, entry):
 
     response = ctx.obj.api.dataset_entry_delete(entry)
 
+    for local_data in [ctx.obj.metadata_cache, ctx.obj.entry_catalog, ctx.obj.path_index]:
+        if local_data is not None and os.path.isfile(local_data.path):
+            local_data.remove(entry)
+
     click.echo(ctx.obj.rendering.render_operation_response(response))
 
 
@@ -431,28 +413,165 @@ def start(ctx, definition, follow):
 @click.pass_context
 @with_filtering
 @with_sorting
+@with_projection
 @click.argument('search-query')
 @click.option('-u', '--until', type=click.DateTime(), help='Timestamp for restricting search results.')
-def search(ctx, search_query, until):
+@click.option('-l', '--local', is_flag=True, default=False,
+              help='Search the local path index (see `backup index`) instead of using the client API.')
+def search(ctx, search_query, until, local):
     """
     Search available metadata for files matching the provided SEARCH_QUERY regular expression,
     (optionally) restricting the results by searching entries only up to the provided timestamp.
+
+    With `--local`, only the locally indexed metadata is searched (see `backup index`), without using the client API;
+    as only the indexed (latest) entries are searched, `--until` finds no entries for definitions whose indexed entries
+    are all newer.
+    """
+    if local:
+        if not ctx.obj.path_index.entries():
+            logging.warning('Local path index is empty; run `backup index` to create it')
+
+        search_result = json_stream.document_items(
+            document=ctx.obj.path_index.search(search_query, until),
+            subtrees=dataset_metadata.SUBTREES_SEARCH_RESULT
+        )
+    else:
+        search_result = ctx.obj.api.dataset_metadata_search_stream(
+            search_query,
+            until,
+            subtrees=dataset_metadata.SUBTREES_SEARCH_RESULT
+        )
+    search_result = Query.from_context(ctx, spec=dataset_metadata.get_spec_search_result()).apply(
+        dataset_metadata.stream_search_result(search_result)
+    )
+
+    echo_rendered(ctx.obj.rendering.render_dataset_metadata_search_result(search_result))
+
+
+@click.command(short_help='Index backup metadata for local searches.')
+@click.pass_context
+@click.option('--latest', type=click.IntRange(min=1), default=1, show_default=True,
+              help='Number of latest entries of each definition to index.')
+@click.option('--concurrency', type=click.IntRange(min=1), default=4, show_default=True,
+              help='Maximum number of entries whose metadata is retrieved at the same time (requires [httpx]).')
+def index(ctx, latest, concurrency):
     """
-    spec = dataset_metadata.get_spec_search_result()
+    Update the local path index with the filesystem metadata of the latest dataset entries of each
+    definition, so that it can be searched with `backup search --local`, even if the client API is
+    not available; entries that are no longer among the latest ones are removed from the index.
 
-    fields = spec['fields']
-    default_sorting = spec['sorting']
-    default_sorting = Sorting(field=default_sorting['field'], ordering=default_sorting['ordering'])
+    The metadata of new entries is retrieved concurrently, if the asynchronous client API is available.
+    """
+    def entities(entry):
+        items = metadata_stream(
+            api=ctx.obj.api,
+            cache=ctx.obj.metadata_cache,
+            entry=entry['id'],
+            subtrees=dataset_metadata.SUBTREES_FILESYSTEM
+        )
+        return map(lambda item: (item[1], item[2]), items)
 
-    filtering = ctx.obj.filtering
-    sorting = ctx.obj.sorting
+    definitions = ctx.obj.api.dataset_definitions()
+    entries = list(catalog_entries(api=ctx.obj.api, catalog=ctx.obj.entry_catalog, latest=latest))
+
+    indexed = ctx.obj.path_index.entries()
+    pending = {entry['id']: entry for entry in entries if entry['id'] not in indexed}
+
+    added_concurrently = 0
+    if concurrency > 1 and len(pending) > 1 and ctx.obj.create_async_api and is_asynchronous_api_available():
+        def add(entry, items):
+            ctx.obj.path_index.add(pending[entry], entities=map(lambda item: (item[1], item[2]), items))
+
+        async def retrieve():
+            api = ctx.obj.create_async_api()
+            try:
+                await retrieve_metadata(
+                    api=api,
+                    cache=ctx.obj.metadata_cache,
+                    entries=list(pending.keys()),
+                    subtrees=dataset_metadata.SUBTREES_FILESYSTEM,
+                    concurrency=concurrency,
+                    handler=add
+                )
+            finally:
+                await api.aclose()
+
+        asyncio.run(retrieve())
+        added_concurrently = len(pending)
+
+    added, removed = ctx.obj.path_index.update(definitions=definitions, entries=entries, entities=entities)
+    added += added_concurrently
+
+    logging.info('Indexed [{}] new dataset entries and removed [{}] dataset entries'.format(added, removed))
+
+
+@click.command(name='export', short_help='Export dataset metadata to Arrow IPC or Parquet files.')
+@click.argument('output', type=click.Choice(['changes', 'fs', 'crates'], case_sensitive=False))
+@click.argument('entries', type=click.UUID, nargs=-1, required=True)
+@click.option('-o', '--output-file', type=click.Path(dir_okay=False, writable=True), required=True,
+              help='File to write the exported metadata to (an existing file will be overwritten).')
+@click.option('--format', 'file_format', type=click.Choice(columnar.FORMATS, case_sensitive=False),
+              default='parquet', show_default=True, help='Format of the exported file.')
+@click.option('--batch-size', type=click.IntRange(min=1), default=10000, show_default=True,
+              help='Maximum number of rows to flatten and write at a time.')
+@click.pass_context
+@with_filtering
+def export(ctx, output, entries, output_file, file_format, batch_size):
+    """
+    Export OUTPUT (changes, fs or crates) metadata information for one or more dataset ENTRIES,
+    as typed columns, to an Arrow IPC or Parquet file; requires [pyarrow].
 
-    search_result = ctx.obj.api.dataset_metadata_search(search_query, until)
-    search_result = dataset_metadata.flatten_search_result(search_result)
-    search_result = filtering.apply(search_result, fields) if filtering else search_result
-    search_result = (sorting or default_sorting).apply(search_result, fields)
+    Every row contains the dataset entry it belongs to (in the `dataset_entry` column).
+    """
+    # pylint: disable=too-many-arguments
+    if output == 'changes':
+        spec = dataset_metadata.get_spec_changes()
+    elif output == 'fs':
+        spec = dataset_metadata.get_spec_filesystem()
+    else:
+        spec = dataset_metadata.get_spec_crates()
+
+    predicate = ctx.obj.filtering.compile(spec=spec['fields']) if ctx.obj.filtering else None
+
+    def batches():
+        for entry in entries:
+            items, extractors = _select_metadata(ctx=ctx, output=output, entry=entry)
+
+            yield from columnar.to_batches(
+                entry=entry,
+                items=items,
+                extractors=extractors,
+                batch_size=batch_size,
+                predicate=predicate
+            )
 
-    click.echo(ctx.obj.rendering.render_dataset_metadata_search_result(search_result))
+    columnar.load_pyarrow()
+    rows = columnar.write_batches(path=output_file, file_format=file_format, spec=spec, batches=batches())
+
+    logging.info(
+        'Exported [{}] row(s) from [{}] dataset entries to [{}]'.format(rows, len(entries), output_file)
+    )
+
+
+def _select_metadata(ctx, output, entry):
+    def stream(subtrees):
+        return metadata_stream(api=ctx.obj.api, cache=ctx.obj.metadata_cache, entry=entry, subtrees=subtrees)
+
+    if output == 'changes':
+        return (
+            dataset_metadata.stream_changes(stream(subtrees=dataset_metadata.SUBTREES_CHANGES)),
+            dataset_metadata.get_extractors_changes()
+        )
+    elif output == 'fs':
+        return (
+            dataset_metadata.stream_filesystem(stream(subtrees=dataset_metadata.SUBTREES_FILESYSTEM)),
+            dataset_metadata.get_extractors_filesystem(entry)
+        )
+    else:
+        return (
+            dataset_metadata.stream_crates(stream(subtrees=dataset_metadata.SUBTREES_CRATES)),
+            dataset_metadata.get_extractors_crates()
+        )
 
 
 @click.group(name='backup')
@@ -466,3 +585,5 @@ cli.add_command(update)
 cli.add_command(delete)
 cli.add_command(start)
 cli.add_command(search)
+cli.add_command(index)
+cli.add_command(export)
@@ -6,7 +6,6 @@ import pexpect
 from tqdm import tqdm
 
 from client_cli.cli.service import _get_processes
-from client_cli.render.json_writer import JsonWriter
 
 
 @click.command()
@@ -62,7 +61,7 @@ def bootstrap(ctx, server, code, username, password, verify_password, accept_sel
             ncols=progress_cols,
             desc='Starting bootstrap',
             bar_format='{desc}: |{bar}| {n_fmt}/{total_fmt}',
-            disable=isinstance(ctx.obj.rendering, JsonWriter)
+            disable=ctx.obj.rendering.is_machine_readable
     ) as progress:
         process = pexpect.spawn(
             ctx.obj.service_binary,
@@ -109,7 +108,7 @@ def bootstrap(ctx, server, code, username, password, verify_password, accept_sel
 
             response = {'successful': False, 'failure': 'Client bootstrap failed'}
 
-    if not response['successful'] and not isinstance(ctx.obj.rendering, JsonWriter):
+    if not response['successful'] and not ctx.obj.rendering.is_machine_readable:
         click.echo(process.before.decode('utf-8'))
 
     click.echo(ctx.obj.rendering.render_operation_response(response))
@@ -0,0 +1,39 @@
+"""CLI commands for showing and managing the local metadata cache."""
+
+import logging
+import os
+
+import click
+
+
+@click.command(name='stats')
+@click.pass_context
+def show_stats(ctx):
+    """Show the current state of the local metadata cache."""
+    click.echo(ctx.obj.rendering.render_metadata_cache_stats(ctx.obj.metadata_cache.stats()))
+
+
+@click.command(name='clear')
+@click.pass_context
+def clear(ctx):
+    """
+    Remove all metadata from the local metadata cache and all entries from the local entry catalog
+    and path index.
+    """
+    for local_data, description in [
+        (ctx.obj.metadata_cache, 'cached'),
+        (ctx.obj.entry_catalog, 'cataloged'),
+        (ctx.obj.path_index, 'indexed'),
+    ]:
+        if local_data is not None and os.path.isfile(local_data.path):
+            removed = local_data.clear()
+            logging.info('Removed [{}] {} dataset entries'.format(removed, description))
+
+
+@click.group(name='cache')
+def cli():
+    """Showing and managing the local cache of dataset metadata."""
+
+
+cli.add_command(show_stats)
+cli.add_command(clear)
@@ -11,6 +11,9 @@ def normalize(value):
     """
     Normalizes a memory size or duration string to a value that can be filtered/sorted.
 
+    Entries are flattened with their raw (numeric) values so only user-provided values,
+    such as filter conditions (ex: `size > 16 GB`), need to be normalized.
+
     :param value: value to be normalized
     :return: normalized value or original value (if parsing failed)
     """
@@ -1,9 +1,9 @@
 """Functions and classes for handling filtering of entries retrieved by the CLI."""
 
 import logging
+import re
 
 import click
-from pyparsing import Word, one_of, alphas8bit, alphanums, infix_notation, opAssoc, ParseResults
 
 from client_cli.cli.common import coerce, normalize
 from client_cli.cli.context import Context
@@ -24,6 +24,12 @@ def with_filtering(command):
         'Show entries matching the provided filter expression',
         'supported operators: [{}]'.format(', '.join(FilterBinaryOperator.supported_operators())),
         'supported aggregations: [{}]'.format(', '.join(FilterGroup.supported_operators())),
+        'values for [{}] can be lists (`(a, b, c)`) or files with one value per line (`@path/to/file`)'.format(
+            ', '.join(FilterBinaryOperator.MEMBERSHIP_OPERATORS)
+        ),
+        'values for [{}] are regular expressions and glob patterns (`*`, `**`, `?`, `[...]`), respectively'.format(
+            ', '.join(FilterBinaryOperator.PATTERN_OPERATORS)
+        ),
         'for example: \'(is_hidden==true or path like /tmp/test_ or path is none) && size >= 100\'.',
     ]
 
@@ -46,28 +52,143 @@ class Filtering:
         """
         Applies this filter to the provided list of entries.
 
+        The filter is compiled (see :func:`Filtering.compile`) once, before any entries are processed.
+
         :param entries: entries to filter
         :param spec: specification of `field->field-type` mapping
         :return: filtered list of entries
         """
-        return filter(lambda entry: self.filter.apply(entry=entry, spec=spec), entries)
+        return filter(self.compile(spec=spec), entries)
+
+    def compile(self, spec: dict):
+        """
+        Compiles this filter into a function that can be applied to entries
+        (see :func:`Filter.compile` and :func:`FilterGroup.compile`).
+
+        :param spec: specification of `field->field-type` mapping
+        :return: function accepting an entry and returning True, if the filter matches the entry
+        """
+        return self.filter.compile(spec=spec, reorder=True)
+
+
+def _like(condition: str):
+    return lambda v: v is not None and condition in str(v)
+
+
+def _matches(pattern: str):
+    try:
+        search = re.compile(pattern).search
+    except re.error as e:
+        logging.error('Invalid regular expression [{}]: [{}]'.format(pattern, e))
+        raise click.Abort()
+
+    return lambda v: v is not None and search(str(v)) is not None
+
+
+def _glob(pattern: str):
+    prefix = glob_prefix(pattern=pattern)
+
+    if prefix == pattern:
+        return lambda v: v is not None and str(v) == pattern
+
+    match = re.compile(glob_to_regex(pattern=pattern)).fullmatch
+
+    def predicate(v):
+        if v is None:
+            return False
+
+        v = str(v)
+        return v.startswith(prefix) and match(v) is not None
+
+    return predicate
+
+
+def glob_to_regex(pattern: str) -> str:
+    """
+    Converts the provided glob pattern to a regular expression.
+
+    Supported wildcards:
+        `*` - any characters, except `/`
+        `**` - any characters, including `/` (`**/` also matches no directories at all)
+        `?` - any single character, except `/`
+        `[...]` / `[!...]` - any single character in / not in the specified set
+
+    :param pattern: glob pattern to convert
+    :return: regular expression string
+    """
+    result = []
+    i = 0
+
+    while i < len(pattern):
+        if pattern.startswith('**/', i):
+            result.append('(?:.*/)?')
+            i += 3
+        elif pattern.startswith('**', i):
+            result.append('.*')
+            i += 2
+        elif pattern[i] == '*':
+            result.append('[^/]*')
+            i += 1
+        elif pattern[i] == '?':
+            result.append('[^/]')
+            i += 1
+        elif pattern[i] == '[' and pattern.find(']', i + (3 if pattern.startswith('[!', i) else 2)) > 0:
+            end = pattern.find(']', i + (3 if pattern.startswith('[!', i) else 2))
+            characters = pattern[i + 1:end].replace('\\', '\\\\')
+            if characters.startswith('!'):
+                characters = '^{}'.format(characters[1:])
+            result.append('[{}]'.format(characters))
+            i = end + 1
+        else:
+            result.append(re.escape(pattern[i]))
+            i += 1
+
+    return ''.join(result)
+
+
+def glob_prefix(pattern: str) -> str:
+    """
+    Retrieves the literal prefix of the provided glob pattern (everything before the first wildcard);
+    for example, the prefix of `/home/user/**/*.txt` is `/home/user/`.
+
+    :param pattern: glob pattern
+    :return: literal prefix of the pattern (or the pattern itself, if it has no wildcards)
+    """
+    match = re.search(r'[*?\[]', pattern)
+    return pattern[:match.start()] if match else pattern
 
 
 class FilterBinaryOperator:
     """Representation of binary operator used (>=, <, !=, etc) for defining filters."""
 
     OPERATORS = {
-        '<': lambda v, c: v < c if v is not None else False,
-        '<=': lambda v, c: v <= c if v is not None else False,
-        '>': lambda v, c: v > c if v is not None else False,
-        '>=': lambda v, c: v >= c if v is not None else False,
-        '==': lambda v, c: v == c if v is not None else False,
-        '!=': lambda v, c: v != c if v is not None else False,
-        'like': lambda v, c: str(c) in str(v) if v is not None else False,
-        'is': lambda v, c: str(c).lower() == 'none' and v is None,
-        'is-not': lambda v, c: str(c).lower() == 'none' and v is not None,
+        '<': lambda c: lambda v: v is not None and v < c,
+        '<=': lambda c: lambda v: v is not None and v <= c,
+        '>': lambda c: lambda v: v is not None and v > c,
+        '>=': lambda c: lambda v: v is not None and v >= c,
+        '==': lambda c: lambda v: v is not None and v == c,
+        '!=': lambda c: lambda v: v is not None and v != c,
+        'like': lambda c: _like(condition=str(c)),
+        'is': lambda c: (lambda v: v is None) if str(c).lower() == 'none' else (lambda v: False),
+        'is-not': lambda c: (lambda v: v is not None) if str(c).lower() == 'none' else (lambda v: False),
+        'in': lambda c: lambda v: v is not None and v in c,
+        'not-in': lambda c: lambda v: v is not None and v not in c,
+        'matches': lambda c: _matches(pattern=str(c)),
+        'glob': lambda c: _glob(pattern=str(c)),
     }
 
+    MEMBERSHIP_OPERATORS = ['in', 'not-in']
+
+    PATTERN_OPERATORS = ['matches', 'glob']
+
+    COSTS = {
+        'like': 2,
+        'matches': 3,
+        'glob': 3,
+    }
+
+    DEFAULT_COST = 1
+
     def __init__(self, operator):
         self.raw = operator
 
@@ -79,14 +200,32 @@ class FilterBinaryOperator:
         :param condition: condition to check against (right)
         :return: True, if the operator returns True for the provided value and condition
         """
+        return self.compile(condition=condition)(value)
+
+    def compile(self, condition):
+        """
+        Creates a function that applies this operator, with the provided condition, to a value.
+
+        :param condition: condition to check against (right)
+        :return: function accepting a value (left) and returning True, if the operator returns True for it
+        """
         operator = FilterBinaryOperator.OPERATORS.get(self.raw, None)
 
         if operator:
-            return operator(value, condition)
+            return operator(condition)
         else:
             logging.error('Unsupported filter binary operator encountered: [{}]'.format(self.raw))
             raise click.Abort()
 
+    @property
+    def cost(self):
+        """
+        Retrieves the (relative) cost of applying this operator.
+
+        :return: operator cost
+        """
+        return FilterBinaryOperator.COSTS.get(self.raw, FilterBinaryOperator.DEFAULT_COST)
+
     def as_dict(self):
         """
         Converts this instance to a dictionary.
@@ -131,9 +270,47 @@ class Filter:
         :param spec: specification of `field->field-type` mapping
         :return: True, if the filter matches the entry
         """
-        value = normalize(entry.get(self.field, None))
-        condition = normalize(self.condition)
-        return self.operator.apply(value, coerce(provided=condition, field=self.field, spec=spec, coerce_none=False))
+        return self.compile(spec=spec)(entry)
+
+    def compile(self, spec: dict, reorder: bool = False):
+        """
+        Compiles this filter into a function that can be applied to entries.
+
+        The condition is normalized and coerced to the expected field type only once, during compilation;
+        list conditions (for `in` / `not-in`) are coerced into a :class:`frozenset` and
+        patterns (for `matches` / `glob`) are compiled.
+
+        :param spec: specification of `field->field-type` mapping
+        :param reorder: unused; filters have nothing to reorder
+        :return: function accepting an entry and returning True, if the filter matches the entry
+        """
+        # pylint: disable=unused-argument
+
+        field = self.field
+
+        def coerce_condition(condition):
+            condition = normalize(condition) if spec.get(field, None) in (int, float) else condition
+            return coerce(provided=condition, field=field, spec=spec, coerce_none=False)
+
+        if self.operator.raw in FilterBinaryOperator.PATTERN_OPERATORS:
+            condition = self.condition
+        elif isinstance(self.condition, (list, tuple, set, frozenset)):
+            condition = frozenset(map(coerce_condition, self.condition))
+        else:
+            condition = coerce_condition(self.condition)
+
+        operator = self.operator.compile(condition=condition)
+
+        return lambda entry: operator(entry.get(field, None))
+
+    @property
+    def cost(self):
+        """
+        Retrieves the (relative) cost of applying this filter.
+
+        :return: filter cost
+        """
+        return self.operator.cost
 
     def as_dict(self):
         """
@@ -175,17 +352,79 @@ class FilterGroup:
         :param spec: specification of `field->field-type` mapping
         :return: True, if the filter group matches the entry
         """
-        left_result = self.left.apply(entry=entry, spec=spec)
-        right_result = self.right.apply(entry=entry, spec=spec)
+        return self.compile(spec=spec)(entry)
+
+    def compile(self, spec: dict, reorder: bool = False):
+        """
+        Compiles this filter group (and all nested filters / filter groups) into a function
+        that can be applied to entries.
+
+        Chains of groups with the same operator (ex: `a and b and c`) are compiled into a single function
+        that short-circuits; if `reorder` is set, the cheaper operands of each chain are evaluated first.
+
+        :param spec: specification of `field->field-type` mapping
+        :param reorder: set to `True` to evaluate cheaper filters / filter groups first
+        :return: function accepting an entry and returning True, if the filter group matches the entry
+        """
+        operands = self.operands()
+
+        if reorder:
+            operands = sorted(operands, key=lambda operand: operand.cost)
+
+        predicates = tuple(map(lambda operand: operand.compile(spec=spec, reorder=reorder), operands))
+
+        if self.operator in FilterGroup.AND_OPERATORS:
+            def predicate(entry):
+                for current in predicates:
+                    if not current(entry):
+                        return False
+                return True
+        else:
+            def predicate(entry):
+                for current in predicates:
+                    if current(entry):
+                        return True
+                return False
+
+        return predicate
+
+    def operands(self):
+        """
+        Retrieves the operands of this filter group and of all directly nested groups that use the same
+        (type of) operator; for example, for `a and (b && c)`, the operands are `a`, `b` and `c`.
 
+        :return: list of filters / filter groups
+        """
         if self.operator in FilterGroup.AND_OPERATORS:
-            return left_result and right_result
+            operators = FilterGroup.AND_OPERATORS
         elif self.operator in FilterGroup.OR_OPERATORS:
-            return left_result or right_result
+            operators = FilterGroup.OR_OPERATORS
         else:
             logging.error('Unsupported filter group operator encountered: [{}]'.format(self.operator))
             raise click.Abort()
 
+        operands = []
+        pending = [self]
+
+        while pending:
+            current = pending.pop()
+            if isinstance(current, FilterGroup) and current.operator in operators:
+                pending.append(current.right)
+                pending.append(current.left)
+            else:
+                operands.append(current)
+
+        return operands
+
+    @property
+    def cost(self):
+        """
+        Retrieves the (relative) cost of applying this filter group.
+
+        :return: filter group cost
+        """
+        return sum(map(lambda operand: operand.cost, self.operands()))
+
     def as_dict(self):
         """
         Converts this instance to a dictionary.
@@ -216,60 +455,180 @@ class FilterGroup:
         return list(FilterGroup.AND_OPERATORS + FilterGroup.OR_OPERATORS)
 
 
+def _group_operators_pattern(operators) -> str:
+    """
+    Creates a regex pattern matching any of the provided group operators.
+
+    Word operators (ex: `and`) must not be followed by other value characters so that they are
+    not matched as the prefix of a field name (ex: `android`); symbolic operators (ex: `&&`) can
+    be followed by anything (ex: `a==1&&b==2`).
+
+    :param operators: group operators to match
+    :return: the regex pattern
+    """
+    return '|'.join(
+        map(
+            lambda operator: re.escape(operator) + (r'(?![\w./-])' if operator.isalpha() else ''),
+            operators
+        )
+    )
+
+
 class FilterParser:
-    """Parser for user-provided filter strings."""
-
-    def __init__(self):
-        field = Word(alphanums + alphas8bit + '_')
-        operator = one_of(FilterBinaryOperator.supported_operators())
-        value = Word(alphanums + alphas8bit + '.' + '_' + "-" + "/")
-
-        comparison = field + operator + value
-        comparison.setParseAction(Filter)
-
-        self.query = infix_notation(
-            comparison,
-            [
-                (one_of(FilterGroup.AND_OPERATORS), 2, opAssoc.LEFT),
-                (one_of(FilterGroup.OR_OPERATORS), 2, opAssoc.LEFT),
-            ]
+    """
+    Recursive-descent parser for user-provided filter strings.
+
+    Supported syntax (`and` has higher precedence than `or`):
+        expression := and-expression [OR and-expression]...
+        and-expression := operand [AND operand]...
+        operand := '(' expression ')' | field operator value | field membership-operator values
+                   | field pattern-operator pattern
+        values := '(' [value [',' value]...] ')' | '@' file | value
+        pattern := "'" characters "'" | '"' characters '"' | characters
+    """
+
+    FIELD = re.compile(r'\s*([\w]+)')
+    OPERATOR = re.compile(
+        r'\s*({})'.format(
+            '|'.join(map(re.escape, sorted(FilterBinaryOperator.supported_operators(), key=len, reverse=True)))
         )
+    )
+    VALUE = re.compile(r'\s*([\w./-]+)')
+    AND = re.compile(r'\s*({})'.format(_group_operators_pattern(FilterGroup.AND_OPERATORS)))
+    OR = re.compile(r'\s*({})'.format(_group_operators_pattern(FilterGroup.OR_OPERATORS)))
+    GROUP_START = re.compile(r'\s*(\()')
+    GROUP_END = re.compile(r'\s*(\))')
+    VALUES_FILE = re.compile(r'\s*@([^\s()]+)')
+    VALUES_SEPARATOR = re.compile(r'\s*(,)')
+    PATTERN = re.compile(r'\s*(?:\'([^\']*)\'|"([^"]*)"|([^\s()\'"]+))')
+    END = re.compile(r'\s*$')
 
     def parse(self, raw_filter):
         """
-        Parses the provided string into a :class:`FilterGroup` that can be used for filtering entries.
+        Parses the provided string into a :class:`FilterGroup` (or a :class:`Filter`, if the string contains
+        a single comparison) that can be used for filtering entries.
 
         :param raw_filter: string to parse
         :return: parsed filter group
         """
-        result = self.query.parseString(raw_filter)
-        return FilterParser.transform_result(result)
+        result, position = self._parse_expression(raw_filter=raw_filter, position=0)
+        FilterParser._expect(FilterParser.END, 'end of filter', raw_filter=raw_filter, position=position)
+        return result
+
+    def _parse_expression(self, raw_filter, position):
+        return self._parse_chain(
+            raw_filter=raw_filter,
+            position=position,
+            operator=FilterParser.OR,
+            parse_operand=self._parse_and_expression
+        )
+
+    def _parse_and_expression(self, raw_filter, position):
+        return self._parse_chain(
+            raw_filter=raw_filter,
+            position=position,
+            operator=FilterParser.AND,
+            parse_operand=self._parse_operand
+        )
 
     @staticmethod
-    def transform_result(parsing_result):
-        """
-        Transformed the provided parsing result into a (potentially) nested :class:`FilterGroup`.
+    def _parse_chain(raw_filter, position, operator, parse_operand):
+        operand, position = parse_operand(raw_filter=raw_filter, position=position)
+        operands = [operand]
+        operators = []
+
+        match = operator.match(raw_filter, position)
+        while match:
+            operators.append(match.group(1))
+            operand, position = parse_operand(raw_filter=raw_filter, position=match.end())
+            operands.append(operand)
+            match = operator.match(raw_filter, position)
+
+        result = operands.pop()
+        while operands:
+            result = FilterGroup(left=operands.pop(), operator=operators.pop(), right=result)
+
+        return result, position
+
+    def _parse_operand(self, raw_filter, position):
+        match = FilterParser.GROUP_START.match(raw_filter, position)
+        if match:
+            result, position = self._parse_expression(raw_filter=raw_filter, position=match.end())
+            _, position = FilterParser._expect(FilterParser.GROUP_END, '")"', raw_filter=raw_filter, position=position)
+            return result, position
+        else:
+            field, position = FilterParser._expect(
+                FilterParser.FIELD, 'field', raw_filter=raw_filter, position=position
+            )
+            operator, position = FilterParser._expect(
+                FilterParser.OPERATOR, 'operator', raw_filter=raw_filter, position=position
+            )
+            if operator in FilterBinaryOperator.MEMBERSHIP_OPERATORS:
+                value, position = FilterParser._parse_values(raw_filter=raw_filter, position=position)
+            elif operator in FilterBinaryOperator.PATTERN_OPERATORS:
+                value, position = FilterParser._expect(
+                    FilterParser.PATTERN, 'pattern', raw_filter=raw_filter, position=position
+                )
+            else:
+                value, position = FilterParser._expect(
+                    FilterParser.VALUE, 'value', raw_filter=raw_filter, position=position
+                )
+            return Filter(tokens=[field, operator, value]), position
 
-        :param parsing_result: result to transform
-        :return: transformed filter group
-        """
-        if isinstance(parsing_result, list):
-            if len(parsing_result) == 1 and isinstance(parsing_result[0], list):
-                parsing_result = parsing_result[0]
+    @staticmethod
+    def _parse_values(raw_filter, position):
+        match = FilterParser.VALUES_FILE.match(raw_filter, position)
+        if match:
+            return FilterParser._load_values(path=match.group(1)), match.end()
+
+        match = FilterParser.GROUP_START.match(raw_filter, position)
+        if not match:
+            value, position = FilterParser._expect(
+                FilterParser.VALUE, 'value or list', raw_filter=raw_filter, position=position
+            )
+            return [value], position
 
-            left, operator, *right = (parsing_result if len(parsing_result) >= 3 else (parsing_result + [None] * 3)[:3])
+        values = []
+        position = match.end()
 
-            if operator:
-                return FilterGroup(
-                    left=FilterParser.transform_result(parsing_result=left),
-                    operator=operator,
-                    right=FilterParser.transform_result(parsing_result=right)
+        match = FilterParser.GROUP_END.match(raw_filter, position)
+        while not match:
+            if values:
+                _, position = FilterParser._expect(
+                    FilterParser.VALUES_SEPARATOR, '","', raw_filter=raw_filter, position=position
                 )
-            else:
-                return left
-        elif isinstance(parsing_result, ParseResults):
-            return FilterParser.transform_result(
-                parsing_result=parsing_result.asList()
+
+            value, position = FilterParser._expect(
+                FilterParser.VALUE, 'value', raw_filter=raw_filter, position=position
             )
+            values.append(value)
+            match = FilterParser.GROUP_END.match(raw_filter, position)
+
+        return values, match.end()
+
+    @staticmethod
+    def _load_values(path):
+        try:
+            with open(path, 'r', encoding='utf-8') as file:
+                lines = map(lambda line: line.strip(), file.readlines())
+                return [line for line in lines if line and not line.startswith('#')]
+        except OSError as e:
+            logging.error('Failed to load filter values from [{}]: [{}]'.format(path, e))
+            raise click.Abort()
+
+    @staticmethod
+    def _expect(expected, name, raw_filter, position):
+        match = expected.match(raw_filter, position)
+
+        if match:
+            return next(filter(lambda group: group is not None, match.groups()), None), match.end()
         else:
-            return parsing_result
+            logging.error(
+                'Invalid filter [{}]: expected {} at position [{}], found [{}]'.format(
+                    raw_filter,
+                    name,
+                    position,
+                    raw_filter[position:].strip() or '<end>'
+                )
+            )
+            raise click.Abort()
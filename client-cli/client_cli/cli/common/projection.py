@@ -0,0 +1,86 @@
+"""Functions and classes for handling projection (field selection) of entries retrieved by the CLI."""
+
+import logging
+
+import click
+
+from client_cli.cli.context import Context
+
+
+def with_projection(command):
+    """CLI annotation for creating projection (field selection) options."""
+
+    def callback(ctx, _, value):
+        if value:
+            fields = list(dict.fromkeys(field.strip() for field in value.split(',') if field.strip()))
+            if not fields:
+                raise click.BadParameter('At least one field is required', param_hint='--{}'.format(FIELDS_PARAMETER))
+
+            ctx.ensure_object(Context).projection = Projection(fields=fields)
+
+        return value
+
+    return click.option(
+        '--{}'.format(FIELDS_PARAMETER), expose_value=False, metavar='FIELDS',
+        help='Show only the provided, comma-separated, fields (ex: `entity,size,updated`).',
+        callback=callback
+    )(command)
+
+
+FIELDS_PARAMETER = 'fields'
+
+
+class Projection:
+    """Wrapper for selecting a subset of the fields of entries."""
+
+    def __init__(self, fields: list):
+        self.fields = fields
+
+    def validate(self, spec: dict):
+        """
+        Validates this projection against the provided spec.
+
+        :param spec: specification of `field->field-type` mapping
+        :return: this instance
+        :raises click.Abort: if any of the requested fields are not supported
+        """
+        unsupported = [field for field in self.fields if field not in spec]
+
+        if unsupported:
+            logging.error(
+                'Unsupported field(s) requested: [{}]; supported fields are: [{}]'.format(
+                    ', '.join(unsupported),
+                    ', '.join(spec.keys())
+                )
+            )
+            raise click.Abort()
+
+        return self
+
+    def apply(self, entries):
+        """
+        Applies this projection to the provided list of entries.
+
+        :param entries: entries to process
+        :return: list of entries with only the selected fields (in the requested order)
+        """
+        fields = self.fields
+        return [{field: entry[field] for field in fields} for entry in entries]
+
+    def as_dict(self):
+        """
+        Converts this instance to a dictionary.
+
+        :return: dictionary representation of this instance
+        """
+        return {
+            'fields': self.fields
+        }
+
+    def __str__(self):
+        """
+        Converts this instance to a string.
+
+        :return: string representation of this instance
+        """
+        return 'Projection(fields=[{}])'.format(', '.join(self.fields))
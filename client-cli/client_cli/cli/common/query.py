@@ -0,0 +1,118 @@
+"""
+Query pipeline for processing (flattening, filtering, sorting, paging and projecting) entries retrieved by the CLI.
+"""
+
+from client_cli.cli.common.sorting import Sorting
+from client_cli.render.flatten import extract_fields
+
+
+class Query:
+    """
+    Lazy pipeline for processing entries retrieved by the CLI:
+        items -> filter -> flatten -> sort (or select top entries, if limited) -> page -> project
+
+    If field extractors are provided, the items are expected to be raw (not flattened) and the filter is applied
+    to them directly, by extracting only the fields it needs, before the (full) flattening of each item;
+    otherwise, the items are expected to already be flattened.
+
+    If a projection is provided, only the selected fields (and the field needed for sorting) are extracted when
+    flattening raw items; the filter still has access to all fields.
+
+    All steps before sorting work on iterators so, when a limit is set, only the selected entries are kept in memory.
+    """
+
+    def __init__(self, spec: dict, extractors: dict = None, filtering=None, sorting=None, paging=None, projection=None):
+        # pylint: disable=too-many-arguments
+        self.spec = spec
+        self.extractors = extractors
+        self.filtering = filtering
+        self.sorting = sorting or Sorting(field=spec['sorting']['field'], ordering=spec['sorting']['ordering'])
+        self.paging = paging
+        self.projection = projection
+
+    @staticmethod
+    def from_context(ctx, spec: dict, extractors: dict = None):
+        """
+        Creates a new query based on the filtering, sorting, paging and projection options in the provided CLI context.
+
+        :param ctx: CLI context
+        :param spec: table spec (`fields` and default `sorting`) of the entries to process
+        :param extractors: `field->extractor-function` mapping, if the entries are to be flattened by the query
+        :return: the new query
+        """
+        return Query(
+            spec=spec,
+            extractors=extractors,
+            filtering=ctx.obj.filtering,
+            sorting=ctx.obj.sorting,
+            paging=ctx.obj.paging,
+            projection=ctx.obj.projection
+        )
+
+    def apply(self, items):
+        """
+        Applies this query to the provided items.
+
+        :param items: items to process
+        :return: the processed (flattened, filtered, sorted, paged and projected) list of entries
+        :raises click.Abort: if the projection contains fields that are not in the spec
+        """
+        fields = self.spec['fields']
+        entries = iter(items)
+
+        if self.projection:
+            self.projection.validate(spec=fields)
+
+        if self.filtering:
+            predicate = self.filtering.compile(spec=fields)
+
+            if self.extractors:
+                extractors = self.extractors
+                entries = filter(lambda item: predicate(RawEntry(item=item, extractors=extractors)), entries)
+            else:
+                entries = filter(predicate, entries)
+
+        if self.extractors:
+            projected = self.projected_extractors()
+            entries = map(lambda item: extract_fields(item, projected), entries)
+
+        entries = self.sorting.apply(entries, fields, self.paging)
+
+        return self.projection.apply(entries) if self.projection else entries
+
+    def projected_extractors(self):
+        """
+        Provides the field extractors needed for flattening items, based on the query's projection (if any).
+
+        :return: `field->extractor-function` mapping
+        """
+        if self.projection:
+            required = self.projection.fields + [self.sorting.field]
+            return {field: self.extractors[field] for field in required if field in self.extractors}
+        else:
+            return self.extractors
+
+
+class RawEntry:
+    """
+    View of a raw (not flattened) item that extracts fields only when they are requested.
+
+    Supports the same `get` method that is used by filters on flattened entries.
+    """
+
+    __slots__ = ('item', 'extractors')
+
+    def __init__(self, item, extractors: dict):
+        self.item = item
+        self.extractors = extractors
+
+    def get(self, field, default=None):
+        """
+        Retrieves the value of the specified field.
+
+        :param field: field to retrieve
+        :param default: value to return if the field is not available
+        :return: the field's value
+        """
+        extractor = self.extractors.get(field, None)
+        return extractor(self.item) if extractor else default
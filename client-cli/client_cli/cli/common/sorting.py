@@ -1,8 +1,10 @@
-"""Functions and classes for handling sorting of entries retrieved by the CLI."""
+"""Functions and classes for handling sorting (and paging) of entries retrieved by the CLI."""
+
+import heapq
 
 import click
 
-from client_cli.cli.common import coerce, normalize
+from client_cli.cli.common import coerce
 from client_cli.cli.context import Context
 
 
@@ -47,8 +49,46 @@ def ordering_option(command):
     )(command)
 
 
+def limit_option(command):
+    """CLI annotation for creating limit options."""
+
+    def callback(ctx, _, value):
+        if value is not None:
+            context = ctx.ensure_object(Context)
+            context.paging = (context.paging or Paging()).with_limit(limit=value)
+
+        return value
+
+    return click.option(
+        '--{}'.format(LIMIT_PARAMETER), expose_value=False, metavar='COUNT',
+        type=click.IntRange(min=0),
+        help='Show at most COUNT entries (after sorting).',
+        callback=callback
+    )(command)
+
+
+def offset_option(command):
+    """CLI annotation for creating offset options."""
+
+    def callback(ctx, _, value):
+        if value is not None:
+            context = ctx.ensure_object(Context)
+            context.paging = (context.paging or Paging()).with_offset(offset=value)
+
+        return value
+
+    return click.option(
+        '--{}'.format(OFFSET_PARAMETER), expose_value=False, metavar='COUNT',
+        type=click.IntRange(min=0),
+        help='Skip the first COUNT entries (after sorting).',
+        callback=callback
+    )(command)
+
+
 def with_sorting(command):
-    """CLI annotation for creating sorting options."""
+    """CLI annotation for creating sorting and paging options."""
+    command = offset_option(command)
+    command = limit_option(command)
     command = ordering_option(command)
     command = order_by_option(command)
     return command
@@ -56,6 +96,8 @@ def with_sorting(command):
 
 ORDER_BY_PARAMETER = 'order-by'
 ORDERING_PARAMETER = 'ordering'
+LIMIT_PARAMETER = 'limit'
+OFFSET_PARAMETER = 'offset'
 
 
 class Sorting:
@@ -77,19 +119,31 @@ class Sorting:
         self.ordering = ordering
         return self
 
-    def apply(self, entries, spec: dict):
+    def apply(self, entries, spec: dict, paging=None):
         """
-        Applies this sorting to the provided list of entries.
+        Applies this sorting (and the optional paging) to the provided list of entries.
+
+        If a limit is set, only the top `offset + limit` entries are selected (via a heap), instead of
+        sorting all entries.
 
         :param entries: entries to sort
         :param spec: specification of `field->field-type` mapping
+        :param paging: paging (limit and offset) to apply after sorting, if any
         :return: sorted list of entries
         """
 
         def extract(entry):
-            return coerce(provided=normalize(entry.get(self.field, None)), field=self.field, spec=spec)
+            return coerce(provided=entry.get(self.field, None), field=self.field, spec=spec)
+
+        reverse = self.ordering == 'desc'
 
-        return sorted(entries, key=extract, reverse=self.ordering == 'desc')
+        if paging is None or (paging.limit is None and not paging.offset):
+            return sorted(entries, key=extract, reverse=reverse)
+        elif paging.limit is None:
+            return sorted(entries, key=extract, reverse=reverse)[paging.offset:]
+        else:
+            select = heapq.nlargest if reverse else heapq.nsmallest
+            return select(paging.offset + paging.limit, entries, key=extract)[paging.offset:]
 
     def as_dict(self):
         """
@@ -109,3 +163,50 @@ class Sorting:
         :return: string representation of this instance
         """
         return 'Sorting(field=[{}], ordering=[{}])'.format(self.field, self.ordering)
+
+
+class Paging:
+    """Wrapper for limiting the (sorted) entries retrieved by the CLI."""
+
+    def __init__(self, limit=None, offset=0):
+        self.limit = limit
+        self.offset = offset
+
+    def with_limit(self, limit):
+        """
+        Updates the limit for this paging.
+
+        :param limit: new limit to use
+        :return: this instance
+        """
+        self.limit = limit
+        return self
+
+    def with_offset(self, offset):
+        """
+        Updates the offset for this paging.
+
+        :param offset: new offset to use
+        :return: this instance
+        """
+        self.offset = offset
+        return self
+
+    def as_dict(self):
+        """
+        Converts this instance to a dictionary.
+
+        :return: dictionary representation of this instance
+        """
+        return {
+            'limit': self.limit,
+            'offset': self.offset
+        }
+
+    def __str__(self):
+        """
+        Converts this instance to a string.
+
+        :return: string representation of this instance
+        """
+        return 'Paging(limit=[{}], offset=[{}])'.format(self.limit, self.offset)
@@ -0,0 +1,207 @@
+"""Compiled cache of the client config values used by the CLI."""
+
+import hashlib
+import json
+import logging
+import os
+import re
+
+CACHED_CONFIG_PATH = 'stasis.client.api'
+
+CACHE_FILE_MODE = 0o600
+
+INCLUDE_REGEX = r'(?:^|[{,])\s*include\b(.*)$'
+
+SUPPORTED_INCLUDE_REGEX = r'^\s+(?:required\s*\(\s*)?(?:file\s*\(\s*)?"([^"*?\[\]]+)"'
+
+
+class CachedConfig:
+    """
+    Flattened, read-only view of (part of) a HOCON config.
+
+    Supports the same accessors that the CLI uses on :class:`pyhocon.ConfigTree`.
+    """
+
+    def __init__(self, values: dict):
+        self.values = values
+
+    def get_config(self, path):
+        """
+        Retrieves the config at the specified path.
+
+        :param path: config path
+        :return: nested config
+        """
+        prefix = '{}.'.format(path)
+        nested = {key[len(prefix):]: value for key, value in self.values.items() if key.startswith(prefix)}
+
+        if not nested:
+            raise KeyError('No configuration setting found for key [{}]'.format(path))
+
+        return CachedConfig(values=nested)
+
+    def get_string(self, path):
+        """
+        Retrieves the value at the specified path as a string.
+
+        :param path: value path
+        :return: value as a string
+        """
+        value = self._get(path)
+        return str(value).lower() if isinstance(value, bool) else str(value)
+
+    def get_int(self, path):
+        """
+        Retrieves the value at the specified path as an int.
+
+        :param path: value path
+        :return: value as an int
+        """
+        return int(self._get(path))
+
+    def get_bool(self, path):
+        """
+        Retrieves the value at the specified path as a bool.
+
+        :param path: value path
+        :return: value as a bool
+        """
+        value = self._get(path)
+        return value if isinstance(value, bool) else str(value).lower() in ('true', 'yes', 'on')
+
+    def _get(self, path):
+        if path not in self.values:
+            raise KeyError('No configuration setting found for key [{}]'.format(path))
+
+        return self.values[path]
+
+
+def cache_path(config_file_path):
+    """
+    Retrieves the path of the cache file associated with the specified config file.
+
+    :param config_file_path: config file path
+    :return: cache file path
+    """
+    return '{}.cache'.format(config_file_path)
+
+
+def load_cached_config(config_file_path):
+    """
+    Loads the cached config for the specified config file, if it exists and is still up-to-date
+    with the config file (and all files it includes).
+
+    :param config_file_path: config file path
+    :return: cached config or None if it is missing or outdated
+    """
+    try:
+        with open(cache_path(config_file_path), 'r', encoding='utf-8') as file:
+            cached = json.load(file)
+
+        if cached.get('sources') != config_sources_fingerprint(config_file_path):
+            logging.debug('Cached config for [{}] is outdated'.format(config_file_path))
+            return None
+
+        return CachedConfig(values=cached['values'])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def store_cached_config(config_file_path, config):
+    """
+    Stores the values from the provided config that are used by the CLI (`stasis.client.api.*`).
+
+    Configs with substitutions (ex: `${?ENV_VAR}`) or with includes that cannot be tracked (ex: `classpath(...)`,
+    `url(...)` or glob patterns) are not cached as their values can change without any changes to the config files.
+
+    The cached values include secrets (ex: the API keystore password) so the cache file is only
+    accessible by its owner.
+
+    :param config_file_path: config file path
+    :param config: loaded config
+    """
+    try:
+        sources = config_sources_fingerprint(config_file_path)
+        if sources is None:
+            logging.debug(
+                'Config [{}] contains substitutions or unsupported includes; skipping caching'.format(config_file_path)
+            )
+            return
+
+        values = flatten_config(prefix=CACHED_CONFIG_PATH, config=config.get(CACHED_CONFIG_PATH, None))
+        if not values:
+            return
+
+        path = cache_path(config_file_path)
+        descriptor = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, CACHE_FILE_MODE)
+        with open(descriptor, 'w', encoding='utf-8') as file:
+            os.chmod(path, CACHE_FILE_MODE)
+            json.dump({'sources': sources, 'values': values}, file)
+    except (OSError, ValueError, TypeError, AttributeError) as e:
+        logging.debug('Failed to cache config [{}]: [{}]'.format(config_file_path, e))
+
+
+def flatten_config(prefix, config):
+    """
+    Converts the provided (nested) config into a `path->value` dict.
+
+    :param prefix: path of the provided config
+    :param config: config to flatten
+    :return: flattened config
+    """
+    if isinstance(config, dict):
+        values = {}
+        for key, value in config.items():
+            values.update(flatten_config(prefix='{}.{}'.format(prefix, key), config=value))
+        return values
+    elif isinstance(config, (str, int, float, bool)):
+        return {prefix: config}
+    else:
+        return {}
+
+
+def config_sources_fingerprint(config_file_path):
+    """
+    Creates a fingerprint (path, size, modification time and content hash) of the specified config file and
+    of all files it includes.
+
+    :param config_file_path: config file path
+    :return: list of file fingerprints or None if the config contains substitutions or unsupported includes
+    """
+    fingerprints = []
+    pending = [os.path.abspath(config_file_path)]
+
+    while pending:
+        path = pending.pop(0)
+        if any(fingerprint['path'] == path for fingerprint in fingerprints):
+            continue
+
+        if fingerprints and not os.path.isfile(path):
+            fingerprints.append({'path': path, 'missing': True})
+            continue
+
+        stat = os.stat(path)
+        with open(path, 'rb') as file:
+            content = file.read()
+
+        text = content.decode('utf-8', errors='replace')
+        if '${' in text:
+            return None
+
+        fingerprints.append(
+            {
+                'path': path,
+                'size': stat.st_size,
+                'mtime_ns': stat.st_mtime_ns,
+                'sha256': hashlib.sha256(content).hexdigest(),
+            }
+        )
+
+        for include in re.findall(INCLUDE_REGEX, text, re.MULTILINE):
+            included = re.match(SUPPORTED_INCLUDE_REGEX, include)
+            if included is None:
+                return None
+
+            pending.append(os.path.abspath(os.path.join(os.path.dirname(path), included.group(1))))
+
+    return fingerprints
@@ -4,12 +4,20 @@
 class Context:
     """CLI context container."""
 
+    # pylint: disable=too-many-instance-attributes
+
     def __init__(self):
         self.api = None
         self.init = None
+        self.create_async_api = None
         self.service_binary = None
         self.service_main_class = None
         self.filtering = None
         self.sorting = None
+        self.paging = None
+        self.projection = None
         self.rendering = None
+        self.metadata_cache = None
+        self.entry_catalog = None
+        self.path_index = None
         self.is_configured = False
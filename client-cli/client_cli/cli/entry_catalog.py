@@ -0,0 +1,302 @@
+"""Persistent catalog of dataset entries used by the CLI."""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import time
+
+from client_cli import json_codec
+from client_cli.cli.local_database import connect, timestamp_key
+
+
+class EntryCatalog:
+    """
+    Local (SQLite) catalog of dataset entries, indexed by definition and creation time.
+
+    The catalog is synced with the dataset entries provided by the API; only entries that are not already part
+    of the catalog are added and entries no longer provided by the API are removed, so that existing entries
+    (that never change once created) are not rewritten on every sync. Creation times are stored normalised to UTC
+    (see :func:`timestamp_key`) so that they are compared and ordered correctly.
+    """
+
+    def __init__(self, path, enabled: bool = True):
+        self.path = path
+        self.enabled = enabled
+        self._connection = None
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """
+        Retrieves the connection to the underlying database, creating the database if needed.
+
+        :return: the database connection
+        """
+        if self._connection is None:
+            self._connection = connect(self.path, schema=SCHEMA)
+
+        return self._connection
+
+    def sync(self, entries, definition=None) -> tuple:
+        """
+        Updates the catalog with the provided dataset entries.
+
+        Entries never change once created so, if the provided entries have the same IDs (in the same order)
+        as the ones of the last sync of the same scope (see :func:`listing_digest`), the catalog is already
+        up-to-date; otherwise, the provided and the cataloged entries are compared by ID.
+
+        :param entries: all available dataset entries (or all entries of the provided definition)
+        :param definition: definition of the provided entries, if they are restricted to a single definition;
+                           only the cataloged entries of that definition are considered for removal
+        :return: number of added and number of removed entries
+        """
+        scope = str(definition) if definition else ''
+        scope_condition, scope_params = ('WHERE definition = ?', (scope,)) if definition else ('', ())
+        digest = listing_digest(entries)
+
+        with self.connection as connection:
+            connection.execute('INSERT OR REPLACE INTO syncs (scope, synced) VALUES (?, ?)', (scope, time.time()))
+
+            last_digest = connection.execute('SELECT digest FROM digests WHERE scope = ?', (scope,)).fetchone()
+            if last_digest is not None and last_digest[0] == digest:
+                return 0, 0
+
+            cataloged = {
+                row[0] for row in connection.execute('SELECT id FROM entries {}'.format(scope_condition), scope_params)
+            }
+            available = set()
+            added = []
+
+            for entry in entries:
+                available.add(entry['id'])
+                if entry['id'] not in cataloged:
+                    added.append(
+                        (entry['id'], entry['definition'], timestamp_key(entry['created']), json_codec.dumps(entry))
+                    )
+
+            removed = [(entry,) for entry in cataloged - available]
+
+            connection.executemany(
+                'INSERT OR REPLACE INTO entries (id, definition, created_utc, entry) VALUES (?, ?, ?, ?)',
+                added
+            )
+            connection.executemany('DELETE FROM entries WHERE id = ?', removed)
+
+            if added or removed:
+                # the listings of other scopes (if any) no longer match the catalog
+                connection.execute('DELETE FROM digests')
+
+            connection.execute('INSERT OR REPLACE INTO digests (scope, digest) VALUES (?, ?)', (scope, digest))
+
+        logging.debug('Synced entry catalog: [{}] added, [{}] removed'.format(len(added), len(removed)))
+        return len(added), len(removed)
+
+    def is_fresh(self, definition=None, max_age: float = None) -> bool:
+        """
+        Checks if the catalog was synced with the entries of the provided definition (or with all entries)
+        recently enough to be used instead of retrieving the entries again.
+
+        :param definition: definition of the entries to check (or None for entries of all definitions)
+        :param max_age: maximum time (in seconds) since the last sync; defaults to :const:`SYNC_MAX_AGE`
+        :return: True, if the catalog was synced within the provided time
+        """
+        if self._connection is None and not os.path.isfile(self.path):
+            return False
+
+        synced = self.connection.execute(
+            'SELECT MAX(synced) FROM syncs WHERE scope IN (?, ?)', ('', str(definition) if definition else '')
+        ).fetchone()[0]
+
+        return synced is not None and 0 <= time.time() - synced <= (SYNC_MAX_AGE if max_age is None else max_age)
+
+    def entries(self, definition=None, since=None, until=None, latest=None) -> list:
+        """
+        Retrieves cataloged dataset entries, newest first.
+
+        :param definition: definition of the entries to retrieve (or None for entries of all definitions)
+        :param since: if provided, only entries created at or after this time are retrieved
+        :param until: if provided, only entries created before this time are retrieved
+        :param latest: if provided, at most this many (newest) entries are retrieved for each definition
+        :return: the requested entries
+        """
+        connection = self.connection
+
+        if definition:
+            definitions = [str(definition)]
+        elif latest:
+            definitions = [row[0] for row in connection.execute('SELECT DISTINCT definition FROM entries')]
+        else:
+            definitions = [None]
+
+        conditions = []
+        params = []
+
+        if since:
+            conditions.append('created_utc >= ?')
+            params.append(timestamp_key(since))
+
+        if until:
+            conditions.append('created_utc < ?')
+            params.append(timestamp_key(until))
+
+        result = []
+        for current in definitions:
+            query_conditions = (['definition = ?'] if current else []) + conditions
+            query_params = ([current] if current else []) + params
+
+            query = 'SELECT created_utc, entry FROM entries{} ORDER BY created_utc DESC'.format(
+                ' WHERE {}'.format(' AND '.join(query_conditions)) if query_conditions else ''
+            )
+
+            if latest:
+                query += ' LIMIT ?'
+                query_params.append(latest)
+
+            result.extend(connection.execute(query, query_params))
+
+        if len(definitions) > 1:
+            result.sort(key=lambda row: row[0], reverse=True)
+
+        return [json_codec.loads(entry) for _, entry in result]
+
+    def remove(self, entry):
+        """
+        Removes the specified entry from the catalog, if it is cataloged.
+
+        :param entry: entry to remove
+        """
+        with self.connection as connection:
+            connection.execute('DELETE FROM entries WHERE id = ?', (str(entry),))
+            connection.execute('DELETE FROM digests')
+
+    def clear(self) -> int:
+        """
+        Removes all cataloged entries.
+
+        :return: number of removed entries
+        """
+        with self.connection as connection:
+            connection.execute('DELETE FROM syncs')
+            connection.execute('DELETE FROM digests')
+            return connection.execute('DELETE FROM entries').rowcount
+
+    def close(self):
+        """
+        Closes the connection to the underlying database, if it is open.
+        """
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+
+def listing_digest(entries) -> str:
+    """
+    Creates a digest of the provided dataset entries listing, based only on the IDs of the entries (and their order),
+    as entries never change once created; computing it is much cheaper than comparing the entries themselves.
+
+    :param entries: entries to use
+    :return: the listing digest
+    """
+    return hashlib.sha256('\n'.join(entry['id'] for entry in entries).encode('utf-8')).hexdigest()
+
+
+def select_entries(entries, since=None, until=None, latest=None) -> list:
+    """
+    Selects the requested dataset entries from the provided (uncataloged) entries, newest first.
+
+    :param entries: entries to select from
+    :param since: if provided, only entries created at or after this time are selected
+    :param until: if provided, only entries created before this time are selected
+    :param latest: if provided, at most this many (newest) entries are selected for each definition
+    :return: the selected entries
+    """
+    since = timestamp_key(since) if since else None
+    until = timestamp_key(until) if until else None
+
+    selected = [
+        entry for created, entry in sorted(
+            ((timestamp_key(entry['created']), entry) for entry in entries),
+            key=lambda item: item[0],
+            reverse=True
+        )
+        if (since is None or created >= since) and (until is None or created < until)
+    ]
+
+    if latest:
+        counts = {}
+        limited = []
+        for entry in selected:
+            count = counts.get(entry['definition'], 0)
+            if count < latest:
+                counts[entry['definition']] = count + 1
+                limited.append(entry)
+        selected = limited
+
+    return selected
+
+
+def catalog_entries(api, catalog, definition=None, since=None, until=None, latest=None) -> list:
+    """
+    Retrieves the requested dataset entries, from the provided catalog, if it was synced recently
+    (see :func:`EntryCatalog.is_fresh`), or from the provided API otherwise (in which case, the catalog
+    is also synced with the retrieved entries and then used for selecting the requested entries).
+
+    :param api: client API to use for retrieving dataset entries
+    :param catalog: entry catalog to use; if it is not provided (or is disabled), the API is always used
+    :param definition: definition of the entries to retrieve (or None for entries of all definitions)
+    :param since: if provided, only entries created at or after this time are retrieved
+    :param until: if provided, only entries created before this time are retrieved
+    :param latest: if provided, at most this many (newest) entries are retrieved for each definition
+    :return: the requested entries
+    """
+    use_catalog = catalog is not None and catalog.enabled
+
+    if use_catalog:
+        try:
+            if catalog.is_fresh(definition=definition):
+                return catalog.entries(definition=definition, since=since, until=until, latest=latest)
+        except (sqlite3.Error, OSError) as e:
+            logging.debug('Failed to use entry catalog [{}]: [{}]'.format(catalog.path, e))
+
+    entries = api.dataset_entries_for_definition(definition) if definition else api.dataset_entries()
+
+    if use_catalog:
+        try:
+            catalog.sync(entries, definition=definition)
+            if since or until or latest:
+                return catalog.entries(definition=definition, since=since, until=until, latest=latest)
+        except (sqlite3.Error, OSError) as e:
+            logging.debug('Failed to sync entry catalog [{}]: [{}]'.format(catalog.path, e))
+
+    if since or until or latest:
+        return select_entries(entries, since=since, until=until, latest=latest)
+    else:
+        return entries
+
+
+def get_catalog_path(app_dir):
+    """
+    Retrieves the path of the entry catalog file in the specified application directory.
+
+    :param app_dir: application (config) directory
+    :return: catalog file path
+    """
+    return os.path.join(app_dir, CATALOG_FILE_NAME)
+
+
+CATALOG_FILE_NAME = 'entry-catalog.db'
+
+SYNC_MAX_AGE = 10
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS entries (
+    id TEXT PRIMARY KEY,
+    definition TEXT NOT NULL,
+    created_utc TEXT NOT NULL,
+    entry TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_definition_created_utc ON entries (definition, created_utc);
+CREATE INDEX IF NOT EXISTS entries_created_utc ON entries (created_utc);
+CREATE TABLE IF NOT EXISTS syncs (scope TEXT PRIMARY KEY, synced REAL NOT NULL);
+CREATE TABLE IF NOT EXISTS digests (scope TEXT PRIMARY KEY, digest TEXT NOT NULL);
+'''
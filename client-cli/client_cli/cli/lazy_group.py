@@ -0,0 +1,41 @@
+"""CLI command group with lazily loaded subcommands."""
+
+import importlib
+
+import click
+
+
+class LazyGroup(click.Group):
+    """
+    :class:`click.Group` with subcommands that are imported only when they are needed.
+
+    Subcommands are provided as a `name->'module:attribute'` mapping and are loaded (together with
+    all of their dependencies) the first time they are resolved by `click`, instead of when the CLI starts.
+    """
+
+    def __init__(self, *args, lazy_subcommands=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx):
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_subcommands.keys()))
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name not in self.commands and cmd_name in self.lazy_subcommands:
+            self.add_command(self._load_command(cmd_name), name=cmd_name)
+
+        return super().get_command(ctx, cmd_name)
+
+    def _load_command(self, cmd_name):
+        module_name, attribute_name = self.lazy_subcommands[cmd_name].split(':', maxsplit=1)
+        command = getattr(importlib.import_module(module_name), attribute_name)
+
+        if not isinstance(command, click.Command):
+            raise ValueError(
+                'Lazy subcommand [{}] loaded from [{}] is not a command'.format(
+                    cmd_name,
+                    self.lazy_subcommands[cmd_name]
+                )
+            )
+
+        return command
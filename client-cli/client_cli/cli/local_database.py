@@ -0,0 +1,58 @@
+"""Utility functions for working with the local (SQLite) databases used by the CLI."""
+
+import logging
+import os
+import re
+import sqlite3
+from datetime import datetime, timezone
+
+
+def connect(path, schema) -> sqlite3.Connection:
+    """
+    Opens a connection to the local database at the provided path, creating the database (and its parent
+    directories) if needed; existing files that are not valid databases are removed and recreated.
+
+    :param path: database file path
+    :param schema: SQL script for creating the database tables, if they do not exist
+    :return: the database connection
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    connection = sqlite3.connect(path)
+    try:
+        connection.executescript(schema)
+    except sqlite3.DatabaseError as e:
+        logging.warning('Local database [{}] is invalid and will be recreated: [{}]'.format(path, e))
+        connection.close()
+        os.remove(path)
+        connection = sqlite3.connect(path)
+        connection.executescript(schema)
+
+    return connection
+
+
+def timestamp_key(timestamp) -> str:
+    """
+    Converts the provided timestamp to a UTC string that can be compared with (and sorts like) other such strings.
+
+    Timestamps can be provided as :class:`datetime` or as ISO 8601 strings (ex: `2020-10-01T01:02:03.456Z`);
+    a :class:`datetime` without a timezone is assumed to be in local time (like the timestamps provided by users)
+    and a string without an offset is assumed to be in UTC (like the timestamps provided by the client API).
+
+    :param timestamp: timestamp to convert
+    :return: normalised timestamp (ex: `2020-10-01T01:02:03.456000`)
+    """
+    if isinstance(timestamp, str):
+        timestamp = datetime.fromisoformat(
+            FRACTION_REGEX.sub(lambda match: '.{:0<6.6}'.format(match.group(1)), timestamp).replace('Z', '+00:00')
+        )
+
+        if timestamp.tzinfo is None:
+            timestamp = timestamp.replace(tzinfo=timezone.utc)
+
+    return timestamp.astimezone(timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.%f')
+
+
+FRACTION_REGEX = re.compile(r'\.(\d+)')
@@ -6,7 +6,6 @@ import pexpect
 from tqdm import tqdm
 
 from client_cli.cli.service import _get_processes
-from client_cli.render.json_writer import JsonWriter
 
 
 @click.command()
@@ -27,7 +26,7 @@ def regenerate_api_certificate(ctx, force):
             ncols=progress_cols,
             desc='Generating API certificate',
             bar_format='{desc}: |{bar}| {n_fmt}/{total_fmt}',
-            disable=isinstance(ctx.obj.rendering, JsonWriter)
+            disable=ctx.obj.rendering.is_machine_readable
     ) as progress:
         process = spawn_regenerate_api_certificate(service_binary=ctx.obj.service_binary)
         progress.update()
@@ -114,7 +113,7 @@ def credentials_reset(ctx, current_password, new_password, verify_new_password,
             ncols=progress_cols,
             desc='Resetting user credentials',
             bar_format='{desc}: |{bar}| {n_fmt}/{total_fmt}',
-            disable=isinstance(ctx.obj.rendering, JsonWriter)
+            disable=ctx.obj.rendering.is_machine_readable
     ) as progress:
         process = pexpect.spawn(
             ctx.obj.service_binary,
@@ -190,7 +189,7 @@ def secret_push(ctx, current_username, current_password, remote_password, verify
             ncols=progress_cols,
             desc='Sending client secret to server',
             bar_format='{desc}: |{bar}| {n_fmt}/{total_fmt}',
-            disable=isinstance(ctx.obj.rendering, JsonWriter)
+            disable=ctx.obj.rendering.is_machine_readable
     ) as progress:
         process = pexpect.spawn(
             ctx.obj.service_binary,
@@ -254,7 +253,7 @@ def secret_pull(ctx, current_username, current_password, remote_password, force)
             ncols=progress_cols,
             desc='Retrieving client secret from server',
             bar_format='{desc}: |{bar}| {n_fmt}/{total_fmt}',
-            disable=isinstance(ctx.obj.rendering, JsonWriter)
+            disable=ctx.obj.rendering.is_machine_readable
     ) as progress:
         process = pexpect.spawn(
             ctx.obj.service_binary,
@@ -318,7 +317,7 @@ def secret_re_encrypt(ctx, current_username, current_password, old_password, for
             ncols=progress_cols,
             desc='Re-encrypting client secret',
             bar_format='{desc}: |{bar}| {n_fmt}/{total_fmt}',
-            disable=isinstance(ctx.obj.rendering, JsonWriter)
+            disable=ctx.obj.rendering.is_machine_readable
     ) as progress:
         process = pexpect.spawn(
             ctx.obj.service_binary,
@@ -390,5 +389,5 @@ def _require_configured(ctx, force):
 
 
 def _render_failed_response(ctx, process, response):
-    if not response['successful'] and not isinstance(ctx.obj.rendering, JsonWriter):
+    if not response['successful'] and not ctx.obj.rendering.is_machine_readable:
         click.echo(process.before.decode('utf-8'))
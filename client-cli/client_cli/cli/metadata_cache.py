@@ -0,0 +1,311 @@
+"""Persistent, size-limited cache of dataset metadata used by the CLI."""
+
+import asyncio
+import logging
+import os
+import sqlite3
+import time
+import zlib
+
+from client_cli import json_codec, json_stream
+from client_cli.cli.local_database import connect
+from client_cli.render.flatten import dataset_metadata
+
+
+class MetadataCache:
+    """
+    Local (SQLite) cache of dataset metadata, keyed by dataset entry ID.
+
+    Dataset entries (and their metadata) never change once created, so cached metadata is never outdated;
+    it is only removed when the cache grows beyond its maximum size (least recently used entries first),
+    when its entry is deleted or when the cache is cleared.
+
+    Metadata is stored as `(subtree, member-key, member-value)` items (see :func:`client_cli.json_stream.iter_items`),
+    in compressed chunks of (at most) :const:`CHUNK_SIZE` consecutive items of the same subtree, so that only
+    the requested subtrees are read back, one chunk at a time, in their original order.
+    """
+
+    def __init__(self, path, max_size: int, enabled: bool = True):
+        self.path = path
+        self.max_size = max_size
+        self.enabled = enabled
+        self._connection = None
+        self._pending_accessed = {}
+        self._pending_counters = {'hits': 0, 'misses': 0}
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """
+        Retrieves the connection to the underlying database, creating the database if needed.
+
+        :return: the database connection
+        """
+        if self._connection is None:
+            self._connection = connect(self.path, schema=SCHEMA)
+
+        return self._connection
+
+    def load(self, entry, subtrees: list):
+        """
+        Retrieves the requested subtrees of the cached metadata for the specified entry.
+
+        Loading metadata does not write to the cache; the access time of the entry and the cache counters
+        are only updated in memory and are persisted the next time metadata is stored.
+
+        :param entry: entry associated with the requested metadata
+        :param subtrees: dot-separated paths to the metadata objects to retrieve (ex: `filesystem.entities`)
+        :return: iterator of `(subtree, member-key, member-value)` items or None if the entry is not cached
+        """
+        entry = str(entry)
+
+        try:
+            cached = (self._connection is not None or os.path.isfile(self.path)) and self.connection.execute(
+                'SELECT 1 FROM entries WHERE entry = ?', (entry,)
+            ).fetchone() is not None
+        except (sqlite3.Error, OSError) as e:
+            logging.debug('Failed to load cached metadata for entry [{}]: [{}]'.format(entry, e))
+            return None
+
+        if not cached:
+            self._pending_counters['misses'] += 1
+            return None
+
+        self._pending_counters['hits'] += 1
+        self._pending_accessed[entry] = time.time()
+
+        return self._items(entry=entry, subtrees=subtrees)
+
+    def store(self, entry, items):
+        """
+        Stores the provided metadata items for the specified entry, as they are requested.
+
+        The (compressed) items are kept in memory while they are requested and the entry is only added to
+        the cache, in a single transaction, after all of its items are retrieved; if not all items are consumed
+        (or if retrieving them fails), nothing is stored. Failing to store the entry (ex: because the cache is
+        locked by another process) does not affect the provided items. Least recently used entries are evicted
+        afterwards, if the cache is larger than its maximum size.
+
+        :param entry: entry associated with the provided metadata
+        :param items: `(subtree, member-key, member-value)` items to store
+        :return: generator of the provided items
+        """
+        entry = str(entry)
+
+        chunks = []
+        chunk_subtree = None
+        chunk = []
+        for subtree, key, value in items:
+            if chunk and (subtree != chunk_subtree or len(chunk) >= CHUNK_SIZE):
+                chunks.append((chunk_subtree, zlib.compress(json_codec.dumps(chunk).encode('utf-8'))))
+                chunk = []
+
+            chunk_subtree = subtree
+            chunk.append([key, value])
+
+            yield subtree, key, value
+
+        if chunk:
+            chunks.append((chunk_subtree, zlib.compress(json_codec.dumps(chunk).encode('utf-8'))))
+
+        try:
+            with self.connection as connection:
+                self._flush(connection)
+                connection.execute('DELETE FROM chunks WHERE entry = ?', (entry,))
+                connection.executemany(
+                    'INSERT INTO chunks (entry, subtree, items) VALUES (?, ?, ?)',
+                    [(entry, subtree, encoded) for subtree, encoded in chunks]
+                )
+                connection.execute(
+                    'INSERT OR REPLACE INTO entries (entry, size, accessed) VALUES (?, ?, ?)',
+                    (entry, sum(len(encoded) for _, encoded in chunks), time.time())
+                )
+
+            self._reset_pending()
+            self._evict()
+        except (sqlite3.Error, OSError) as e:
+            logging.debug('Failed to store metadata for entry [{}]: [{}]'.format(entry, e))
+
+    def remove(self, entry):
+        """
+        Removes the cached metadata of the specified entry, if it is cached.
+
+        :param entry: entry to remove
+        """
+        entry = str(entry)
+        self._pending_accessed.pop(entry, None)
+
+        with self.connection as connection:
+            connection.execute('DELETE FROM chunks WHERE entry = ?', (entry,))
+            connection.execute('DELETE FROM entries WHERE entry = ?', (entry,))
+
+    def clear(self) -> int:
+        """
+        Removes all cached metadata and resets the cache counters.
+
+        :return: number of removed entries
+        """
+        with self.connection as connection:
+            removed = connection.execute('DELETE FROM entries').rowcount
+            connection.execute('DELETE FROM chunks')
+            connection.execute('DELETE FROM counters')
+
+        self._reset_pending()
+        self.connection.execute('VACUUM')
+        return removed
+
+    def stats(self) -> dict:
+        """
+        Retrieves the current state of the cache.
+
+        :return: dict with cache location, number of cached entries, size of cached metadata, maximum size,
+                 size of the cache file and number of cache hits and misses
+        """
+        connection = self.connection
+        entries, size = connection.execute('SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries').fetchone()
+        counters = dict(connection.execute('SELECT name, value FROM counters').fetchall())
+
+        return {
+            'path': self.path,
+            'enabled': self.enabled,
+            'entries': entries,
+            'size': size,
+            'max_size': self.max_size,
+            'file_size': os.path.getsize(self.path) if os.path.isfile(self.path) else 0,
+            'hits': counters.get('hits', 0) + self._pending_counters['hits'],
+            'misses': counters.get('misses', 0) + self._pending_counters['misses'],
+        }
+
+    def close(self):
+        """
+        Closes the connection to the underlying database, if it is open.
+        """
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def _items(self, entry, subtrees):
+        cursor = self.connection.execute(
+            'SELECT subtree, items FROM chunks WHERE entry = ? AND subtree IN ({}) ORDER BY rowid'.format(
+                ', '.join('?' * len(subtrees))
+            ),
+            [entry] + list(subtrees)
+        )
+
+        for subtree, chunk in cursor:
+            for key, value in json_codec.loads(zlib.decompress(chunk)):
+                yield subtree, key, value
+
+    def _flush(self, connection):
+        connection.executemany(
+            'UPDATE entries SET accessed = ? WHERE entry = ?',
+            [(accessed, entry) for entry, accessed in self._pending_accessed.items()]
+        )
+        connection.executemany(
+            'INSERT INTO counters (name, value) VALUES (?, ?) ON CONFLICT (name) DO UPDATE SET value = value + ?',
+            [(name, value, value) for name, value in self._pending_counters.items() if value]
+        )
+
+    def _reset_pending(self):
+        self._pending_accessed = {}
+        self._pending_counters = {'hits': 0, 'misses': 0}
+
+    def _evict(self):
+        with self.connection as connection:
+            total = connection.execute('SELECT COALESCE(SUM(size), 0) FROM entries').fetchone()[0]
+            if total <= self.max_size:
+                return
+
+            for entry, size in connection.execute('SELECT entry, size FROM entries ORDER BY accessed').fetchall():
+                connection.execute('DELETE FROM chunks WHERE entry = ?', (entry,))
+                connection.execute('DELETE FROM entries WHERE entry = ?', (entry,))
+                logging.debug('Evicted cached metadata for entry [{}]'.format(entry))
+
+                total -= size
+                if total <= self.max_size:
+                    break
+
+
+def metadata_stream(api, cache, entry, subtrees: list):
+    """
+    Retrieves the requested subtrees of the metadata for the specified entry, from the provided cache, if
+    the entry is cached, or from the provided API otherwise (in which case, the metadata is also cached).
+
+    :param api: client API to use for retrieving uncached metadata
+    :param cache: metadata cache to use; if it is not provided (or is disabled), the API is always used
+    :param entry: entry associated with the requested metadata
+    :param subtrees: dot-separated paths to the metadata objects to retrieve (ex: `filesystem.entities`)
+    :return: iterator of `(subtree, member-key, member-value)` items
+    """
+    if cache is None or not cache.enabled:
+        return api.dataset_metadata_stream(entry, subtrees=subtrees)
+
+    cached = cache.load(entry, subtrees=subtrees)
+    if cached is not None:
+        return cached
+
+    return filter(
+        lambda item: item[0] in subtrees,
+        cache.store(entry, items=api.dataset_metadata_stream(entry, subtrees=CACHED_SUBTREES))
+    )
+
+
+async def retrieve_metadata(api, cache, entries, subtrees: list, concurrency: int, handler):
+    """
+    Retrieves the requested subtrees of the metadata for all specified entries, from the provided cache, if
+    an entry is cached, or from the provided asynchronous API otherwise (in which case, the metadata is also
+    cached); up to `concurrency` requests are made at the same time.
+
+    The handler is called once for each entry, as soon as its metadata is available (in no particular order).
+
+    :param api: asynchronous client API to use for retrieving uncached metadata
+    :param cache: metadata cache to use; if it is not provided (or is disabled), the API is always used
+    :param entries: entries associated with the requested metadata
+    :param subtrees: dot-separated paths to the metadata objects to retrieve (ex: `filesystem.entities`)
+    :param concurrency: maximum number of concurrent requests
+    :param handler: function called with each entry and an iterator of its `(subtree, member-key, member-value)` items
+    """
+    is_cache_enabled = cache is not None and cache.enabled
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def retrieve(entry):
+        cached = cache.load(entry, subtrees=subtrees) if is_cache_enabled else None
+        if cached is not None:
+            handler(entry, cached)
+            return
+
+        async with semaphore:
+            metadata = await api.dataset_metadata(entry)
+
+        if is_cache_enabled:
+            items = list(cache.store(entry, items=json_stream.document_items(metadata, subtrees=CACHED_SUBTREES)))
+            handler(entry, filter(lambda item: item[0] in subtrees, items))
+        else:
+            handler(entry, json_stream.document_items(metadata, subtrees=subtrees))
+
+    await asyncio.gather(*map(retrieve, entries))
+
+
+def get_cache_path(app_dir):
+    """
+    Retrieves the path of the metadata cache file in the specified application directory.
+
+    :param app_dir: application (config) directory
+    :return: cache file path
+    """
+    return os.path.join(app_dir, CACHE_FILE_NAME)
+
+
+CACHE_FILE_NAME = 'metadata-cache.db'
+
+CACHED_SUBTREES = dataset_metadata.SUBTREES_CHANGES + dataset_metadata.SUBTREES_FILESYSTEM
+
+DEFAULT_MAX_SIZE = 512 * 1024 * 1024
+
+CHUNK_SIZE = 1000
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS entries (entry TEXT PRIMARY KEY, size INTEGER NOT NULL, accessed REAL NOT NULL);
+CREATE TABLE IF NOT EXISTS chunks (entry TEXT NOT NULL, subtree TEXT NOT NULL, items BLOB NOT NULL);
+CREATE INDEX IF NOT EXISTS chunks_entry ON chunks (entry, subtree);
+CREATE TABLE IF NOT EXISTS counters (name TEXT PRIMARY KEY, value INTEGER NOT NULL);
+'''
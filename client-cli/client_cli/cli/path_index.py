@@ -0,0 +1,461 @@
+"""Persistent, local index of dataset entry paths, for searching metadata without the client API."""
+
+import logging
+import os
+import itertools
+import re
+import sqlite3
+import zlib
+from array import array
+from collections import defaultdict
+
+from client_cli import json_codec
+from client_cli.cli.local_database import connect, timestamp_key
+
+
+class PathIndex:
+    """
+    Local (SQLite) index of the filesystem entities (paths) of dataset entries.
+
+    Every indexed entry has its own paths (with their states) and trigram postings (over the case-folded paths);
+    each posting is stored as a single compressed array of (delta-encoded) path IDs, together with its size.
+    Searches use the trigrams that any match must contain (see :func:`compile_query`), rarest first, to select
+    candidate paths and only those candidates are matched against the query itself; queries without such trigrams
+    skip the postings and are matched against all paths of the entry, inside the database.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._connection = None
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """
+        Retrieves the connection to the underlying database, creating the database if needed.
+
+        :return: the database connection
+        """
+        if self._connection is None:
+            self._connection = connect(self.path, schema=SCHEMA)
+
+        return self._connection
+
+    def update(self, definitions, entries, entities) -> tuple:
+        """
+        Updates the index so that it contains (only) the provided dataset entries.
+
+        Entries never change once created so already indexed entries are kept as-is and only the entities
+        of new entries are retrieved and indexed.
+
+        :param definitions: all available dataset definitions
+        :param entries: dataset entries to index
+        :param entities: function for retrieving the `(path, state)` filesystem entities of a dataset entry
+        :return: number of added and number of removed entries
+        """
+        with self.connection as connection:
+            connection.execute('DELETE FROM definitions')
+            connection.executemany(
+                'INSERT INTO definitions (id, info) VALUES (?, ?)',
+                [(definition['id'], definition['info']) for definition in definitions]
+            )
+
+        indexed = self.entries()
+        selected = {entry['id'] for entry in entries}
+
+        removed = [entry for entry in indexed if entry not in selected]
+        for entry in removed:
+            self.remove(entry)
+
+        added = [entry for entry in entries if entry['id'] not in indexed]
+        for entry in added:
+            self.add(entry, entities=entities(entry))
+
+        return len(added), len(removed)
+
+    def add(self, entry, entities):
+        """
+        Indexes the provided filesystem entities of the specified dataset entry.
+
+        :param entry: dataset entry associated with the provided entities
+        :param entities: `(path, state)` filesystem entities to index
+        """
+        paths = []
+        postings = defaultdict(list)
+
+        for path_id, (path, state) in enumerate(entities):
+            paths.append((entry['id'], path_id, path, json_codec.dumps(state)))
+            for trigram in trigrams(fold_case(path)):
+                postings[trigram].append(path_id)
+
+        with self.connection as connection:
+            connection.execute('DELETE FROM paths WHERE entry = ?', (entry['id'],))
+            connection.execute('DELETE FROM postings WHERE entry = ?', (entry['id'],))
+            connection.executemany('INSERT INTO paths (entry, id, path, state) VALUES (?, ?, ?, ?)', paths)
+            connection.executemany(
+                'INSERT INTO postings (entry, trigram, size, paths) VALUES (?, ?, ?, ?)',
+                (
+                    (entry['id'], trigram, len(path_ids), _encode_posting(path_ids))
+                    for trigram, path_ids in postings.items()
+                )
+            )
+            connection.execute(
+                'INSERT OR REPLACE INTO entries (id, definition, created, created_utc) VALUES (?, ?, ?, ?)',
+                (entry['id'], entry['definition'], entry['created'], timestamp_key(entry['created']))
+            )
+
+        logging.debug('Indexed [{}] path(s) of entry [{}]'.format(len(paths), entry['id']))
+
+    def remove(self, entry):
+        """
+        Removes the specified dataset entry from the index, if it is indexed.
+
+        :param entry: entry to remove
+        """
+        entry = str(entry)
+        with self.connection as connection:
+            connection.execute('DELETE FROM entries WHERE id = ?', (entry,))
+            connection.execute('DELETE FROM paths WHERE entry = ?', (entry,))
+            connection.execute('DELETE FROM postings WHERE entry = ?', (entry,))
+
+    def clear(self) -> int:
+        """
+        Removes all indexed entries.
+
+        :return: number of removed entries
+        """
+        with self.connection as connection:
+            removed = connection.execute('DELETE FROM entries').rowcount
+            connection.execute('DELETE FROM paths')
+            connection.execute('DELETE FROM postings')
+            connection.execute('DELETE FROM definitions')
+
+        self.connection.execute('VACUUM')
+        return removed
+
+    def entries(self) -> set:
+        """
+        Retrieves the IDs of all indexed dataset entries.
+
+        :return: the indexed entries
+        """
+        return {row[0] for row in self.connection.execute('SELECT id FROM entries')}
+
+    def search(self, search_query, until=None) -> dict:
+        """
+        Searches the latest indexed entry of each definition for paths matching the provided query, in the
+        same way (and with the same result structure) as the client API does.
+
+        Only indexed entries are searched so, unlike the client API, no entry is found for definitions whose
+        indexed entries were all created after the provided time; a warning is logged for such definitions.
+
+        :param search_query: regular expression (or plain text) to search for (see :func:`compile_query`)
+        :param until: if provided, only entries created up to this time are searched
+        :return: search result, with (at most) one entry per definition
+        """
+        pattern, required = compile_query(search_query)
+        connection = self.connection
+
+        if not required:
+            connection.create_function(
+                'matches_query', 1, lambda path: pattern.fullmatch(path) is not None, deterministic=True
+            )
+
+        definitions = {}
+        for definition, info in connection.execute('SELECT id, info FROM definitions').fetchall():
+            latest = connection.execute(
+                'SELECT id, created FROM entries WHERE definition = ?{} ORDER BY created_utc DESC LIMIT 1'.format(
+                    ' AND created_utc <= ?' if until else ''
+                ),
+                (definition, timestamp_key(until)) if until else (definition,)
+            ).fetchone()
+
+            matches = {}
+            if latest:
+                if required:
+                    candidates = (
+                        (path, state) for path, state in self._candidates(entry=latest[0], required=required)
+                        if pattern.fullmatch(path)
+                    )
+                else:
+                    candidates = connection.execute(
+                        'SELECT path, state FROM paths WHERE entry = ? AND matches_query(path) ORDER BY id',
+                        (latest[0],)
+                    )
+
+                for path, state in candidates:
+                    matches[path] = json_codec.loads(state)
+            elif until and connection.execute('SELECT 1 FROM entries WHERE definition = ?', (definition,)).fetchone():
+                logging.warning(
+                    'No entries of definition [{}] created up to [{}] are indexed; '
+                    'index more entries with `backup index --latest`'.format(definition, until)
+                )
+
+            definitions[definition] = {
+                'definition_info': info,
+                'entry_id': latest[0],
+                'entry_created': latest[1],
+                'matches': matches,
+            } if matches else None
+
+        return {'definitions': definitions}
+
+    def stats(self) -> dict:
+        """
+        Retrieves the current state of the index.
+
+        :return: dict with index location, number of indexed entries, paths and trigram postings and size
+                 of the index file
+        """
+        connection = self.connection
+
+        return {
+            'path': self.path,
+            'entries': connection.execute('SELECT COUNT(*) FROM entries').fetchone()[0],
+            'paths': connection.execute('SELECT COUNT(*) FROM paths').fetchone()[0],
+            'postings': connection.execute('SELECT COUNT(*) FROM postings').fetchone()[0],
+            'file_size': os.path.getsize(self.path) if os.path.isfile(self.path) else 0,
+        }
+
+    def close(self):
+        """
+        Closes the connection to the underlying database, if it is open.
+        """
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def _candidates(self, entry, required):
+        connection = self.connection
+
+        sizes = dict(
+            connection.execute(
+                'SELECT trigram, size FROM postings WHERE entry = ? AND trigram IN ({})'.format(
+                    ', '.join('?' * len(required))
+                ),
+                [entry] + sorted(required)
+            )
+        )
+
+        if len(sizes) < len(required):
+            return []
+
+        candidates = None
+        for trigram in sorted(sizes, key=sizes.get):
+            posting = connection.execute(
+                'SELECT paths FROM postings WHERE entry = ? AND trigram = ?', (entry, trigram)
+            ).fetchone()[0]
+            path_ids = _decode_posting(posting)
+            candidates = set(path_ids) if candidates is None else candidates.intersection(path_ids)
+            if len(candidates) <= MAX_CANDIDATES:
+                break
+
+        return self._paths(entry=entry, path_ids=sorted(candidates))
+
+    def _paths(self, entry, path_ids):
+        for i in range(0, len(path_ids), MAX_QUERY_PARAMS):
+            batch = path_ids[i:i + MAX_QUERY_PARAMS]
+            yield from self.connection.execute(
+                'SELECT path, state FROM paths WHERE entry = ? AND id IN ({}) ORDER BY id'.format(
+                    ', '.join('?' * len(batch))
+                ),
+                [entry] + batch
+            )
+
+
+def compile_query(search_query) -> tuple:
+    """
+    Compiles the provided search query in the same way as the client API: plain text queries (letters, digits,
+    spaces, `_` and `-`) match any path containing them (ignoring case), valid regular expressions must match
+    the entire path (ignoring case) and invalid expressions are used as literal (case-sensitive) paths.
+
+    :param search_query: query to compile
+    :return: the compiled pattern and the set of (case-folded, see :func:`fold_case`) trigrams that all matching
+             paths contain
+    """
+    if PLAIN_QUERY.fullmatch(search_query):
+        pattern = re.compile('.*{}.*'.format(re.escape(search_query)), re.IGNORECASE)
+        literals = [search_query]
+    else:
+        try:
+            pattern = re.compile(search_query, re.IGNORECASE)
+            literals = required_literals(search_query)
+        except re.error:
+            pattern = re.compile(re.escape(search_query))
+            literals = [search_query]
+
+    required = set()
+    for literal in literals:
+        required.update(trigrams(fold_case(literal)))
+
+    return pattern, required
+
+
+def required_literals(expression) -> list:
+    """
+    Extracts (conservatively) the literal strings that any match of the provided regular expression must contain.
+
+    Alternations, inline flags and non-ASCII characters disable the extraction; groups, character classes,
+    escape sequences and optional characters are skipped.
+
+    :param expression: regular expression to process
+    :return: the required literal strings (can be empty)
+    """
+    if '|' in expression or '(?' in expression:
+        return []
+
+    literals = []
+    current = ''
+    i = 0
+
+    while i < len(expression):
+        char = expression[i]
+
+        if char in '*?{':
+            current = current[:-1]
+            literals.append(current)
+            current = ''
+            i = _skip_quantifier(expression, i) if char == '{' else i + 1
+            continue
+
+        if char == '\\':
+            char = expression[i + 1] if i + 1 < len(expression) and not expression[i + 1].isalnum() else None
+            i += 2
+        elif char == '[':
+            char = None
+            i = _skip_class(expression, i)
+        elif char == '(':
+            char = None
+            i = _skip_group(expression, i)
+        elif char in '.^$+)':
+            char = None
+            i += 1
+        else:
+            i += 1
+
+        if char is not None and char.isascii():
+            current += char
+        else:
+            literals.append(current)
+            current = ''
+
+    literals.append(current)
+    return [literal for literal in literals if len(literal) >= 3]
+
+
+def _encode_posting(path_ids):
+    deltas = array('I', (current - previous for previous, current in zip(itertools.chain((0,), path_ids), path_ids)))
+    return zlib.compress(deltas.tobytes())
+
+
+def _decode_posting(posting):
+    return itertools.accumulate(array('I', zlib.decompress(posting)))
+
+
+def _skip_quantifier(expression, start):
+    end = expression.find('}', start)
+    return end + 1 if end >= 0 else len(expression)
+
+
+def _skip_class(expression, start):
+    i = start + 1
+    if i < len(expression) and expression[i] == '^':
+        i += 1
+    if i < len(expression) and expression[i] == ']':
+        i += 1
+
+    while i < len(expression) and expression[i] != ']':
+        i += 2 if expression[i] == '\\' else 1
+
+    return i + 1
+
+
+def _skip_group(expression, start):
+    depth = 0
+    i = start
+
+    while i < len(expression):
+        char = expression[i]
+        if char == '\\':
+            i += 2
+        elif char == '[':
+            i = _skip_class(expression, i)
+        else:
+            if char == '(':
+                depth += 1
+            elif char == ')':
+                depth -= 1
+                if depth == 0:
+                    return i + 1
+            i += 1
+
+    return i
+
+
+def fold_case(value) -> str:
+    """
+    Folds the case of the provided value, for indexing paths and for extracting the trigrams of search queries.
+
+    `str.casefold` and case-insensitive regular expressions do not agree on the dotted and dotless `I`
+    (`İ` is folded to `i̇` but is matched by `i`, `ı` is left as-is but is also matched by `i`), so both
+    are folded to `i`; all indexed paths that a (case-insensitive) query matches contain its trigrams.
+
+    :param value: value to fold
+    :return: the case-folded value
+    """
+    return value.translate(DOTTED_AND_DOTLESS_I).casefold()
+
+
+def trigrams(value) -> set:
+    """
+    Retrieves all (overlapping) three-character substrings of the provided value.
+
+    :param value: value to process
+    :return: the value's trigrams
+    """
+    return {value[i:i + 3] for i in range(len(value) - 2)}
+
+
+def get_index_path(app_dir):
+    """
+    Retrieves the path of the path index file in the specified application directory.
+
+    :param app_dir: application (config) directory
+    :return: index file path
+    """
+    return os.path.join(app_dir, INDEX_FILE_NAME)
+
+
+INDEX_FILE_NAME = 'path-index.db'
+
+PLAIN_QUERY = re.compile(r'[\w _-]*', re.ASCII)
+
+MAX_CANDIDATES = 256
+
+DOTTED_AND_DOTLESS_I = str.maketrans({'\u0130': 'i', '\u0131': 'i'})
+
+MAX_QUERY_PARAMS = 500
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS definitions (id TEXT PRIMARY KEY, info TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS entries (
+    id TEXT PRIMARY KEY,
+    definition TEXT NOT NULL,
+    created TEXT NOT NULL,
+    created_utc TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_definition_created_utc ON entries (definition, created_utc);
+CREATE TABLE IF NOT EXISTS paths (
+    entry TEXT NOT NULL,
+    id INTEGER NOT NULL,
+    path TEXT NOT NULL,
+    state TEXT NOT NULL,
+    PRIMARY KEY (entry, id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS postings (
+    entry TEXT NOT NULL,
+    trigram TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    paths BLOB NOT NULL,
+    PRIMARY KEY (entry, trigram)
+) WITHOUT ROWID;
+'''
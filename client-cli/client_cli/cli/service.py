@@ -9,7 +9,6 @@ import psutil
 from tqdm import tqdm
 
 from client_cli.render.flatten.init_state import flatten_primary_init_state, flatten_secondary_init_state
-from client_cli.render.json_writer import JsonWriter
 
 
 @click.command(
@@ -42,7 +41,7 @@ def start(ctx, username, password, service_arguments):
                     ncols=progress_cols,
                     desc='Starting service',
                     bar_format='{desc}: |{bar}| {n_fmt}/{total_fmt}',
-                    disable=isinstance(ctx.obj.rendering, JsonWriter)
+                    disable=ctx.obj.rendering.is_machine_readable
             ) as progress:
                 # pylint: disable=consider-using-with
                 Popen([service] + list(service_arguments or []), stdout=DEVNULL, stdin=DEVNULL, stderr=DEVNULL,
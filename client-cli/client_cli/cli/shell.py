@@ -0,0 +1,174 @@
+"""CLI command for running multiple commands with a single, shared, CLI context."""
+
+import logging
+import shlex
+import sys
+
+import click
+import requests
+
+from client_cli.api.lazy_api import LazyApi, LazyClientApi
+
+PROMPT = 'stasis> '
+
+EXIT_COMMANDS = ('exit', 'quit')
+
+UNSUPPORTED_COMMANDS = ('shell', 'bootstrap')
+
+SERVICE_STATE_COMMANDS = (('service', 'start'), ('service', 'stop'))
+
+
+@click.command(name='shell')
+@click.pass_context
+@click.option('-b', '--batch', type=click.File('r'),
+              help='File with commands to run, one per line (use `-` for stdin).')
+@click.option('--fail-fast', is_flag=True, default=False,
+              help='Stop processing commands after the first failure.')
+def shell(ctx, batch, fail_fast):
+    """
+    Running multiple commands with a single client API session.
+
+    Commands are provided without the `stasis-client-cli` prefix (ex: `backup show entries`), either
+    interactively or, in batch mode, one per line from a file or from stdin. Empty lines and lines starting
+    with `#` are ignored and `exit` or `quit` stop processing any further commands.
+
+    All commands share the same CLI context (client API connection, configuration, output format, etc.);
+    the client API connection is re-established after the background service is started or stopped, after
+    failing to connect to it and, while it is not active, before every command.
+    """
+    if batch is not None:
+        lines = batch
+    elif sys.stdin.isatty():
+        lines = _interactive_lines()
+    else:
+        lines = click.get_text_stream('stdin')
+
+    root = ctx.find_root()
+    failures = 0
+
+    for line in lines:
+        if line.strip() in EXIT_COMMANDS:
+            break
+
+        if not run_command(root=root, line=line):
+            failures += 1
+            if fail_fast:
+                break
+
+    if failures > 0:
+        logging.error('[{}] command(s) failed'.format(failures))
+        ctx.exit(1)
+
+
+def run_command(root, line):
+    """
+    Runs the provided command line as a subcommand of the provided root (CLI) context,
+    reusing the context's object.
+
+    Any per-command state stored in the CLI context (filtering, sorting, paging, projection) is reset
+    before the command is run. The (lazy) client and init APIs are reset after the command is run if the
+    state of the background service may have changed (see :func:`reset_apis`).
+
+    :param root: root click context
+    :param line: command line to run
+    :return: True, if the command completed successfully (or there was nothing to run)
+    """
+    try:
+        args = shlex.split(line, comments=True)
+    except ValueError as e:
+        logging.error('Invalid command [{}]: [{}]'.format(line.strip(), e))
+        return False
+
+    if not args:
+        return True
+
+    command = _get_command(root=root, name=args[0])
+    if command is None:
+        return False
+
+    root.obj.filtering = None
+    root.obj.sorting = None
+    root.obj.paging = None
+    root.obj.projection = None
+
+    successful = _invoke_command(root=root, command=command, name=args[0], args=args[1:])
+
+    if tuple(args[:2]) in SERVICE_STATE_COMMANDS or not _is_api_active(api=root.obj.api):
+        reset_apis(context=root.obj)
+
+    return successful
+
+
+def reset_apis(context):
+    """
+    Resets the (lazy) client and init APIs of the provided CLI context, so that they are created (and the
+    background service is checked for activity) again when they are next needed.
+
+    :param context: CLI context
+    """
+    for api in (context.api, context.init):
+        if isinstance(api, LazyApi):
+            api.reset()
+
+
+def _is_api_active(api):
+    if isinstance(api, LazyClientApi) and api.is_created:
+        return api.is_active()
+    else:
+        return True
+
+
+def _get_command(root, name):
+    if name in UNSUPPORTED_COMMANDS:
+        logging.error('Command [{}] is not supported in shell mode'.format(name))
+        return None
+
+    command = root.command.get_command(root, name)
+    if command is None:
+        logging.error('Unknown command [{}]'.format(name))
+
+    return command
+
+
+def _invoke_command(root, command, name, args):
+    # pylint: disable=broad-except
+
+    try:
+        with command.make_context(name, args, parent=root) as command_ctx:
+            command.invoke(command_ctx)
+        return True
+    except click.exceptions.Exit as e:
+        return e.exit_code == 0
+    except click.ClickException as e:
+        e.show()
+        return False
+    except click.Abort:
+        click.echo('Aborted!')
+        return False
+    except requests.exceptions.ConnectionError as e:
+        logging.error('Failed to connect to client API: [{}]'.format(e))
+        reset_apis(context=root.obj)
+        click.echo('Aborted!')
+        return False
+    except Exception as e:
+        verbose = logging.getLogger(name='root').getEffectiveLevel() == logging.DEBUG
+        if verbose:
+            logging.exception(e)
+        else:
+            logging.error('{}: {}'.format(e.__class__.__name__, e))
+        click.echo('Aborted!')
+        return False
+
+
+def _interactive_lines():
+    try:
+        import readline  # pylint: disable=import-outside-toplevel,unused-import
+    except ImportError:
+        pass
+
+    while True:
+        try:
+            yield input(PROMPT)
+        except EOFError:
+            click.echo()
+            return
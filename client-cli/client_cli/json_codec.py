@@ -0,0 +1,153 @@
+"""
+Pluggable JSON codec, used for decoding API responses and for encoding JSON output.
+
+[orjson] is used, if it is available (install it with [stasis-client-cli[fast-json]]);
+otherwise, the standard library's [json] module is used.
+"""
+
+import json
+from abc import ABC, abstractmethod
+
+
+class JsonCodec(ABC):
+    """Interface for JSON encoding and decoding."""
+
+    name = None
+
+    @abstractmethod
+    def loads(self, data):
+        """
+        Decodes the provided JSON document.
+
+        :param data: JSON document, as a string or as bytes
+        :return: decoded value
+        :raises json.JSONDecodeError: if the document is not valid JSON
+        """
+
+    @abstractmethod
+    def dumps(self, value, pretty: bool = False) -> str:
+        """
+        Encodes the provided value as JSON.
+
+        All codecs produce the same output: non-ASCII characters are not escaped and indented
+        output uses two spaces (the only indentation supported by `orjson`).
+
+        :param value: value to encode
+        :param pretty: set to `True` to produce indented output; otherwise, the output is compact (single line)
+        :return: encoded value
+        """
+
+
+class StdlibJsonCodec(JsonCodec):
+    """:class:`JsonCodec` based on the standard library's `json` module."""
+
+    name = 'json'
+
+    def loads(self, data):
+        return json.loads(data)
+
+    def dumps(self, value, pretty: bool = False) -> str:
+        return _stdlib_dumps(value, pretty=pretty)
+
+
+class OrjsonCodec(JsonCodec):
+    """
+    :class:`JsonCodec` based on `orjson`.
+
+    Decoding failures are raised as `orjson.JSONDecodeError`, which is a subclass of `json.JSONDecodeError`.
+
+    `orjson` only supports 64-bit integers; larger integers are silently decoded as floats (without failing)
+    and cannot be encoded at all, so documents that might contain larger integers (ex: 256-bit checksums)
+    are handled with the standard library's `json` module instead (see :func:`_has_long_numbers`).
+    """
+
+    name = 'orjson'
+
+    def __init__(self):
+        import orjson  # pylint: disable=import-outside-toplevel
+        self.orjson = orjson
+
+    def loads(self, data):
+        if _has_long_numbers(data):
+            return json.loads(data)
+        else:
+            return self.orjson.loads(data)
+
+    def dumps(self, value, pretty: bool = False) -> str:
+        try:
+            return self.orjson.dumps(value, option=self.orjson.OPT_INDENT_2 if pretty else None).decode('utf-8')
+        except TypeError:
+            return _stdlib_dumps(value, pretty=pretty)
+
+
+def _stdlib_dumps(value, pretty):
+    if pretty:
+        return json.dumps(value, indent=2, ensure_ascii=False)
+    else:
+        return json.dumps(value, separators=(',', ':'), ensure_ascii=False)
+
+
+def _has_long_numbers(data):
+    # checks for runs of (at least) 19 digits, one (bounded) chunk at a time, without copying the whole
+    # document; chunks overlap so that runs crossing chunk boundaries are also found
+    overlap = len(LONG_NUMBER) - 1
+    for start in range(0, len(data), SCAN_CHUNK_SIZE):
+        chunk = data[max(start - overlap, 0):start + SCAN_CHUNK_SIZE]
+        if LONG_NUMBER in (chunk.encode('utf-8') if isinstance(chunk, str) else chunk).translate(DIGITS):
+            return True
+
+    return False
+
+
+def create_codec(name=None) -> JsonCodec:
+    """
+    Creates a new JSON codec.
+
+    :param name: name of the codec to create (`orjson` or `json`); if not provided,
+                 `orjson` is used when it is available and `json` is used otherwise
+    :return: the new codec
+    :raises ImportError: if `orjson` is explicitly requested but is not available
+    :raises ValueError: if an unsupported codec name is provided
+    """
+    if name is None:
+        try:
+            return OrjsonCodec()
+        except ImportError:
+            return StdlibJsonCodec()
+    elif name == OrjsonCodec.name:
+        return OrjsonCodec()
+    elif name == StdlibJsonCodec.name:
+        return StdlibJsonCodec()
+    else:
+        raise ValueError('Unsupported JSON codec requested: [{}]'.format(name))
+
+
+def loads(data):
+    """
+    Decodes the provided JSON document with the default codec (see :const:`CODEC`).
+
+    :param data: JSON document, as a string or as bytes
+    :return: decoded value
+    :raises json.JSONDecodeError: if the document is not valid JSON
+    """
+    return CODEC.loads(data)
+
+
+def dumps(value, pretty: bool = False) -> str:
+    """
+    Encodes the provided value as JSON with the default codec (see :const:`CODEC`).
+
+    :param value: value to encode
+    :param pretty: set to `True` to produce indented output; otherwise, the output is compact (single line)
+    :return: encoded value
+    """
+    return CODEC.dumps(value, pretty=pretty)
+
+
+DIGITS = bytes(ord('0') if chr(byte) in '0123456789' else ord(' ') for byte in range(256))
+
+LONG_NUMBER = b'0' * 19
+
+SCAN_CHUNK_SIZE = 256 * 1024
+
+CODEC = create_codec()
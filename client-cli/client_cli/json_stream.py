@@ -0,0 +1,111 @@
+"""
+Incremental (streaming) decoding of selected parts of large JSON documents.
+
+Instead of decoding a whole document, only the members of the requested objects (subtrees) are decoded,
+one at a time, while the document is being read; everything else is skipped.
+
+Requires [ijson] (install it with [stasis-client-cli[streaming]]); if it is not available, documents
+can still be processed, after being fully decoded, with :func:`document_items`.
+"""
+
+import itertools
+from decimal import Decimal
+from json import JSONDecodeError
+
+
+def is_available() -> bool:
+    """
+    Checks if incremental decoding is available (if `ijson` is installed).
+
+    :return: True, if :func:`iter_items` can be used
+    """
+    try:
+        import ijson  # pylint: disable=import-outside-toplevel,unused-import
+        return True
+    except ImportError:
+        return False
+
+
+def iter_items(source, subtrees: list):
+    """
+    Incrementally decodes the members of the requested objects (subtrees) from the provided JSON document.
+
+    Only a single member value is kept in memory at a time; the rest of the document is discarded as it is read.
+    Items are provided in the order in which they appear in the document; a single subtree is decoded
+    natively by `ijson`, while multiple subtrees are collected from the (slower) stream of parsing events.
+
+    Integers are decoded exactly (regardless of their size; ex: 256-bit checksums) and all other numbers
+    are decoded as floats, as with the standard library's `json` module.
+
+    :param source: JSON document, as bytes or as a file-like object (ex: a streamed response)
+    :param subtrees: dot-separated paths to the objects to decode (ex: `filesystem.entities`)
+    :return: generator of `(subtree, member-key, member-value)` items
+    :raises json.JSONDecodeError: if the document is not valid JSON
+    """
+    import ijson  # pylint: disable=import-outside-toplevel
+
+    try:
+        if len(subtrees) == 1:
+            subtree = subtrees[0]
+            for key, value in ijson.kvitems(source, subtree):
+                yield subtree, key, _without_decimals(value)
+        else:
+            subtrees = set(subtrees)
+            events = ijson.parse(source)
+            for prefix, event, value in events:
+                if event == 'map_key' and prefix in subtrees:
+                    yield prefix, value, _build_value(ijson.ObjectBuilder(), events)
+    except ijson.JSONError as e:
+        raise JSONDecodeError(str(e), '', 0) from e
+
+
+def document_items(document: dict, subtrees: list):
+    """
+    Retrieves the members of the requested objects (subtrees) from the provided, already decoded, JSON document.
+
+    Items are provided subtree by subtree, in the requested order; missing subtrees (and subtrees
+    that are not objects) are skipped.
+
+    :param document: decoded JSON document
+    :param subtrees: dot-separated paths to the objects to retrieve (ex: `filesystem.entities`)
+    :return: iterator of `(subtree, member-key, member-value)` items
+    """
+
+    def members(subtree):
+        current = document
+        for key in subtree.split('.'):
+            current = current.get(key, None) if isinstance(current, dict) else None
+
+        if not isinstance(current, dict):
+            current = {}
+
+        return map(lambda member: (subtree, member[0], member[1]), current.items())
+
+    return itertools.chain.from_iterable(map(members, subtrees))
+
+
+def _build_value(builder, events):
+    depth = 0
+    for _, event, value in events:
+        builder.event(event, float(value) if isinstance(value, Decimal) else value)
+
+        if event in ('start_map', 'start_array'):
+            depth += 1
+        elif event in ('end_map', 'end_array'):
+            depth -= 1
+
+        if depth == 0:
+            return builder.value
+
+    return builder.value
+
+
+def _without_decimals(value):
+    if isinstance(value, dict):
+        return {key: _without_decimals(member) for key, member in value.items()}
+    elif isinstance(value, list):
+        return [_without_decimals(element) for element in value]
+    elif isinstance(value, Decimal):
+        return float(value)
+    else:
+        return value
@@ -0,0 +1,41 @@
+"""Proxy for deferring the creation of objects until they are actually needed."""
+
+
+class Lazy:
+    """
+    Proxy for an object that is created, via the provided factory, on first attribute access.
+    """
+
+    def __init__(self, factory):
+        self._factory = factory
+        self._underlying = None
+
+    @property
+    def underlying(self):
+        """
+        Retrieves the underlying object, creating it if needed.
+
+        :return: the underlying object
+        """
+        if self._underlying is None:
+            self._underlying = self._factory()
+
+        return self._underlying
+
+    @property
+    def is_created(self):
+        """
+        Checks if the underlying object was already created.
+
+        :return: True, if the underlying object exists
+        """
+        return self._underlying is not None
+
+    def reset(self):
+        """
+        Discards the underlying object (if any) so that a new one is created on next attribute access.
+        """
+        self._underlying = None
+
+    def __getattr__(self, name):
+        return getattr(self.underlying, name)
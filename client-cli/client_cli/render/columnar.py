@@ -0,0 +1,170 @@
+"""
+Functions for exporting flattened dataset metadata to columnar (Arrow IPC and Parquet) files.
+
+Requires [pyarrow]; install it with [stasis-client-cli[arrow]].
+"""
+
+import logging
+from datetime import datetime, timezone
+
+import click
+
+from client_cli.render.flatten import extract_fields
+
+
+def load_pyarrow():
+    """
+    Loads the (optional) `pyarrow` dependency.
+
+    :return: the `pyarrow` module
+    :raises click.Abort: if `pyarrow` is not available
+    """
+    try:
+        # pylint: disable=import-outside-toplevel
+        import pyarrow
+        import pyarrow.ipc
+        import pyarrow.parquet
+    except ImportError:
+        logging.error('Exporting metadata requires [pyarrow]; install it with [stasis-client-cli[arrow]]')
+        raise click.Abort() from None
+
+    return pyarrow
+
+
+def create_schema(spec: dict):
+    """
+    Creates an Arrow schema based on the provided table spec.
+
+    The schema contains an additional (first) column with the dataset entry each row belongs to
+    (see :const:`ENTRY_COLUMN`); fields with values that cannot be represented as 64-bit integers
+    (see :const:`UNBOUNDED_INT_FIELDS`) are stored as strings, while timestamp and boolean fields
+    (see :const:`TIMESTAMP_FIELDS` and :const:`BOOLEAN_FIELDS`), which are flattened to strings for
+    rendering them as text, are stored as UTC timestamps and booleans.
+
+    :param spec: table spec (`fields` and default `sorting`) of the entries to export
+    :return: the Arrow schema
+    """
+    pa = load_pyarrow()
+
+    types = {
+        str: pa.string(),
+        int: pa.int64(),
+        float: pa.float64(),
+        bool: pa.bool_(),
+    }
+
+    def field_type(field, default_type):
+        if field in UNBOUNDED_INT_FIELDS:
+            return pa.string()
+        elif field in TIMESTAMP_FIELDS:
+            return pa.timestamp('us', tz='UTC')
+        elif field in BOOLEAN_FIELDS:
+            return pa.bool_()
+        else:
+            return types[default_type]
+
+    return pa.schema(
+        [pa.field(ENTRY_COLUMN, pa.string(), nullable=False)] + [
+            pa.field(field, field_type(field, default_type)) for field, default_type in spec['fields'].items()
+        ]
+    )
+
+
+def to_batches(entry, items, extractors: dict, batch_size: int, predicate=None):
+    """
+    Flattens the provided (raw) items into column batches.
+
+    Items are filtered based on their flattened (text) values and the values of fields that are
+    stored with a different type (see :func:`create_schema`) are converted afterwards.
+
+    :param entry: dataset entry the items belong to
+    :param items: items to flatten
+    :param extractors: `field->extractor-function` mapping
+    :param batch_size: maximum number of rows per batch
+    :param predicate: function for filtering flattened items (see :func:`client_cli.cli.common.filtering.Filtering`)
+    :return: generator of `field->list-of-values` dicts, with at most `batch_size` rows each
+    """
+    entry = str(entry)
+    fields = list(extractors.keys())
+    converters = [_converter(field) for field in fields]
+
+    batch = {field: [] for field in fields}
+    size = 0
+
+    for item in items:
+        row = extract_fields(item, extractors)
+        if predicate and not predicate(row):
+            continue
+
+        for field, convert in zip(fields, converters):
+            value = row[field]
+            batch[field].append(convert(value) if convert and value is not None else value)
+
+        size += 1
+        if size >= batch_size:
+            yield dict({ENTRY_COLUMN: [entry] * size}, **batch)
+            batch = {field: [] for field in fields}
+            size = 0
+
+    if size > 0:
+        yield dict({ENTRY_COLUMN: [entry] * size}, **batch)
+
+
+def _converter(field):
+    if field in UNBOUNDED_INT_FIELDS:
+        return str
+    elif field in TIMESTAMP_FIELDS:
+        return _to_timestamp
+    elif field in BOOLEAN_FIELDS:
+        return lambda value: value == 'yes'
+    else:
+        return None
+
+
+def _to_timestamp(value):
+    timestamp = datetime.fromisoformat(value)
+    return timestamp if timestamp.tzinfo else timestamp.replace(tzinfo=timezone.utc)
+
+
+def write_batches(path, file_format, spec: dict, batches):
+    """
+    Writes the provided column batches to a new Arrow IPC or Parquet file.
+
+    Each batch is written (and released) before the next one is requested.
+
+    :param path: path of the file to create
+    :param file_format: file format to use (`arrow` or `parquet`)
+    :param spec: table spec (`fields` and default `sorting`) of the exported entries
+    :param batches: `field->list-of-values` dicts to write (see :func:`to_batches`)
+    :return: number of written rows
+    """
+    pa = load_pyarrow()
+    schema = create_schema(spec)
+
+    if file_format == 'parquet':
+        writer = pa.parquet.ParquetWriter(path, schema=schema)
+    elif file_format == 'arrow':
+        writer = pa.ipc.new_file(path, schema=schema)
+    else:
+        logging.error('Unsupported export format provided: [{}]'.format(file_format))
+        raise click.Abort()
+
+    rows = 0
+    with writer:
+        for batch in batches:
+            record_batch = pa.RecordBatch.from_pydict(batch, schema=schema)
+            writer.write_batch(record_batch)
+            rows += record_batch.num_rows
+
+    return rows
+
+
+ENTRY_COLUMN = 'dataset_entry'
+
+UNBOUNDED_INT_FIELDS = ['checksum']
+
+TIMESTAMP_FIELDS = ['created', 'updated']
+
+BOOLEAN_FIELDS = ['hidden']
+
+FORMATS = ['parquet', 'arrow']
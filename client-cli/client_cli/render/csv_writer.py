@@ -0,0 +1,145 @@
+"""Delimiter-separated values (CSV/TSV) :class:`Writer`."""
+
+import csv
+import io
+from typing import Iterable
+
+from client_cli import json_codec
+from client_cli.render.writer import Writer
+
+
+class CsvWriter(Writer):
+    """
+    Delimiter-separated values (CSV/TSV) :class:`Writer`.
+
+    Lists are rendered as a header row (based on the fields of their first element) followed by one row per element;
+    all other responses are rendered as a header row and a single row. Values are not converted to human-readable
+    strings (ex: memory sizes are provided in bytes and durations in seconds) and nested values are provided as JSON.
+
+    Dataset definitions, entries, metadata and search results are rendered lazily, one row at a time
+    (see :func:`client_cli.cli.echo_rendered`), with their columns in the order of their (flattened) fields.
+    """
+
+    def __init__(self, dialect='excel'):
+        self.dialect = dialect
+
+    @property
+    def is_machine_readable(self) -> bool:
+        return True
+
+    def render_dataset_definitions(self, definitions) -> Iterable[str]:
+        return stream_rows(rows=definitions, dialect=self.dialect)
+
+    def render_dataset_entries(self, entries) -> Iterable[str]:
+        return stream_rows(rows=entries, dialect=self.dialect)
+
+    def render_dataset_metadata_changes(self, metadata) -> Iterable[str]:
+        return stream_rows(rows=metadata, dialect=self.dialect)
+
+    def render_dataset_metadata_crates(self, metadata) -> Iterable[str]:
+        return stream_rows(rows=metadata, dialect=self.dialect)
+
+    def render_dataset_metadata_filesystem(self, metadata) -> Iterable[str]:
+        return stream_rows(rows=metadata, dialect=self.dialect)
+
+    def render_dataset_metadata_search_result(self, search_result) -> Iterable[str]:
+        return stream_rows(rows=search_result, dialect=self.dialect)
+
+    def render_device(self, device) -> str:
+        return render_rows(value=device, dialect=self.dialect)
+
+    def render_device_connections(self, connections) -> str:
+        return render_rows(value=connections, dialect=self.dialect)
+
+    def render_device_commands(self, commands) -> str:
+        return render_rows(value=commands, dialect=self.dialect)
+
+    def render_operations(self, operations) -> str:
+        return render_rows(value=operations, dialect=self.dialect)
+
+    def render_operation_progress(self, progress) -> str:
+        return render_rows(value=progress, dialect=self.dialect)
+
+    def render_backup_rules(self, rules) -> str:
+        return render_rows(value=rules, dialect=self.dialect)
+
+    def render_backup_specification_matched(self, state, spec) -> str:
+        return render_rows(value=spec, dialect=self.dialect)
+
+    def render_backup_specification_unmatched(self, spec) -> str:
+        return render_rows(value=spec, dialect=self.dialect)
+
+    def render_operation_response(self, response):
+        return render_rows(value=response, dialect=self.dialect)
+
+    def render_public_schedules(self, public_schedules) -> str:
+        return render_rows(value=public_schedules, dialect=self.dialect)
+
+    def render_configured_schedules(self, configured_schedules) -> str:
+        return render_rows(value=configured_schedules, dialect=self.dialect)
+
+    def render_user(self, user) -> str:
+        return render_rows(value=user, dialect=self.dialect)
+
+    def render_analytics_state(self, state) -> str:
+        return render_rows(value=state, dialect=self.dialect)
+
+    def render_metadata_cache_stats(self, stats) -> str:
+        return render_rows(value=stats, dialect=self.dialect)
+
+
+def stream_rows(rows, dialect='excel'):
+    """
+    Renders the provided, flattened, rows as delimiter-separated lines, as they are requested.
+
+    The first line is a header with the fields of the first row; nothing is rendered if there are no rows.
+
+    :param rows: rows to render
+    :param dialect: CSV dialect to use (ex: `excel` for CSV or `excel-tab` for TSV)
+    :return: generator of rendered lines
+    """
+    rows = iter(rows)
+    first = next(rows, None)
+
+    if first is None:
+        return
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, dialect=dialect, lineterminator='\n')
+
+    def render(values):
+        writer.writerow(values)
+        line = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate(0)
+        return line[:-1]
+
+    fields = list(first.keys())
+    yield render(fields)
+    yield render([first.get(field, None) for field in fields])
+
+    for row in rows:
+        yield render([row.get(field, None) for field in fields])
+
+
+def render_rows(value, dialect='excel'):
+    """
+    Renders the provided value as delimiter-separated lines; lists are rendered with one element per row.
+
+    :param value: value to render
+    :param dialect: CSV dialect to use (ex: `excel` for CSV or `excel-tab` for TSV)
+    :return: rendered string
+    """
+    rows = value if isinstance(value, list) else [value]
+    return '\n'.join(stream_rows(rows=map(_to_row, rows), dialect=dialect))
+
+
+def _to_row(value):
+    if isinstance(value, dict):
+        return {field: _to_cell(field_value) for field, field_value in value.items()}
+    else:
+        return {'value': _to_cell(value)}
+
+
+def _to_cell(value):
+    return json_codec.dumps(value) if isinstance(value, (dict, list)) else value
@@ -0,0 +1,119 @@
+"""Common functions for rendering flattened entries as tables."""
+
+import itertools
+import re
+from collections.abc import Sequence
+
+from terminaltables.width_and_alignment import visible_width
+
+
+def render_columns_as_table(rows, columns):
+    """
+    Renders the provided, flattened rows as a table.
+
+    Only the supported columns that are present in the rows are rendered, in the order of the rows' fields;
+    this allows rendering rows with only a subset of their fields (ex: when the `--fields` option is used).
+
+    :param rows: rows to render
+    :param columns: `field->(column-header, value-rendering-function)` mapping of all supported columns
+    :return: rendered table string
+    """
+    return '\n'.join(stream_columns_as_table(rows=rows, columns=columns))
+
+
+def stream_columns_as_table(rows, columns, sample_size=None):
+    """
+    Renders the provided, flattened rows as a table, one line at a time, without building the full table
+    (or all of its rendered cells) in memory.
+
+    The output is the same as the one produced by :func:`render_columns_as_table` (and by `AsciiTable`, including
+    cells spanning multiple lines, which are split across as many table lines); column widths are calculated
+    by a first pass over the rows, if they are provided as a sequence (ex: a list), or over a sample of
+    (at most) `sample_size` rows, otherwise. When widths are based on a sample, cells that are wider
+    than their column are not truncated and extend their row past the table's border.
+
+    :param rows: rows to render (sequence or iterable)
+    :param columns: `field->(column-header, value-rendering-function)` mapping of all supported columns
+    :param sample_size: maximum number of rows to use for calculating column widths (default is to use all rows,
+                        if they are provided as a sequence, or :const:`DEFAULT_SAMPLE_SIZE` rows, otherwise)
+    :return: generator of rendered table lines
+    """
+    if isinstance(rows, Sequence) and sample_size is None:
+        sample = rows
+        remaining = ()
+    else:
+        rows = iter(rows)
+        sample = list(itertools.islice(rows, sample_size or DEFAULT_SAMPLE_SIZE))
+        remaining = rows
+
+    if not sample:
+        yield 'No data'
+        return
+
+    fields = [field for field in sample[0] if field in columns]
+    renderers = [columns[field][1] for field in fields]
+    header = [columns[field][0] for field in fields]
+
+    widths = _column_widths(header=header, rows=sample, fields=fields, renderers=renderers)
+    border = '+{}+'.format('+'.join('-' * (width + 2) for width in widths))
+
+    def render_row(cells):
+        cells = [str(cell) for cell in cells]
+
+        if not any(LINE_BOUNDARY.search(cell) for cell in cells):
+            yield '| {} |'.format(' | '.join(_pad_cell(cell, width) for cell, width in zip(cells, widths)))
+        else:
+            cells = [_cell_lines(cell) for cell in cells]
+            height = max(len(lines) for lines in cells)
+            for i in range(height):
+                yield '| {} |'.format(
+                    ' | '.join(
+                        _pad_cell(lines[i] if i < len(lines) else '', width) for lines, width in zip(cells, widths)
+                    )
+                )
+
+    yield border
+    yield from render_row(header)
+    yield border
+
+    for row in itertools.chain(sample, remaining):
+        yield from render_row([render(row[field]) for field, render in zip(fields, renderers)])
+
+    yield border
+
+
+def _column_widths(header, rows, fields, renderers):
+    widths = [_cell_width(cell) for cell in header]
+
+    for row in rows:
+        for i, (field, render) in enumerate(zip(fields, renderers)):
+            width = _cell_width(str(render(row[field])))
+            if width > widths[i]:
+                widths[i] = width
+
+    return widths
+
+
+def _cell_width(cell):
+    if LINE_BOUNDARY.search(cell):
+        return max(map(_cell_width, _cell_lines(cell)))
+
+    return len(cell) if cell.isascii() else visible_width(cell)
+
+
+def _cell_lines(cell):
+    # same as `AsciiTable`: a trailing line break results in an additional, empty line
+    lines = cell.splitlines() or ['']
+    if cell.endswith('\n'):
+        lines.append('')
+
+    return lines
+
+
+def _pad_cell(cell, width):
+    return cell + ' ' * (width - _cell_width(cell))
+
+
+DEFAULT_SAMPLE_SIZE = 10000
+
+LINE_BOUNDARY = re.compile('[\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]')
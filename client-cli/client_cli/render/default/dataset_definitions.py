@@ -1,6 +1,6 @@
 """Utility functions for rendering dataset definitions."""
 
-from terminaltables import AsciiTable
+from client_cli.render.default import render_columns_as_table
 
 
 def render_as_table(definitions):
@@ -10,24 +10,14 @@ def render_as_table(definitions):
     :param definitions: definitions to render
     :return: rendered table string
     """
+    return render_columns_as_table(rows=definitions, columns=COLUMNS)
 
-    if definitions:
-        header = [['Definition', 'Info', 'Device', 'Copies', 'Keep Existing Versions', 'Keep Removed Versions']]
-        table = AsciiTable(
-            header + list(
-                map(
-                    lambda definition: [
-                        definition['definition'],
-                        definition['info'],
-                        definition['device'],
-                        definition['copies'],
-                        definition['existing_versions'],
-                        definition['removed_versions'],
-                    ],
-                    definitions
-                )
-            )
-        ).table
-        return table
-    else:
-        return 'No data'
+
+COLUMNS = {
+    'definition': ('Definition', lambda value: value),
+    'info': ('Info', lambda value: value),
+    'device': ('Device', lambda value: value),
+    'copies': ('Copies', lambda value: value),
+    'existing_versions': ('Keep Existing Versions', lambda value: value),
+    'removed_versions': ('Keep Removed Versions', lambda value: value),
+}
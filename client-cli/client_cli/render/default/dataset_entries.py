@@ -1,8 +1,7 @@
 """Utility functions for rendering dataset entries."""
 
-from terminaltables import AsciiTable
-
-from client_cli.render import timestamp_to_iso
+from client_cli.render import memory_size_to_str, timestamp_to_iso
+from client_cli.render.default import render_columns_as_table
 
 
 def render_as_table(entries):
@@ -12,27 +11,16 @@ def render_as_table(entries):
     :param entries: entries to render
     :return: rendered table string
     """
+    return render_columns_as_table(rows=entries, columns=COLUMNS)
 
-    if entries:
-        header = [['Entry', 'Definition', 'Device', 'Crates', 'Metadata', 'Changes', 'Size', 'Created']]
-        table = AsciiTable(
-            header + list(
-                map(
-                    lambda entry: [
-                        entry['entry'],
-                        entry['definition'],
-                        entry['device'],
-                        entry['crates'],
-                        entry['metadata'],
-                        entry['changes'] or '-',
-                        entry['size'] or '-',
-                        timestamp_to_iso(entry['created']),
-                    ],
-                    entries
-                )
-            )
-        ).table
 
-        return table
-    else:
-        return 'No data'
+COLUMNS = {
+    'entry': ('Entry', lambda value: value),
+    'definition': ('Definition', lambda value: value),
+    'device': ('Device', lambda value: value),
+    'crates': ('Crates', lambda value: value),
+    'metadata': ('Metadata', lambda value: value),
+    'changes': ('Changes', lambda value: value or '-'),
+    'size': ('Size', lambda value: memory_size_to_str(value) if value else '-'),
+    'created': ('Created', timestamp_to_iso),
+}
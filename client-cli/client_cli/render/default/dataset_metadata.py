@@ -1,8 +1,7 @@
 """Utility functions for rendering dataset metadata and search results."""
 
-from terminaltables import AsciiTable
-
-from client_cli.render import timestamp_to_iso
+from client_cli.render import memory_size_to_str, timestamp_to_iso
+from client_cli.render.default import render_columns_as_table
 
 
 def render_changes_as_table(metadata):
@@ -12,54 +11,7 @@ def render_changes_as_table(metadata):
     :param metadata: metadata to render
     :return: rendered table string
     """
-
-    if metadata:
-        header = [
-            [
-                'Changed',
-                'Type',
-                'Entity',
-                'Size',
-                'Link',
-                'Hidden?',
-                'Created',
-                'Updated',
-                'Owner',
-                'Group',
-                'Permissions',
-                'Checksum',
-                'Crates',
-                'Compression'
-            ]
-        ]
-
-        table = AsciiTable(
-            header + list(
-                map(
-                    lambda entity_metadata: [
-                        entity_metadata['changed'],
-                        entity_metadata['type'],
-                        entity_metadata['entity'],
-                        entity_metadata['size'],
-                        entity_metadata['link'],
-                        entity_metadata['hidden'],
-                        timestamp_to_iso(entity_metadata['created']),
-                        timestamp_to_iso(entity_metadata['updated']),
-                        entity_metadata['owner'],
-                        entity_metadata['group'],
-                        entity_metadata['permissions'],
-                        entity_metadata['checksum'],
-                        entity_metadata['crates'],
-                        entity_metadata['compression'],
-                    ],
-                    metadata
-                )
-            )
-        ).table
-
-        return table
-    else:
-        return 'No data'
+    return render_columns_as_table(rows=metadata, columns=CHANGES_COLUMNS)
 
 
 def render_filesystem_as_table(metadata):
@@ -69,25 +21,7 @@ def render_filesystem_as_table(metadata):
     :param metadata: metadata to render
     :return: rendered table string
     """
-
-    if metadata:
-        header = [['Entity', 'State', 'Entry']]
-        table = AsciiTable(
-            header + list(
-                map(
-                    lambda entity: [
-                        entity['entity'],
-                        entity['state'],
-                        entity['entry'],
-                    ],
-                    metadata
-                )
-            )
-        ).table
-
-        return table
-    else:
-        return 'No data'
+    return render_columns_as_table(rows=metadata, columns=FILESYSTEM_COLUMNS)
 
 
 def render_crates_as_table(metadata):
@@ -97,32 +31,7 @@ def render_crates_as_table(metadata):
     :param metadata: metadata to render
     :return: rendered table string
     """
-
-    if metadata:
-        header = [
-            [
-                'Entity',
-                'Part',
-                'Crate'
-            ]
-        ]
-
-        table = AsciiTable(
-            header + list(
-                map(
-                    lambda crate_metadata: [
-                        crate_metadata['entity'],
-                        crate_metadata['part'],
-                        crate_metadata['crate'],
-                    ],
-                    metadata
-                )
-            )
-        ).table
-
-        return table
-    else:
-        return 'No data'
+    return render_columns_as_table(rows=metadata, columns=CRATES_COLUMNS)
 
 
 def render_search_result_as_table(search_result):
@@ -132,25 +41,42 @@ def render_search_result_as_table(search_result):
     :param search_result: result to render
     :return: rendered table string
     """
-
-    if search_result:
-        header = [['Definition', 'Info', 'Matched Entity', 'Entity State', 'Entry (Created)']]
-        table = AsciiTable(
-            header + list(
-                map(
-                    lambda result_entry: [
-                        result_entry['definition'],
-                        result_entry['info'],
-                        result_entry['entity'],
-                        result_entry['state'],
-                        result_entry['entry']
-                    ],
-                    search_result
-                )
-
-            )
-        ).table
-
-        return table
-    else:
-        return 'No data'
+    return render_columns_as_table(rows=search_result, columns=SEARCH_RESULT_COLUMNS)
+
+
+CHANGES_COLUMNS = {
+    'changed': ('Changed', lambda value: value),
+    'type': ('Type', lambda value: value),
+    'entity': ('Entity', lambda value: value),
+    'size': ('Size', memory_size_to_str),
+    'link': ('Link', lambda value: value),
+    'hidden': ('Hidden?', lambda value: value),
+    'created': ('Created', timestamp_to_iso),
+    'updated': ('Updated', timestamp_to_iso),
+    'owner': ('Owner', lambda value: value),
+    'group': ('Group', lambda value: value),
+    'permissions': ('Permissions', lambda value: value),
+    'checksum': ('Checksum', lambda value: value),
+    'crates': ('Crates', lambda value: value),
+    'compression': ('Compression', lambda value: value),
+}
+
+FILESYSTEM_COLUMNS = {
+    'entity': ('Entity', lambda value: value),
+    'state': ('State', lambda value: value),
+    'entry': ('Entry', lambda value: value),
+}
+
+CRATES_COLUMNS = {
+    'entity': ('Entity', lambda value: value),
+    'part': ('Part', lambda value: value),
+    'crate': ('Crate', lambda value: value),
+}
+
+SEARCH_RESULT_COLUMNS = {
+    'definition': ('Definition', lambda value: value),
+    'info': ('Info', lambda value: value),
+    'entity': ('Matched Entity', lambda value: value),
+    'state': ('Entity State', lambda value: value),
+    'entry': ('Entry (Created)', lambda value: value),
+}
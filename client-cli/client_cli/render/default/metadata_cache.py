@@ -0,0 +1,27 @@
+"""Utility functions for rendering the local metadata cache state."""
+
+from client_cli.render import memory_size_to_str
+
+
+def render(stats):
+    """
+    Renders the provided metadata cache stats.
+
+    :param stats: stats to render
+    :return: rendered string
+    """
+    return '\n'.join(
+        [
+            'Metadata Cache:',
+            '   location: {}'.format(stats['path']),
+            '   enabled:  {}'.format('yes' if stats['enabled'] else 'no'),
+            '   entries:  {}'.format(stats['entries']),
+            '   size:     {} (max: {}; file: {})'.format(
+                memory_size_to_str(stats['size']),
+                memory_size_to_str(stats['max_size']),
+                memory_size_to_str(stats['file_size'])
+            ),
+            '   hits:     {}'.format(stats['hits']),
+            '   misses:   {}'.format(stats['misses']),
+        ]
+    )
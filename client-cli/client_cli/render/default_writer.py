@@ -1,12 +1,16 @@
 """Table-based :class:`Writer`."""
 
+from typing import Iterable
+
 from client_cli.render.default import (
+    stream_columns_as_table,
     analytics,
     backup_rules,
     dataset_definitions,
     dataset_entries,
     dataset_metadata,
     devices,
+    metadata_cache,
     operations as ops,
     schedules,
     users
@@ -15,25 +19,30 @@ from client_cli.render.writer import Writer
 
 
 class DefaultWriter(Writer):
-    """Table-based :class:`Writer`."""
+    """
+    Table-based :class:`Writer`.
+
+    Dataset definitions, entries, metadata and search results are rendered as streamed tables
+    (see :func:`client_cli.render.default.stream_columns_as_table`).
+    """
 
-    def render_dataset_definitions(self, definitions) -> str:
-        return dataset_definitions.render_as_table(definitions)
+    def render_dataset_definitions(self, definitions) -> Iterable[str]:
+        return stream_columns_as_table(rows=definitions, columns=dataset_definitions.COLUMNS)
 
-    def render_dataset_entries(self, entries) -> str:
-        return dataset_entries.render_as_table(entries)
+    def render_dataset_entries(self, entries) -> Iterable[str]:
+        return stream_columns_as_table(rows=entries, columns=dataset_entries.COLUMNS)
 
-    def render_dataset_metadata_changes(self, metadata) -> str:
-        return dataset_metadata.render_changes_as_table(metadata)
+    def render_dataset_metadata_changes(self, metadata) -> Iterable[str]:
+        return stream_columns_as_table(rows=metadata, columns=dataset_metadata.CHANGES_COLUMNS)
 
-    def render_dataset_metadata_crates(self, metadata) -> str:
-        return dataset_metadata.render_crates_as_table(metadata)
+    def render_dataset_metadata_crates(self, metadata) -> Iterable[str]:
+        return stream_columns_as_table(rows=metadata, columns=dataset_metadata.CRATES_COLUMNS)
 
-    def render_dataset_metadata_filesystem(self, metadata) -> str:
-        return dataset_metadata.render_filesystem_as_table(metadata)
+    def render_dataset_metadata_filesystem(self, metadata) -> Iterable[str]:
+        return stream_columns_as_table(rows=metadata, columns=dataset_metadata.FILESYSTEM_COLUMNS)
 
-    def render_dataset_metadata_search_result(self, search_result) -> str:
-        return dataset_metadata.render_search_result_as_table(search_result)
+    def render_dataset_metadata_search_result(self, search_result) -> Iterable[str]:
+        return stream_columns_as_table(rows=search_result, columns=dataset_metadata.SEARCH_RESULT_COLUMNS)
 
     def render_device(self, device) -> str:
         return devices.render(device)
@@ -73,3 +82,6 @@ class DefaultWriter(Writer):
 
     def render_analytics_state(self, state) -> str:
         return analytics.render(state)
+
+    def render_metadata_cache_stats(self, stats) -> str:
+        return metadata_cache.render(stats)
@@ -0,0 +1,12 @@
+"""Common functions for flattening entries retrieved by the CLI."""
+
+
+def extract_fields(item, extractors):
+    """
+    Flattens the provided item into a `field->field-value` dict by applying each of the provided extractors to it.
+
+    :param item: item to flatten
+    :param extractors: `field->extractor-function` mapping
+    :return: the flattened item
+    """
+    return {field: extractor(item) for field, extractor in extractors.items()}
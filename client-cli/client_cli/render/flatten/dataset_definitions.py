@@ -1,6 +1,7 @@
 """Utility functions for flattening dataset definitions."""
 
 from client_cli.render import duration_to_str
+from client_cli.render.flatten import extract_fields
 
 
 def get_spec():
@@ -26,6 +27,23 @@ def get_spec():
     }
 
 
+def get_extractors():
+    """
+    Retrieves the functions for extracting the (flattened) dataset definition fields from raw dataset definitions.
+
+    :return: the `field->extractor-function` mapping
+    """
+
+    return {
+        'definition': lambda definition: definition['id'],
+        'info': lambda definition: definition['info'],
+        'device': lambda definition: definition['device'],
+        'copies': lambda definition: definition['redundant_copies'],
+        'existing_versions': lambda definition: transform_retention(definition['existing_versions']),
+        'removed_versions': lambda definition: transform_retention(definition['removed_versions']),
+    }
+
+
 def flatten(definitions):
     """
     Converts all nested objects from the provided dataset definitions into non-nested `field->field-value` dicts.
@@ -35,19 +53,8 @@ def flatten(definitions):
     :param definitions: definitions to flatten
     :return: the flattened definitions
     """
-    return list(
-        map(
-            lambda definition: {
-                'definition': definition['id'],
-                'info': definition['info'],
-                'device': definition['device'],
-                'copies': definition['redundant_copies'],
-                'existing_versions': transform_retention(definition['existing_versions']),
-                'removed_versions': transform_retention(definition['removed_versions']),
-            },
-            definitions
-        )
-    )
+    extractors = get_extractors()
+    return list(map(lambda definition: extract_fields(definition, extractors), definitions))
 
 
 def transform_retention(retention) -> str:
@@ -1,5 +1,6 @@
 """Utility functions for flattening dataset entries."""
-from client_cli.render import memory_size_to_str
+
+from client_cli.render.flatten import extract_fields
 
 
 def get_spec():
@@ -27,27 +28,34 @@ def get_spec():
     }
 
 
+def get_extractors():
+    """
+    Retrieves the functions for extracting the (flattened) dataset entry fields from raw dataset entries.
+
+    :return: the `field->extractor-function` mapping
+    """
+
+    return {
+        'entry': lambda entry: entry['id'],
+        'definition': lambda entry: entry['definition'],
+        'device': lambda entry: entry['device'],
+        'crates': lambda entry: len(entry['data']),
+        'metadata': lambda entry: entry['metadata'],
+        'changes': lambda entry: entry.get('changes'),
+        'size': lambda entry: entry.get('size'),
+        'created': lambda entry: entry['created'],
+    }
+
+
 def flatten(entries):
     """
     Converts all nested objects from the provided dataset entries into non-nested `field->field-value` dicts.
 
-    Raw values (such as memory size, timestamps and durations) are transformed into easy-to-read values.
+    Raw values (such as memory size, timestamps and durations) are kept as-is, so that they can be filtered
+    and sorted directly; transforming them into easy-to-read values is left to the renderers.
 
     :param entries: entries to flatten
     :return: the flattened entries
     """
-    return list(
-        map(
-            lambda entry: {
-                'entry': entry['id'],
-                'definition': entry['definition'],
-                'device': entry['device'],
-                'crates': len(entry['data']),
-                'metadata': entry['metadata'],
-                'changes': entry.get('changes'),
-                'size': memory_size_to_str(entry.get('size')) if entry.get('size') else None,
-                'created': entry['created'],
-            },
-            entries
-        )
-    )
+    extractors = get_extractors()
+    return list(map(lambda entry: extract_fields(entry, extractors), entries))
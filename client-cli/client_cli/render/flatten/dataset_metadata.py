@@ -2,7 +2,8 @@
 
 import itertools
 
-from client_cli.render import memory_size_to_str
+from client_cli import json_stream
+from client_cli.render.flatten import extract_fields
 
 
 def get_spec_changes():
@@ -36,40 +37,66 @@ def get_spec_changes():
     }
 
 
+def get_extractors_changes():
+    """
+    Retrieves the functions for extracting the (flattened) metadata changes fields from the items
+    provided by :func:`changes`.
+
+    :return: the `field->extractor-function` mapping
+    """
+
+    return {
+        'changed': lambda item: item[0],
+        'type': lambda item: item[1]['entity_type'],
+        'entity': lambda item: item[1]['path'],
+        'size': lambda item: item[1].get('size', 0),
+        'link': lambda item: item[1].get('link', 'none'),
+        'hidden': lambda item: 'yes' if item[1]['is_hidden'] else 'no',
+        'created': lambda item: item[1]['created'],
+        'updated': lambda item: item[1]['updated'],
+        'owner': lambda item: item[1]['owner'],
+        'group': lambda item: item[1]['group'],
+        'permissions': lambda item: item[1]['permissions'],
+        'checksum': lambda item: item[1].get('checksum', 0),
+        'crates': lambda item: len(item[1].get('crates', {})),
+        'compression': lambda item: item[1].get('compression', '-'),
+    }
+
+
+def changes(metadata):
+    """
+    Retrieves all file content and entity metadata changes from the provided metadata, as `(changed, entity)` items.
+
+    :param metadata: metadata to process
+    :return: iterator of metadata changes
+    """
+    return stream_changes(json_stream.document_items(document=metadata, subtrees=SUBTREES_CHANGES))
+
+
+def stream_changes(items):
+    """
+    Retrieves all file content and entity metadata changes, as `(changed, entity)` items, from the provided
+    metadata subtree items (see :const:`SUBTREES_CHANGES` and :func:`client_cli.json_stream.iter_items`).
+
+    :param items: `(subtree, path, entity)` items to process
+    :return: iterator of metadata changes
+    """
+    return map(lambda item: ('content' if item[0] == 'content_changed' else 'metadata', item[2]), items)
+
+
 def flatten_changes(metadata):
     """
     Converts all nested objects from the provided metadata into non-nested `field->field-value` dicts
     representing file content and entity metadata changes.
 
-    Raw values (such as memory size, timestamps and durations) are transformed into easy-to-read values.
+    Raw values (such as memory size, timestamps and durations) are kept as-is, so that they can be filtered
+    and sorted directly; transforming them into easy-to-read values is left to the renderers.
 
     :param metadata: metadata to flatten
     :return: the flattened metadata
     """
-    content_changed = list(map(lambda meta: dict(meta, changed='content'), metadata['content_changed'].values()))
-    metadata_changed = list(map(lambda meta: dict(meta, changed='metadata'), metadata['metadata_changed'].values()))
-
-    return list(
-        map(
-            lambda entity_metadata: {
-                'changed': entity_metadata['changed'],
-                'type': entity_metadata['entity_type'],
-                'entity': entity_metadata['path'],
-                'size': memory_size_to_str(entity_metadata.get('size', 0)),
-                'link': entity_metadata.get('link', 'none'),
-                'hidden': 'yes' if entity_metadata['is_hidden'] else 'no',
-                'created': entity_metadata['created'],
-                'updated': entity_metadata['updated'],
-                'owner': entity_metadata['owner'],
-                'group': entity_metadata['group'],
-                'permissions': entity_metadata['permissions'],
-                'checksum': entity_metadata.get('checksum', 0),
-                'crates': len(entity_metadata.get('crates', {})),
-                'compression': entity_metadata.get('compression', '-'),
-            },
-            content_changed + metadata_changed
-        )
-    )
+    extractors = get_extractors_changes()
+    return list(map(lambda item: extract_fields(item, extractors), changes(metadata)))
 
 
 def get_spec_crates():
@@ -92,6 +119,50 @@ def get_spec_crates():
     }
 
 
+def get_extractors_crates():
+    """
+    Retrieves the functions for extracting the (flattened) crates metadata fields from the items
+    provided by :func:`crates`.
+
+    :return: the `field->extractor-function` mapping
+    """
+
+    return {
+        'entity': lambda item: item[0]['path'],
+        'part': lambda item: item[1][0],
+        'crate': lambda item: item[1][1],
+    }
+
+
+def crates(metadata):
+    """
+    Retrieves all entity crates from the provided metadata, as `(entity, (part, crate))` items.
+
+    :param metadata: metadata to process
+    :return: iterator of entity crates
+    """
+    return stream_crates(json_stream.document_items(document=metadata, subtrees=SUBTREES_CRATES))
+
+
+def stream_crates(items):
+    """
+    Retrieves all entity crates, as `(entity, (part, crate))` items, from the provided metadata
+    subtree items (see :const:`SUBTREES_CRATES` and :func:`client_cli.json_stream.iter_items`).
+
+    :param items: `(subtree, path, entity)` items to process
+    :return: iterator of entity crates
+    """
+    return itertools.chain.from_iterable(
+        map(
+            lambda item: map(
+                lambda entry: (item[2], entry),
+                item[2].get('crates', {}).items()
+            ),
+            items
+        )
+    )
+
+
 def flatten_crates(metadata):
     """
     Converts all nested objects from the provided metadata into non-nested `field->field-value` dicts
@@ -102,23 +173,8 @@ def flatten_crates(metadata):
     :param metadata: metadata to flatten
     :return: the flattened metadata
     """
-    content_changed = list(metadata['content_changed'].values())
-
-    return list(
-        itertools.chain.from_iterable(
-            map(
-                lambda entity_metadata: map(
-                    lambda entry: {
-                        'entity': entity_metadata['path'],
-                        'part': entry[0],
-                        'crate': entry[1],
-                    },
-                    entity_metadata.get('crates', {}).items()
-                ),
-                content_changed
-            )
-        )
-    )
+    extractors = get_extractors_crates()
+    return list(map(lambda item: extract_fields(item, extractors), crates(metadata)))
 
 
 def get_spec_filesystem():
@@ -141,6 +197,43 @@ def get_spec_filesystem():
     }
 
 
+def get_extractors_filesystem(entry):
+    """
+    Retrieves the functions for extracting the (flattened) filesystem metadata fields from the items
+    provided by :func:`filesystem`.
+
+    :param entry: entry associated with the metadata
+    :return: the `field->extractor-function` mapping
+    """
+
+    return {
+        'entity': lambda item: item[0],
+        'state': lambda item: item[1]['entity_state'],
+        'entry': lambda item: item[1].get('entry', '{} <current>'.format(entry)),
+    }
+
+
+def filesystem(metadata):
+    """
+    Retrieves all filesystem entities from the provided metadata, as `(path, state)` items.
+
+    :param metadata: metadata to process
+    :return: iterator of filesystem entities
+    """
+    return stream_filesystem(json_stream.document_items(document=metadata, subtrees=SUBTREES_FILESYSTEM))
+
+
+def stream_filesystem(items):
+    """
+    Retrieves all filesystem entities, as `(path, state)` items, from the provided metadata
+    subtree items (see :const:`SUBTREES_FILESYSTEM` and :func:`client_cli.json_stream.iter_items`).
+
+    :param items: `(subtree, path, state)` items to process
+    :return: iterator of filesystem entities
+    """
+    return map(lambda item: (item[1], item[2]), items)
+
+
 def flatten_filesystem(entry, metadata):
     """
     Converts all nested objects from the provided metadata into non-nested `field->field-value` dicts
@@ -152,16 +245,8 @@ def flatten_filesystem(entry, metadata):
     :param metadata: metadata to flatten
     :return: the flattened metadata
     """
-    return list(
-        map(
-            lambda entity: {
-                'entity': entity[0],
-                'state': entity[1]['entity_state'],
-                'entry': entity[1].get('entry', '{} <current>'.format(entry)),
-            },
-            metadata['filesystem']['entities'].items()
-        )
-    )
+    extractors = get_extractors_filesystem(entry)
+    return list(map(lambda item: extract_fields(item, extractors), filesystem(metadata)))
 
 
 def get_spec_search_result():
@@ -196,14 +281,25 @@ def flatten_search_result(search_result):
     :return: the flattened result
     """
     return list(
-        itertools.chain.from_iterable(
-            map(
-                lambda result_entry: transform_definition_result(
-                    definition_id=result_entry[0],
-                    definition_result=result_entry[1]
-                ),
-                search_result['definitions'].items()
-            )
+        stream_search_result(json_stream.document_items(document=search_result, subtrees=SUBTREES_SEARCH_RESULT))
+    )
+
+
+def stream_search_result(items):
+    """
+    Converts the provided search result subtree items (see :const:`SUBTREES_SEARCH_RESULT` and
+    :func:`client_cli.json_stream.iter_items`) into non-nested `field->field-value` dicts, one definition at a time.
+
+    :param items: `(subtree, definition, definition-result)` items to process
+    :return: iterator of flattened results
+    """
+    return itertools.chain.from_iterable(
+        map(
+            lambda item: transform_definition_result(
+                definition_id=item[1],
+                definition_result=item[2]
+            ),
+            items
         )
     )
 
@@ -260,3 +356,12 @@ def transform_search_result_match(definition_id, definition_result, path, state)
         'state': state['entity_state'],
         'entry': entry,
     }
+
+
+SUBTREES_CHANGES = ['content_changed', 'metadata_changed']
+
+SUBTREES_CRATES = ['content_changed']
+
+SUBTREES_FILESYSTEM = ['filesystem.entities']
+
+SUBTREES_SEARCH_RESULT = ['definitions']
@@ -0,0 +1,107 @@
+"""Newline-delimited JSON (NDJSON) :class:`Writer`."""
+
+from typing import Iterable
+
+from client_cli import json_codec
+from client_cli.render.writer import Writer
+
+
+class NdjsonWriter(Writer):
+    """
+    Newline-delimited JSON (NDJSON) :class:`Writer`.
+
+    Lists are rendered as one compact JSON object per line (ex: one line per flattened dataset entry or entity);
+    all other responses are rendered as a single compact JSON line.
+
+    Dataset definitions, entries, metadata and search results are rendered lazily, one line at a time
+    (see :func:`client_cli.cli.echo_rendered`).
+    """
+
+    @property
+    def is_machine_readable(self) -> bool:
+        return True
+
+    def render_dataset_definitions(self, definitions) -> Iterable[str]:
+        return stream_lines(definitions)
+
+    def render_dataset_entries(self, entries) -> Iterable[str]:
+        return stream_lines(entries)
+
+    def render_dataset_metadata_changes(self, metadata) -> Iterable[str]:
+        return stream_lines(metadata)
+
+    def render_dataset_metadata_crates(self, metadata) -> Iterable[str]:
+        return stream_lines(metadata)
+
+    def render_dataset_metadata_filesystem(self, metadata) -> Iterable[str]:
+        return stream_lines(metadata)
+
+    def render_dataset_metadata_search_result(self, search_result) -> Iterable[str]:
+        return stream_lines(search_result)
+
+    def render_device(self, device) -> str:
+        return render_lines(device)
+
+    def render_device_connections(self, connections) -> str:
+        return render_lines(connections)
+
+    def render_device_commands(self, commands) -> str:
+        return render_lines(commands)
+
+    def render_operations(self, operations) -> str:
+        return render_lines(operations)
+
+    def render_operation_progress(self, progress) -> str:
+        return render_lines(progress)
+
+    def render_backup_rules(self, rules) -> str:
+        return render_lines(rules)
+
+    def render_backup_specification_matched(self, state, spec) -> str:
+        return render_lines(spec)
+
+    def render_backup_specification_unmatched(self, spec) -> str:
+        return render_lines(spec)
+
+    def render_operation_response(self, response):
+        return render_lines(response)
+
+    def render_public_schedules(self, public_schedules) -> str:
+        return render_lines(public_schedules)
+
+    def render_configured_schedules(self, configured_schedules) -> str:
+        return render_lines(configured_schedules)
+
+    def render_user(self, user) -> str:
+        return render_lines(user)
+
+    def render_analytics_state(self, state) -> str:
+        return render_lines(state)
+
+    def render_metadata_cache_stats(self, stats) -> str:
+        return render_lines(stats)
+
+
+def stream_lines(entries):
+    """
+    Renders each of the provided entries as a compact JSON line, as they are requested.
+
+    :param entries: entries to render
+    :return: generator of rendered lines
+    """
+    dumps = json_codec.dumps
+    for entry in entries:
+        yield dumps(entry)
+
+
+def render_lines(value):
+    """
+    Renders the provided value as compact JSON; lists are rendered with one element per line.
+
+    :param value: value to render
+    :return: rendered string
+    """
+    if isinstance(value, list):
+        return '\n'.join(stream_lines(value))
+    else:
+        return json_codec.dumps(value)
@@ -1,63 +1,79 @@
 """Interface for rendering data retrieved by a client frontend (this CLI)."""
 
 from abc import ABC, abstractmethod
+from typing import Iterable
 
 
 class Writer(ABC):
-    """Interface for rendering data retrieved by a client frontend (this CLI)."""
+    """
+    Interface for rendering data retrieved by a client frontend (this CLI).
+
+    Renderers for potentially large results (dataset definitions, entries, metadata and search results) can
+    provide their output either as a string or as an iterable of lines (see :func:`client_cli.cli.echo_rendered`).
+    """
+
+    @property
+    def is_machine_readable(self) -> bool:
+        """
+        Checks if the rendered output is meant to be processed by other tools (ex: JSON, NDJSON, CSV/TSV),
+        in which case no prompts, progress bars or raw process output should be mixed with it.
+
+        :return: True, if the rendered output is machine-readable
+        """
+        return False
 
     @abstractmethod
-    def render_dataset_definitions(self, definitions) -> str:
+    def render_dataset_definitions(self, definitions) -> str | Iterable[str]:
         """
         Renders the provided dataset definitions.
 
         :param definitions: definitions to render
-        :return: render result, as a string
+        :return: render result, as a string or as an iterable of lines
         """
 
     @abstractmethod
-    def render_dataset_entries(self, entries) -> str:
+    def render_dataset_entries(self, entries) -> str | Iterable[str]:
         """
         Renders the provided dataset entries.
 
         :param entries: entries to render
-        :return: render result, as a string
+        :return: render result, as a string or as an iterable of lines
         """
 
     @abstractmethod
-    def render_dataset_metadata_changes(self, metadata) -> str:
+    def render_dataset_metadata_changes(self, metadata) -> str | Iterable[str]:
         """
         Renders the provided changes metadata.
 
         :param metadata: metadata to render
-        :return: render result, as a string
+        :return: render result, as a string or as an iterable of lines
         """
 
     @abstractmethod
-    def render_dataset_metadata_crates(self, metadata) -> str:
+    def render_dataset_metadata_crates(self, metadata) -> str | Iterable[str]:
         """
         Renders the provided crates metadata.
 
         :param metadata: metadata to render
-        :return: render result, as a string
+        :return: render result, as a string or as an iterable of lines
         """
 
     @abstractmethod
-    def render_dataset_metadata_filesystem(self, metadata) -> str:
+    def render_dataset_metadata_filesystem(self, metadata) -> str | Iterable[str]:
         """
         Renders the provided filesystem metadata.
 
         :param metadata: metadata to render
-        :return: render result, as a string
+        :return: render result, as a string or as an iterable of lines
         """
 
     @abstractmethod
-    def render_dataset_metadata_search_result(self, search_result) -> str:
+    def render_dataset_metadata_search_result(self, search_result) -> str | Iterable[str]:
         """
         Renders the provided metadata search result.
 
         :param search_result: result to render
-        :return: render result, as a string
+        :return: render result, as a string or as an iterable of lines
         """
 
     @abstractmethod
@@ -177,3 +193,12 @@ class Writer(ABC):
         :param state: analytics state to render
         :return: render result, as a string
         """
+
+    @abstractmethod
+    def render_metadata_cache_stats(self, stats) -> str:
+        """
+        Renders the provided (local) metadata cache stats.
+
+        :param stats: metadata cache stats to render
+        :return: render result, as a string
+        """
@@ -18,7 +18,8 @@ tests_lint_result = subprocess.run(
     [
         'pylint',
         '--disable=missing-function-docstring,missing-class-docstring,missing-module-docstring,too-many-arguments,too-many-statements',
-        '{}/tests'.format(client_cli_path)
+        '{}/tests'.format(client_cli_path),
+        '{}/benchmarks'.format(client_cli_path)
     ]
 ).returncode
 print('>: Tests linting finished with exit code [{}]'.format(tests_lint_result))
@@ -7,7 +7,6 @@ install_requires = [
     'hurry.filesize==0.9',
     'pyhocon==0.3.61',
     'click==8.3.0',
-    'pyparsing==3.2.5',
     'psutil==7.1.3',
     'cryptography==46.0.7',
     'sseclient-py==1.8.0',
@@ -15,6 +14,13 @@ install_requires = [
     'pexpect==4.9.0'
 ]
 
+extras_require = {
+    'async': ['httpx[http2]==0.28.1'],
+    'arrow': ['pyarrow==26.0.0'],
+    'fast-json': ['orjson==3.11.5'],
+    'streaming': ['ijson==3.6.0'],
+}
+
 tests_require = []
 
 setup(
@@ -23,6 +29,7 @@ setup(
     url='https://github.com/sndnv/stasis',
     version='1.7.6+SNAPSHOT',
     install_requires=install_requires,
+    extras_require=extras_require,
     tests_require=tests_require,
     packages=find_packages(),
     entry_points={
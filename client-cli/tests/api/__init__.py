@@ -1,13 +1,21 @@
+import hashlib
+import io
 import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from json import JSONDecodeError
 
+from tests.mocks import mock_data
+
 
 class MockResponse:
     def __init__(self, status_code, response):
         self.status_code = status_code
         self.response = response
         self.text = str(response)
+        self.headers = {}
         self.closed = False
+        self._raw = None
 
     @staticmethod
     def success(response=None):
@@ -38,7 +46,14 @@ class MockResponse:
 
     @property
     def content(self) -> str:
-        return json.dumps(self.response) if self.response else ''
+        return json.dumps(self.response, default=str) if self.response else ''
+
+    @property
+    def raw(self) -> io.BytesIO:
+        if self._raw is None:
+            self._raw = io.BytesIO(self.content.encode('utf-8'))
+
+        return self._raw
 
     def json(self):
         if self.response is not None:
@@ -51,3 +66,102 @@ class MockResponse:
 
     def close(self):
         self.closed = True
+
+
+class StubServer:
+    """Local HTTP/1.1 server responding to all requests with a ping response and counting new connections."""
+
+    def __init__(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            disable_nagle_algorithm = True
+
+            def setup(self):
+                super().setup()
+                stub.connections += 1
+
+            def do_GET(self):  # pylint: disable=invalid-name
+                self.rfile.read(int(self.headers.get('Content-Length', 0)))
+                content = json.dumps(mock_data.PING).encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+                pass
+
+        self.connections = 0
+        self.server = ThreadingHTTPServer(('localhost', 0), Handler)
+        self.server.daemon_threads = True
+        self.url = 'http://localhost:{}'.format(self.server.server_address[1])
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class ConditionalStubServer:
+    """
+    Local HTTP/1.1 stand-in for the client API, responding to `GET` requests with the JSON content configured
+    for their path, with an `ETag`, and with `304 Not Modified` if the content matches `If-None-Match`.
+    """
+
+    def __init__(self, contents):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            disable_nagle_algorithm = True
+
+            def do_GET(self):  # pylint: disable=invalid-name
+                self.rfile.read(int(self.headers.get('Content-Length', 0)))
+                content = stub.contents[self.path]
+                etag = '"{}"'.format(hashlib.sha256(content).hexdigest())
+
+                if self.headers.get('If-None-Match', None) == etag:
+                    stub.not_modified += 1
+                    self.send_response(304)
+                    self.send_header('ETag', etag)
+                    self.end_headers()
+                else:
+                    stub.full += 1
+                    self.send_response(200)
+                    self.send_header('Content-Type', 'application/json')
+                    self.send_header('Content-Length', str(len(content)))
+                    self.send_header('ETag', etag)
+                    self.end_headers()
+                    self.wfile.write(content)
+
+            def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+                pass
+
+        self.contents = {}
+        for path, content in contents.items():
+            self.update(path, content)
+
+        self.full = 0
+        self.not_modified = 0
+        self.server = ThreadingHTTPServer(('localhost', 0), Handler)
+        self.server.daemon_threads = True
+        self.url = 'http://localhost:{}'.format(self.server.server_address[1])
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def update(self, path, content):
+        self.contents[path] = json.dumps(content).encode('utf-8')
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.server.shutdown()
+        self.server.server_close()
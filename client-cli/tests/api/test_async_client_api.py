@@ -0,0 +1,195 @@
+import asyncio
+import json
+import ssl
+import unittest
+from uuid import uuid4
+
+import certifi
+from click import Abort
+
+from client_cli.api.endpoint_context import DefaultHttpsContext
+
+try:
+    import httpx
+    from client_cli.api.async_client_api import AsyncClientApi  # pylint: disable=ungrouped-imports
+except ImportError:
+    httpx = None
+
+from tests.mocks import mock_data  # pylint: disable=wrong-import-position
+
+
+@unittest.skipIf(httpx is None, 'httpx is not available')
+class AsyncClientApiSpec(unittest.IsolatedAsyncioTestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.url = 'http://localhost:9999'
+        cls.token = 'test-token'
+
+    def create_client(self, responses):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            status_code, content = responses.get((request.method, request.url.path), (404, None))
+            if isinstance(content, bytes):
+                return httpx.Response(status_code=status_code, content=content)
+            else:
+                return httpx.Response(status_code=status_code, json=content)
+
+        client = AsyncClientApi(
+            api_url=self.url,
+            api_token=self.token,
+            context=DefaultHttpsContext(verify=False),
+            timeout=10,
+            transport=httpx.MockTransport(handler)
+        )
+
+        return client, requests
+
+    async def test_should_check_if_api_is_active(self):
+        client, requests = self.create_client(responses={('GET', '/service/ping'): (200, mock_data.PING)})
+
+        self.assertTrue(await client.is_active())
+        self.assertEqual(len(requests), 1)
+        self.assertEqual(requests[0].headers['Authorization'], 'Bearer {}'.format(self.token))
+
+        client, _ = self.create_client(responses={('GET', '/service/ping'): (500, {})})
+        self.assertFalse(await client.is_active())
+
+        await client.aclose()
+
+    async def test_should_send_service_termination_requests(self):
+        client, _ = self.create_client(responses={('PUT', '/service/stop'): (200, {})})
+        self.assertDictEqual(await client.stop(), {'successful': True, 'operation': None})
+
+        client, _ = self.create_client(responses={('PUT', '/service/stop'): (500, {})})
+        self.assertDictEqual(await client.stop(), {'successful': False})
+
+    async def test_should_get_resources(self):
+        entry = uuid4()
+        definition = uuid4()
+
+        client, requests = self.create_client(
+            responses={
+                ('GET', '/datasets/metadata/{}'.format(entry)): (200, mock_data.METADATA),
+                ('GET', '/datasets/metadata/search'): (200, mock_data.METADATA_SEARCH_RESULTS),
+                ('GET', '/datasets/definitions'): (200, mock_data.DEFINITIONS),
+                ('GET', '/datasets/entries'): (200, mock_data.ENTRIES),
+                ('GET', '/datasets/entries/for-definition/{}'.format(definition)): (200, mock_data.ENTRIES),
+                ('GET', '/user'): (200, mock_data.USER),
+                ('GET', '/device'): (200, mock_data.DEVICE),
+                ('GET', '/operations'): (200, mock_data.OPERATIONS),
+                ('GET', '/schedules/public'): (200, mock_data.SCHEDULES_PUBLIC),
+                ('GET', '/schedules/configured'): (200, mock_data.SCHEDULES_CONFIGURED),
+                ('GET', '/operations/backup/rules/default'): (200, mock_data.BACKUP_RULES['default']),
+                ('GET', '/service/analytics'): (200, mock_data.ANALYTICS),
+            }
+        )
+
+        self.assertEqual(await client.dataset_metadata(entry=entry), mock_data.METADATA)
+        self.assertEqual(
+            await client.dataset_metadata_search(search_query='test.*', until=None),
+            mock_data.METADATA_SEARCH_RESULTS
+        )
+        self.assertEqual(await client.dataset_definitions(), mock_data.DEFINITIONS)
+        self.assertEqual(await client.dataset_entries(), mock_data.ENTRIES)
+        self.assertEqual(await client.dataset_entries_for_definition(definition=definition), mock_data.ENTRIES)
+        self.assertEqual(await client.user(), mock_data.USER)
+        self.assertEqual(await client.device(), mock_data.DEVICE)
+        self.assertEqual(await client.operations(state='active'), mock_data.OPERATIONS)
+        self.assertEqual(await client.schedules_public(), mock_data.SCHEDULES_PUBLIC)
+        self.assertEqual(await client.schedules_configured(), mock_data.SCHEDULES_CONFIGURED)
+        self.assertEqual(await client.backup_rules_for_definition(definition=None), mock_data.BACKUP_RULES['default'])
+        self.assertEqual(await client.analytics_state(), mock_data.ANALYTICS)
+
+        search_request = requests[1]
+        self.assertEqual(dict(search_request.url.params), {'query': 'test.*'})
+
+        operations_request = requests[7]
+        self.assertEqual(dict(operations_request.url.params), {'state': 'active'})
+
+    async def test_should_fetch_resources_concurrently(self):
+        entries = [uuid4() for _ in range(10)]
+
+        client, requests = self.create_client(
+            responses={
+                ('GET', '/datasets/metadata/{}'.format(entry)): (200, mock_data.METADATA) for entry in entries
+            }
+        )
+
+        async with client:
+            results = await asyncio.gather(*[client.dataset_metadata(entry=entry) for entry in entries])
+
+        self.assertEqual(results, [mock_data.METADATA] * len(entries))
+        self.assertEqual(len(requests), len(entries))
+
+    async def test_should_send_actions(self):
+        operation = str(uuid4())
+        definition = uuid4()
+        entry = uuid4()
+
+        client, requests = self.create_client(
+            responses={
+                ('POST', '/datasets/definitions'): (200, {'definition': str(definition)}),
+                ('PUT', '/operations/backup/{}'.format(definition)): (200, {'operation': operation}),
+                ('PUT', '/operations/recover/{}/from/{}'.format(definition, entry)): (200, {'operation': operation}),
+                ('DELETE', '/datasets/entries/{}'.format(entry)): (200, b''),
+            }
+        )
+
+        self.assertEqual(
+            await client.backup_define(request={'info': 'test'}),
+            {'successful': True, 'operation': None}
+        )
+        self.assertEqual(
+            await client.backup_start(definition=definition),
+            {'successful': True, 'operation': operation}
+        )
+        self.assertEqual(
+            await client.recover_from(
+                definition=definition,
+                entry=entry,
+                path_query='test.*',
+                destination=None,
+                discard_paths=True
+            ),
+            {'successful': True, 'operation': operation}
+        )
+        self.assertEqual(
+            await client.dataset_entry_delete(entry=entry),
+            {'successful': True, 'operation': None}
+        )
+
+        self.assertEqual(json.loads(requests[0].content), {'info': 'test'})
+        self.assertEqual(dict(requests[2].url.params), {'query': 'test.*', 'keep_structure': 'false'})
+
+    async def test_should_follow_operation_progress(self):
+        operation = uuid4()
+
+        content = ''.join(
+            map(lambda e: 'data: {}\n\n'.format(json.dumps(e)), mock_data.BACKUP_PROGRESS)
+        ).encode('utf-8')
+
+        client, _ = self.create_client(
+            responses={('GET', '/operations/{}/follow'.format(operation)): (200, content)}
+        )
+
+        progress = [p async for p in client.operation_follow(operation)]
+
+        self.assertEqual(progress, mock_data.BACKUP_PROGRESS)
+
+    async def test_should_handle_request_failures(self):
+        client, _ = self.create_client(responses={})
+
+        with self.assertRaises(Abort):
+            await client.user()
+
+        with self.assertRaises(Abort):
+            _ = [p async for p in client.operation_follow(uuid4())]
+
+    def test_should_support_custom_tls_contexts(self):
+        # pylint: disable=protected-access
+        self.assertTrue(AsyncClientApi._ssl_verify(True))
+        self.assertFalse(AsyncClientApi._ssl_verify(False))
+        self.assertIsInstance(AsyncClientApi._ssl_verify(certifi.where()), ssl.SSLContext)
@@ -1,13 +1,18 @@
+# pylint: disable=too-many-lines
+import io
 import json
+import time
 import unittest
 from unittest.mock import patch
 from uuid import uuid4
 
+import requests
 from click import Abort
 
+from client_cli import json_codec, json_stream
 from client_cli.api.default_client_api import DefaultClientApi
 from client_cli.api.endpoint_context import DefaultHttpsContext, CustomHttpsContext
-from tests.api import MockResponse
+from tests.api import ConditionalStubServer, MockResponse, StubServer
 from tests.mocks import mock_data
 
 
@@ -19,7 +24,7 @@ class DefaultClientApiSpec(unittest.TestCase):
         cls.url = 'http://localhost:9999'
         cls.token = 'test-token'
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_should_check_if_api_is_active(self, mock_request):
         client = DefaultClientApi(
             api_url=self.url,
@@ -41,7 +46,7 @@ class DefaultClientApiSpec(unittest.TestCase):
 
         self.assertFalse(client.is_active())
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_should_send_service_termination_requests(self, mock_request):
         client = DefaultClientApi(
             api_url=self.url,
@@ -63,7 +68,7 @@ class DefaultClientApiSpec(unittest.TestCase):
 
         self.assertDictEqual(client.stop(), {'successful': False})
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_should_get_dataset_metadata(self, mock_request):
         client = DefaultClientApi(
             api_url=self.url,
@@ -82,7 +87,7 @@ class DefaultClientApiSpec(unittest.TestCase):
             expected_url='/datasets/metadata/{}'.format(entry)
         )
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_should_search_dataset_metadata(self, mock_request):
         client = DefaultClientApi(
             api_url=self.url,
@@ -106,7 +111,116 @@ class DefaultClientApiSpec(unittest.TestCase):
             expected_request_params={'query': query, 'until': until}
         )
 
-    @patch('requests.request')
+    @unittest.skipUnless(json_stream.is_available(), 'ijson is not available')
+    @patch('requests.Session.request')
+    def test_should_stream_dataset_metadata(self, mock_request):
+        client = DefaultClientApi(
+            api_url=self.url,
+            api_token=self.token,
+            context=DefaultHttpsContext(verify=False),
+            timeout=10
+        )
+        mock_response = MockResponse.success(mock_data.METADATA)
+        mock_request.return_value = mock_response
+
+        entry = uuid4()
+        items = client.dataset_metadata_stream(entry=entry, subtrees=['filesystem.entities', 'metadata_changed'])
+
+        mock_request.assert_not_called()
+        self.assertListEqual(
+            list(items),
+            list(
+                json_stream.document_items(
+                    document=mock_data.METADATA,
+                    subtrees=['metadata_changed', 'filesystem.entities']  # in document order
+                )
+            )
+        )
+        self.assertTrue(mock_response.raw.decode_content)  # pylint: disable=no-member
+        self.assertTrue(mock_response.closed)
+
+        self.assert_valid_streaming_request(
+            mock=mock_request,
+            expected_method='get',
+            expected_url='/datasets/metadata/{}'.format(entry)
+        )
+
+    @unittest.skipUnless(json_stream.is_available(), 'ijson is not available')
+    @patch('requests.Session.request')
+    def test_should_stream_dataset_metadata_search_results(self, mock_request):
+        client = DefaultClientApi(
+            api_url=self.url,
+            api_token=self.token,
+            context=DefaultHttpsContext(verify=False),
+            timeout=10
+        )
+        mock_request.return_value = MockResponse.success(mock_data.METADATA_SEARCH_RESULTS)
+
+        query = 'test.*'
+        until = '2020-02-02T02:02:02'
+        self.assertListEqual(
+            list(client.dataset_metadata_search_stream(search_query=query, until=until, subtrees=['definitions'])),
+            list(json_stream.document_items(document=mock_data.METADATA_SEARCH_RESULTS, subtrees=['definitions']))
+        )
+
+        self.assert_valid_streaming_request(
+            mock=mock_request,
+            expected_method='get',
+            expected_url='/datasets/metadata/search',
+            expected_request_params={'query': query, 'until': until}
+        )
+
+    @patch('client_cli.json_stream.is_available')
+    @patch('requests.Session.request')
+    def test_should_decode_full_dataset_metadata_when_streaming_is_not_available(self, mock_request, mock_available):
+        client = DefaultClientApi(
+            api_url=self.url,
+            api_token=self.token,
+            context=DefaultHttpsContext(verify=False),
+            timeout=10
+        )
+        mock_available.return_value = False
+        mock_request.return_value = MockResponse.success(mock_data.METADATA)
+
+        entry = uuid4()
+        self.assertListEqual(
+            list(client.dataset_metadata_stream(entry=entry, subtrees=['content_changed'])),
+            list(json_stream.document_items(document=mock_data.METADATA, subtrees=['content_changed']))
+        )
+
+        self.assert_valid_request(
+            mock=mock_request,
+            expected_method='get',
+            expected_url='/datasets/metadata/{}'.format(entry)
+        )
+
+        mock_request.reset_mock()
+        mock_request.return_value = MockResponse.success(mock_data.METADATA_SEARCH_RESULTS)
+
+        self.assertListEqual(
+            list(client.dataset_metadata_search_stream(search_query='test.*', until=None, subtrees=['definitions'])),
+            list(json_stream.document_items(document=mock_data.METADATA_SEARCH_RESULTS, subtrees=['definitions']))
+        )
+
+    @unittest.skipUnless(json_stream.is_available(), 'ijson is not available')
+    @patch('requests.Session.request')
+    def test_should_handle_streamed_response_decoding_failures(self, mock_request):
+        client = DefaultClientApi(
+            api_url=self.url,
+            api_token=self.token,
+            context=DefaultHttpsContext(verify=False),
+            timeout=10
+        )
+        mock_response = MockResponse.success()
+        mock_response._raw = io.BytesIO(b'{"content_changed": {')  # pylint: disable=protected-access
+        mock_request.return_value = mock_response
+
+        with self.assertRaises(Abort):
+            list(client.dataset_metadata_stream(entry=uuid4(), subtrees=['content_changed']))
+
+        self.assertTrue(mock_response.closed)
+
+    @patch('requests.Session.request')
     def test_should_get_specific_dataset_definitions(self, mock_request):
         client = DefaultClientApi(
             api_url=self.url,
@@ -129,7 +243,7 @@ class DefaultClientApiSpec(unittest.TestCase):
             expected_url='/datasets/definitions/{}'.format(definition),
         )
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_should_get_dataset_definitions(self, mock_request):
         client = DefaultClientApi(
             api_url=self.url,
@@ -147,7 +261,7 @@ class DefaultClientApiSpec(unittest.TestCase):
             expected_url='/datasets/definitions'
         )
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_should_delete_dataset_definitions(self, mock_request):
         client = DefaultClientApi(
             api_url=self.url,
@@ -170,7 +284,7 @@ class DefaultClientApiSpec(unittest.TestCase):
             expected_url='/datasets/definitions/{}'.format(definition),
         )
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_should_get_dataset_entries(self, mock_request):
         client = DefaultClientApi(
             api_url=self.url,
@@ -188,7 +302,7 @@ class DefaultClientApiSpec(unittest.TestCase):
             expected_url='/datasets/entries'
         )
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_should_get_dataset_entries_for_definition(self, mock_request):
         client = DefaultClientApi(
             api_url=self.url,
@@ -207,7 +321,7 @@ class DefaultClientApiSpec(unittest.TestCase):
             expected_url='/datasets/entries/for-definition/{}'.format(definition)
         )
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_should_delete_dataset_entries(self, mock_request):
         client = DefaultClientApi(
             api_url=self.url,
@@ -226,7 +340,7 @@ class DefaultClientApiSpec(unittest.TestCase):
             expected_url='/datasets/entries/{}'.format(entry),
         )
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_should_get_current_user(self, mock_request):
         client = DefaultClientApi(
             api_url=self.url,
@@ -244,7 +358,7 @@ class DefaultClientApiSpec(unittest.TestCase):
             expected_url='/user'
         )
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_should_update_current_user_password(self, mock_request):
         client = DefaultClientApi(
             api_url=self.url,
@@ -264,7 +378,7 @@ class DefaultClientApiSpec(unittest.TestCase):
             expected_request_data=update_request
         )
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_should_update_current_user_salt(self, mock_request):
         client = DefaultClientApi(
             api_url=self.url,
@@ -284,7 +398,7 @@ class DefaultClientApiSpec(unittest.TestCase):
             expected_request_data=update_request
         )
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_should_get_current_device(self, mock_request):
         client = DefaultClientApi(
             api_url=self.url,
@@ -302,7 +416,7 @@ class DefaultClientApiSpec(unittest.TestCase):
             expected_url='/device'
         )
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_should_get_device_connections(self, mock_request):
         client = DefaultClientApi(
             api_url=self.url,
@@ -320,7 +434,7 @@ class DefaultClientApiSpec(unittest.TestCase):
             expected_url='/device/connections'
         )
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_should_reencrypt_current_device_secret(self, mock_request):
         client = DefaultClientApi(
             api_url=self.url,
@@ -341,7 +455,7 @@ class DefaultClientApiSpec(unittest.TestCase):
             expected_request_data=update_request
         )
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_should_get_device_commands(self, mock_request):
         client = DefaultClientApi(
             api_url=self.url,
@@ -359,7 +473,7 @@ class DefaultClientApiSpec(unittest.TestCase):
             expected_url='/device/commands'
         )
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_should_get_active_operations(self, mock_request):
         client = DefaultClientApi(
             api_url=self.url,
@@ -378,7 +492,7 @@ class DefaultClientApiSpec(unittest.TestCase):
             expected_request_params={'state': 'active'}
         )
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_should_get_completed_operations(self, mock_request):
         client = DefaultClientApi(
             api_url=self.url,
@@ -397,7 +511,7 @@ class DefaultClientApiSpec(unittest.TestCase):
             expected_request_params={'state': 'completed'}
         )
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_should_get_all_operations(self, mock_request):
         client = DefaultClientApi(
             api_url=self.url,
@@ -416,7 +530,7 @@ class DefaultClientApiSpec(unittest.TestCase):
             expected_request_params={'state': 'all'}
         )
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_should_get_operation_progress(self, mock_request):
         client = DefaultClientApi(
             api_url=self.url,
@@ -435,7 +549,7 @@ class DefaultClientApiSpec(unittest.TestCase):
             expected_url='/operations/{}/progress'.format(operation)
         )
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_should_follow_operation_progress(self, mock_request):
         client = DefaultClientApi(
             api_url=self.url,
@@ -463,7 +577,7 @@ class DefaultClientApiSpec(unittest.TestCase):
             expected_url='/operations/{}/follow'.format(operation)
         )
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_should_stop_an_active_operation(self, mock_request):
         client = DefaultClientApi(
             api_url=self.url,
@@ -482,7 +596,7 @@ class DefaultClientApiSpec(unittest.TestCase):
             expected_url='/operations/{}/stop'.format(operation)
         )
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_should_resume_an_inactive_operation(self, mock_request):
         client = DefaultClientApi(
             api_url=self.url,
@@ -501,7 +615,7 @@ class DefaultClientApiSpec(unittest.TestCase):
             expected_url='/operations/{}/resume'.format(operation)
         )
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_should_remove_an_inactive_operation(self, mock_request):
         client = DefaultClientApi(
             api_url=self.url,
@@ -520,7 +634,7 @@ class DefaultClientApiSpec(unittest.TestCase):
             expected_url='/operations/{}'.format(operation)
         )
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_should_get_backup_rules(self, mock_request):
         client = DefaultClientApi(
             api_url=self.url,
@@ -538,7 +652,7 @@ class DefaultClientApiSpec(unittest.TestCase):
             expected_url='/operations/backup/rules'
         )
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_should_get_backup_rules_for_definition(self, mock_request):
         client = DefaultClientApi(
             api_url=self.url,
@@ -559,7 +673,7 @@ class DefaultClientApiSpec(unittest.TestCase):
             expected_url='/operations/backup/rules/{}'.format(mock_data.DEFINITIONS[0]['id'])
         )
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_should_get_default_backup_rules(self, mock_request):
         client = DefaultClientApi(
             api_url=self.url,
@@ -580,7 +694,7 @@ class DefaultClientApiSpec(unittest.TestCase):
             expected_url='/operations/backup/rules/default'
         )
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_should_get_backup_specification_for_definition(self, mock_request):
         client = DefaultClientApi(
             api_url=self.url,
@@ -601,7 +715,7 @@ class DefaultClientApiSpec(unittest.TestCase):
             expected_url='/operations/backup/rules/{}/specification'.format(mock_data.DEFINITIONS[0]['id'])
         )
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_should_get_default_backup_specification(self, mock_request):
         client = DefaultClientApi(
             api_url=self.url,
@@ -622,9 +736,9 @@ class DefaultClientApiSpec(unittest.TestCase):
             expected_url='/operations/backup/rules/default/specification'
         )
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_should_start_backups(self, mock_request):
-        operation = uuid4()
+        operation = str(uuid4())
 
         client = DefaultClientApi(
             api_url=self.url,
@@ -643,7 +757,7 @@ class DefaultClientApiSpec(unittest.TestCase):
             expected_url='/operations/backup/{}'.format(definition)
         )
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_should_define_backups(self, mock_request):
         client = DefaultClientApi(
             api_url=self.url,
@@ -663,7 +777,7 @@ class DefaultClientApiSpec(unittest.TestCase):
             expected_request_data=definition_request
         )
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_should_update_backups(self, mock_request):
         client = DefaultClientApi(
             api_url=self.url,
@@ -687,9 +801,9 @@ class DefaultClientApiSpec(unittest.TestCase):
             expected_request_data=definition_request
         )
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_should_recover_until_timestamp(self, mock_request):
-        operation = uuid4()
+        operation = str(uuid4())
 
         client = DefaultClientApi(
             api_url=self.url,
@@ -723,9 +837,9 @@ class DefaultClientApiSpec(unittest.TestCase):
             expected_request_params={'query': query, 'destination': destination, 'keep_structure': not discard_paths}
         )
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_should_recover_from_entry(self, mock_request):
-        operation = uuid4()
+        operation = str(uuid4())
 
         client = DefaultClientApi(
             api_url=self.url,
@@ -759,9 +873,9 @@ class DefaultClientApiSpec(unittest.TestCase):
             expected_request_params={'query': query, 'destination': destination, 'keep_structure': not discard_paths}
         )
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_should_recover_from_latest_entry(self, mock_request):
-        operation = uuid4()
+        operation = str(uuid4())
 
         client = DefaultClientApi(
             api_url=self.url,
@@ -793,7 +907,7 @@ class DefaultClientApiSpec(unittest.TestCase):
             expected_request_params={'query': query, 'destination': destination, 'keep_structure': not discard_paths}
         )
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_should_get_public_schedules(self, mock_request):
         client = DefaultClientApi(
             api_url=self.url,
@@ -811,7 +925,7 @@ class DefaultClientApiSpec(unittest.TestCase):
             expected_url='/schedules/public'
         )
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_should_get_configured_schedules(self, mock_request):
         client = DefaultClientApi(
             api_url=self.url,
@@ -829,7 +943,7 @@ class DefaultClientApiSpec(unittest.TestCase):
             expected_url='/schedules/configured'
         )
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_should_refresh_configured_schedules(self, mock_request):
         client = DefaultClientApi(
             api_url=self.url,
@@ -847,7 +961,7 @@ class DefaultClientApiSpec(unittest.TestCase):
             expected_url='/schedules/configured/refresh'
         )
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_should_get_analytics_state(self, mock_request):
         client = DefaultClientApi(
             api_url=self.url,
@@ -865,7 +979,7 @@ class DefaultClientApiSpec(unittest.TestCase):
             expected_url='/service/analytics'
         )
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_should_send_analytics_state(self, mock_request):
         client = DefaultClientApi(
             api_url=self.url,
@@ -883,7 +997,7 @@ class DefaultClientApiSpec(unittest.TestCase):
             expected_url='/service/analytics/send'
         )
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_should_handle_request_failures(self, mock_request):
         client = DefaultClientApi(
             api_url=self.url,
@@ -896,7 +1010,7 @@ class DefaultClientApiSpec(unittest.TestCase):
         with self.assertRaises(Abort):
             client.operations(state='completed')
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_should_handle_streaming_request_failures(self, mock_request):
         client = DefaultClientApi(
             api_url=self.url,
@@ -912,7 +1026,7 @@ class DefaultClientApiSpec(unittest.TestCase):
             list(client.operation_follow(operation))
 
     @patch('client_cli.api.endpoint_context.CustomHttpsContext._create_context_pem_file')
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_should_handle_requests_with_custom_tls_context(self, mock_request, mock_create_pem):
         path = '/tmp/some/path'
         password = 'test-password'
@@ -931,18 +1045,216 @@ class DefaultClientApiSpec(unittest.TestCase):
             method='get',
             url='{}{}'.format(self.url, '/service/ping'),
             params={},
-            headers={'Authorization': 'Bearer {}'.format(self.token)},
             json={},
             verify=context.verify,
             timeout=10
         )
 
+        self.assertEqual(client.session.verify, context.verify)
+
         mock_create_pem.assert_called_once_with(
             pkcs12_certificate_path=path,
             pkcs12_certificate_password=password,
             pem_certificate_path='{}.as.pem'.format(path)
         )
 
+    @patch('requests.adapters.HTTPAdapter.send')
+    def test_should_not_let_environment_ca_bundles_override_tls_verification(self, mock_send):
+        def send(request, **kwargs):
+            del kwargs
+            response = requests.Response()
+            response.status_code = 200
+            response.request = request
+            response._content = b'{}'  # pylint: disable=protected-access
+            return response
+
+        mock_send.side_effect = send
+
+        for context, expected in [
+            (DefaultHttpsContext(verify=False), False),
+            (DefaultHttpsContext(verify='/tmp/some/path.as.pem'), '/tmp/some/path.as.pem'),
+        ]:
+            client = DefaultClientApi(api_url=self.url, api_token=self.token, context=context, timeout=10)
+
+            for variable in ['REQUESTS_CA_BUNDLE', 'CURL_CA_BUNDLE']:
+                with patch.dict('os.environ', {variable: '/tmp/other/bundle.pem'}):
+                    client.send(method='get', url='/service/ping')
+                    client.request_stream(method='get', url='/service/ping')
+
+            self.assertListEqual([call.kwargs['verify'] for call in mock_send.call_args_list], [expected] * 4)
+
+            mock_send.reset_mock()
+            client.close()
+
+    def test_should_configure_persistent_session(self):
+        client = DefaultClientApi(
+            api_url=self.url,
+            api_token=self.token,
+            context=DefaultHttpsContext(verify=False),
+            timeout=10
+        )
+
+        self.assertEqual(client.session.headers['Authorization'], 'Bearer {}'.format(self.token))
+        self.assertFalse(client.session.verify)
+
+        adapter = client.session.get_adapter(url='{}/service/ping'.format(self.url))
+        self.assertEqual(adapter._pool_maxsize, DefaultClientApi.POOL_MAXSIZE)  # pylint: disable=protected-access
+
+        client.close()
+
+    def test_should_reuse_connections_between_requests(self):
+        requests_count = 50
+
+        with StubServer() as server:
+            client = DefaultClientApi(
+                api_url=server.url,
+                api_token=self.token,
+                context=DefaultHttpsContext(verify=False),
+                timeout=10
+            )
+
+            for _ in range(requests_count):
+                self.assertTrue(client.is_active())
+            pooled_connections = server.connections
+
+            client.close()
+
+            for _ in range(requests_count):
+                response = requests.request(
+                    method='get',
+                    url='{}/service/ping'.format(server.url),
+                    headers={'Authorization': 'Bearer {}'.format(self.token)},
+                    timeout=10
+                )
+                self.assertTrue(response.ok)
+            unpooled_connections = server.connections - pooled_connections
+
+        self.assertEqual(pooled_connections, 1)
+        self.assertEqual(unpooled_connections, requests_count)
+
+    @patch('requests.Session.request')
+    def test_should_cache_listings_until_they_expire(self, mock_request):
+        client = DefaultClientApi(
+            api_url=self.url,
+            api_token=self.token,
+            context=DefaultHttpsContext(verify=False),
+            timeout=10
+        )
+        mock_request.return_value = MockResponse.success(mock_data.DEFINITIONS)
+
+        self.assertEqual(client.dataset_definitions(), mock_data.DEFINITIONS)
+        self.assertEqual(client.dataset_definitions(), mock_data.DEFINITIONS)
+
+        self.assert_valid_request(
+            mock=mock_request,
+            expected_method='get',
+            expected_url='/datasets/definitions'
+        )
+
+        client.responses.clock = lambda: time.monotonic() + client.cache_ttls['dataset_definitions']
+        self.assertEqual(client.dataset_definitions(), mock_data.DEFINITIONS)
+        self.assertEqual(mock_request.call_count, 2)
+        self.assertNotIn('headers', mock_request.call_args.kwargs)
+
+    @patch('requests.Session.request')
+    def test_should_revalidate_expired_listings(self, mock_request):
+        client = DefaultClientApi(
+            api_url=self.url,
+            api_token=self.token,
+            context=DefaultHttpsContext(verify=False),
+            timeout=10,
+            cache_ttls={'user': 0}
+        )
+        response = MockResponse.success(mock_data.USER)
+        response.headers = {'ETag': '"abc"', 'Last-Modified': 'Wed, 21 Oct 2015 07:28:00 GMT'}
+        mock_request.return_value = response
+
+        self.assertEqual(client.user(), mock_data.USER)
+        self.assertNotIn('headers', mock_request.call_args.kwargs)
+
+        mock_request.return_value = MockResponse(status_code=304, response=None)
+        self.assertEqual(client.user(), mock_data.USER)
+
+        self.assertEqual(mock_request.call_count, 2)
+        self.assertDictEqual(
+            mock_request.call_args.kwargs['headers'],
+            {'If-None-Match': '"abc"', 'If-Modified-Since': 'Wed, 21 Oct 2015 07:28:00 GMT'}
+        )
+
+        mock_request.return_value = MockResponse.success(mock_data.USER_WITHOUT_LIMITS)
+        self.assertEqual(client.user(), mock_data.USER_WITHOUT_LIMITS)
+        self.assertEqual(mock_request.call_count, 3)
+
+        mock_request.return_value = MockResponse.failure()
+        with self.assertRaises(Abort):
+            client.user()
+
+    @patch('requests.Session.request')
+    def test_should_drop_cached_listings_after_modifying_requests(self, mock_request):
+        client = DefaultClientApi(
+            api_url=self.url,
+            api_token=self.token,
+            context=DefaultHttpsContext(verify=False),
+            timeout=10
+        )
+        mock_request.return_value = MockResponse.success(mock_data.ENTRIES)
+
+        self.assertEqual(client.dataset_entries(), mock_data.ENTRIES)
+        client.dataset_entries()[0]['id'] = 'modified'
+        self.assertEqual(client.dataset_entries(), mock_data.ENTRIES)
+        self.assertEqual(mock_request.call_count, 1)
+
+        mock_request.return_value = MockResponse.success()
+        client.dataset_entry_delete(entry=uuid4())
+        self.assertEqual(mock_request.call_count, 2)
+
+        mock_request.return_value = MockResponse.success(mock_data.ENTRIES[:1])
+        self.assertEqual(client.dataset_entries(), mock_data.ENTRIES[:1])
+        self.assertEqual(mock_request.call_count, 3)
+
+    def test_should_revalidate_unchanged_listings_with_a_local_api(self):
+        definitions = [
+            dict(mock_data.DEFINITIONS[0], id=str(uuid4()), info='test-definition-{}'.format(i)) for i in range(100)
+        ]
+        requests_count = 5
+
+        with ConditionalStubServer(contents={'/datasets/definitions': definitions}) as server:
+            uncached = DefaultClientApi(
+                api_url=server.url,
+                api_token=self.token,
+                context=DefaultHttpsContext(verify=False),
+                timeout=10
+            )
+
+            for _ in range(requests_count):
+                uncached.responses.clear()
+                self.assertEqual(len(uncached.dataset_definitions()), len(definitions))
+            uncached.close()
+
+            self.assertEqual(server.full, requests_count)
+
+            revalidated = DefaultClientApi(
+                api_url=server.url,
+                api_token=self.token,
+                context=DefaultHttpsContext(verify=False),
+                timeout=10,
+                cache_ttls={'dataset_definitions': 0}
+            )
+
+            with patch('client_cli.json_codec.loads', wraps=json_codec.loads) as loads:
+                for _ in range(requests_count):
+                    self.assertEqual(len(revalidated.dataset_definitions()), len(definitions))
+
+            self.assertEqual(server.full, requests_count + 1)
+            self.assertEqual(server.not_modified, requests_count - 1)
+            self.assertEqual(loads.call_count, 1)
+
+            server.update('/datasets/definitions', definitions[:10])
+            self.assertEqual(len(revalidated.dataset_definitions()), 10)
+            self.assertEqual(server.full, requests_count + 2)
+
+            revalidated.close()
+
     def assert_valid_request(
             self,
             mock,
@@ -962,7 +1274,6 @@ class DefaultClientApiSpec(unittest.TestCase):
             method=expected_method,
             url='{}{}'.format(self.url, expected_url),
             params=expected_request_params,
-            headers={'Authorization': 'Bearer {}'.format(self.token)},
             json=expected_request_data,
             verify=False,
             timeout=10
@@ -987,7 +1298,6 @@ class DefaultClientApiSpec(unittest.TestCase):
             method=expected_method,
             url='{}{}'.format(self.url, expected_url),
             params=expected_request_params,
-            headers={'Authorization': 'Bearer {}'.format(self.token)},
             json=expected_request_data,
             verify=False,
             stream=True,
@@ -1,8 +1,18 @@
 import datetime
+import json
+import os
+import subprocess
+import sys
+import tempfile
 import unittest
 from unittest.mock import patch, mock_open
 
 from click import Abort
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.hazmat.primitives.serialization import BestAvailableEncryption, pkcs12
+from cryptography.x509.oid import NameOID
 
 from client_cli.api.endpoint_context import DefaultHttpsContext, CustomHttpsContext, InvalidCertificateFailure
 
@@ -176,6 +186,104 @@ class EndpointContextSpec(unittest.TestCase):
             CustomHttpsContext.validate_pkcs12_certificate(pkcs12_certificate_path='abc', pkcs12_certificate=future)
         self.assertTrue('API certificate [abc] not valid before' in str(future_failure.exception))
 
+    def test_should_skip_loading_unchanged_pkcs12_certificates(self):
+        with tempfile.TemporaryDirectory() as directory:
+            pkcs12_path = create_pkcs12_certificate(directory=directory, password='test-password')
+            pem_path = '{}.as.pem'.format(pkcs12_path)
+
+            with patch(
+                    'client_cli.api.endpoint_context.CustomHttpsContext.load_pkcs12_certificate',
+                    wraps=CustomHttpsContext.load_pkcs12_certificate
+            ) as mock_load_cert:
+                CustomHttpsContext(certificate_type='pkcs12', certificate_path=pkcs12_path,
+                                   certificate_password='test-password')
+                self.assertEqual(mock_load_cert.call_count, 1)
+                self.assertTrue(os.path.isfile(pem_path))
+                self.assertTrue(os.path.isfile(CustomHttpsContext.fingerprint_path(pem_path)))
+
+                context = CustomHttpsContext(certificate_type='pkcs12', certificate_path=pkcs12_path,
+                                             certificate_password='test-password')
+                self.assertEqual(mock_load_cert.call_count, 1)
+                self.assertEqual(context.verify, pem_path)
+
+                stat = os.stat(pkcs12_path)
+                os.utime(pkcs12_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+                CustomHttpsContext(certificate_type='pkcs12', certificate_path=pkcs12_path,
+                                   certificate_password='test-password')
+                self.assertEqual(mock_load_cert.call_count, 2)
+
+                with open(pem_path, 'ab') as pem_file:
+                    pem_file.write(b'\n')
+
+                CustomHttpsContext(certificate_type='pkcs12', certificate_path=pkcs12_path,
+                                   certificate_password='test-password')
+                self.assertEqual(mock_load_cert.call_count, 3)
+
+    def test_should_validate_cached_certificates(self):
+        with tempfile.TemporaryDirectory() as directory:
+            pkcs12_path = create_pkcs12_certificate(directory=directory, password='test-password')
+            pem_path = '{}.as.pem'.format(pkcs12_path)
+
+            CustomHttpsContext(certificate_type='pkcs12', certificate_path=pkcs12_path,
+                               certificate_password='test-password')
+
+            fingerprint_path = CustomHttpsContext.fingerprint_path(pem_path)
+            with open(fingerprint_path, 'r', encoding='utf-8') as file:
+                fingerprint = json.load(file)
+
+            expired = datetime.datetime.now(datetime.UTC) - datetime.timedelta(days=1)
+            fingerprint['not_valid_after'] = expired.isoformat()
+
+            with open(fingerprint_path, 'w', encoding='utf-8') as file:
+                json.dump(fingerprint, file)
+
+            with self.assertRaises(InvalidCertificateFailure):
+                CustomHttpsContext(certificate_type='pkcs12', certificate_path=pkcs12_path,
+                                   certificate_password='test-password')
+
+    def test_should_not_import_cryptography_when_loading_module(self):
+        result = subprocess.run(
+            [
+                sys.executable, '-c',
+                'import sys, client_cli.api.endpoint_context; print("cryptography" in sys.modules)'
+            ],
+            capture_output=True,
+            check=True
+        )
+
+        self.assertEqual(result.stdout.decode('utf-8').strip(), 'False')
+
+
+def create_pkcs12_certificate(directory, password):
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, 'localhost')])
+    now = datetime.datetime.now(datetime.UTC)
+
+    certificate = x509.CertificateBuilder() \
+        .subject_name(name) \
+        .issuer_name(name) \
+        .public_key(key.public_key()) \
+        .serial_number(x509.random_serial_number()) \
+        .not_valid_before(now - datetime.timedelta(days=1)) \
+        .not_valid_after(now + datetime.timedelta(days=30)) \
+        .sign(key, hashes.SHA256())
+
+    path = os.path.join(directory, 'api.p12')
+
+    with open(path, 'wb') as file:
+        file.write(
+            pkcs12.serialize_key_and_certificates(
+                name=b'api',
+                key=key,
+                cert=certificate,
+                cas=None,
+                encryption_algorithm=BestAvailableEncryption(password.encode('utf-8'))
+            )
+        )
+
+    return path
+
 
 class MockCertificate:
     def __init__(self, content, created=datetime.datetime.now(datetime.UTC)):
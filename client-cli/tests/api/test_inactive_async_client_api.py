@@ -0,0 +1,81 @@
+import asyncio
+import unittest
+from uuid import uuid4
+
+from click import Abort
+
+from client_cli.api.inactive_async_client_api import InactiveAsyncClientApi
+
+
+class InactiveAsyncClientApiSpec(unittest.TestCase):
+
+    def test_should_check_if_api_is_active(self):
+        async def is_active():
+            async with InactiveAsyncClientApi() as api:
+                return await api.is_active()
+
+        self.assertFalse(asyncio.run(is_active()))
+
+    def test_should_fail_all_requests(self):
+        api = InactiveAsyncClientApi()
+
+        definition = uuid4()
+        entry = uuid4()
+        operation = uuid4()
+        request = {'a': 1, 'b': 2}
+
+        for call in [
+            api.stop,
+            lambda: api.dataset_metadata(entry=entry),
+            lambda: api.dataset_metadata_search(search_query='test.*', until='2020-02-02T02:02:02'),
+            lambda: api.dataset_definition(definition=definition),
+            api.dataset_definitions,
+            lambda: api.dataset_definition_delete(definition=definition),
+            api.dataset_entries,
+            lambda: api.dataset_entries_for_definition(definition=definition),
+            lambda: api.dataset_entry_delete(entry=entry),
+            api.user,
+            lambda: api.user_password_update(request=request),
+            lambda: api.user_salt_update(request=request),
+            api.device,
+            api.device_connections,
+            lambda: api.device_reencrypt_secret(request=request),
+            api.device_commands,
+            lambda: api.operations(state='active'),
+            lambda: api.operation_progress(operation=operation),
+            lambda: api.operation_stop(operation=operation),
+            lambda: api.operation_resume(operation=operation),
+            lambda: api.operation_remove(operation=operation),
+            api.backup_rules,
+            lambda: api.backup_rules_for_definition(definition=definition),
+            lambda: api.backup_specification_for_definition(definition=definition),
+            lambda: api.backup_start(definition=definition),
+            lambda: api.backup_define(request=request),
+            lambda: api.backup_update(definition=definition, request=request),
+            lambda: api.recover_until(
+                definition=definition,
+                until='2020-02-02T02:02:02',
+                path_query=None,
+                destination=None,
+                discard_paths=False
+            ),
+            lambda: api.recover_from(
+                definition=definition, entry=entry, path_query=None, destination=None, discard_paths=False
+            ),
+            lambda: api.recover_from_latest(
+                definition=definition, path_query=None, destination=None, discard_paths=False
+            ),
+            api.schedules_public,
+            api.schedules_configured,
+            api.schedules_configured_refresh,
+            api.analytics_state,
+            api.analytics_state_send,
+        ]:
+            with self.assertRaises(Abort):
+                asyncio.run(call())
+
+        async def follow():
+            return [progress async for progress in api.operation_follow(operation=operation)]
+
+        with self.assertRaises(Abort):
+            asyncio.run(follow())
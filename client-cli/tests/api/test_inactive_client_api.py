@@ -34,6 +34,12 @@ class InactiveClientApiSpec(unittest.TestCase):
         with self.assertRaises(Abort):
             api.dataset_metadata_search(search_query=query, until=until)
 
+        with self.assertRaises(Abort):
+            api.dataset_metadata_stream(entry=entry, subtrees=['content_changed'])
+
+        with self.assertRaises(Abort):
+            api.dataset_metadata_search_stream(search_query=query, until=until, subtrees=['definitions'])
+
         with self.assertRaises(Abort):
             api.dataset_definition(definition=definition)
 
@@ -0,0 +1,42 @@
+import unittest
+
+from client_cli.api.inactive_client_api import InactiveClientApi
+from client_cli.api.lazy_api import LazyApi, LazyClientApi
+from tests.mocks.mock_client_api import MockClientApi
+
+
+class LazyApiSpec(unittest.TestCase):
+
+    def test_should_create_underlying_api_on_first_access(self):
+        created = []
+
+        def factory():
+            api = MockClientApi()
+            created.append(api)
+            return api
+
+        api = LazyApi(factory=factory)
+
+        self.assertFalse(api.is_created)
+        self.assertEqual(len(created), 0)
+
+        api.user()
+        api.device()
+
+        self.assertTrue(api.is_created)
+        self.assertEqual(len(created), 1)
+        self.assertEqual(created[0].stats['user'], 1)
+        self.assertEqual(created[0].stats['device'], 1)
+
+    def test_should_memoise_client_api_activity(self):
+        active_api = MockClientApi()
+        active = LazyClientApi(factory=lambda: active_api)
+
+        self.assertTrue(active.is_active())
+        self.assertTrue(active.is_active())
+        self.assertEqual(active_api.stats['is_active'], 0)
+
+        inactive = LazyClientApi(factory=InactiveClientApi)
+
+        self.assertFalse(inactive.is_active())
+        self.assertTrue(isinstance(inactive.underlying, InactiveClientApi))
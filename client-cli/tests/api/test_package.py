@@ -1,3 +1,4 @@
+import asyncio
 import unittest
 from unittest.mock import patch
 
@@ -8,6 +9,7 @@ from client_cli.api import create_client_api, create_init_api, InvalidCertificat
 from client_cli.api.default_client_api import DefaultClientApi
 from client_cli.api.default_init_api import DefaultInitApi
 from client_cli.api.endpoint_context import CustomHttpsContext, DefaultHttpsContext
+from client_cli.api.inactive_async_client_api import InactiveAsyncClientApi
 from client_cli.api.inactive_client_api import InactiveClientApi
 from client_cli.api.inactive_init_api import InactiveInitApi
 from tests.mocks.mock_client_api import MockClientApi
@@ -69,6 +71,52 @@ class ApiPackageSpec(unittest.TestCase):
         self.assertEqual(api.api_url, 'https://localhost:9999')
         self.assertFalse(api.context.verify)
 
+    @patch('client_cli.api.default_client_api.DefaultClientApi.is_active')
+    def test_should_create_async_client_api(self, mock_is_active):
+        try:
+            from client_cli.api.async_client_api import AsyncClientApi  # pylint: disable=import-outside-toplevel
+        except ImportError:
+            self.skipTest('httpx is not available')
+
+        api = create_client_api(
+            config=ApiPackageSpec.create_config(with_context=False),
+            timeout=10,
+            api_token='test-token',
+            insecure=False,
+            on_custom_cert_expired=lambda: None,
+            asynchronous=True
+        )
+
+        self.assertTrue(isinstance(api, AsyncClientApi))
+        self.assertTrue(isinstance(api.context, DefaultHttpsContext))
+        self.assertEqual(api.api_url, 'http://localhost:9999')
+        mock_is_active.assert_not_called()
+
+    def test_should_fail_to_create_async_client_api_when_httpx_is_not_available(self):
+        with patch.dict('sys.modules', {'client_cli.api.async_client_api': None}):
+            with self.assertRaises(Abort):
+                create_client_api(
+                    config=ApiPackageSpec.create_config(with_context=False),
+                    timeout=10,
+                    api_token='test-token',
+                    insecure=False,
+                    on_custom_cert_expired=lambda: None,
+                    asynchronous=True
+                )
+
+    def test_should_create_inactive_async_client_api_when_api_token_is_not_available(self):
+        api = create_client_api(
+            config=ApiPackageSpec.create_config(with_context=True),
+            timeout=10,
+            api_token=None,
+            insecure=False,
+            on_custom_cert_expired=lambda: None,
+            asynchronous=True
+        )
+
+        self.assertTrue(isinstance(api, InactiveAsyncClientApi))
+        self.assertFalse(asyncio.run(api.is_active()))
+
     def test_should_create_inactive_client_api_when_api_token_is_not_available(self):
         api = create_client_api(
             config=ApiPackageSpec.create_config(with_context=True),
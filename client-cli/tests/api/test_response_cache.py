@@ -0,0 +1,98 @@
+import unittest
+
+from client_cli.api.response_cache import CachedResponse, ResponseCache, request_key
+
+
+class ResponseCacheSpec(unittest.TestCase):
+
+    def test_should_cache_responses_until_they_expire(self):
+        clock = MockClock()
+        cache = ResponseCache(clock=clock)
+        key = request_key(url='/test')
+
+        self.assertIsNone(cache.get(key))
+
+        cache.put(key, result={'a': 1}, ttl=10)
+        self.assertDictEqual(cache.get(key).result(), {'a': 1})
+        self.assertTrue(cache.is_fresh(cache.get(key)))
+
+        clock.now = 10
+        self.assertFalse(cache.is_fresh(cache.get(key)))
+        self.assertDictEqual(cache.get(key).result(), {'a': 1})
+
+        cache.refresh(key, ttl=5)
+        self.assertTrue(cache.is_fresh(cache.get(key)))
+
+        clock.now = 15
+        self.assertFalse(cache.is_fresh(cache.get(key)))
+
+        cache.refresh(request_key(url='/other'), ttl=5)
+        self.assertIsNone(cache.get(request_key(url='/other')))
+
+        cache.clear()
+        self.assertIsNone(cache.get(key))
+
+    def test_should_never_consider_responses_without_ttl_fresh(self):
+        cache = ResponseCache(clock=MockClock())
+        key = request_key(url='/test')
+
+        cache.put(key, result={'a': 1}, ttl=0)
+        self.assertFalse(cache.is_fresh(cache.get(key)))
+
+    def test_should_provide_a_new_copy_of_cached_responses_for_every_caller(self):
+        cache = ResponseCache(clock=MockClock())
+        key = request_key(url='/test')
+
+        cache.put(key, result=[{'a': 1, 'b': {'c': 2}}], ttl=10)
+
+        result = cache.get(key).result()
+        result[0]['a'] = 2
+        result.append({'b': 3})
+
+        self.assertListEqual(cache.get(key).result(), [{'a': 1, 'b': {'c': 2}}])
+        self.assertIsNot(cache.get(key).result()[0], cache.get(key).result()[0])
+        self.assertIs(cache.get(key).result()[0]['b'], cache.get(key).result()[0]['b'])
+
+        cache.put(key, result={'a': {'b': 1}}, ttl=10)
+
+        result = cache.get(key).result()
+        result['a']['b'] = 2
+        result['c'] = 3
+
+        self.assertDictEqual(cache.get(key).result(), {'a': {'b': 1}})
+        self.assertEqual(CachedResponse(result=42, expires_at=0).result(), 42)
+
+    def test_should_provide_conditional_request_validators(self):
+        self.assertDictEqual(CachedResponse(result={}, expires_at=0).validators(), {})
+
+        self.assertDictEqual(
+            CachedResponse(result={}, expires_at=0, etag='"abc"').validators(),
+            {'If-None-Match': '"abc"'}
+        )
+
+        self.assertDictEqual(
+            CachedResponse(
+                result={},
+                expires_at=0,
+                etag='"abc"',
+                last_modified='Wed, 21 Oct 2015 07:28:00 GMT'
+            ).validators(),
+            {'If-None-Match': '"abc"', 'If-Modified-Since': 'Wed, 21 Oct 2015 07:28:00 GMT'}
+        )
+
+    def test_should_create_request_keys(self):
+        self.assertEqual(request_key(url='/test'), request_key(url='/test', params={}))
+        self.assertEqual(
+            request_key(url='/test', params={'a': 1, 'b': 2}),
+            request_key(url='/test', params={'b': 2, 'a': 1})
+        )
+        self.assertNotEqual(request_key(url='/test', params={'a': 1}), request_key(url='/test', params={'a': 2}))
+        self.assertNotEqual(request_key(url='/test'), request_key(url='/other'))
+
+
+class MockClock:
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        return self.now
@@ -19,5 +19,5 @@ class Runner:
         self.cli.add_command(command)
         return self
 
-    def invoke(self, args, obj=None):
-        return self.runner.invoke(self.cli, args=args, obj=obj)
+    def invoke(self, args, obj=None, stdin=None):
+        return self.runner.invoke(self.cli, args=args, obj=obj, input=stdin)
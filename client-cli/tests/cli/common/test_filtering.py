@@ -1,15 +1,22 @@
+import os
+import re
+import tempfile
 import unittest
+from unittest.mock import patch
 
 import click
 from click import Abort
 
+from client_cli.cli.common import coerce
 from client_cli.cli.common.filtering import (
     FilterParser,
     FilterGroup,
     Filter,
     FilterBinaryOperator,
     Filtering,
-    with_filtering
+    with_filtering,
+    glob_to_regex,
+    glob_prefix
 )
 from tests.cli.cli_runner import Runner
 
@@ -56,6 +63,56 @@ class FilterBinaryOperatorSpec(unittest.TestCase):
         self.assertTrue(FilterBinaryOperator(operator='is').apply(value=None, condition='NONE'))
         self.assertFalse(FilterBinaryOperator(operator='is-not').apply(value=None, condition='NONE'))
 
+        self.assertTrue(FilterBinaryOperator(operator='in').apply(value='a', condition=frozenset(['a', 'b'])))
+        self.assertFalse(FilterBinaryOperator(operator='in').apply(value='c', condition=frozenset(['a', 'b'])))
+        self.assertFalse(FilterBinaryOperator(operator='in').apply(value=None, condition=frozenset(['a', 'b'])))
+        self.assertFalse(FilterBinaryOperator(operator='not-in').apply(value='a', condition=frozenset(['a', 'b'])))
+        self.assertTrue(FilterBinaryOperator(operator='not-in').apply(value='c', condition=frozenset(['a', 'b'])))
+        self.assertFalse(FilterBinaryOperator(operator='not-in').apply(value=None, condition=frozenset(['a', 'b'])))
+
+        self.assertTrue(FilterBinaryOperator(operator='matches').apply(value='/tmp/a.txt', condition=r'\.txt$'))
+        self.assertTrue(FilterBinaryOperator(operator='matches').apply(value=42, condition=r'^4\d$'))
+        self.assertFalse(FilterBinaryOperator(operator='matches').apply(value='/tmp/a.log', condition=r'\.txt$'))
+        self.assertFalse(FilterBinaryOperator(operator='matches').apply(value=None, condition=r'.*'))
+
+        self.assertTrue(FilterBinaryOperator(operator='glob').apply(value='/tmp/a/b.txt', condition='/tmp/**'))
+        self.assertTrue(FilterBinaryOperator(operator='glob').apply(value='/tmp/b.txt', condition='/tmp/*.txt'))
+        self.assertTrue(FilterBinaryOperator(operator='glob').apply(value='/tmp/b.txt', condition='/tmp/b.txt'))
+        self.assertFalse(FilterBinaryOperator(operator='glob').apply(value='/tmp/a/b.txt', condition='/tmp/*.txt'))
+        self.assertFalse(FilterBinaryOperator(operator='glob').apply(value='/other/b.txt', condition='/tmp/**'))
+        self.assertFalse(FilterBinaryOperator(operator='glob').apply(value=None, condition='**'))
+
+    def test_should_fail_when_provided_with_invalid_regular_expressions(self):
+        with self.assertRaises(Abort):
+            FilterBinaryOperator(operator='matches').compile(condition='(abc')
+
+    def test_should_convert_glob_patterns_to_regular_expressions(self):
+        patterns = {
+            '/home/user/**': (['/home/user/a', '/home/user/a/b/c'], ['/home/other/a', '/home/user']),
+            '/home/*/file.txt': (['/home/a/file.txt'], ['/home/a/b/file.txt', '/home/a/fileatxt']),
+            '**/*.py': (['a.py', '/a/b/c.py'], ['/a/b/c.pyc']),
+            '/tmp/**/file': (['/tmp/file', '/tmp/a/b/file'], ['/tmp/afile']),
+            'file-?[0-9]': (['file-a1', 'file-b9'], ['file-/1', 'file-aa']),
+            'file-[!0-9]': (['file-a'], ['file-1']),
+            'file[': (['file['], ['file']),
+        }
+
+        for pattern, (matching, non_matching) in patterns.items():
+            regex = re.compile(glob_to_regex(pattern=pattern))
+
+            for value in matching:
+                self.assertIsNotNone(regex.fullmatch(value), 'for [{}] and [{}]'.format(pattern, value))
+
+            for value in non_matching:
+                self.assertIsNone(regex.fullmatch(value), 'for [{}] and [{}]'.format(pattern, value))
+
+    def test_should_retrieve_glob_pattern_prefixes(self):
+        self.assertEqual(glob_prefix(pattern='/home/user/**/*.txt'), '/home/user/')
+        self.assertEqual(glob_prefix(pattern='/home/?/a'), '/home/')
+        self.assertEqual(glob_prefix(pattern='/home/[ab]'), '/home/')
+        self.assertEqual(glob_prefix(pattern='**/*.txt'), '')
+        self.assertEqual(glob_prefix(pattern='/home/user'), '/home/user')
+
     def test_should_fail_when_provided_with_unsupported_operations(self):
         operator = FilterBinaryOperator(operator='?')
         with self.assertRaises(Abort):
@@ -72,7 +129,7 @@ class FilterBinaryOperatorSpec(unittest.TestCase):
     def test_should_provide_a_list_of_supported_operators(self):
         self.assertListEqual(
             FilterBinaryOperator.supported_operators(),
-            ['<', '<=', '>', '>=', '==', '!=', 'like', 'is', 'is-not']
+            ['<', '<=', '>', '>=', '==', '!=', 'like', 'is', 'is-not', 'in', 'not-in', 'matches', 'glob']
         )
 
 
@@ -109,6 +166,52 @@ class FilterSpec(unittest.TestCase):
         self.assertTrue(filter_instance.apply(entry={'test_field': '40', 'other_field': 40}, spec=spec))
         self.assertFalse(filter_instance.apply(entry={'test_field': None, 'other_field': 40}, spec=spec))
 
+    def test_should_filter_entries_with_raw_values(self):
+        spec = {'test_field': int, 'other_field': str}
+
+        filter_instance = Filter(tokens=['test_field', '>=', '2kb'])
+        self.assertTrue(filter_instance.apply(entry={'test_field': 2048, 'other_field': 'a'}, spec=spec))
+        self.assertFalse(filter_instance.apply(entry={'test_field': 2047, 'other_field': 'a'}, spec=spec))
+
+        filter_instance = Filter(tokens=['test_field', '==', '01:02:03'])
+        self.assertTrue(filter_instance.apply(entry={'test_field': 3723, 'other_field': 'a'}, spec=spec))
+
+        filter_instance = Filter(tokens=['other_field', '==', '3kb'])
+        self.assertTrue(filter_instance.apply(entry={'test_field': 0, 'other_field': '3kb'}, spec=spec))
+        self.assertFalse(filter_instance.apply(entry={'test_field': 0, 'other_field': '3072'}, spec=spec))
+
+    def test_should_filter_entries_with_lists_of_values(self):
+        spec = {'test_field': int, 'other_field': str}
+
+        filter_instance = Filter(tokens=['test_field', 'in', ['1', '1kb', 'none']])
+        predicate = filter_instance.compile(spec=spec)
+        self.assertTrue(predicate({'test_field': 1, 'other_field': 'a'}))
+        self.assertTrue(predicate({'test_field': 1024, 'other_field': 'a'}))
+        self.assertFalse(predicate({'test_field': 2, 'other_field': 'a'}))
+        self.assertFalse(predicate({'test_field': None, 'other_field': 'a'}))
+
+        filter_instance = Filter(tokens=['other_field', 'not-in', ['a', 'b']])
+        self.assertFalse(filter_instance.apply(entry={'test_field': 1, 'other_field': 'a'}, spec=spec))
+        self.assertTrue(filter_instance.apply(entry={'test_field': 1, 'other_field': 'c'}, spec=spec))
+
+        with patch('client_cli.cli.common.filtering.coerce', wraps=coerce) as mock_coerce:
+            filter_instance = Filter(tokens=['other_field', 'in', ['a', 'b', 'c']])
+            predicate = filter_instance.compile(spec=spec)
+            for _ in range(10):
+                predicate({'test_field': 1, 'other_field': 'a'})
+            self.assertEqual(mock_coerce.call_count, 3)
+
+    def test_should_filter_entries_with_patterns(self):
+        spec = {'test_field': int, 'other_field': str}
+
+        filter_instance = Filter(tokens=['other_field', 'glob', '/tmp/**'])
+        self.assertTrue(filter_instance.apply(entry={'test_field': 1, 'other_field': '/tmp/a/b'}, spec=spec))
+        self.assertFalse(filter_instance.apply(entry={'test_field': 1, 'other_field': '/other/a/b'}, spec=spec))
+
+        filter_instance = Filter(tokens=['test_field', 'matches', '^1[0-9]*$'])
+        self.assertTrue(filter_instance.apply(entry={'test_field': 1024, 'other_field': 'a'}, spec=spec))
+        self.assertFalse(filter_instance.apply(entry={'test_field': 2048, 'other_field': 'a'}, spec=spec))
+
     def test_should_fail_filtering_entries_when_invalid_field_is_provided(self):
         spec = {'test_field': int, 'other_field': int}
 
@@ -203,6 +306,81 @@ class FilterGroupSpec(unittest.TestCase):
     def test_should_provide_a_list_of_supported_operators(self):
         self.assertListEqual(FilterGroup.supported_operators(), ['AND', 'and', '&&', 'OR', 'or', '||'])
 
+    def test_should_compile_filters(self):
+        spec = {'test_field': int, 'other_field': str}
+
+        group = FilterGroup(
+            left=Filter(tokens=['test_field', '>', '1kb']),
+            operator='and',
+            right=Filter(tokens=['other_field', 'like', 'test'])
+        )
+
+        with patch('client_cli.cli.common.filtering.coerce', wraps=coerce) as mock_coerce:
+            predicate = group.compile(spec=spec)
+            self.assertEqual(mock_coerce.call_count, 2)
+
+            self.assertTrue(predicate({'test_field': 1025, 'other_field': 'some-test-value'}))
+            self.assertFalse(predicate({'test_field': 1024, 'other_field': 'some-test-value'}))
+            self.assertFalse(predicate({'test_field': 1025, 'other_field': 'some-value'}))
+            self.assertFalse(predicate({'test_field': None, 'other_field': 'some-test-value'}))
+            self.assertEqual(mock_coerce.call_count, 2)
+
+    def test_should_short_circuit_compiled_filters(self):
+        spec = {'test_field': int, 'other_field': str}
+
+        and_group = FilterGroup(
+            left=Filter(tokens=['test_field', '>', '42']),
+            operator='and',
+            right=Filter(tokens=['other_field', 'like', 'test'])
+        ).compile(spec=spec)
+
+        entry = RecordingEntry({'test_field': 40, 'other_field': 'some-test-value'})
+        self.assertFalse(and_group(entry))
+        self.assertListEqual(entry.retrieved, ['test_field'])
+
+        or_group = FilterGroup(
+            left=Filter(tokens=['test_field', '>', '42']),
+            operator='or',
+            right=Filter(tokens=['other_field', 'like', 'test'])
+        ).compile(spec=spec)
+
+        entry = RecordingEntry({'test_field': 50, 'other_field': 'some-value'})
+        self.assertTrue(or_group(entry))
+        self.assertListEqual(entry.retrieved, ['test_field'])
+
+    def test_should_reorder_compiled_filters(self):
+        spec = {'test_field': int, 'other_field': str}
+
+        group = FilterGroup(
+            left=Filter(tokens=['other_field', 'like', 'test']),
+            operator='and',
+            right=Filter(tokens=['test_field', '>', '42'])
+        )
+
+        self.assertEqual(group.left.cost, 2)
+        self.assertEqual(group.right.cost, 1)
+        self.assertEqual(group.cost, 3)
+
+        entry = RecordingEntry({'test_field': 40, 'other_field': 'some-test-value'})
+        self.assertFalse(group.compile(spec=spec, reorder=False)(entry))
+        self.assertListEqual(entry.retrieved, ['other_field', 'test_field'])
+
+        entry = RecordingEntry({'test_field': 40, 'other_field': 'some-test-value'})
+        self.assertFalse(group.compile(spec=spec, reorder=True)(entry))
+        self.assertListEqual(entry.retrieved, ['test_field'])
+
+    def test_should_fail_to_compile_filters_when_invalid_field_is_provided(self):
+        spec = {'test_field': int, 'other_field': str}
+
+        group = FilterGroup(
+            left=Filter(tokens=['test_field', '>', 42]),
+            operator='or',
+            right=Filter(tokens=['missing_field', 'like', 'test'])
+        )
+
+        with self.assertRaises(Abort):
+            group.compile(spec=spec)
+
 
 class FilterParserSpec(unittest.TestCase):
 
@@ -234,6 +412,205 @@ class FilterParserSpec(unittest.TestCase):
         self.assertFalse(parser.parse(raw_filter=and_filter).apply(entry=entry3, spec=spec))
         self.assertFalse(parser.parse(raw_filter=nested_filter).apply(entry=entry3, spec=spec))
 
+    def test_should_parse_raw_filter_strings_into_filter_groups(self):
+        parser = FilterParser()
+
+        self.assertDictEqual(
+            parser.parse(raw_filter='test_field>42').as_dict(),
+            {'field': 'test_field', 'operator': {'raw': '>'}, 'condition': '42'}
+        )
+
+        self.assertDictEqual(
+            parser.parse(raw_filter='a == 1 or b is-not none and (c like /tmp/test_ || d <= -1.5)').as_dict(),
+            {
+                'left': {'field': 'a', 'operator': {'raw': '=='}, 'condition': '1'},
+                'operator': 'or',
+                'right': {
+                    'left': {'field': 'b', 'operator': {'raw': 'is-not'}, 'condition': 'none'},
+                    'operator': 'and',
+                    'right': {
+                        'left': {'field': 'c', 'operator': {'raw': 'like'}, 'condition': '/tmp/test_'},
+                        'operator': '||',
+                        'right': {'field': 'd', 'operator': {'raw': '<='}, 'condition': '-1.5'},
+                    },
+                },
+            }
+        )
+
+        self.assertDictEqual(
+            parser.parse(raw_filter='a == 1 && b == 2 && c == 3').as_dict(),
+            {
+                'left': {'field': 'a', 'operator': {'raw': '=='}, 'condition': '1'},
+                'operator': '&&',
+                'right': {
+                    'left': {'field': 'b', 'operator': {'raw': '=='}, 'condition': '2'},
+                    'operator': '&&',
+                    'right': {'field': 'c', 'operator': {'raw': '=='}, 'condition': '3'},
+                },
+            }
+        )
+
+    def test_should_parse_raw_filter_strings_with_symbolic_group_operators_without_spaces(self):
+        parser = FilterParser()
+
+        self.assertDictEqual(
+            parser.parse(raw_filter='size>1&&hidden==yes').as_dict(),
+            {
+                'left': {'field': 'size', 'operator': {'raw': '>'}, 'condition': '1'},
+                'operator': '&&',
+                'right': {'field': 'hidden', 'operator': {'raw': '=='}, 'condition': 'yes'},
+            }
+        )
+
+        self.assertDictEqual(
+            parser.parse(raw_filter='a==1||b==2').as_dict(),
+            {
+                'left': {'field': 'a', 'operator': {'raw': '=='}, 'condition': '1'},
+                'operator': '||',
+                'right': {'field': 'b', 'operator': {'raw': '=='}, 'condition': '2'},
+            }
+        )
+
+        self.assertDictEqual(
+            parser.parse(raw_filter='(a==1||b==2)&&c==3').as_dict(),
+            {
+                'left': {
+                    'left': {'field': 'a', 'operator': {'raw': '=='}, 'condition': '1'},
+                    'operator': '||',
+                    'right': {'field': 'b', 'operator': {'raw': '=='}, 'condition': '2'},
+                },
+                'operator': '&&',
+                'right': {'field': 'c', 'operator': {'raw': '=='}, 'condition': '3'},
+            }
+        )
+
+        with self.assertLogs(level='ERROR'):
+            with self.assertRaises(Abort):
+                parser.parse(raw_filter='a == 1 android == 2')
+
+    def test_should_parse_raw_filter_strings_with_lists_of_values(self):
+        parser = FilterParser()
+
+        self.assertDictEqual(
+            parser.parse(raw_filter='test_field in (a, b,c)').as_dict(),
+            {'field': 'test_field', 'operator': {'raw': 'in'}, 'condition': ['a', 'b', 'c']}
+        )
+
+        self.assertDictEqual(
+            parser.parse(raw_filter='test_field not-in ()').as_dict(),
+            {'field': 'test_field', 'operator': {'raw': 'not-in'}, 'condition': []}
+        )
+
+        self.assertDictEqual(
+            parser.parse(raw_filter='test_field in a').as_dict(),
+            {'field': 'test_field', 'operator': {'raw': 'in'}, 'condition': ['a']}
+        )
+
+        with tempfile.TemporaryDirectory() as directory:
+            values_file = os.path.join(directory, 'values.txt')
+            with open(values_file, 'w', encoding='utf-8') as file:
+                file.write('a\n\n# comment\n b \nc\n')
+
+            self.assertDictEqual(
+                parser.parse(raw_filter='(test_field in @{}) and other_field == d'.format(values_file)).as_dict(),
+                {
+                    'left': {'field': 'test_field', 'operator': {'raw': 'in'}, 'condition': ['a', 'b', 'c']},
+                    'operator': 'and',
+                    'right': {'field': 'other_field', 'operator': {'raw': '=='}, 'condition': 'd'},
+                }
+            )
+
+            with self.assertRaises(Abort):
+                parser.parse(raw_filter='test_field in @{}/missing.txt'.format(directory))
+
+    def test_should_parse_raw_filter_strings_with_patterns(self):
+        parser = FilterParser()
+
+        self.assertDictEqual(
+            parser.parse(raw_filter='entity glob /home/user/**/*.txt').as_dict(),
+            {'field': 'entity', 'operator': {'raw': 'glob'}, 'condition': '/home/user/**/*.txt'}
+        )
+
+        self.assertDictEqual(
+            parser.parse(raw_filter='entity matches \'^/a/(b|c) d$\' or (entity glob "/tmp/[!a]*")').as_dict(),
+            {
+                'left': {'field': 'entity', 'operator': {'raw': 'matches'}, 'condition': '^/a/(b|c) d$'},
+                'operator': 'or',
+                'right': {'field': 'entity', 'operator': {'raw': 'glob'}, 'condition': '/tmp/[!a]*'},
+            }
+        )
+
+    def test_should_filter_entries_with_glob_patterns(self):
+        spec = {'entity': str}
+
+        entries = [
+            {'entity': '/home/user-{}/documents/{}/file-{}.txt'.format(i % 10, i % 100, i)}
+            for i in range(1000)
+        ]
+
+        parser = FilterParser()
+
+        matched = list(
+            Filtering(
+                parsed_filter=parser.parse(raw_filter='entity matches \'^/home/user-1/.*\\.txt$\'')
+            ).apply(entries=entries, spec=spec)
+        )
+
+        globbed = list(
+            Filtering(
+                parsed_filter=parser.parse(raw_filter='entity glob /home/user-1/**/*.txt')
+            ).apply(entries=entries, spec=spec)
+        )
+
+        self.assertListEqual(globbed, matched)
+        self.assertEqual(len(globbed), len(entries) // 10)
+
+    def test_should_filter_entries_with_lists_of_values_efficiently(self):
+        spec = {'test_field': int, 'other_field': str}
+        values = list(range(0, 1000, 2))
+
+        entries = [{'test_field': i, 'other_field': str(i)} for i in range(1000)]
+
+        parser = FilterParser()
+        chained_filter = parser.parse(raw_filter=' or '.join('test_field == {}'.format(i) for i in values))
+        membership_filter = parser.parse(raw_filter='test_field in ({})'.format(', '.join(map(str, values))))
+
+        chained = list(Filtering(parsed_filter=chained_filter).apply(entries=entries, spec=spec))
+        membership = list(Filtering(parsed_filter=membership_filter).apply(entries=entries, spec=spec))
+
+        self.assertListEqual(membership, chained)
+        self.assertEqual(len(membership), len(entries) // 2)
+
+        entry = RecordingEntry({'test_field': 999, 'other_field': '999'})
+        self.assertFalse(chained_filter.compile(spec=spec)(entry))
+        self.assertEqual(len(entry.retrieved), len(values))
+
+        entry = RecordingEntry({'test_field': 999, 'other_field': '999'})
+        self.assertFalse(membership_filter.compile(spec=spec)(entry))
+        self.assertListEqual(entry.retrieved, ['test_field'])
+
+    def test_should_fail_to_parse_invalid_filter_strings(self):
+        parser = FilterParser()
+
+        for raw_filter in ['', 'test_field', 'test_field >', 'test_field ? 42', '(test_field > 42', 'a == 1 or',
+                           'a == 1 b == 2', 'a == 1)', 'test_field in (a b)', 'test_field in (a,', 'test_field in']:
+            with self.assertRaises(Abort, msg='for filter [{}]'.format(raw_filter)):
+                parser.parse(raw_filter=raw_filter)
+
+    def test_should_parse_and_apply_long_filter_strings(self):
+        spec = {'test_field': int, 'other_field': str}
+
+        raw_filter = ' OR '.join(
+            '(test_field == {0} AND other_field like test-{0})'.format(i) for i in range(2000)
+        )
+
+        parsed = FilterParser().parse(raw_filter=raw_filter)
+
+        predicate = parsed.compile(spec=spec, reorder=True)
+        self.assertTrue(predicate({'test_field': 1999, 'other_field': 'some-test-1999'}))
+        self.assertFalse(predicate({'test_field': 1999, 'other_field': 'some-test-1998'}))
+        self.assertEqual(len(parsed.operands()), 2000)
+
 
 class FilteringSpec(unittest.TestCase):
 
@@ -273,6 +650,24 @@ class FilteringSpec(unittest.TestCase):
             [entries[0]]
         )
 
+    def test_should_filter_entries_with_compiled_filters(self):
+        spec = {'test_field': int, 'other_field': str, 'third_field': bool}
+        raw_filter = '(other_field like test-1 OR third_field == true) AND test_field >= 1kb AND test_field < 1mb'
+
+        unique_entries = [
+            {'test_field': i * 64, 'other_field': 'some-test-{}'.format(i), 'third_field': i % 3 == 0}
+            for i in range(1000)
+        ]
+
+        entries = unique_entries * 10
+        parsed_filter = FilterParser().parse(raw_filter=raw_filter)
+
+        interpreted = [entry for entry in unique_entries if parsed_filter.apply(entry=entry, spec=spec)]
+        compiled = list(Filtering(parsed_filter=parsed_filter).apply(entries=entries, spec=spec))
+
+        self.assertListEqual(compiled[:len(interpreted)], interpreted)
+        self.assertEqual(len(compiled), len(interpreted) * 10)
+
 
 class WithFilteringSpec(unittest.TestCase):
 
@@ -296,3 +691,13 @@ class WithFilteringSpec(unittest.TestCase):
 
         self.assertEqual(result.exit_code, 0)
         self.assertEqual(result.output.strip(), 'size=1')
+
+
+class RecordingEntry(dict):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.retrieved = []
+
+    def get(self, key, default=None):
+        self.retrieved.append(key)
+        return super().get(key, default)
@@ -0,0 +1,65 @@
+import json
+import unittest
+
+import click
+
+from client_cli.cli.common.projection import Projection, with_projection
+from tests.cli.cli_runner import Runner
+
+
+class ProjectionSpec(unittest.TestCase):
+
+    def test_should_project_entries(self):
+        entries = [
+            {'id': 0, 'test_field': 40, 'other_field': 'some-test-value'},
+            {'id': 1, 'test_field': 50, 'other_field': 'some-value'},
+        ]
+
+        self.assertListEqual(
+            Projection(fields=['other_field', 'id']).apply(entries),
+            [
+                {'other_field': 'some-test-value', 'id': 0},
+                {'other_field': 'some-value', 'id': 1},
+            ]
+        )
+
+        self.assertListEqual(
+            [list(entry.keys()) for entry in Projection(fields=['other_field', 'id']).apply(entries)],
+            [['other_field', 'id'], ['other_field', 'id']]
+        )
+
+    def test_should_validate_fields(self):
+        spec = {'id': int, 'test_field': int, 'other_field': str}
+
+        projection = Projection(fields=['test_field', 'id'])
+        self.assertEqual(projection.validate(spec=spec), projection)
+
+        with self.assertRaises(click.Abort):
+            Projection(fields=['id', 'missing_field']).validate(spec=spec)
+
+    def test_should_convert_projection_to_dict(self):
+        self.assertDictEqual(Projection(fields=['a', 'b']).as_dict(), {'fields': ['a', 'b']})
+
+    def test_should_convert_projection_to_string(self):
+        self.assertEqual(str(Projection(fields=['a', 'b'])), 'Projection(fields=[a, b])')
+
+    def test_should_support_projection_options(self):
+        @click.command()
+        @click.pass_context
+        @with_projection
+        def test(ctx):
+            click.echo(json.dumps(ctx.obj.projection.as_dict() if ctx.obj and ctx.obj.projection else None))
+
+        runner = Runner().with_command(test)
+
+        result = runner.invoke(args=['test', '--fields', 'a, b,,a,c'])
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertDictEqual(json.loads(result.output), {'fields': ['a', 'b', 'c']})
+
+        result = runner.invoke(args=['test'])
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertIsNone(json.loads(result.output))
+
+        result = runner.invoke(args=['test', '--fields', ' , '])
+        self.assertEqual(result.exit_code, 2, result.output)
+        self.assertIn('At least one field is required', result.output)
@@ -0,0 +1,188 @@
+import json
+import tracemalloc
+import unittest
+
+import click
+
+from client_cli.cli.common.filtering import Filtering, FilterParser, with_filtering
+from client_cli.cli.common.projection import Projection, with_projection
+from client_cli.cli.common.query import Query, RawEntry
+from client_cli.cli.common.sorting import Sorting, Paging, with_sorting
+from client_cli.render.flatten import dataset_metadata, extract_fields
+from tests.cli.cli_runner import Runner
+from tests.mocks import mock_data
+
+
+class QuerySpec(unittest.TestCase):
+
+    def test_should_process_flattened_entries(self):
+        spec = {'fields': {'id': int, 'test_field': int}, 'sorting': {'field': 'id', 'ordering': 'desc'}}
+        entries = [{'id': i, 'test_field': i % 3} for i in range(10)]
+
+        self.assertListEqual(Query(spec=spec).apply(entries), list(reversed(entries)))
+
+        query = Query(
+            spec=spec,
+            filtering=Filtering(parsed_filter=FilterParser().parse(raw_filter='test_field == 1')),
+            sorting=Sorting(field='id', ordering='asc'),
+            paging=Paging(limit=2, offset=1)
+        )
+
+        self.assertListEqual(query.apply(iter(entries)), [entries[4], entries[7]])
+
+    def test_should_process_raw_entries(self):
+        spec = dataset_metadata.get_spec_changes()
+        extractors = dataset_metadata.get_extractors_changes()
+
+        self.assertListEqual(
+            Query(spec=spec, extractors=extractors).apply(dataset_metadata.changes(mock_data.METADATA)),
+            Sorting(field='entity', ordering='asc').apply(
+                dataset_metadata.flatten_changes(mock_data.METADATA), spec['fields']
+            )
+        )
+
+        query = Query(
+            spec=spec,
+            extractors=extractors,
+            filtering=Filtering(parsed_filter=FilterParser().parse(raw_filter='changed == content and size > 1kb')),
+            sorting=Sorting(field='size', ordering='desc'),
+            paging=Paging(limit=1)
+        )
+
+        result = query.apply(dataset_metadata.changes(mock_data.METADATA))
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result[0]['size'], 1024 ** 3)
+        self.assertListEqual(list(result[0].keys()), list(spec['fields'].keys()))
+
+    def test_should_extract_only_filtered_fields_before_flattening(self):
+        spec = {'fields': {'id': int, 'test_field': int}, 'sorting': {'field': 'id', 'ordering': 'asc'}}
+        extracted = []
+
+        def extractor(field):
+            def extract(item):
+                extracted.append(field)
+                return item[field]
+
+            return extract
+
+        query = Query(
+            spec=spec,
+            extractors={'id': extractor('id'), 'test_field': extractor('test_field')},
+            filtering=Filtering(parsed_filter=FilterParser().parse(raw_filter='test_field == 1')),
+        )
+
+        result = query.apply([{'id': i, 'test_field': i % 5} for i in range(10)])
+
+        self.assertListEqual(result, [{'id': 1, 'test_field': 1}, {'id': 6, 'test_field': 1}])
+        self.assertEqual(extracted.count('test_field'), 10 + 2)
+        self.assertEqual(extracted.count('id'), 2)
+
+    def test_should_extract_only_projected_and_sorting_fields(self):
+        spec = {
+            'fields': {'id': int, 'test_field': int, 'other_field': str},
+            'sorting': {'field': 'id', 'ordering': 'desc'}
+        }
+        extracted = []
+
+        def extractor(field):
+            def extract(item):
+                extracted.append(field)
+                return item[field]
+
+            return extract
+
+        query = Query(
+            spec=spec,
+            extractors={field: extractor(field) for field in spec['fields']},
+            filtering=Filtering(parsed_filter=FilterParser().parse(raw_filter='other_field == b')),
+            projection=Projection(fields=['test_field'])
+        )
+
+        result = query.apply([{'id': i, 'test_field': i % 5, 'other_field': 'ab'[i % 2]} for i in range(10)])
+
+        self.assertListEqual([entry['test_field'] for entry in result], [4, 2, 0, 3, 1])
+        self.assertListEqual([list(entry.keys()) for entry in result], [['test_field']] * 5)
+        self.assertEqual(extracted.count('other_field'), 10)
+        self.assertEqual(extracted.count('test_field'), 5)
+        self.assertEqual(extracted.count('id'), 5)
+
+    def test_should_project_flattened_entries(self):
+        spec = {'fields': {'id': int, 'test_field': int}, 'sorting': {'field': 'id', 'ordering': 'asc'}}
+        entries = [{'id': i, 'test_field': i % 3} for i in range(3)]
+
+        query = Query(spec=spec, sorting=Sorting(field='test_field', ordering='desc'), projection=Projection(['id']))
+        self.assertListEqual(query.apply(entries), [{'id': 2}, {'id': 1}, {'id': 0}])
+
+    def test_should_fail_to_project_unsupported_fields(self):
+        spec = {'fields': {'id': int, 'test_field': int}, 'sorting': {'field': 'id', 'ordering': 'asc'}}
+
+        with self.assertRaises(click.Abort):
+            Query(spec=spec, projection=Projection(fields=['id', 'other'])).apply([{'id': 0, 'test_field': 0}])
+
+    def test_should_be_created_from_cli_context(self):
+        @click.command()
+        @click.pass_context
+        @with_filtering
+        @with_sorting
+        @with_projection
+        def test(ctx):
+            spec = {'fields': {'id': int, 'test_field': int}, 'sorting': {'field': 'id', 'ordering': 'asc'}}
+            entries = [{'id': i, 'test_field': i % 3} for i in range(10)]
+            click.echo(json.dumps(Query.from_context(ctx, spec=spec).apply(entries)))
+
+        runner = Runner().with_command(test)
+        result = runner.invoke(args=['test', '--filter', 'test_field == 0', '--order-by', 'id', '--limit', '2'])
+
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertListEqual(json.loads(result.output), [{'id': 9, 'test_field': 0}, {'id': 6, 'test_field': 0}])
+
+        result = runner.invoke(args=['test', '--order-by', 'test_field', '--limit', '2', '--fields', 'id'])
+
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertListEqual(json.loads(result.output), [{'id': 2}, {'id': 5}])
+
+    def test_should_limit_memory_usage_to_selected_entries(self):
+        spec = dataset_metadata.get_spec_changes()
+        extractors = dataset_metadata.get_extractors_changes()
+
+        entity = mock_data.METADATA['content_changed']['/some/path/01']
+        metadata = {
+            'content_changed': {
+                '/some/path/{}'.format(i): dict(entity, path='/some/path/{}'.format(i), size=i) for i in range(10000)
+            },
+            'metadata_changed': {},
+        }
+
+        tracemalloc.start()
+        try:
+            expected = Sorting(field='size', ordering='desc').apply(
+                dataset_metadata.flatten_changes(metadata), spec['fields']
+            )[:10]
+            _, eager_peak = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+
+            actual = Query(
+                spec=spec,
+                extractors=extractors,
+                sorting=Sorting(field='size', ordering='desc'),
+                paging=Paging(limit=10)
+            ).apply(dataset_metadata.changes(metadata))
+            _, lazy_peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        self.assertListEqual(actual, expected)
+        self.assertLess(lazy_peak, eager_peak)
+
+
+class RawEntrySpec(unittest.TestCase):
+
+    def test_should_extract_fields(self):
+        extractors = {'a': lambda item: item[0], 'b': lambda item: item[1] * 2}
+        entry = RawEntry(item=(1, 2), extractors=extractors)
+
+        self.assertEqual(entry.get('a'), 1)
+        self.assertEqual(entry.get('b'), 4)
+        self.assertIsNone(entry.get('c'))
+        self.assertEqual(entry.get('c', 'default'), 'default')
+        self.assertDictEqual(extract_fields(item=(1, 2), extractors=extractors), {'a': 1, 'b': 4})
@@ -1,8 +1,9 @@
+import random
 import unittest
 
 import click
 
-from client_cli.cli.common.sorting import Sorting, with_sorting
+from client_cli.cli.common.sorting import Sorting, Paging, with_sorting
 from tests.cli.cli_runner import Runner
 
 
@@ -27,6 +28,43 @@ class SortingSpec(unittest.TestCase):
             [entries[1], entries[0], entries[2]]
         )
 
+    def test_should_sort_and_page_entries(self):
+        spec = {'id': int, 'test_field': int}
+
+        entries = [{'id': i, 'test_field': i % 7} for i in range(50)]
+
+        for ordering in ['asc', 'desc']:
+            sorting = Sorting(field='test_field', ordering=ordering)
+            expected = sorting.apply(entries=entries, spec=spec)
+
+            for limit, offset in [(None, 0), (None, 5), (0, 0), (10, 0), (10, 5), (10, 45), (100, 0), (5, 100)]:
+                paging = Paging(limit=limit, offset=offset)
+                self.assertListEqual(
+                    sorting.apply(entries=entries, spec=spec, paging=paging),
+                    expected[offset:(offset + limit if limit is not None else None)],
+                    'for ordering [{}] and paging [{}]'.format(ordering, paging)
+                )
+
+    def test_should_select_top_entries_without_sorting_all_entries(self):
+        spec = {'id': int, 'test_field': str}
+        comparisons = []
+
+        entries = [
+            {'id': i, 'test_field': CountedValue(value=value, comparisons=comparisons)}
+            for i, value in enumerate(random.sample(range(1, 1000000), 10000))
+        ]
+        sorting = Sorting(field='test_field', ordering='desc')
+
+        sorted_entries = sorting.apply(entries=entries, spec=spec)[:20]
+        sorted_comparisons = len(comparisons)
+        comparisons.clear()
+
+        selected_entries = sorting.apply(entries=entries, spec=spec, paging=Paging(limit=20))
+        selected_comparisons = len(comparisons)
+
+        self.assertListEqual(selected_entries, sorted_entries)
+        self.assertLess(selected_comparisons, sorted_comparisons / 4)
+
     def test_should_support_updating_ordering(self):
         sorting = Sorting(field='test_field', ordering='asc')
 
@@ -98,6 +136,45 @@ class WithSortingSpec(unittest.TestCase):
         self.assertEqual(result_desc.exit_code, 0)
         self.assertEqual(result_desc.output.strip(), 'entries=1,0,2')
 
+    def test_should_create_paging_options(self):
+        @click.command()
+        @click.pass_context
+        @with_sorting
+        def test(ctx):
+            spec = {'id': int, 'test_field': int}
+            entries = [{'id': i, 'test_field': i} for i in range(10)]
+
+            sorting = ctx.obj.sorting or Sorting(field='id', ordering='asc')
+
+            click.echo(
+                'entries={}'.format(
+                    ','.join(map(lambda e: str(e['id']), sorting.apply(entries, spec=spec, paging=ctx.obj.paging)))
+                )
+            )
+
+        @click.group()
+        def cli():
+            pass
+
+        cli.add_command(test)
+
+        runner = Runner(cli)
+        result_limit = runner.invoke(args=['test', '--limit', '3'])
+        result_offset = runner.invoke(args=['test', '--offset', '8'])
+        result_both = runner.invoke(args=['test', '--order-by', 'test_field', '--limit', '2', '--offset', '1'])
+        result_invalid = runner.invoke(args=['test', '--limit', '-1'])
+
+        self.assertEqual(result_limit.exit_code, 0, result_limit.output)
+        self.assertEqual(result_limit.output.strip(), 'entries=0,1,2')
+
+        self.assertEqual(result_offset.exit_code, 0, result_offset.output)
+        self.assertEqual(result_offset.output.strip(), 'entries=8,9')
+
+        self.assertEqual(result_both.exit_code, 0, result_both.output)
+        self.assertEqual(result_both.output.strip(), 'entries=8,7')
+
+        self.assertNotEqual(result_invalid.exit_code, 0)
+
     def test_should_fail_if_ordering_specified_without_sorting(self):
         @click.command()
         @with_sorting
@@ -115,3 +192,30 @@ class WithSortingSpec(unittest.TestCase):
 
         self.assertEqual(result.exit_code, 2)
         self.assertTrue('Specifying "--ordering" without "--order-by" is not supported' in result.output.strip())
+
+
+class PagingSpec(unittest.TestCase):
+
+    def test_should_support_updating_limit_and_offset(self):
+        paging = Paging()
+
+        self.assertIsNone(paging.limit)
+        self.assertEqual(paging.offset, 0)
+        self.assertEqual(paging.with_limit(limit=10).limit, 10)
+        self.assertEqual(paging.with_offset(offset=5).offset, 5)
+
+    def test_should_be_representable_as_a_string(self):
+        self.assertEqual(str(Paging(limit=10, offset=5)), 'Paging(limit=[10], offset=[5])')
+
+    def test_should_be_representable_as_a_dict(self):
+        self.assertDictEqual(Paging(limit=10, offset=5).as_dict(), {'limit': 10, 'offset': 5})
+
+
+class CountedValue:
+    def __init__(self, value, comparisons):
+        self.value = value
+        self.comparisons = comparisons
+
+    def __lt__(self, other):
+        self.comparisons.append(other)
+        return self.value < other.value
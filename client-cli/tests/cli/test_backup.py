@@ -1,12 +1,23 @@
 import json
+import os
+import tempfile
 import unittest
+from datetime import datetime, timezone
 from unittest.mock import patch
 from uuid import uuid4
 
 from client_cli.cli.backup import cli
 from client_cli.cli.context import Context
+from client_cli.cli.entry_catalog import EntryCatalog
+from client_cli.cli.metadata_cache import MetadataCache
+from client_cli.cli.path_index import PathIndex
+from client_cli.render.csv_writer import CsvWriter
+from client_cli.render.default_writer import DefaultWriter
 from client_cli.render.json_writer import JsonWriter
+from client_cli.render.ndjson_writer import NdjsonWriter
 from tests.cli.cli_runner import Runner
+from tests.mocks import mock_data
+from tests.mocks.mock_async_client_api import MockAsyncClientApi
 from tests.mocks.mock_client_api import MockClientApi
 
 
@@ -37,6 +48,33 @@ class BackupSpec(unittest.TestCase):
         self.assertEqual(context.api.stats['dataset_entries'], 1)
         self.assertEqual(context.api.stats['dataset_entries_for_definition'], 0)
 
+    def test_should_show_limited_entries(self):
+        context = Context()
+        context.api = MockClientApi()
+        context.rendering = JsonWriter()
+
+        runner = Runner(cli)
+        result = runner.invoke(args=['show', 'entries', '--limit', '1'], obj=context)
+
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertEqual(len(json.loads(result.output)), 1)
+        self.assertEqual(context.api.stats['dataset_entries'], 1)
+
+    def test_should_show_entries_with_selected_fields(self):
+        context = Context()
+        context.api = MockClientApi()
+        context.rendering = JsonWriter()
+
+        runner = Runner(cli)
+        result = runner.invoke(args=['show', 'entries', '--fields', 'size,entry', '--order-by', 'created'], obj=context)
+
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertTrue(json.loads(result.output))
+        self.assertTrue(all(list(entry.keys()) == ['size', 'entry'] for entry in json.loads(result.output)))
+
+        result = runner.invoke(args=['show', 'entries', '--fields', 'size,other'], obj=context)
+        self.assertEqual(result.exit_code, 1, result.output)
+
     def test_should_show_entries_for_definition(self):
         context = Context()
         context.api = MockClientApi()
@@ -50,6 +88,65 @@ class BackupSpec(unittest.TestCase):
         self.assertEqual(context.api.stats['dataset_entries'], 0)
         self.assertEqual(context.api.stats['dataset_entries_for_definition'], 1)
 
+    def test_should_show_selected_entries(self):
+        context = Context()
+        context.api = MockClientApi()
+        context.rendering = JsonWriter()
+
+        runner = Runner(cli)
+        result = runner.invoke(
+            args=['show', 'entries', '--since', '2020-10-01T01:03:02', '--until', '2020-10-01T01:03:04'],
+            obj=context
+        )
+
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertListEqual(
+            [entry['entry'] for entry in json.loads(result.output)],
+            [mock_data.ENTRIES[2]['id'], mock_data.ENTRIES[1]['id']]
+        )
+
+        result = runner.invoke(args=['show', 'entries', '--latest', '1'], obj=context)
+
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertListEqual(
+            [entry['entry'] for entry in json.loads(result.output)],
+            [mock_data.ENTRIES[3]['id'], mock_data.ENTRIES[2]['id']]
+        )
+
+        result = runner.invoke(args=['show', 'entries', '--latest', '0'], obj=context)
+        self.assertEqual(result.exit_code, 2, result.output)
+
+    def test_should_show_cataloged_entries(self):
+        with tempfile.TemporaryDirectory() as directory:
+            context = Context()
+            context.api = MockClientApi()
+            context.rendering = JsonWriter()
+            context.entry_catalog = EntryCatalog(path=os.path.join(directory, 'catalog.db'))
+
+            runner = Runner(cli)
+            result = runner.invoke(args=['show', 'entries'], obj=context)
+
+            self.assertEqual(result.exit_code, 0, result.output)
+            self.assertEqual(len(json.loads(result.output)), len(mock_data.ENTRIES))
+            self.assertEqual(len(context.entry_catalog.entries()), len(mock_data.ENTRIES))
+
+            until = datetime(2020, 10, 1, 1, 3, 3, tzinfo=timezone.utc).astimezone().strftime('%Y-%m-%dT%H:%M:%S')
+            result = runner.invoke(
+                args=['show', 'entries', mock_data.DEFINITIONS[0]['id'], '--latest', '2', '--until', until],
+                obj=context
+            )
+
+            self.assertEqual(result.exit_code, 0, result.output)
+            self.assertListEqual(
+                [entry['entry'] for entry in json.loads(result.output)],
+                [mock_data.ENTRIES[1]['id'], mock_data.ENTRIES[0]['id']]
+            )
+
+            self.assertEqual(context.api.stats['dataset_entries'], 1)
+            self.assertEqual(context.api.stats['dataset_entries_for_definition'], 0)
+
+            context.entry_catalog.close()
+
     def test_should_show_metadata(self):
         context = Context()
         context.api = MockClientApi()
@@ -69,6 +166,93 @@ class BackupSpec(unittest.TestCase):
 
         self.assertEqual(context.api.stats['dataset_metadata'], 3)
 
+    def test_should_show_cached_metadata(self):
+        with tempfile.TemporaryDirectory() as directory:
+            context = Context()
+            context.api = MockClientApi()
+            context.rendering = JsonWriter()
+            context.metadata_cache = MetadataCache(path=os.path.join(directory, 'cache.db'), max_size=1024 * 1024)
+
+            entry = str(uuid4())
+
+            runner = Runner(cli)
+            results = [
+                runner.invoke(args=['show', 'metadata', entry, output], obj=context)
+                for output in ['changes', 'crates', 'fs', 'changes']
+            ]
+
+            for result in results:
+                self.assertEqual(result.exit_code, 0, result.output)
+                self.assertTrue(json.loads(result.output))
+
+            self.assertEqual(results[0].output, results[3].output)
+            self.assertEqual(context.api.stats['dataset_metadata'], 1)
+            self.assertEqual(context.metadata_cache.stats()['hits'], 3)
+
+            context.metadata_cache.enabled = False
+            result = runner.invoke(args=['show', 'metadata', entry, 'changes'], obj=context)
+
+            self.assertEqual(result.exit_code, 0, result.output)
+            self.assertEqual(result.output, results[0].output)
+            self.assertEqual(context.api.stats['dataset_metadata'], 2)
+
+            context.metadata_cache.close()
+
+    def test_should_show_metadata_as_streamed_tables(self):
+        context = Context()
+        context.api = MockClientApi()
+        context.rendering = DefaultWriter()
+
+        runner = Runner(cli)
+        result = runner.invoke(
+            args=['show', 'metadata', str(uuid4()), 'changes', '--fields', 'entity,size'],
+            obj=context
+        )
+
+        self.assertEqual(result.exit_code, 0, result.output)
+
+        lines = result.output.strip().split('\n')
+        self.assertListEqual([column.strip() for column in lines[1].strip('|').split('|')], ['Entity', 'Size'])
+        self.assertTrue(all(line.startswith('+') or line.startswith('|') for line in lines))
+        self.assertEqual(len(set(len(line) for line in lines)), 1)
+
+    def test_should_show_metadata_as_ndjson(self):
+        context = Context()
+        context.api = MockClientApi()
+        context.rendering = NdjsonWriter()
+
+        runner = Runner(cli)
+        result = runner.invoke(
+            args=['show', 'metadata', str(uuid4()), 'changes', '--fields', 'entity,size'],
+            obj=context
+        )
+
+        self.assertEqual(result.exit_code, 0, result.output)
+
+        rows = [json.loads(line) for line in result.output.strip().split('\n')]
+        self.assertTrue(rows)
+        self.assertTrue(all(list(row.keys()) == ['entity', 'size'] for row in rows))
+
+    def test_should_show_metadata_as_csv(self):
+        context = Context()
+        context.api = MockClientApi()
+        context.rendering = CsvWriter()
+
+        runner = Runner(cli)
+        result = runner.invoke(
+            args=[
+                'show', 'metadata', str(uuid4()), 'changes',
+                '--filter', 'size > 1kb', '--order-by', 'size', '--fields', 'size,entity'
+            ],
+            obj=context
+        )
+
+        self.assertEqual(result.exit_code, 0, result.output)
+
+        lines = result.output.strip().split('\n')
+        self.assertEqual(lines[0], 'size,entity')
+        self.assertListEqual([line.split(',')[0] for line in lines[1:]], [str(1024 ** 3), str(32 * 1024)])
+
     def test_should_show_spec_for_definition(self):
         context = Context()
         context.api = MockClientApi()
@@ -242,6 +426,135 @@ class BackupSpec(unittest.TestCase):
         self.assertTrue(json.loads(result.output))
         self.assertEqual(context.api.stats['dataset_metadata_search'], 1)
 
+    def test_should_search_metadata_locally(self):
+        with tempfile.TemporaryDirectory() as directory:
+            context = Context()
+            context.api = MockClientApi()
+            context.rendering = JsonWriter()
+            context.metadata_cache = MetadataCache(path=os.path.join(directory, 'cache.db'), max_size=1024 * 1024)
+            context.entry_catalog = EntryCatalog(path=os.path.join(directory, 'catalog.db'))
+            context.path_index = PathIndex(path=os.path.join(directory, 'index.db'))
+
+            runner = Runner(cli)
+            with self.assertLogs(level='WARNING'):
+                result = runner.invoke(args=['search', 'path', '--local'], obj=context)
+
+            self.assertEqual(result.exit_code, 0, result.output)
+            self.assertListEqual(json.loads(result.output), [])
+
+            with self.assertLogs(level='INFO') as logs:
+                result = runner.invoke(args=['index', '--latest', '2'], obj=context)
+
+            self.assertEqual(result.exit_code, 0, result.output)
+            self.assertEqual(result.output, '')
+            self.assertIn('Indexed [3] new dataset entries and removed [0] dataset entries', '\n'.join(logs.output))
+            self.assertEqual(len(context.path_index.entries()), 3)
+            self.assertEqual(context.api.stats['dataset_definitions'], 1)
+            self.assertEqual(context.api.stats['dataset_metadata'], 3)
+
+            result = runner.invoke(args=['search', '.*/some/path/0[12]', '--local'], obj=context)
+
+            self.assertEqual(result.exit_code, 0, result.output)
+            self.assertListEqual(
+                sorted((match['definition'], match['entity']) for match in json.loads(result.output)),
+                sorted([
+                    (mock_data.DEFINITIONS[0]['id'], '/some/path/01'),
+                    (mock_data.DEFINITIONS[0]['id'], '/some/path/02'),
+                    (mock_data.DEFINITIONS[1]['id'], '/some/path/01'),
+                    (mock_data.DEFINITIONS[1]['id'], '/some/path/02'),
+                    (mock_data.DEFINITIONS[2]['id'], '-'),
+                ])
+            )
+            self.assertEqual(context.api.stats['dataset_metadata_search'], 0)
+
+            result = runner.invoke(args=['index'], obj=context)
+
+            self.assertEqual(result.exit_code, 0, result.output)
+            self.assertEqual(len(context.path_index.entries()), 2)
+            self.assertEqual(context.api.stats['dataset_metadata'], 3)
+
+            context.metadata_cache.close()
+            context.entry_catalog.close()
+            context.path_index.close()
+
+    def test_should_index_metadata_concurrently(self):
+        with tempfile.TemporaryDirectory() as directory:
+            async_api = MockAsyncClientApi()
+
+            context = Context()
+            context.api = MockClientApi()
+            context.create_async_api = lambda: async_api
+            context.rendering = JsonWriter()
+            context.metadata_cache = MetadataCache(path=os.path.join(directory, 'cache.db'), max_size=1024 * 1024)
+            context.entry_catalog = EntryCatalog(path=os.path.join(directory, 'catalog.db'))
+            context.path_index = PathIndex(path=os.path.join(directory, 'index.db'))
+
+            runner = Runner(cli)
+
+            with self.assertLogs(level='INFO') as logs:
+                result = runner.invoke(args=['index', '--latest', '2', '--concurrency', '2'], obj=context)
+
+            self.assertEqual(result.exit_code, 0, result.output)
+            self.assertIn('Indexed [3] new dataset entries and removed [0] dataset entries', '\n'.join(logs.output))
+            self.assertEqual(len(context.path_index.entries()), 3)
+            self.assertEqual(context.api.stats['dataset_metadata'], 0)
+            self.assertEqual(async_api.stats['dataset_metadata'], 3)
+            self.assertEqual(async_api.stats['aclose'], 1)
+            self.assertEqual(async_api.max_active_requests, 2)
+
+            result = runner.invoke(args=['search', '.*/some/path/0[12]', '--local'], obj=context)
+
+            self.assertEqual(result.exit_code, 0, result.output)
+            self.assertEqual(len(json.loads(result.output)), 5)
+
+            with self.assertLogs(level='INFO') as logs:
+                result = runner.invoke(args=['index', '--latest', '3', '--concurrency', '1'], obj=context)
+
+            self.assertEqual(result.exit_code, 0, result.output)
+            self.assertEqual(async_api.stats['dataset_metadata'], 3)
+            self.assertEqual(async_api.stats['aclose'], 1)
+
+            context.metadata_cache.close()
+            context.entry_catalog.close()
+            context.path_index.close()
+
+    def test_should_export_metadata(self):
+        try:
+            import pyarrow.parquet  # pylint: disable=import-outside-toplevel
+        except ImportError:
+            self.skipTest('pyarrow is not available')
+
+        context = Context()
+        context.api = MockClientApi()
+        context.rendering = JsonWriter()
+
+        runner = Runner(cli)
+
+        with tempfile.TemporaryDirectory() as directory:
+            output_file = os.path.join(directory, 'changes.parquet')
+            result = runner.invoke(
+                args=['export', 'changes', str(uuid4()), str(uuid4()), '-o', output_file, '--filter', 'size > 1kb'],
+                obj=context
+            )
+
+            self.assertEqual(result.exit_code, 0, result.output)
+            table = pyarrow.parquet.read_table(output_file)
+
+        self.assertEqual(context.api.stats['dataset_metadata'], 2)
+        self.assertEqual(table.num_rows, 4)
+        self.assertTrue(all(size > 1024 for size in table.column('size').to_pylist()))
+
+    def test_should_fail_to_export_metadata_without_entries(self):
+        context = Context()
+        context.api = MockClientApi()
+        context.rendering = JsonWriter()
+
+        runner = Runner(cli)
+        result = runner.invoke(args=['export', 'changes', '-o', 'changes.parquet'], obj=context)
+
+        self.assertEqual(result.exit_code, 2, result.output)
+        self.assertEqual(context.api.stats['dataset_metadata'], 0)
+
     @patch('click.confirm')
     def test_should_delete_dataset_definitions(self, mock_confirm):
         context = Context()
@@ -283,3 +596,54 @@ class BackupSpec(unittest.TestCase):
 
         self.assertTrue(json.loads(result.output))
         self.assertEqual(context.api.stats['dataset_entry_delete'], 1)
+
+    @patch('click.confirm')
+    def test_should_remove_deleted_dataset_entries_from_local_data(self, mock_confirm):
+        with tempfile.TemporaryDirectory() as directory:
+            context = Context()
+            context.api = MockClientApi()
+            context.rendering = JsonWriter()
+            context.metadata_cache = MetadataCache(path=os.path.join(directory, 'cache.db'), max_size=1024 * 1024)
+            context.entry_catalog = EntryCatalog(path=os.path.join(directory, 'catalog.db'))
+            context.entry_catalog.sync(mock_data.ENTRIES)
+            context.path_index = PathIndex(path=os.path.join(directory, 'index.db'))
+            context.path_index.add(mock_data.ENTRIES[0], entities=[('/a/b/c', {'entity_state': 'new'})])
+
+            mock_confirm.return_value = None
+
+            entry = mock_data.ENTRIES[0]['id']
+
+            runner = Runner(cli)
+            result = runner.invoke(args=['show', 'metadata', entry], obj=context)
+            self.assertEqual(result.exit_code, 0, result.output)
+            self.assertEqual(context.metadata_cache.stats()['entries'], 1)
+
+            result = runner.invoke(args=['delete', 'entry', entry], obj=context)
+            self.assertEqual(result.exit_code, 0, result.output)
+            self.assertEqual(context.api.stats['dataset_entry_delete'], 1)
+            self.assertEqual(context.metadata_cache.stats()['entries'], 0)
+            self.assertEqual(len(context.entry_catalog.entries()), len(mock_data.ENTRIES) - 1)
+            self.assertSetEqual(context.path_index.entries(), set())
+
+            context.metadata_cache.close()
+            context.entry_catalog.close()
+            context.path_index.close()
+
+    @patch('click.confirm')
+    def test_should_not_create_missing_local_data_when_deleting_dataset_entries(self, mock_confirm):
+        with tempfile.TemporaryDirectory() as directory:
+            context = Context()
+            context.api = MockClientApi()
+            context.rendering = JsonWriter()
+            context.metadata_cache = MetadataCache(path=os.path.join(directory, 'cache.db'), max_size=1024 * 1024)
+            context.entry_catalog = EntryCatalog(path=os.path.join(directory, 'catalog.db'))
+            context.path_index = PathIndex(path=os.path.join(directory, 'index.db'))
+
+            mock_confirm.return_value = None
+
+            runner = Runner(cli)
+            result = runner.invoke(args=['delete', 'entry', mock_data.ENTRIES[0]['id']], obj=context)
+
+            self.assertEqual(result.exit_code, 0, result.output)
+            self.assertEqual(context.api.stats['dataset_entry_delete'], 1)
+            self.assertListEqual(os.listdir(directory), [])
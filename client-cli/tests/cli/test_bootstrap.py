@@ -8,6 +8,7 @@ from client_cli.cli.bootstrap import bootstrap
 from client_cli.cli.context import Context
 from client_cli.render.default_writer import DefaultWriter
 from client_cli.render.json_writer import JsonWriter
+from client_cli.render.ndjson_writer import NdjsonWriter
 from tests.cli.cli_runner import Runner
 from tests.cli.test_service import MockProcess
 
@@ -328,6 +329,38 @@ class BootstrapSpec(unittest.TestCase):
             mock_spawn.return_value.sendline.assert_no_call(username)
             mock_spawn.return_value.sendline.assert_no_call(password)
 
+    @patch('psutil.process_iter')
+    def test_should_not_print_bootstrap_failure_information_for_machine_readable_output(self, mock_process_iter):
+        with patch('pexpect.spawn') as mock_spawn:
+            context = Context()
+            context.rendering = NdjsonWriter()
+            context.service_binary = 'test-name'
+            context.service_main_class = 'test.name.Main'
+
+            mock_process_iter.return_value = []
+            mock_spawn.return_value.expect.return_value = 1
+
+            server = 'https://localhost:1234'
+            code = 'code'
+            username = 'username'
+            password = 'password'
+
+            runner = Runner(bootstrap)
+            result = runner.invoke(
+                args=['--server', server,
+                      '--code', code,
+                      '--username', username,
+                      '--password', password,
+                      '--verify-password', password],
+                obj=context
+            )
+
+            self.assertEqual(result.exit_code, 0, result.output)
+            self.assertDictEqual(
+                json.loads(result.output),
+                {'successful': False, 'failure': 'Client bootstrap failed'}
+            )
+
 
 def assert_no_call(self, *args, **kwargs):
     # pylint: disable=protected-access
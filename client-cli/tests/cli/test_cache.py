@@ -0,0 +1,78 @@
+import json
+import os
+import tempfile
+import unittest
+
+from client_cli.cli.cache import cli
+from client_cli.cli.context import Context
+from client_cli.cli.entry_catalog import EntryCatalog
+from client_cli.cli.metadata_cache import MetadataCache, CACHED_SUBTREES
+from client_cli.cli.path_index import PathIndex
+from client_cli.json_stream import document_items
+from client_cli.render.json_writer import JsonWriter
+from tests.cli.cli_runner import Runner
+from tests.mocks import mock_data
+
+
+class CacheSpec(unittest.TestCase):
+
+    def test_should_show_cache_stats(self):
+        with tempfile.TemporaryDirectory() as directory:
+            context = Context()
+            context.metadata_cache = MetadataCache(path=os.path.join(directory, 'cache.db'), max_size=1024)
+            context.rendering = JsonWriter()
+
+            list(context.metadata_cache.store('entry-0', items=document_items(mock_data.METADATA, CACHED_SUBTREES)))
+
+            runner = Runner(cli)
+            result = runner.invoke(args=['stats'], obj=context)
+
+            self.assertEqual(result.exit_code, 0, result.output)
+
+            stats = json.loads(result.output)
+            self.assertEqual(stats['entries'], 1)
+            self.assertEqual(stats['max_size'], 1024)
+            self.assertTrue(stats['enabled'])
+
+            context.metadata_cache.close()
+
+    def test_should_clear_cache(self):
+        with tempfile.TemporaryDirectory() as directory:
+            context = Context()
+            context.metadata_cache = MetadataCache(path=os.path.join(directory, 'cache.db'), max_size=1024)
+            context.entry_catalog = EntryCatalog(path=os.path.join(directory, 'catalog.db'))
+            context.path_index = PathIndex(path=os.path.join(directory, 'index.db'))
+            context.rendering = JsonWriter()
+
+            list(context.metadata_cache.store('entry-0', items=document_items(mock_data.METADATA, CACHED_SUBTREES)))
+            context.entry_catalog.sync(mock_data.ENTRIES)
+            context.path_index.add(mock_data.ENTRIES[0], entities=[('/a/b/c', {'entity_state': 'new'})])
+
+            runner = Runner(cli)
+            with self.assertLogs(level='INFO') as logs:
+                result = runner.invoke(args=['clear'], obj=context)
+
+            self.assertEqual(result.exit_code, 0, result.output)
+            self.assertEqual(result.output, '')
+            self.assertIn('Removed [1] cached dataset entries', '\n'.join(logs.output))
+            self.assertEqual(context.metadata_cache.stats()['entries'], 0)
+            self.assertListEqual(context.entry_catalog.entries(), [])
+            self.assertSetEqual(context.path_index.entries(), set())
+
+            context.metadata_cache.close()
+            context.entry_catalog.close()
+            context.path_index.close()
+
+    def test_should_not_create_missing_local_data_when_clearing_cache(self):
+        with tempfile.TemporaryDirectory() as directory:
+            context = Context()
+            context.metadata_cache = MetadataCache(path=os.path.join(directory, 'cache.db'), max_size=1024)
+            context.entry_catalog = EntryCatalog(path=os.path.join(directory, 'catalog.db'))
+            context.path_index = PathIndex(path=os.path.join(directory, 'index.db'))
+            context.rendering = JsonWriter()
+
+            runner = Runner(cli)
+            result = runner.invoke(args=['clear'], obj=context)
+
+            self.assertEqual(result.exit_code, 0, result.output)
+            self.assertListEqual(os.listdir(directory), [])
@@ -0,0 +1,204 @@
+import os
+import stat
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from client_cli.cli import load_config_from_file
+from client_cli.cli.config_cache import CachedConfig, cache_path, load_cached_config, config_sources_fingerprint
+
+CONFIG = '''
+stasis.client {
+  api {
+    type = "http"
+    http {
+      interface = "localhost"
+      port = 9090
+      context {
+        enabled = true
+        keystore { type = "pkcs12", path = "/tmp/some/path", password = "" }
+      }
+    }
+  }
+}
+
+include "{include}"
+'''
+
+INCLUDED_CONFIG = '''
+stasis.client.api.init {
+  interface = "localhost"
+  port = 9091
+  context.enabled = false
+}
+'''
+
+
+class ConfigCacheSpec(unittest.TestCase):
+
+    def test_should_provide_cached_config_values(self):
+        config = CachedConfig(
+            values={
+                'a.b.c': 'test',
+                'a.b.d': 42,
+                'a.b.e': True,
+                'a.f': '1',
+                'a.g': 'false',
+            }
+        )
+
+        self.assertEqual(config.get_string('a.b.c'), 'test')
+        self.assertEqual(config.get_string('a.b.e'), 'true')
+        self.assertEqual(config.get_int('a.b.d'), 42)
+        self.assertEqual(config.get_int('a.f'), 1)
+        self.assertTrue(config.get_bool('a.b.e'))
+        self.assertFalse(config.get_bool('a.g'))
+
+        nested = config.get_config('a.b')
+        self.assertEqual(nested.get_string('c'), 'test')
+        self.assertEqual(nested.get_int('d'), 42)
+
+        with self.assertRaises(KeyError):
+            config.get_string('a.x')
+
+        with self.assertRaises(KeyError):
+            config.get_config('x')
+
+    def test_should_cache_loaded_configs(self):
+        with tempfile.TemporaryDirectory() as directory:
+            config_path = create_config(directory=directory)
+
+            config = load_config_from_file(config_file_path=config_path)
+            self.assertTrue(os.path.isfile(cache_path(config_path)))
+
+            with patch('pyhocon.ConfigFactory.parse_file') as mock_parse_file:
+                cached = load_config_from_file(config_file_path=config_path)
+                mock_parse_file.assert_not_called()
+
+            self.assertIsInstance(cached, CachedConfig)
+
+            for path in ['stasis.client.api.http', 'stasis.client.api.init']:
+                self.assertEqual(
+                    cached.get_config(path).get_string('interface'),
+                    config.get_config(path).get_string('interface')
+                )
+                self.assertEqual(cached.get_config(path).get_int('port'), config.get_config(path).get_int('port'))
+                self.assertEqual(
+                    cached.get_config(path).get_bool('context.enabled'),
+                    config.get_config(path).get_bool('context.enabled')
+                )
+
+            self.assertEqual(cached.get_string('stasis.client.api.type'), 'http')
+            self.assertEqual(cached.get_config('stasis.client.api.http').get_string('context.keystore.password'), '')
+
+    def test_should_invalidate_cached_configs_when_sources_change(self):
+        with tempfile.TemporaryDirectory() as directory:
+            config_path = create_config(directory=directory)
+            load_config_from_file(config_file_path=config_path)
+            self.assertIsNotNone(load_cached_config(config_file_path=config_path))
+
+            with open(os.path.join(directory, 'included.conf'), 'a', encoding='utf-8') as file:
+                file.write('stasis.client.api.init.port = 9092\n')
+
+            self.assertIsNone(load_cached_config(config_file_path=config_path))
+
+            config = load_config_from_file(config_file_path=config_path)
+            self.assertEqual(config.get_config('stasis.client.api.init').get_int('port'), 9092)
+
+            cached = load_config_from_file(config_file_path=config_path)
+            self.assertIsInstance(cached, CachedConfig)
+            self.assertEqual(cached.get_config('stasis.client.api.init').get_int('port'), 9092)
+
+    def test_should_not_cache_configs_with_substitutions(self):
+        with tempfile.TemporaryDirectory() as directory:
+            config_path = create_config(directory=directory)
+
+            with open(config_path, 'a', encoding='utf-8') as file:
+                file.write('stasis.client.api.http.port = ${?TEST_PORT}\n')
+
+            self.assertIsNone(config_sources_fingerprint(config_file_path=config_path))
+
+            load_config_from_file(config_file_path=config_path)
+            self.assertFalse(os.path.isfile(cache_path(config_path)))
+
+    def test_should_not_cache_configs_with_unsupported_includes(self):
+        with tempfile.TemporaryDirectory() as directory:
+            config_path = create_config(directory=directory)
+            self.assertEqual(len(config_sources_fingerprint(config_file_path=config_path)), 2)
+
+            for include in [
+                'include required(file("included.conf"))',
+                'include file("included.conf")',
+                'a { include required("included.conf") }',
+            ]:
+                with open(config_path, 'w', encoding='utf-8') as file:
+                    file.write(CONFIG.replace('include "{include}"', include))
+
+                self.assertEqual(len(config_sources_fingerprint(config_file_path=config_path)), 2, include)
+
+            for include in [
+                'include classpath("application.conf")',
+                'include url("https://localhost/client.conf")',
+                'include required(package("client_cli:client.conf"))',
+                'include "*.conf"',
+                'a { include "conf.d/?.conf" }',
+            ]:
+                with open(config_path, 'w', encoding='utf-8') as file:
+                    file.write(CONFIG.replace('include "{include}"', include))
+
+                self.assertIsNone(config_sources_fingerprint(config_file_path=config_path), include)
+
+            with open(config_path, 'w', encoding='utf-8') as file:
+                file.write(CONFIG.replace('{include}', 'includ*.conf'))
+
+            config = load_config_from_file(config_file_path=config_path)
+            self.assertEqual(config.get_config('stasis.client.api.init').get_int('port'), 9091)
+            self.assertFalse(os.path.isfile(cache_path(config_path)))
+
+    @unittest.skipIf(os.name != 'posix', 'file permissions are only checked on POSIX systems')
+    def test_should_restrict_access_to_cached_configs(self):
+        with tempfile.TemporaryDirectory() as directory:
+            config_path = create_config(directory=directory)
+
+            with open(cache_path(config_path), 'w', encoding='utf-8') as file:
+                file.write('{}')
+            os.chmod(cache_path(config_path), 0o644)
+
+            load_config_from_file(config_file_path=config_path)
+            self.assertIsNotNone(load_cached_config(config_file_path=config_path))
+            self.assertEqual(stat.S_IMODE(os.stat(cache_path(config_path)).st_mode), 0o600)
+
+            os.remove(cache_path(config_path))
+            load_config_from_file(config_file_path=config_path)
+            self.assertEqual(stat.S_IMODE(os.stat(cache_path(config_path)).st_mode), 0o600)
+
+    def test_should_not_import_pyhocon_when_loading_cached_configs(self):
+        with tempfile.TemporaryDirectory() as directory:
+            config_path = create_config(directory=directory)
+            load_config_from_file(config_file_path=config_path)
+
+            result = subprocess.run(
+                [
+                    sys.executable, '-c',
+                    'import sys; from client_cli.cli import load_config_from_file; '
+                    'load_config_from_file({}); print("pyhocon" in sys.modules)'.format(repr(config_path))
+                ],
+                capture_output=True,
+                check=True
+            )
+
+            self.assertEqual(result.stdout.decode('utf-8').strip(), 'False')
+
+
+def create_config(directory):
+    config_path = os.path.join(directory, 'client.conf')
+
+    with open(config_path, 'w', encoding='utf-8') as file:
+        file.write(CONFIG.replace('{include}', 'included.conf'))
+
+    with open(os.path.join(directory, 'included.conf'), 'w', encoding='utf-8') as file:
+        file.write(INCLUDED_CONFIG)
+
+    return config_path
@@ -0,0 +1,272 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+from uuid import uuid4
+
+from client_cli.cli.entry_catalog import (
+    EntryCatalog, select_entries, catalog_entries, get_catalog_path, listing_digest
+)
+from tests.mocks import mock_data
+from tests.mocks.mock_client_api import MockClientApi
+
+
+class EntryCatalogSpec(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.path = get_catalog_path(os.path.join(self.directory.name, 'app'))
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_should_sync_entries_incrementally(self):
+        catalog = EntryCatalog(path=self.path)
+
+        self.assertEqual(catalog.sync(mock_data.ENTRIES[:2]), (2, 0))
+        self.assertEqual(catalog.sync(mock_data.ENTRIES[:2]), (0, 0))
+        self.assertEqual(catalog.sync(mock_data.ENTRIES), (2, 0))
+        self.assertEqual(catalog.sync(mock_data.ENTRIES[1:]), (0, 1))
+
+        self.assertListEqual(catalog.entries(), newest_first(mock_data.ENTRIES[1:]))
+
+        catalog.close()
+        self.assertListEqual(EntryCatalog(path=self.path).entries(), newest_first(mock_data.ENTRIES[1:]))
+
+    def test_should_skip_syncing_unchanged_listings(self):
+        catalog = EntryCatalog(path=self.path)
+        definition = mock_data.DEFINITIONS[0]['id']
+        definition_entries = [entry for entry in mock_data.ENTRIES if entry['definition'] == definition]
+
+        self.assertEqual(catalog.sync(mock_data.ENTRIES), (4, 0))
+        self.assertEqual(catalog.sync(definition_entries, definition=definition), (0, 0))
+
+        changes = catalog.connection.total_changes
+        with patch('client_cli.cli.entry_catalog.timestamp_key') as timestamp_key:
+            self.assertEqual(catalog.sync(mock_data.ENTRIES), (0, 0))
+            self.assertEqual(catalog.sync(definition_entries, definition=definition), (0, 0))
+
+        timestamp_key.assert_not_called()
+        self.assertEqual(catalog.connection.total_changes - changes, 2)  # only the sync times are updated
+
+        catalog.remove(mock_data.ENTRIES[0]['id'])
+        self.assertEqual(catalog.sync(mock_data.ENTRIES), (1, 0))
+
+        self.assertEqual(catalog.sync(definition_entries[1:], definition=definition), (0, 1))
+        self.assertEqual(catalog.sync(mock_data.ENTRIES), (1, 0))
+
+        catalog.clear()
+        self.assertEqual(catalog.sync(mock_data.ENTRIES), (4, 0))
+        self.assertListEqual(catalog.entries(), newest_first(mock_data.ENTRIES))
+
+    def test_should_create_listing_digests_based_on_entry_ids(self):
+        self.assertEqual(listing_digest(mock_data.ENTRIES), listing_digest([dict(e) for e in mock_data.ENTRIES]))
+        self.assertEqual(
+            listing_digest(mock_data.ENTRIES),
+            listing_digest([dict(entry, data='other') for entry in mock_data.ENTRIES])
+        )
+        self.assertNotEqual(listing_digest(mock_data.ENTRIES), listing_digest(mock_data.ENTRIES[1:]))
+        self.assertNotEqual(listing_digest(mock_data.ENTRIES), listing_digest(list(reversed(mock_data.ENTRIES))))
+        self.assertNotEqual(listing_digest([]), listing_digest(mock_data.ENTRIES))
+
+    def test_should_sync_entries_of_a_single_definition(self):
+        catalog = EntryCatalog(path=self.path)
+        definition = mock_data.DEFINITIONS[0]['id']
+
+        catalog.sync(mock_data.ENTRIES)
+
+        definition_entries = [entry for entry in mock_data.ENTRIES if entry['definition'] == definition]
+        self.assertEqual(catalog.sync(definition_entries[1:], definition=definition), (0, 1))
+
+        self.assertListEqual(catalog.entries(), newest_first(mock_data.ENTRIES[1:]))
+        self.assertListEqual(catalog.entries(definition=definition), newest_first(definition_entries[1:]))
+        self.assertListEqual(catalog.entries(definition=uuid4()), [])
+
+    def test_should_retrieve_entries_by_time_and_definition(self):
+        catalog = EntryCatalog(path=self.path)
+        catalog.sync(mock_data.ENTRIES)
+
+        for kwargs in [
+            {},
+            {'since': datetime(2020, 10, 1, 1, 3, 2, tzinfo=timezone.utc)},
+            {'until': datetime(2020, 10, 1, 1, 3, 3, tzinfo=timezone.utc)},
+            {
+                'since': datetime(2020, 10, 1, 1, 3, 2, tzinfo=timezone.utc),
+                'until': datetime(2020, 10, 1, 1, 3, 4, tzinfo=timezone.utc)
+            },
+            {'since': datetime(2020, 10, 2, tzinfo=timezone.utc)},
+            {'latest': 1},
+            {'latest': 2, 'until': datetime(2020, 10, 1, 1, 3, 4, tzinfo=timezone.utc)},
+        ]:
+            expected = select_entries(mock_data.ENTRIES, **kwargs)
+            self.assertListEqual(
+                sorted(catalog.entries(**kwargs), key=lambda entry: entry['id']),
+                sorted(expected, key=lambda entry: entry['id']),
+                kwargs
+            )
+
+        self.assertListEqual(
+            [entry['id'] for entry in catalog.entries(latest=1)],
+            [mock_data.ENTRIES[3]['id'], mock_data.ENTRIES[2]['id']]
+        )
+
+        self.assertListEqual(
+            [entry['id'] for entry in catalog.entries(definition=mock_data.DEFINITIONS[0]['id'], latest=2)],
+            [mock_data.ENTRIES[2]['id'], mock_data.ENTRIES[1]['id']]
+        )
+
+    def test_should_remove_and_clear_entries(self):
+        catalog = EntryCatalog(path=self.path)
+        catalog.sync(mock_data.ENTRIES)
+
+        catalog.remove(mock_data.ENTRIES[0]['id'])
+        catalog.remove(uuid4())
+        self.assertListEqual(catalog.entries(), newest_first(mock_data.ENTRIES[1:]))
+
+        self.assertEqual(catalog.clear(), 3)
+        self.assertListEqual(catalog.entries(), [])
+
+    def test_should_select_entries_without_catalog(self):
+        self.assertListEqual(select_entries(mock_data.ENTRIES), newest_first(mock_data.ENTRIES))
+
+        self.assertListEqual(
+            select_entries(
+                mock_data.ENTRIES,
+                since=datetime(2020, 10, 1, 1, 3, 2, tzinfo=timezone.utc),
+                until=datetime(2020, 10, 1, 1, 3, 4, tzinfo=timezone.utc)
+            ),
+            [mock_data.ENTRIES[2], mock_data.ENTRIES[1]]
+        )
+
+        self.assertListEqual(select_entries(mock_data.ENTRIES, latest=1), [mock_data.ENTRIES[3], mock_data.ENTRIES[2]])
+
+    def test_should_compare_entries_by_normalised_creation_time(self):
+        catalog = EntryCatalog(path=self.path)
+        entries = [
+            dict(mock_data.ENTRIES[0], id='a', created='2020-10-01T01:03:01.5Z'),
+            dict(mock_data.ENTRIES[0], id='b', created='2020-10-01T03:03:02+02:00'),
+            dict(mock_data.ENTRIES[0], id='c', created='2020-10-01T01:03:03Z'),
+            dict(mock_data.ENTRIES[0], id='d', created='2020-10-01T01:03:03.25'),
+        ]
+        catalog.sync(entries)
+
+        until = datetime(2020, 10, 1, 3, 3, 3, tzinfo=timezone(timedelta(hours=2)))
+
+        for kwargs, expected in [
+            ({}, ['d', 'c', 'b', 'a']),
+            ({'since': datetime(2020, 10, 1, 1, 3, 2, tzinfo=timezone.utc)}, ['d', 'c', 'b']),
+            ({'until': until}, ['b', 'a']),
+            ({'since': until}, ['d', 'c']),
+            ({'latest': 1}, ['d']),
+        ]:
+            self.assertListEqual([entry['id'] for entry in catalog.entries(**kwargs)], expected, kwargs)
+            self.assertListEqual([entry['id'] for entry in select_entries(entries, **kwargs)], expected, kwargs)
+
+    def test_should_retrieve_entries_via_catalog(self):
+        api = MockClientApi()
+        catalog = EntryCatalog(path=self.path)
+
+        self.assertFalse(catalog.is_fresh())
+        self.assertListEqual(catalog_entries(api=api, catalog=catalog), mock_data.ENTRIES)
+        self.assertListEqual(catalog.entries(), newest_first(mock_data.ENTRIES))
+        self.assertEqual(api.stats['dataset_entries'], 1)
+
+        self.assertTrue(catalog.is_fresh())
+        self.assertTrue(catalog.is_fresh(definition=mock_data.DEFINITIONS[1]['id']))
+
+        self.assertListEqual(catalog_entries(api=api, catalog=catalog), newest_first(mock_data.ENTRIES))
+        self.assertListEqual(
+            catalog_entries(api=api, catalog=catalog, definition=mock_data.DEFINITIONS[1]['id'], latest=1),
+            [mock_data.ENTRIES[3]]
+        )
+        self.assertEqual(api.stats['dataset_entries'], 1)
+        self.assertEqual(api.stats['dataset_entries_for_definition'], 0)
+
+        with patch('client_cli.cli.entry_catalog.SYNC_MAX_AGE', 0):
+            with patch('client_cli.cli.entry_catalog.select_entries') as select:
+                self.assertListEqual(
+                    catalog_entries(api=api, catalog=catalog, latest=1),
+                    [mock_data.ENTRIES[3], mock_data.ENTRIES[2]]
+                )
+                select.assert_not_called()
+            self.assertEqual(api.stats['dataset_entries'], 2)
+
+        self.assertListEqual(catalog_entries(api=api, catalog=None), mock_data.ENTRIES)
+        self.assertListEqual(
+            catalog_entries(api=api, catalog=None, latest=1),
+            [mock_data.ENTRIES[3], mock_data.ENTRIES[2]]
+        )
+        self.assertEqual(api.stats['dataset_entries'], 4)
+
+        catalog.enabled = False
+        catalog.clear()
+        self.assertListEqual(catalog_entries(api=api, catalog=catalog), mock_data.ENTRIES)
+        self.assertListEqual(catalog.entries(), [])
+        self.assertFalse(catalog.is_fresh())
+        self.assertEqual(api.stats['dataset_entries'], 5)
+
+    def test_should_not_create_catalog_when_checking_if_it_is_fresh(self):
+        catalog = EntryCatalog(path=self.path)
+
+        self.assertFalse(catalog.is_fresh())
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_should_fall_back_to_selecting_entries_without_catalog_on_failure(self):
+        api = MockClientApi()
+        catalog = EntryCatalog(path=self.path)
+
+        with patch('client_cli.cli.entry_catalog.EntryCatalog.sync') as mock_sync:
+            mock_sync.side_effect = sqlite3.OperationalError('database is locked')
+
+            self.assertListEqual(
+                catalog_entries(api=api, catalog=catalog, latest=1),
+                [mock_data.ENTRIES[3], mock_data.ENTRIES[2]]
+            )
+
+        with open(os.path.join(self.directory.name, 'file'), 'w', encoding='utf-8') as file:
+            file.write('test')
+
+        catalog = EntryCatalog(path=get_catalog_path(os.path.join(self.directory.name, 'file', 'app')))
+
+        with patch('client_cli.cli.entry_catalog.EntryCatalog.is_fresh') as mock_is_fresh:
+            mock_is_fresh.return_value = True
+
+            self.assertListEqual(
+                catalog_entries(api=api, catalog=catalog, latest=1),
+                [mock_data.ENTRIES[3], mock_data.ENTRIES[2]]
+            )
+
+        self.assertListEqual(
+            catalog_entries(api=api, catalog=catalog, latest=1),
+            [mock_data.ENTRIES[3], mock_data.ENTRIES[2]]
+        )
+
+    def test_should_retrieve_the_same_entries_as_client_side_selection(self):
+        definitions = [str(uuid4()) for _ in range(20)]
+        start_time = datetime(2020, 1, 1)
+        entries = [
+            dict(
+                mock_data.ENTRIES[1],
+                id=str(uuid4()),
+                definition=definitions[i % len(definitions)],
+                created=(start_time + timedelta(hours=i)).isoformat()
+            )
+            for i in range(2000)
+        ]
+
+        catalog = EntryCatalog(path=self.path)
+        catalog.sync(entries)
+        self.assertEqual(catalog.sync(entries), (0, 0))
+
+        for kwargs, expected in [
+            ({'latest': 1}, len(definitions)),
+            ({'since': datetime(2020, 2, 1), 'until': datetime(2020, 2, 8)}, 7 * 24),
+        ]:
+            cataloged = catalog.entries(**kwargs)
+            self.assertListEqual(cataloged, select_entries(entries, **kwargs))
+            self.assertEqual(len(cataloged), expected)
+
+def newest_first(entries):
+    return sorted(entries, key=lambda entry: entry['created'], reverse=True)
@@ -0,0 +1,59 @@
+import sys
+import unittest
+
+import click
+
+from client_cli.cli.lazy_group import LazyGroup
+from tests.cli.cli_runner import Runner
+
+
+class LazyGroupSpec(unittest.TestCase):
+
+    def test_should_load_subcommands_only_when_invoked(self):
+        sys.modules.pop('client_cli.cli.schedules', None)
+
+        @click.group(cls=LazyGroup, lazy_subcommands={'schedules': 'client_cli.cli.schedules:cli'})
+        def cli():
+            pass
+
+        self.assertEqual(cli.list_commands(ctx=None), ['schedules'])
+        self.assertNotIn('client_cli.cli.schedules', sys.modules)
+
+        result = Runner(cli).invoke(args=['schedules', '--help'])
+
+        self.assertEqual(result.exit_code, 0, result.output or result.exc_info)
+        self.assertIn('client_cli.cli.schedules', sys.modules)
+        self.assertIn('schedules', cli.commands)
+
+    def test_should_support_regular_subcommands(self):
+        @click.group(cls=LazyGroup, lazy_subcommands={'logs': 'client_cli.cli.logs:cli'})
+        def cli():
+            pass
+
+        @click.command(name='other')
+        def other():
+            click.echo('ok')
+
+        cli.add_command(other)
+
+        self.assertEqual(cli.list_commands(ctx=None), ['logs', 'other'])
+
+        result = Runner(cli).invoke(args=['other'])
+
+        self.assertEqual(result.exit_code, 0, result.output or result.exc_info)
+        self.assertEqual(result.output, 'ok\n')
+
+    def test_should_fail_to_load_invalid_subcommands(self):
+        @click.group(cls=LazyGroup, lazy_subcommands={'invalid': 'client_cli.cli.logs:show_logs_missing'})
+        def cli():
+            pass
+
+        with self.assertRaises(AttributeError):
+            cli.get_command(ctx=None, cmd_name='invalid')
+
+        @click.group(cls=LazyGroup, lazy_subcommands={'invalid': 'client_cli.cli.logs:os'})
+        def other_cli():
+            pass
+
+        with self.assertRaises(ValueError):
+            other_cli.get_command(ctx=None, cmd_name='invalid')
@@ -0,0 +1,61 @@
+import os
+import tempfile
+import time
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+from client_cli.cli.local_database import connect, timestamp_key
+
+
+class LocalDatabaseSpec(unittest.TestCase):
+
+    def test_should_create_databases(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'app', 'test.db')
+
+            connection = connect(path, schema=SCHEMA)
+            connection.execute('INSERT INTO test (value) VALUES (?)', ('a',))
+            connection.commit()
+            connection.close()
+
+            connection = connect(path, schema=SCHEMA)
+            self.assertListEqual(connection.execute('SELECT value FROM test').fetchall(), [('a',)])
+            connection.close()
+
+    def test_should_recreate_invalid_databases(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'test.db')
+            with open(path, 'wb') as file:
+                file.write(b'invalid' * 1024)
+
+            with self.assertLogs(level='WARNING'):
+                connection = connect(path, schema=SCHEMA)
+
+            self.assertListEqual(connection.execute('SELECT value FROM test').fetchall(), [])
+            connection.close()
+
+    def test_should_normalise_timestamps(self):
+        for timestamp in [
+            '2020-10-01T01:02:03.45',
+            '2020-10-01T01:02:03.45Z',
+            '2020-10-01T01:02:03.450000001Z',
+            '2020-10-01T03:02:03.45+02:00',
+            datetime(2020, 10, 1, 1, 2, 3, 450000, tzinfo=timezone.utc),
+            datetime(2020, 9, 30, 22, 2, 3, 450000, tzinfo=timezone(timedelta(hours=-3))),
+        ]:
+            self.assertEqual(timestamp_key(timestamp), '2020-10-01T01:02:03.450000', timestamp)
+
+        self.assertLess(timestamp_key('2020-10-01T01:02:03Z'), timestamp_key('2020-10-01T01:02:03.001Z'))
+
+    def test_should_treat_timestamps_without_timezone_as_local_time(self):
+        try:
+            with patch.dict(os.environ, {'TZ': 'Etc/GMT-2'}):
+                time.tzset()
+                self.assertEqual(timestamp_key(datetime(2020, 10, 1, 3, 2, 3)), '2020-10-01T01:02:03.000000')
+                self.assertEqual(timestamp_key('2020-10-01T03:02:03'), '2020-10-01T03:02:03.000000')
+        finally:
+            time.tzset()
+
+
+SCHEMA = 'CREATE TABLE IF NOT EXISTS test (value TEXT NOT NULL);'
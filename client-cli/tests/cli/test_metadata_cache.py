@@ -0,0 +1,298 @@
+import asyncio
+import json
+import os
+import sqlite3
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+from uuid import uuid4
+
+from client_cli import json_codec, json_stream
+from client_cli.cli.metadata_cache import (
+    MetadataCache, metadata_stream, retrieve_metadata, get_cache_path, CACHED_SUBTREES
+)
+from client_cli.render.flatten import dataset_metadata
+from tests.mocks import mock_data
+from tests.mocks.mock_async_client_api import MockAsyncClientApi
+from tests.mocks.mock_client_api import MockClientApi
+
+
+class MetadataCacheSpec(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.path = get_cache_path(os.path.join(self.directory.name, 'app'))
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_should_store_and_load_metadata(self):
+        cache = MetadataCache(path=self.path, max_size=1024 * 1024)
+        entry = uuid4()
+
+        self.assertIsNone(cache.load(entry, subtrees=CACHED_SUBTREES))
+        self.assertFalse(os.path.exists(self.path))
+
+        items = metadata_items(subtrees=CACHED_SUBTREES)
+        self.assertListEqual(list(cache.store(entry, items=iter(items))), items)
+
+        for subtrees in [CACHED_SUBTREES, dataset_metadata.SUBTREES_FILESYSTEM, dataset_metadata.SUBTREES_CRATES]:
+            self.assertListEqual(list(cache.load(entry, subtrees=subtrees)), metadata_items(subtrees=subtrees))
+
+        self.assertIsNone(cache.load(uuid4(), subtrees=CACHED_SUBTREES))
+
+        stats = cache.stats()
+        self.assertEqual(stats['path'], self.path)
+        self.assertTrue(stats['enabled'])
+        self.assertEqual(stats['entries'], 1)
+        self.assertGreater(stats['size'], 0)
+        self.assertEqual(stats['max_size'], 1024 * 1024)
+        self.assertGreater(stats['file_size'], 0)
+        self.assertEqual(stats['hits'], 3)
+        self.assertEqual(stats['misses'], 2)
+
+        cache.close()
+        self.assertListEqual(
+            list(MetadataCache(path=self.path, max_size=1024 * 1024).load(entry, subtrees=CACHED_SUBTREES)),
+            items
+        )
+
+    @patch('client_cli.cli.metadata_cache.CHUNK_SIZE', 2)
+    def test_should_store_metadata_in_multiple_chunks(self):
+        cache = MetadataCache(path=self.path, max_size=1024 * 1024)
+        entry = uuid4()
+
+        items = metadata_items(subtrees=CACHED_SUBTREES)
+        list(cache.store(entry, items=iter(items)))
+
+        self.assertGreater(len(items), 4)
+        self.assertListEqual(list(cache.load(entry, subtrees=CACHED_SUBTREES)), items)
+        self.assertListEqual(
+            list(cache.load(entry, subtrees=dataset_metadata.SUBTREES_CRATES)),
+            metadata_items(subtrees=dataset_metadata.SUBTREES_CRATES)
+        )
+
+    def test_should_not_store_incomplete_metadata(self):
+        cache = MetadataCache(path=self.path, max_size=1024 * 1024)
+        entry = uuid4()
+
+        stored = cache.store(entry, items=iter(metadata_items(subtrees=CACHED_SUBTREES)))
+        next(stored)
+        stored.close()
+
+        self.assertIsNone(cache.load(entry, subtrees=CACHED_SUBTREES))
+
+        def failing_items():
+            yield from metadata_items(subtrees=CACHED_SUBTREES)[:2]
+            raise RuntimeError('Test failure')
+
+        with self.assertRaises(RuntimeError):
+            list(cache.store(entry, items=failing_items()))
+
+        self.assertIsNone(cache.load(entry, subtrees=CACHED_SUBTREES))
+        self.assertEqual(cache.stats()['entries'], 0)
+
+    def test_should_not_write_when_loading_metadata(self):
+        cache = MetadataCache(path=self.path, max_size=1024 * 1024)
+        list(cache.store('entry-0', items=iter(metadata_items(subtrees=CACHED_SUBTREES))))
+
+        changes = cache.connection.total_changes
+        self.assertIsNotNone(cache.load('entry-0', subtrees=CACHED_SUBTREES))
+        self.assertIsNone(cache.load('entry-1', subtrees=CACHED_SUBTREES))
+        self.assertEqual(cache.connection.total_changes, changes)
+
+        stats = cache.stats()
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['misses'], 1)
+
+        list(cache.store('entry-1', items=iter(metadata_items(subtrees=CACHED_SUBTREES))))
+        cache.close()
+
+        stats = MetadataCache(path=self.path, max_size=1024 * 1024).stats()
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['misses'], 1)
+
+    def test_should_provide_metadata_when_storing_it_fails(self):
+        cache = MetadataCache(path=self.path, max_size=1024 * 1024)
+        items = metadata_items(subtrees=CACHED_SUBTREES)
+
+        with patch('client_cli.cli.metadata_cache.connect') as mock_connect:
+            mock_connect.side_effect = sqlite3.OperationalError('database is locked')
+            self.assertListEqual(list(cache.store('entry-0', items=iter(items))), items)
+
+        with patch('client_cli.cli.metadata_cache.MetadataCache._evict') as mock_evict:
+            mock_evict.side_effect = sqlite3.OperationalError('database or disk is full')
+            self.assertListEqual(list(cache.store('entry-1', items=iter(items))), items)
+
+        self.assertIsNone(cache.load('entry-0', subtrees=CACHED_SUBTREES))
+        self.assertIsNotNone(cache.load('entry-1', subtrees=CACHED_SUBTREES))
+
+    def test_should_store_and_load_metadata_with_large_integers(self):
+        cache = MetadataCache(path=self.path, max_size=1024 * 1024)
+        entity = dict(mock_data.METADATA['content_changed']['/some/path/01'], checksum=2 ** 256 - 1)
+        items = [('content_changed', '/some/path/01', entity)]
+
+        self.assertListEqual(list(cache.store('entry', items=iter(items))), items)
+        self.assertListEqual(list(cache.load('entry', subtrees=['content_changed'])), items)
+
+    def test_should_evict_least_recently_used_entries(self):
+        items = metadata_items(subtrees=CACHED_SUBTREES)
+
+        cache = MetadataCache(path=self.path, max_size=1024 * 1024)
+        list(cache.store('entry-0', items=iter(items)))
+        entry_size = cache.stats()['size']
+
+        cache.max_size = entry_size * 2
+        list(cache.store('entry-1', items=iter(items)))
+        time.sleep(0.01)
+        self.assertIsNotNone(cache.load('entry-0', subtrees=CACHED_SUBTREES))
+
+        list(cache.store('entry-2', items=iter(items)))
+
+        self.assertIsNotNone(cache.load('entry-0', subtrees=CACHED_SUBTREES))
+        self.assertIsNone(cache.load('entry-1', subtrees=CACHED_SUBTREES))
+        self.assertIsNotNone(cache.load('entry-2', subtrees=CACHED_SUBTREES))
+        self.assertEqual(cache.stats()['entries'], 2)
+        self.assertEqual(cache.stats()['size'], entry_size * 2)
+
+        cache.max_size = 0
+        list(cache.store('entry-3', items=iter(items)))
+        self.assertEqual(cache.stats()['entries'], 0)
+
+    def test_should_remove_and_clear_entries(self):
+        items = metadata_items(subtrees=CACHED_SUBTREES)
+
+        cache = MetadataCache(path=self.path, max_size=1024 * 1024)
+        for entry in ['entry-0', 'entry-1', 'entry-2']:
+            list(cache.store(entry, items=iter(items)))
+
+        cache.remove('entry-1')
+        cache.remove('other')
+
+        self.assertIsNotNone(cache.load('entry-0', subtrees=CACHED_SUBTREES))
+        self.assertIsNone(cache.load('entry-1', subtrees=CACHED_SUBTREES))
+        self.assertEqual(cache.stats()['entries'], 2)
+
+        self.assertEqual(cache.clear(), 2)
+
+        stats = cache.stats()
+        self.assertEqual(stats['entries'], 0)
+        self.assertEqual(stats['size'], 0)
+        self.assertEqual(stats['hits'], 0)
+        self.assertEqual(stats['misses'], 0)
+
+    def test_should_recreate_invalid_cache_files(self):
+        os.makedirs(os.path.dirname(self.path))
+        with open(self.path, 'wb') as file:
+            file.write(b'invalid' * 1024)
+
+        with self.assertLogs(level='WARNING'):
+            cache = MetadataCache(path=self.path, max_size=1024 * 1024)
+            self.assertIsNone(cache.load('entry-0', subtrees=CACHED_SUBTREES))
+
+        list(cache.store('entry-0', items=iter(metadata_items(subtrees=CACHED_SUBTREES))))
+        self.assertIsNotNone(cache.load('entry-0', subtrees=CACHED_SUBTREES))
+
+    def test_should_retrieve_metadata_via_cache(self):
+        api = MockClientApi()
+        cache = MetadataCache(path=self.path, max_size=1024 * 1024)
+        entry = uuid4()
+
+        for subtrees in [dataset_metadata.SUBTREES_FILESYSTEM, dataset_metadata.SUBTREES_CHANGES]:
+            self.assertListEqual(
+                list(metadata_stream(api=api, cache=cache, entry=entry, subtrees=subtrees)),
+                metadata_items(subtrees=subtrees)
+            )
+
+        self.assertEqual(api.stats['dataset_metadata'], 1)
+
+        self.assertListEqual(
+            list(metadata_stream(api=api, cache=None, entry=entry, subtrees=dataset_metadata.SUBTREES_CRATES)),
+            metadata_items(subtrees=dataset_metadata.SUBTREES_CRATES)
+        )
+        self.assertEqual(api.stats['dataset_metadata'], 2)
+
+        cache.enabled = False
+        self.assertListEqual(
+            list(metadata_stream(api=api, cache=cache, entry=entry, subtrees=dataset_metadata.SUBTREES_CRATES)),
+            metadata_items(subtrees=dataset_metadata.SUBTREES_CRATES)
+        )
+        self.assertEqual(api.stats['dataset_metadata'], 3)
+
+    def test_should_retrieve_metadata_concurrently_via_cache(self):
+        api = MockAsyncClientApi()
+        cache = MetadataCache(path=self.path, max_size=1024 * 1024)
+        entries = [str(uuid4()) for _ in range(5)]
+
+        def retrieve(subtrees, concurrency, cache_to_use=cache):
+            retrieved = {}
+
+            def handler(entry, items):
+                retrieved[entry] = list(items)
+
+            asyncio.run(
+                retrieve_metadata(
+                    api=api,
+                    cache=cache_to_use,
+                    entries=entries,
+                    subtrees=subtrees,
+                    concurrency=concurrency,
+                    handler=handler
+                )
+            )
+
+            return retrieved
+
+        retrieved = retrieve(subtrees=dataset_metadata.SUBTREES_FILESYSTEM, concurrency=2)
+        self.assertDictEqual(
+            retrieved,
+            {entry: metadata_items(subtrees=dataset_metadata.SUBTREES_FILESYSTEM) for entry in entries}
+        )
+        self.assertEqual(api.stats['dataset_metadata'], 5)
+        self.assertEqual(api.max_active_requests, 2)
+
+        retrieved = retrieve(subtrees=dataset_metadata.SUBTREES_CHANGES, concurrency=2)
+        self.assertDictEqual(
+            retrieved,
+            {entry: metadata_items(subtrees=dataset_metadata.SUBTREES_CHANGES) for entry in entries}
+        )
+        self.assertEqual(api.stats['dataset_metadata'], 5)
+
+        retrieved = retrieve(subtrees=dataset_metadata.SUBTREES_CRATES, concurrency=5, cache_to_use=None)
+        self.assertDictEqual(
+            retrieved,
+            {entry: metadata_items(subtrees=dataset_metadata.SUBTREES_CRATES) for entry in entries}
+        )
+        self.assertEqual(api.stats['dataset_metadata'], 10)
+        self.assertEqual(api.max_active_requests, 5)
+
+    def test_should_load_the_same_metadata_as_decoded_responses(self):
+        entity = mock_data.METADATA['content_changed']['/some/path/01']
+        metadata = {
+            'content_changed': {
+                '/some/path/{}'.format(i): dict(entity, path='/some/path/{}'.format(i), size=i) for i in range(2000)
+            },
+            'metadata_changed': {},
+            'filesystem': {
+                'entities': {'/some/path/{}'.format(i): {'entity_state': 'new'} for i in range(2000)}
+            },
+        }
+        document = json.dumps(metadata).encode('utf-8')
+
+        cache = MetadataCache(path=self.path, max_size=1024 * 1024 * 1024)
+        list(cache.store('entry', items=json_stream.document_items(document=metadata, subtrees=CACHED_SUBTREES)))
+
+        decoded = list(
+            json_stream.document_items(
+                document=json_codec.loads(document),
+                subtrees=dataset_metadata.SUBTREES_FILESYSTEM
+            )
+        )
+        cached = list(cache.load('entry', subtrees=dataset_metadata.SUBTREES_FILESYSTEM))
+
+        self.assertListEqual(cached, decoded)
+        self.assertLess(cache.stats()['file_size'], len(document))
+
+def metadata_items(subtrees):
+    return list(json_stream.document_items(document=mock_data.METADATA, subtrees=subtrees))
@@ -12,6 +12,7 @@ from client_cli.cli import (
     load_client_config,
     validate_duration,
     capture_failures,
+    echo_rendered,
     get_app_dir,
     get_top_level_command, is_client_configured,
 )
@@ -227,6 +228,26 @@ class CliPackageSpec(unittest.TestCase):
             None
         )
 
+    @patch('click.echo')
+    def test_should_echo_rendered_strings(self, mock_echo):
+        echo_rendered('test-result')
+        mock_echo.assert_called_once_with('test-result')
+
+    @patch('click.echo')
+    def test_should_echo_rendered_lines_in_chunks(self, mock_echo):
+        lines = ['line-{}'.format(i) for i in range(10)]
+
+        echo_rendered(iter(lines), buffer_size=len(lines[0]) * 4)
+
+        self.assertListEqual(
+            [call.args[0] for call in mock_echo.call_args_list],
+            ['\n'.join(lines[0:4]), '\n'.join(lines[4:8]), '\n'.join(lines[8:10])]
+        )
+
+        mock_echo.reset_mock()
+        echo_rendered(iter([]))
+        mock_echo.assert_not_called()
+
 
 class MockLogger:
     def __init__(self, level):
@@ -0,0 +1,279 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+from client_cli.cli.path_index import (
+    PathIndex, compile_query, fold_case, required_literals, trigrams, get_index_path
+)
+from tests.mocks import mock_data
+
+
+class PathIndexSpec(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.path = get_index_path(os.path.join(self.directory.name, 'app'))
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_should_compile_search_queries(self):
+        pattern, required = compile_query('Some-File 01')
+        self.assertTrue(pattern.fullmatch('/tmp/some-file 01.txt'))
+        self.assertFalse(pattern.fullmatch('/tmp/some-file-01.txt'))
+        self.assertSetEqual(required, trigrams('some-file 01'))
+
+        pattern, required = compile_query('.*/TMP/[a-z]+\\.txt')
+        self.assertTrue(pattern.fullmatch('/home/tmp/file.txt'))
+        self.assertFalse(pattern.fullmatch('/home/tmp/file.txt.bak'))
+        self.assertSetEqual(required, trigrams('/tmp/') | trigrams('.txt'))
+
+        pattern, required = compile_query('/tmp/[abc')
+        self.assertTrue(pattern.fullmatch('/tmp/[abc'))
+        self.assertFalse(pattern.fullmatch('/TMP/[abc'))
+        self.assertSetEqual(required, trigrams('/tmp/[abc'))
+
+        _, required = compile_query('.*(two|four)$')
+        self.assertSetEqual(required, set())
+
+    def test_should_extract_required_literals(self):
+        for expression, expected in [
+            ('.*abc.*', ['abc']),
+            ('.*/tmp/file\\.txt', ['/tmp/file.txt']),
+            ('abcd?e', ['abc']),
+            ('ab+cde', ['cde']),
+            ('abcd*', ['abc']),
+            ('abc{2,3}def', ['def']),
+            ('[^]abc]xyz', ['xyz']),
+            ('(a[)]bcd)efgh', ['efgh']),
+            ('\\dabcd\\w+', ['abcd']),
+            ('abc|def', []),
+            ('(?i)abcdef', []),
+            ('abécd', []),
+            ('.*', []),
+        ]:
+            self.assertListEqual(required_literals(expression), expected, expression)
+
+    def test_should_index_and_search_entry_paths(self):
+        index = PathIndex(path=self.path)
+
+        self.assertEqual(index.update(definitions=[], entries=[], entities=entities), (0, 0))
+        self.assertDictEqual(index.search('path'), {'definitions': {}})
+
+        self.assertEqual(
+            index.update(definitions=mock_data.DEFINITIONS, entries=mock_data.ENTRIES, entities=entities),
+            (len(mock_data.ENTRIES), 0)
+        )
+
+        result = index.search('path')
+        self.assertDictEqual(
+            result['definitions'][mock_data.DEFINITIONS[0]['id']],
+            {
+                'definition_info': mock_data.DEFINITIONS[0]['info'],
+                'entry_id': mock_data.ENTRIES[2]['id'],
+                'entry_created': mock_data.ENTRIES[2]['created'],
+                'matches': {
+                    path: state
+                    for path, state in mock_data.METADATA['filesystem']['entities'].items()
+                    if 'path' in path
+                },
+            }
+        )
+        self.assertEqual(
+            result['definitions'][mock_data.DEFINITIONS[1]['id']]['entry_id'],
+            mock_data.ENTRIES[3]['id']
+        )
+        self.assertIsNone(result['definitions'][mock_data.DEFINITIONS[2]['id']])
+
+        result = index.search('.*/some/PATH/0[13]', until=datetime(2020, 10, 1, 1, 3, 1, tzinfo=timezone.utc))
+        self.assertDictEqual(
+            result['definitions'][mock_data.DEFINITIONS[0]['id']]['matches'],
+            {
+                '/some/path/01': {'entity_state': 'new'},
+                '/some/path/03': {'entity_state': 'updated'},
+            }
+        )
+        self.assertEqual(
+            result['definitions'][mock_data.DEFINITIONS[0]['id']]['entry_id'],
+            mock_data.ENTRIES[0]['id']
+        )
+        self.assertIsNone(result['definitions'][mock_data.DEFINITIONS[1]['id']])
+
+        self.assertTrue(all(value is None for value in index.search('other')['definitions'].values()))
+
+        result = index.search('.*0[13]$')
+        self.assertDictEqual(
+            result['definitions'][mock_data.DEFINITIONS[0]['id']]['matches'],
+            {
+                '/some/path/01': {'entity_state': 'new'},
+                '/some/path/03': {'entity_state': 'updated'},
+            }
+        )
+
+        expected = index.search('path')
+        index.close()
+        self.assertDictEqual(PathIndex(path=self.path).search('path'), expected)
+
+    def test_should_search_entries_by_normalised_creation_time(self):
+        index = PathIndex(path=self.path)
+
+        index.add(dict(mock_data.ENTRIES[0], created='2020-10-01T01:03:01Z'), entities=[('/a/b/c', {})])
+        index.add(dict(mock_data.ENTRIES[1], created='2020-10-01T03:03:02.5+02:00'), entities=[('/a/b/c', {})])
+        index.update(definitions=mock_data.DEFINITIONS, entries=mock_data.ENTRIES[:2], entities=entities)
+
+        definition = mock_data.DEFINITIONS[0]['id']
+        for until, expected in [
+            (datetime(2020, 10, 1, 1, 3, 2, 500000, tzinfo=timezone.utc), mock_data.ENTRIES[1]),
+            (datetime(2020, 10, 1, 3, 3, 2, tzinfo=timezone(timedelta(hours=2))), mock_data.ENTRIES[0]),
+            (datetime(2020, 10, 1, 1, 3, 1, tzinfo=timezone.utc), mock_data.ENTRIES[0]),
+        ]:
+            self.assertEqual(index.search('/a/b/c', until=until)['definitions'][definition]['entry_id'], expected['id'])
+
+        with self.assertLogs(level='WARNING') as logs:
+            result = index.search('/a/b/c', until=datetime(2020, 10, 1, 1, 3, tzinfo=timezone.utc))
+
+        self.assertIsNone(result['definitions'][definition])
+        self.assertIn(definition, '\n'.join(logs.output))
+
+    def test_should_update_indexed_entries(self):
+        index = PathIndex(path=self.path)
+
+        index.update(definitions=mock_data.DEFINITIONS, entries=mock_data.ENTRIES[:2], entities=entities)
+        stats = index.stats()
+        self.assertEqual(stats['entries'], 2)
+        self.assertEqual(stats['paths'], 2 * len(mock_data.METADATA['filesystem']['entities']))
+        self.assertGreater(stats['postings'], 0)
+        self.assertGreater(stats['file_size'], 0)
+
+        requested = []
+
+        def tracked_entities(entry):
+            requested.append(entry['id'])
+            return entities(entry)
+
+        self.assertEqual(
+            index.update(definitions=mock_data.DEFINITIONS, entries=mock_data.ENTRIES[1:], entities=tracked_entities),
+            (2, 1)
+        )
+        self.assertListEqual(requested, [mock_data.ENTRIES[2]['id'], mock_data.ENTRIES[3]['id']])
+        self.assertSetEqual(index.entries(), {entry['id'] for entry in mock_data.ENTRIES[1:]})
+
+        index.remove(mock_data.ENTRIES[1]['id'])
+        index.remove('other')
+        self.assertEqual(index.stats()['paths'], 2 * len(mock_data.METADATA['filesystem']['entities']))
+
+        self.assertEqual(index.clear(), 2)
+
+        stats = index.stats()
+        self.assertEqual(stats['entries'], 0)
+        self.assertEqual(stats['paths'], 0)
+        self.assertEqual(stats['postings'], 0)
+
+    def test_should_keep_path_states_per_entry(self):
+        index = PathIndex(path=self.path)
+
+        index.add(mock_data.ENTRIES[0], entities=[('/a/b/c', {'entity_state': 'new'})])
+        index.add(mock_data.ENTRIES[1], entities=[('/a/b/c', {'entity_state': 'updated'}), ('/d/e/f', {})])
+
+        stats = index.stats()
+        self.assertEqual(stats['paths'], 3)
+        self.assertEqual(stats['postings'], len(trigrams('/a/b/c')) + len(trigrams('/a/b/c') | trigrams('/d/e/f')))
+
+        self.assertEqual(
+            index.update(definitions=mock_data.DEFINITIONS, entries=mock_data.ENTRIES[:2], entities=entities),
+            (0, 0)
+        )
+
+        for until, entry, expected in [
+            (
+                datetime(2020, 10, 1, 1, 3, 1, tzinfo=timezone.utc),
+                mock_data.ENTRIES[0],
+                {'/a/b/c': {'entity_state': 'new'}}
+            ),
+            (None, mock_data.ENTRIES[1], {'/a/b/c': {'entity_state': 'updated'}}),
+        ]:
+            result = index.search('.*/B/.*', until=until)['definitions'][mock_data.DEFINITIONS[0]['id']]
+            self.assertEqual(result['entry_id'], entry['id'])
+            self.assertDictEqual(result['matches'], expected)
+
+        index.remove(mock_data.ENTRIES[1]['id'])
+
+        stats = index.stats()
+        self.assertEqual(stats['paths'], 1)
+        self.assertEqual(stats['postings'], len(trigrams('/a/b/c')))
+
+    def test_should_search_indexed_candidates_instead_of_all_paths(self):
+        paths = [
+            '/home/user/{}/project-{}/src/module_{}/file-{}.{}'.format(
+                ['documents', 'photos', 'music', 'code'][i % 4],
+                i % 97,
+                i % 13,
+                i,
+                ['txt', 'jpg', 'py', 'md'][i % 7 % 4]
+            )
+            for i in range(5000)
+        ]
+
+        index = PathIndex(path=self.path)
+        index.update(
+            definitions=mock_data.DEFINITIONS[:1],
+            entries=[dict(mock_data.ENTRIES[0])],
+            entities=lambda _: ((path, {'entity_state': 'new'}) for path in paths)
+        )
+
+        candidates = []
+        original_candidates = PathIndex._candidates  # pylint: disable=protected-access
+
+        def counted_candidates(index, entry, required):
+            result = list(original_candidates(index, entry, required))
+            candidates.append(len(result))
+            return result
+
+        with patch.object(PathIndex, '_candidates', counted_candidates):
+            for query in ['file-4242', '.*/photos/project-42/.*\\.jpg', '.*(two|four)$']:
+                pattern, _ = compile_query(query)
+                scanned = {path for path in paths if pattern.fullmatch(path)}
+
+                result = index.search(query)['definitions'][mock_data.DEFINITIONS[0]['id']]
+                indexed = set(result['matches'].keys()) if result else set()
+
+                self.assertSetEqual(indexed, scanned, query)
+
+        self.assertEqual(len(candidates), 2)
+        self.assertTrue(all(count < len(paths) / 10 for count in candidates), candidates)
+
+    def test_should_find_paths_whose_case_folds_differently_from_their_matches(self):
+        paths = [
+            '/data/İstanbul/file-01.txt',
+            '/data/ıstanbul/file-02.txt',
+            '/data/istanbul/file-03.txt',
+            '/data/ISTANBUL/file-04.txt',
+            '/data/i\u0307stanbul/file-05.txt',
+            '/data/ankara/file-06.txt',
+        ]
+
+        index = PathIndex(path=self.path)
+        index.update(
+            definitions=mock_data.DEFINITIONS[:1],
+            entries=[dict(mock_data.ENTRIES[0])],
+            entities=lambda _: ((path, {'entity_state': 'new'}) for path in paths)
+        )
+
+        for query in ['istanbul', 'ISTANBUL', '.*/istanbul/.*', '.*/İstanbul/.*', '.*/ıstanbul/.*', '/data/İstanbul[']:
+            pattern, _ = compile_query(query)
+            scanned = {path for path in paths if pattern.fullmatch(path)}
+
+            result = index.search(query)['definitions'][mock_data.DEFINITIONS[0]['id']]
+            indexed = set(result['matches'].keys()) if result else set()
+
+            self.assertSetEqual(indexed, scanned, query)
+
+        self.assertEqual(fold_case('/İı/IiK'), '/ii/iik')
+        self.assertEqual(fold_case('Straße'), 'strasse')
+
+
+def entities(entry):
+    del entry
+    return mock_data.METADATA['filesystem']['entities'].items()
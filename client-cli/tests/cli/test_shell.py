@@ -0,0 +1,244 @@
+import json
+import os
+import tempfile
+import unittest
+
+import click
+import requests
+
+from client_cli.api.inactive_client_api import InactiveClientApi
+from client_cli.api.lazy_api import LazyApi, LazyClientApi
+from client_cli.cli import backup, schedules, service
+from client_cli.cli.context import Context
+from client_cli.cli.shell import shell
+from client_cli.render.json_writer import JsonWriter
+from tests.cli.cli_runner import Runner
+from tests.mocks.mock_client_api import MockClientApi
+
+
+class ShellSpec(unittest.TestCase):
+
+    def test_should_run_commands_from_stdin(self):
+        context = Context()
+        context.api = MockClientApi()
+        context.rendering = JsonWriter()
+
+        commands = [
+            'schedules show available',
+            '',
+            '# comment',
+            'backup show definitions',
+            'backup show definitions',
+        ]
+
+        result = create_runner().invoke(args=['shell'], obj=context, stdin='\n'.join(commands))
+
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertEqual(context.api.stats['schedules_public'], 1)
+        self.assertEqual(context.api.stats['dataset_definitions'], 2)
+
+    def test_should_run_commands_from_file(self):
+        context = Context()
+        context.api = MockClientApi()
+        context.rendering = JsonWriter()
+
+        with tempfile.TemporaryDirectory() as directory:
+            batch = os.path.join(directory, 'commands.txt')
+            with open(batch, 'w', encoding='utf-8') as file:
+                file.write('schedules show configured\nschedules refresh\n')
+
+            result = create_runner().invoke(args=['shell', '--batch', batch], obj=context)
+
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertEqual(context.api.stats['schedules_configured'], 1)
+        self.assertEqual(context.api.stats['schedules_configured_refresh'], 1)
+
+    def test_should_reset_filtering_sorting_and_projection_between_commands(self):
+        context = Context()
+        context.api = MockClientApi()
+        context.rendering = JsonWriter()
+
+        commands = [
+            'backup show definitions --filter "info == missing" --order-by info --fields info',
+            'backup show definitions',
+        ]
+
+        result = create_runner().invoke(args=['shell'], obj=context, stdin='\n'.join(commands))
+
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertIsNone(context.filtering)
+        self.assertIsNone(context.sorting)
+        self.assertIsNone(context.projection)
+
+        outputs = [json.loads(output) for output in split_json_outputs(result.output)]
+        self.assertEqual(len(outputs), 2)
+        self.assertEqual(len(outputs[0]), 0)
+        self.assertGreater(len(outputs[1]), 0)
+
+    def test_should_continue_after_failed_commands(self):
+        context = Context()
+        context.api = MockClientApi()
+        context.rendering = JsonWriter()
+
+        commands = [
+            'other',
+            'shell',
+            'backup show definitions --filter',
+            'backup show \'definitions',
+            'schedules show available',
+        ]
+
+        result = create_runner().invoke(args=['shell'], obj=context, stdin='\n'.join(commands))
+
+        self.assertEqual(result.exit_code, 1, result.output)
+        self.assertEqual(context.api.stats['schedules_public'], 1)
+
+    def test_should_stop_after_first_failure_when_requested(self):
+        context = Context()
+        context.api = MockClientApi()
+        context.rendering = JsonWriter()
+
+        commands = [
+            'other',
+            'schedules show available',
+        ]
+
+        result = create_runner().invoke(args=['shell', '--fail-fast'], obj=context, stdin='\n'.join(commands))
+
+        self.assertEqual(result.exit_code, 1, result.output)
+        self.assertEqual(context.api.stats['schedules_public'], 0)
+
+    def test_should_stop_processing_commands_on_exit(self):
+        context = Context()
+        context.api = MockClientApi()
+        context.rendering = JsonWriter()
+
+        commands = [
+            'schedules show available',
+            'exit',
+            'schedules show available',
+        ]
+
+        result = create_runner().invoke(args=['shell'], obj=context, stdin='\n'.join(commands))
+
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertEqual(context.api.stats['schedules_public'], 1)
+
+    def test_should_recreate_apis_after_service_state_changes(self):
+        apis = []
+        inits = []
+
+        context = Context()
+        context.api = LazyClientApi(factory=lambda: apis.append(MockClientApi()) or apis[-1])
+        context.init = LazyApi(factory=lambda: inits.append(object()) or inits[-1])
+        context.rendering = JsonWriter()
+
+        commands = [
+            'backup show definitions',
+            'backup show definitions',
+            'service stop --confirm',
+            'backup show definitions',
+        ]
+
+        result = create_runner().invoke(args=['shell'], obj=context, stdin='\n'.join(commands))
+
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertEqual(len(apis), 2)
+        self.assertEqual(apis[0].stats['dataset_definitions'], 2)
+        self.assertEqual(apis[0].stats['stop'], 1)
+        self.assertEqual(apis[1].stats['dataset_definitions'], 1)
+
+    def test_should_recreate_inactive_apis_before_every_command(self):
+        apis = [InactiveClientApi(), InactiveClientApi(), MockClientApi()]
+        created = []
+
+        def factory():
+            created.append(apis[len(created)])
+            return created[-1]
+
+        context = Context()
+        context.api = LazyClientApi(factory=factory)
+        context.rendering = JsonWriter()
+
+        commands = [
+            'backup show definitions',
+            'backup show definitions',
+            'backup show definitions',
+            'backup show definitions',
+        ]
+
+        with self.assertLogs(level='ERROR'):
+            result = create_runner().invoke(args=['shell'], obj=context, stdin='\n'.join(commands))
+
+        self.assertEqual(result.exit_code, 1, result.output)
+        self.assertEqual(len(created), 3)
+        self.assertEqual(apis[2].stats['dataset_definitions'], 2)
+
+    def test_should_recreate_apis_after_connection_failures(self):
+        class FailingClientApi(MockClientApi):
+            def dataset_definitions(self):
+                raise requests.exceptions.ConnectionError('test failure')
+
+        apis = [FailingClientApi(), MockClientApi()]
+        created = []
+
+        def factory():
+            created.append(apis[len(created)])
+            return created[-1]
+
+        context = Context()
+        context.api = LazyClientApi(factory=factory)
+        context.rendering = JsonWriter()
+
+        commands = [
+            'backup show definitions',
+            'backup show definitions',
+        ]
+
+        with self.assertLogs(level='ERROR') as logs:
+            result = create_runner().invoke(args=['shell'], obj=context, stdin='\n'.join(commands))
+
+        self.assertEqual(result.exit_code, 1, result.output)
+        self.assertIn('Failed to connect to client API: [test failure]', '\n'.join(logs.output))
+        self.assertEqual(len(created), 2)
+        self.assertEqual(apis[1].stats['dataset_definitions'], 1)
+
+    def test_should_support_command_help(self):
+        context = Context()
+        context.api = MockClientApi()
+        context.rendering = JsonWriter()
+
+        result = create_runner().invoke(args=['shell'], obj=context, stdin='schedules --help\n')
+
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertIn('schedules [OPTIONS] COMMAND', result.output)
+
+
+def create_runner():
+    @click.group()
+    def cli():
+        pass
+
+    return (
+        Runner(cli)
+        .with_command(backup.cli)
+        .with_command(schedules.cli)
+        .with_command(service.cli)
+        .with_command(shell)
+    )
+
+
+def split_json_outputs(output):
+    decoder = json.JSONDecoder()
+    outputs = []
+    position = 0
+
+    output = output.strip()
+    while position < len(output):
+        _, end = decoder.raw_decode(output, position)
+        outputs.append(output[position:end])
+        position = end
+        while position < len(output) and output[position].isspace():
+            position += 1
+
+    return outputs
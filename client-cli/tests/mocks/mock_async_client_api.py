@@ -0,0 +1,26 @@
+import asyncio
+
+from tests.mocks import mock_data
+
+
+class MockAsyncClientApi:
+    # pylint: disable=unused-argument
+
+    def __init__(self):
+        self.stats = {
+            'dataset_metadata': 0,
+            'aclose': 0,
+        }
+        self.active_requests = 0
+        self.max_active_requests = 0
+
+    async def aclose(self):
+        self.stats['aclose'] += 1
+
+    async def dataset_metadata(self, entry):
+        self.stats['dataset_metadata'] += 1
+        self.active_requests += 1
+        self.max_active_requests = max(self.max_active_requests, self.active_requests)
+        await asyncio.sleep(0.01)
+        self.active_requests -= 1
+        return mock_data.METADATA
@@ -565,3 +565,14 @@ INIT_STATE_PENDING = {'startup': 'pending'}
 INIT_STATE_SUCCESSFUL = {'startup': 'successful'}
 
 INIT_STATE_FAILED = {'startup': 'failed', 'cause': 'credentials', 'message': 'invalid credentials'}
+
+METADATA_CACHE_STATS = {
+    'path': '/tmp/stasis-client/metadata-cache.db',
+    'enabled': True,
+    'entries': 3,
+    'size': 1024 * 1024,
+    'max_size': 512 * 1024 * 1024,
+    'file_size': 2 * 1024 * 1024,
+    'hits': 10,
+    'misses': 3,
+}
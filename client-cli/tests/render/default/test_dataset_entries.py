@@ -14,6 +14,15 @@ class DatasetEntriesAsTableSpec(unittest.TestCase):
         table = render_as_table(entries=flatten(mock_data.ENTRIES))
         self.assertEqual(len(table.split('\n')), header_size + len(mock_data.ENTRIES) + footer_size)
 
+    def test_should_render_selected_dataset_entry_fields_as_a_table(self):
+        entries = [{'size': entry['size'], 'entry': entry['entry']} for entry in flatten(mock_data.ENTRIES)]
+
+        table = render_as_table(entries=entries)
+        header = table.split('\n')[1]
+
+        self.assertListEqual([column.strip() for column in header.strip('|').split('|')], ['Size', 'Entry'])
+        self.assertNotIn('Definition', table)
+
     def test_should_render_a_message_when_no_entries_are_available(self):
         result = render_as_table(entries=[])
         self.assertEqual(result, 'No data')
@@ -0,0 +1,16 @@
+import unittest
+
+from client_cli.render.default.metadata_cache import render
+from tests.mocks import mock_data
+
+
+class MetadataCacheSpec(unittest.TestCase):
+
+    def test_should_render_metadata_cache_stats(self):
+        result = render(stats=mock_data.METADATA_CACHE_STATS)
+        self.assertIn('location: /tmp/stasis-client/metadata-cache.db', result)
+        self.assertIn('enabled:  yes', result)
+        self.assertIn('entries:  3', result)
+        self.assertIn('size:     1 MB (max: 512 MB; file: 2 MB)', result)
+        self.assertIn('hits:     10', result)
+        self.assertIn('misses:   3', result)
@@ -0,0 +1,105 @@
+import tracemalloc
+import unittest
+from uuid import uuid4
+
+from terminaltables import AsciiTable
+
+from client_cli.render.default import dataset_metadata, render_columns_as_table, stream_columns_as_table
+from client_cli.render.flatten.dataset_metadata import flatten_changes, flatten_filesystem
+from tests.mocks import mock_data
+
+
+class DefaultPackageSpec(unittest.TestCase):
+
+    def test_should_render_columns_as_tables(self):
+        columns = dataset_metadata.CHANGES_COLUMNS
+        rows = flatten_changes(mock_data.METADATA)
+
+        self.assertEqual(render_columns_as_table(rows=rows, columns=columns), render_with_ascii_table(rows, columns))
+        self.assertEqual(render_columns_as_table(rows=[], columns=columns), 'No data')
+
+    def test_should_stream_columns_as_tables(self):
+        columns = dataset_metadata.FILESYSTEM_COLUMNS
+        rows = flatten_filesystem(str(uuid4()), mock_data.METADATA) + [
+            {'entity': '/some/päth/文件', 'state': 'new', 'entry': str(uuid4())}
+        ]
+
+        expected = render_with_ascii_table(rows, columns)
+
+        self.assertEqual('\n'.join(stream_columns_as_table(rows=rows, columns=columns)), expected)
+        self.assertEqual('\n'.join(stream_columns_as_table(rows=iter(rows), columns=columns)), expected)
+        self.assertListEqual(list(stream_columns_as_table(rows=iter([]), columns=columns)), ['No data'])
+
+    def test_should_stream_multi_line_cells_as_tables(self):
+        columns = dataset_metadata.CRATES_COLUMNS
+        rows = [
+            {'entity': '/some/path\nwith/a/longer/line', 'part': '0', 'crate': 'x'},
+            {'entity': '/a', 'part': '1\n2\n', 'crate': 'y\nz'},
+            {'entity': '/b\n', 'part': '', 'crate': 'päth\n文件'},
+            {'entity': '', 'part': '', 'crate': ''},
+        ]
+
+        expected = render_with_ascii_table(rows, columns)
+
+        self.assertEqual('\n'.join(stream_columns_as_table(rows=rows, columns=columns)), expected)
+        self.assertEqual('\n'.join(stream_columns_as_table(rows=iter(rows), columns=columns)), expected)
+        self.assertEqual(len(expected.split('\n')), 3 + 2 + 3 + 2 + 1 + 1)
+
+    def test_should_not_truncate_cells_wider_than_sampled_columns(self):
+        columns = dataset_metadata.CRATES_COLUMNS
+        rows = [
+            {'entity': '/a', 'part': '0', 'crate': 'x'},
+            {'entity': '/some/longer/path', 'part': '1', 'crate': 'y'},
+        ]
+
+        lines = list(stream_columns_as_table(rows=rows, columns=columns, sample_size=1))
+
+        self.assertEqual(len(lines), 3 + len(rows) + 1)
+        self.assertEqual(lines[3], '| /a     | 0    | x     |')
+        self.assertEqual(lines[4], '| /some/longer/path | 1    | y     |')
+
+    def test_should_stream_large_tables_lazily_and_with_less_memory(self):
+        columns = dataset_metadata.CHANGES_COLUMNS
+        entity = flatten_changes(mock_data.METADATA)[0]
+        rows = [dict(entity, entity='/some/path/{}'.format(i), size=i) for i in range(1000)]
+        consumed = []
+
+        def provided_rows():
+            for row in rows:
+                consumed.append(row)
+                yield row
+
+        lines = stream_columns_as_table(rows=provided_rows(), columns=columns, sample_size=10)
+        next(lines)
+        self.assertEqual(len(consumed), 10)
+
+        remaining_lines = list(lines)
+        self.assertEqual(len(consumed), len(rows))
+        self.assertEqual(len(remaining_lines), 3 + len(rows))
+
+        self.assertListEqual(
+            list(stream_columns_as_table(rows=rows, columns=columns)),
+            render_with_ascii_table(rows, columns).split('\n')
+        )
+
+        tracemalloc.start()
+        try:
+            render_with_ascii_table(rows, columns)
+            _, full_peak = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+
+            for _ in stream_columns_as_table(rows=rows, columns=columns):
+                pass
+            _, stream_peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        self.assertLess(stream_peak, full_peak)
+
+
+def render_with_ascii_table(rows, columns):
+    fields = list(rows[0].keys())
+    return AsciiTable(
+        [[columns[field][0] for field in fields]] +
+        [[columns[field][1](row[field]) for field in fields] for row in rows]
+    ).table
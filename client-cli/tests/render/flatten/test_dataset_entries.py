@@ -24,3 +24,11 @@ class DatasetEntriesSpec(unittest.TestCase):
                 self.assertIn(key, entry)
                 self.assertFalse(isinstance(entry[key], dict), 'for key [{}]'.format(key))
                 self.assertFalse(isinstance(entry[key], list), 'for key [{}]'.format(key))
+
+    def test_should_keep_raw_values_when_flattening_dataset_entries(self):
+        flattened = flatten(entries=mock_data.ENTRIES)
+
+        self.assertListEqual(
+            [entry['size'] for entry in flattened],
+            [entry.get('size') for entry in mock_data.ENTRIES]
+        )
@@ -1,6 +1,9 @@
+import json
 import unittest
 from uuid import uuid4
 
+from client_cli import json_stream
+from client_cli.render.flatten import dataset_metadata
 from client_cli.render.flatten.dataset_metadata import (
     get_spec_changes,
     get_spec_crates,
@@ -39,6 +42,18 @@ class DatasetMetadataSpec(unittest.TestCase):
                 self.assertFalse(isinstance(entry[key], dict), 'for key [{}]'.format(key))
                 self.assertFalse(isinstance(entry[key], list), 'for key [{}]'.format(key))
 
+    def test_should_keep_raw_values_when_flattening_changes_metadata(self):
+        expected = {
+            entity['path']: entity.get('size', 0)
+            for entity in list(mock_data.METADATA['content_changed'].values()) + list(
+                mock_data.METADATA['metadata_changed'].values()
+            )
+        }
+
+        for entry in flatten_changes(metadata=mock_data.METADATA):
+            self.assertIsInstance(entry['size'], int)
+            self.assertEqual(entry['size'], expected[entry['entity']])
+
     def test_should_retrieve_crates_metadata_spec(self):
         spec = get_spec_crates()
 
@@ -86,3 +101,36 @@ class DatasetMetadataSpec(unittest.TestCase):
                 self.assertIn(key, entry)
                 self.assertFalse(isinstance(entry[key], dict), 'for key [{}]'.format(key))
                 self.assertFalse(isinstance(entry[key], list), 'for key [{}]'.format(key))
+
+    @unittest.skipUnless(json_stream.is_available(), 'ijson is not available')
+    def test_should_process_streamed_metadata_subtrees(self):
+        document = json.dumps(mock_data.METADATA).encode('utf-8')
+
+        def stream(subtrees):
+            return json_stream.iter_items(source=document, subtrees=subtrees)
+
+        self.assertListEqual(
+            list(dataset_metadata.stream_changes(stream(dataset_metadata.SUBTREES_CHANGES))),
+            list(dataset_metadata.changes(mock_data.METADATA))
+        )
+        self.assertListEqual(
+            list(dataset_metadata.stream_crates(stream(dataset_metadata.SUBTREES_CRATES))),
+            list(dataset_metadata.crates(mock_data.METADATA))
+        )
+        self.assertListEqual(
+            list(dataset_metadata.stream_filesystem(stream(dataset_metadata.SUBTREES_FILESYSTEM))),
+            list(dataset_metadata.filesystem(mock_data.METADATA))
+        )
+
+    @unittest.skipUnless(json_stream.is_available(), 'ijson is not available')
+    def test_should_process_streamed_search_result_subtrees(self):
+        document = json.dumps(mock_data.METADATA_SEARCH_RESULTS).encode('utf-8')
+
+        self.assertListEqual(
+            list(
+                dataset_metadata.stream_search_result(
+                    json_stream.iter_items(source=document, subtrees=dataset_metadata.SUBTREES_SEARCH_RESULT)
+                )
+            ),
+            flatten_search_result(search_result=mock_data.METADATA_SEARCH_RESULTS)
+        )
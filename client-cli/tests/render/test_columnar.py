@@ -0,0 +1,165 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime, timezone
+from unittest.mock import patch
+from uuid import uuid4
+
+from click import Abort
+
+from client_cli.cli.common.filtering import Filtering, FilterParser
+from client_cli.render import columnar
+from client_cli.render.flatten import dataset_metadata
+from tests.mocks import mock_data
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+
+class ColumnarSpec(unittest.TestCase):
+
+    def test_should_flatten_items_into_batches(self):
+        entry = uuid4()
+        spec = dataset_metadata.get_spec_changes()
+        expected = dataset_metadata.flatten_changes(mock_data.METADATA)
+
+        batches = list(
+            columnar.to_batches(
+                entry=entry,
+                items=dataset_metadata.changes(mock_data.METADATA),
+                extractors=dataset_metadata.get_extractors_changes(),
+                batch_size=4
+            )
+        )
+
+        self.assertListEqual([len(batch[columnar.ENTRY_COLUMN]) for batch in batches], [4, len(expected) - 4])
+        self.assertListEqual(list(batches[0].keys()), [columnar.ENTRY_COLUMN] + list(spec['fields'].keys()))
+        self.assertListEqual(batches[0][columnar.ENTRY_COLUMN], [str(entry)] * 4)
+        self.assertListEqual(batches[0]['size'] + batches[1]['size'], [row['size'] for row in expected])
+        self.assertListEqual(batches[0]['checksum'], [str(row['checksum']) for row in expected[:4]])
+        self.assertListEqual(batches[0]['hidden'], [row['hidden'] == 'yes' for row in expected[:4]])
+        self.assertListEqual(
+            batches[0]['created'],
+            [datetime.fromisoformat(row['created']).replace(tzinfo=timezone.utc) for row in expected[:4]]
+        )
+
+    def test_should_filter_items_when_flattening_batches(self):
+        spec = dataset_metadata.get_spec_changes()
+        predicate = Filtering(
+            parsed_filter=FilterParser().parse(raw_filter='changed == content')
+        ).compile(spec=spec['fields'])
+
+        batches = list(
+            columnar.to_batches(
+                entry=uuid4(),
+                items=dataset_metadata.changes(mock_data.METADATA),
+                extractors=dataset_metadata.get_extractors_changes(),
+                batch_size=100,
+                predicate=predicate
+            )
+        )
+
+        self.assertEqual(len(batches), 1)
+        self.assertListEqual(batches[0]['changed'], ['content'] * len(mock_data.METADATA['content_changed']))
+
+    def test_should_fail_when_pyarrow_is_not_available(self):
+        with patch.dict('sys.modules', {'pyarrow': None}):
+            with self.assertRaises(Abort):
+                columnar.load_pyarrow()
+
+    @unittest.skipIf(pyarrow is None, 'pyarrow is not available')
+    def test_should_create_typed_schemas(self):
+        schema = columnar.create_schema(spec=dataset_metadata.get_spec_changes())
+
+        self.assertEqual(schema.field(columnar.ENTRY_COLUMN).type, pyarrow.string())
+        self.assertEqual(schema.field('entity').type, pyarrow.string())
+        self.assertEqual(schema.field('size').type, pyarrow.int64())
+        self.assertEqual(schema.field('crates').type, pyarrow.int64())
+        self.assertEqual(schema.field('checksum').type, pyarrow.string())
+        self.assertEqual(schema.field('hidden').type, pyarrow.bool_())
+        self.assertEqual(schema.field('created').type, pyarrow.timestamp('us', tz='UTC'))
+        self.assertEqual(schema.field('updated').type, pyarrow.timestamp('us', tz='UTC'))
+
+    @unittest.skipIf(pyarrow is None, 'pyarrow is not available')
+    def test_should_write_batches_to_files(self):
+        spec = dataset_metadata.get_spec_crates()
+        entries = [uuid4(), uuid4()]
+        expected = dataset_metadata.flatten_crates(mock_data.METADATA)
+
+        def batches():
+            for entry in entries:
+                yield from columnar.to_batches(
+                    entry=entry,
+                    items=dataset_metadata.crates(mock_data.METADATA),
+                    extractors=dataset_metadata.get_extractors_crates(),
+                    batch_size=2
+                )
+
+        with tempfile.TemporaryDirectory() as directory:
+            parquet_file = os.path.join(directory, 'crates.parquet')
+            arrow_file = os.path.join(directory, 'crates.arrow')
+
+            rows = columnar.write_batches(path=parquet_file, file_format='parquet', spec=spec, batches=batches())
+            self.assertEqual(rows, len(expected) * len(entries))
+            parquet_table = pyarrow.parquet.read_table(parquet_file)
+
+            rows = columnar.write_batches(path=arrow_file, file_format='arrow', spec=spec, batches=batches())
+            self.assertEqual(rows, len(expected) * len(entries))
+            with pyarrow.ipc.open_file(arrow_file) as reader:
+                arrow_table = reader.read_all()
+
+            with self.assertRaises(Abort):
+                columnar.write_batches(path=arrow_file, file_format='other', spec=spec, batches=batches())
+
+        for table in [parquet_table, arrow_table]:
+            self.assertEqual(table.num_rows, len(expected) * len(entries))
+            self.assertListEqual(table.column_names, [columnar.ENTRY_COLUMN] + list(spec['fields'].keys()))
+            self.assertListEqual(
+                table.column(columnar.ENTRY_COLUMN).to_pylist(),
+                [str(entries[0])] * len(expected) + [str(entries[1])] * len(expected)
+            )
+            self.assertListEqual(table.slice(0, len(expected)).drop([columnar.ENTRY_COLUMN]).to_pylist(), expected)
+
+    @unittest.skipIf(pyarrow is None, 'pyarrow is not available')
+    def test_should_write_typed_timestamps_and_booleans(self):
+        spec = dataset_metadata.get_spec_changes()
+        expected = dataset_metadata.flatten_changes(mock_data.METADATA)
+
+        batches = columnar.to_batches(
+            entry=uuid4(),
+            items=dataset_metadata.changes(mock_data.METADATA),
+            extractors=dataset_metadata.get_extractors_changes(),
+            batch_size=100
+        )
+
+        with tempfile.TemporaryDirectory() as directory:
+            parquet_file = os.path.join(directory, 'changes.parquet')
+            columnar.write_batches(path=parquet_file, file_format='parquet', spec=spec, batches=batches)
+            table = pyarrow.parquet.read_table(parquet_file)
+
+        self.assertEqual(table.schema.field('hidden').type, pyarrow.bool_())
+        self.assertEqual(table.schema.field('created').type, pyarrow.timestamp('us', tz='UTC'))
+        self.assertListEqual(table.column('hidden').to_pylist(), [row['hidden'] == 'yes' for row in expected])
+        self.assertListEqual(
+            [timestamp.isoformat() for timestamp in table.column('updated').to_pylist()],
+            ['{}+00:00'.format(row['updated']) for row in expected]
+        )
+
+    def test_should_convert_timestamps_with_time_zones_to_utc(self):
+        batches = list(
+            columnar.to_batches(
+                entry=uuid4(),
+                items=[{'created': '2020-10-01T03:02:03+02:00'}, {'created': '2020-10-01T01:02:03Z'}],
+                extractors={'created': lambda item: item['created']},
+                batch_size=100
+            )
+        )
+
+        self.assertListEqual(
+            [timestamp.astimezone(timezone.utc) for timestamp in batches[0]['created']],
+            [datetime(2020, 10, 1, 1, 2, 3, tzinfo=timezone.utc)] * 2
+        )
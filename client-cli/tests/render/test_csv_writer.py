@@ -0,0 +1,154 @@
+import csv
+import io
+import json
+import types
+import unittest
+from uuid import uuid4
+
+from client_cli.render.csv_writer import CsvWriter
+from client_cli.render.flatten import dataset_definitions, dataset_entries, dataset_metadata
+from tests.mocks import mock_data
+
+
+class CsvWriterSpec(unittest.TestCase):
+
+    def test_should_provide_machine_readable_output(self):
+        self.assertTrue(CsvWriter().is_machine_readable)
+        self.assertTrue(CsvWriter(dialect='excel-tab').is_machine_readable)
+
+    def test_should_render_dataset_definitions(self):
+        definitions = dataset_definitions.flatten(mock_data.DEFINITIONS)
+        self.assert_rows(CsvWriter().render_dataset_definitions(definitions=definitions), definitions)
+
+    def test_should_render_dataset_entries(self):
+        entries = dataset_entries.flatten(mock_data.ENTRIES)
+        self.assert_rows(CsvWriter().render_dataset_entries(entries=entries), entries)
+
+    def test_should_render_dataset_metadata_changes(self):
+        metadata = dataset_metadata.flatten_changes(mock_data.METADATA)
+        self.assert_rows(CsvWriter().render_dataset_metadata_changes(metadata=metadata), metadata)
+
+    def test_should_render_dataset_metadata_crates(self):
+        metadata = dataset_metadata.flatten_crates(mock_data.METADATA)
+        self.assert_rows(CsvWriter().render_dataset_metadata_crates(metadata=metadata), metadata)
+
+    def test_should_render_dataset_metadata_filesystem(self):
+        metadata = dataset_metadata.flatten_filesystem(str(uuid4()), mock_data.METADATA)
+        self.assert_rows(CsvWriter().render_dataset_metadata_filesystem(metadata=metadata), metadata)
+
+    def test_should_render_dataset_metadata_search_result(self):
+        search_result = dataset_metadata.flatten_search_result(mock_data.METADATA_SEARCH_RESULTS)
+        self.assert_rows(CsvWriter().render_dataset_metadata_search_result(search_result=search_result), search_result)
+
+    def test_should_render_dataset_rows_lazily(self):
+        entries = dataset_entries.flatten(mock_data.ENTRIES)
+        rendered = CsvWriter().render_dataset_entries(entries=iter(entries))
+
+        self.assertIsInstance(rendered, types.GeneratorType)
+        self.assertEqual(next(rendered), ','.join(dataset_entries.get_spec()['fields'].keys()))
+        self.assertEqual(next(rendered).split(',')[0], entries[0]['entry'])
+
+    def test_should_render_raw_values(self):
+        metadata = dataset_metadata.flatten_changes(mock_data.METADATA)
+        rows = parse_rows(CsvWriter().render_dataset_metadata_changes(metadata=metadata))
+
+        self.assertListEqual([int(row['size']) for row in rows], [entity['size'] for entity in metadata])
+
+    def test_should_render_tab_separated_values(self):
+        metadata = dataset_metadata.flatten_changes(mock_data.METADATA)
+        lines = list(CsvWriter(dialect='excel-tab').render_dataset_metadata_changes(metadata=metadata))
+
+        self.assertEqual(lines[0], '\t'.join(dataset_metadata.get_spec_changes()['fields'].keys()))
+        self.assertEqual(len(lines), len(metadata) + 1)
+        self.assert_rows(lines, metadata, dialect='excel-tab')
+
+    def test_should_render_nothing_when_no_rows_are_available(self):
+        self.assertListEqual(list(CsvWriter().render_dataset_entries(entries=[])), [])
+
+    def test_should_render_device(self):
+        rows = parse_rows(CsvWriter().render_device(device=mock_data.DEVICE))
+
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]['id'], mock_data.DEVICE['id'])
+        self.assertDictEqual(json.loads(rows[0]['limits']), mock_data.DEVICE['limits'])
+
+    def test_should_render_device_connections(self):
+        self.assertTrue(
+            CsvWriter().render_device_connections(connections=mock_data.ACTIVE_CONNECTIONS)
+        )
+
+    def test_should_render_device_commands(self):
+        self.assertEqual(
+            len(parse_rows(CsvWriter().render_device_commands(commands=mock_data.COMMANDS))),
+            len(mock_data.COMMANDS)
+        )
+
+    def test_should_render_operations(self):
+        self.assertEqual(
+            len(parse_rows(CsvWriter().render_operations(operations=mock_data.OPERATIONS))),
+            len(mock_data.OPERATIONS)
+        )
+
+    def test_should_render_operation_progress(self):
+        self.assertTrue(
+            CsvWriter().render_operation_progress(progress=mock_data.BACKUP_PROGRESS[-1])
+        )
+
+    def test_should_render_backup_rules(self):
+        self.assertTrue(
+            CsvWriter().render_backup_rules(rules=mock_data.BACKUP_RULES['default'])
+        )
+
+    def test_should_render_backup_specification_matched(self):
+        self.assertTrue(
+            CsvWriter().render_backup_specification_matched(state='included', spec=mock_data.BACKUP_SPEC)
+        )
+
+    def test_should_render_backup_specification_unmatched(self):
+        self.assertTrue(
+            CsvWriter().render_backup_specification_unmatched(spec=mock_data.BACKUP_SPEC)
+        )
+
+    def test_should_render_operation_response(self):
+        self.assertEqual(
+            CsvWriter().render_operation_response(response={'successful': True, 'operation': 'test-operation'}),
+            'successful,operation\nTrue,test-operation'
+        )
+
+    def test_should_render_public_schedules(self):
+        self.assertTrue(
+            CsvWriter().render_public_schedules(public_schedules=mock_data.SCHEDULES_PUBLIC)
+        )
+
+    def test_should_render_configured_schedules(self):
+        self.assertTrue(
+            CsvWriter().render_configured_schedules(configured_schedules=mock_data.SCHEDULES_CONFIGURED)
+        )
+
+    def test_should_render_user(self):
+        self.assertTrue(
+            CsvWriter().render_user(user=mock_data.USER)
+        )
+
+    def test_should_render_analytics_state(self):
+        self.assertTrue(
+            CsvWriter().render_analytics_state(state=mock_data.ANALYTICS)
+        )
+
+    def test_should_render_metadata_cache_stats(self):
+        self.assertTrue(
+            CsvWriter().render_metadata_cache_stats(stats=mock_data.METADATA_CACHE_STATS)
+        )
+
+    def assert_rows(self, rendered, expected, dialect='excel'):
+        rows = parse_rows(rendered, dialect=dialect)
+        self.assertListEqual([list(row.keys()) for row in rows], [list(row.keys()) for row in expected])
+        self.assertListEqual(
+            rows,
+            [{field: '' if value is None else str(value) for field, value in row.items()} for row in expected]
+        )
+
+
+def parse_rows(rendered, dialect='excel'):
+    content = rendered if isinstance(rendered, str) else '\n'.join(rendered)
+    return list(csv.DictReader(io.StringIO(content), dialect=dialect))
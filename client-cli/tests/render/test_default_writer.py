@@ -8,6 +8,9 @@ from tests.mocks import mock_data
 
 class DefaultWriterSpec(unittest.TestCase):
 
+    def test_should_not_provide_machine_readable_output(self):
+        self.assertFalse(DefaultWriter().is_machine_readable)
+
     def test_should_render_dataset_definitions(self):
         self.assertTrue(
             DefaultWriter().render_dataset_definitions(
@@ -128,3 +131,8 @@ class DefaultWriterSpec(unittest.TestCase):
         self.assertTrue(
             DefaultWriter().render_analytics_state(state=mock_data.ANALYTICS)
         )
+
+    def test_should_render_metadata_cache_stats(self):
+        self.assertTrue(
+            DefaultWriter().render_metadata_cache_stats(stats=mock_data.METADATA_CACHE_STATS)
+        )
@@ -6,6 +6,9 @@ from tests.mocks import mock_data
 
 class JsonWriterSpec(unittest.TestCase):
 
+    def test_should_provide_machine_readable_output(self):
+        self.assertTrue(JsonWriter().is_machine_readable)
+
     def test_should_render_dataset_definitions(self):
         self.assertTrue(
             JsonWriter().render_dataset_definitions(definitions=mock_data.DEFINITIONS)
@@ -108,3 +111,8 @@ class JsonWriterSpec(unittest.TestCase):
         self.assertTrue(
             JsonWriter().render_analytics_state(state=mock_data.ANALYTICS)
         )
+
+    def test_should_render_metadata_cache_stats(self):
+        self.assertTrue(
+            JsonWriter().render_metadata_cache_stats(stats=mock_data.METADATA_CACHE_STATS)
+        )
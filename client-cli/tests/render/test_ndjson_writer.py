@@ -0,0 +1,130 @@
+import json
+import types
+import unittest
+from uuid import uuid4
+
+from client_cli.render.flatten import dataset_definitions, dataset_entries, dataset_metadata
+from client_cli.render.ndjson_writer import NdjsonWriter
+from tests.mocks import mock_data
+
+
+class NdjsonWriterSpec(unittest.TestCase):
+
+    def test_should_provide_machine_readable_output(self):
+        self.assertTrue(NdjsonWriter().is_machine_readable)
+
+    def test_should_render_dataset_definitions(self):
+        definitions = dataset_definitions.flatten(mock_data.DEFINITIONS)
+        self.assertListEqual(
+            parse_lines(NdjsonWriter().render_dataset_definitions(definitions=definitions)),
+            definitions
+        )
+
+    def test_should_render_dataset_entries(self):
+        entries = dataset_entries.flatten(mock_data.ENTRIES)
+        self.assertListEqual(parse_lines(NdjsonWriter().render_dataset_entries(entries=entries)), entries)
+
+    def test_should_render_dataset_metadata_changes(self):
+        metadata = dataset_metadata.flatten_changes(mock_data.METADATA)
+        self.assertListEqual(parse_lines(NdjsonWriter().render_dataset_metadata_changes(metadata=metadata)), metadata)
+
+    def test_should_render_dataset_metadata_crates(self):
+        metadata = dataset_metadata.flatten_crates(mock_data.METADATA)
+        self.assertListEqual(parse_lines(NdjsonWriter().render_dataset_metadata_crates(metadata=metadata)), metadata)
+
+    def test_should_render_dataset_metadata_filesystem(self):
+        metadata = dataset_metadata.flatten_filesystem(str(uuid4()), mock_data.METADATA)
+        self.assertListEqual(
+            parse_lines(NdjsonWriter().render_dataset_metadata_filesystem(metadata=metadata)),
+            metadata
+        )
+
+    def test_should_render_dataset_metadata_search_result(self):
+        search_result = dataset_metadata.flatten_search_result(mock_data.METADATA_SEARCH_RESULTS)
+        self.assertListEqual(
+            parse_lines(NdjsonWriter().render_dataset_metadata_search_result(search_result=search_result)),
+            search_result
+        )
+
+    def test_should_render_dataset_rows_lazily(self):
+        rendered = NdjsonWriter().render_dataset_entries(entries=iter(dataset_entries.flatten(mock_data.ENTRIES)))
+
+        self.assertIsInstance(rendered, types.GeneratorType)
+        self.assertNotIn('\n', next(rendered))
+        self.assertNotIn(' ', next(rendered))
+
+    def test_should_render_device(self):
+        self.assertDictEqual(json.loads(NdjsonWriter().render_device(device=mock_data.DEVICE)), mock_data.DEVICE)
+
+    def test_should_render_device_connections(self):
+        self.assertTrue(
+            NdjsonWriter().render_device_connections(connections=mock_data.ACTIVE_CONNECTIONS)
+        )
+
+    def test_should_render_device_commands(self):
+        self.assertListEqual(
+            parse_lines(NdjsonWriter().render_device_commands(commands=mock_data.COMMANDS)),
+            mock_data.COMMANDS
+        )
+
+    def test_should_render_operations(self):
+        self.assertListEqual(
+            parse_lines(NdjsonWriter().render_operations(operations=mock_data.OPERATIONS)),
+            mock_data.OPERATIONS
+        )
+
+    def test_should_render_operation_progress(self):
+        self.assertTrue(
+            NdjsonWriter().render_operation_progress(progress=mock_data.BACKUP_PROGRESS[-1])
+        )
+
+    def test_should_render_backup_rules(self):
+        self.assertTrue(
+            NdjsonWriter().render_backup_rules(rules=mock_data.BACKUP_RULES['default'])
+        )
+
+    def test_should_render_backup_specification_matched(self):
+        self.assertTrue(
+            NdjsonWriter().render_backup_specification_matched(state='included', spec=mock_data.BACKUP_SPEC)
+        )
+
+    def test_should_render_backup_specification_unmatched(self):
+        self.assertTrue(
+            NdjsonWriter().render_backup_specification_unmatched(spec=mock_data.BACKUP_SPEC)
+        )
+
+    def test_should_render_operation_response(self):
+        self.assertEqual(
+            NdjsonWriter().render_operation_response(response={'successful': True, 'operation': 'test-operation'}),
+            '{"successful":true,"operation":"test-operation"}'
+        )
+
+    def test_should_render_public_schedules(self):
+        self.assertTrue(
+            NdjsonWriter().render_public_schedules(public_schedules=mock_data.SCHEDULES_PUBLIC)
+        )
+
+    def test_should_render_configured_schedules(self):
+        self.assertTrue(
+            NdjsonWriter().render_configured_schedules(configured_schedules=mock_data.SCHEDULES_CONFIGURED)
+        )
+
+    def test_should_render_user(self):
+        self.assertTrue(
+            NdjsonWriter().render_user(user=mock_data.USER)
+        )
+
+    def test_should_render_analytics_state(self):
+        self.assertTrue(
+            NdjsonWriter().render_analytics_state(state=mock_data.ANALYTICS)
+        )
+
+    def test_should_render_metadata_cache_stats(self):
+        self.assertTrue(
+            NdjsonWriter().render_metadata_cache_stats(stats=mock_data.METADATA_CACHE_STATS)
+        )
+
+
+def parse_lines(rendered):
+    lines = rendered.split('\n') if isinstance(rendered, str) else list(rendered)
+    return [json.loads(line) for line in lines]
@@ -0,0 +1,110 @@
+import json
+import unittest
+from unittest.mock import patch
+
+from client_cli import json_codec
+from client_cli.json_codec import OrjsonCodec, StdlibJsonCodec, create_codec
+from client_cli.render.json_writer import JsonWriter
+from tests.mocks import mock_data
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class JsonCodecSpec(unittest.TestCase):
+
+    def test_should_encode_and_decode_json_with_stdlib(self):
+        self.assert_valid_codec(codec=StdlibJsonCodec())
+        self.assertEqual(StdlibJsonCodec().dumps({'a': [1, 2]}, pretty=True), json.dumps({'a': [1, 2]}, indent=2))
+
+    @unittest.skipIf(orjson is None, 'orjson is not available')
+    def test_should_encode_and_decode_json_with_orjson(self):
+        self.assert_valid_codec(codec=OrjsonCodec())
+        self.assertEqual(OrjsonCodec().dumps({'a': [1, 2]}, pretty=True), json.dumps({'a': [1, 2]}, indent=2))
+
+    def test_should_create_codecs(self):
+        self.assertIsInstance(create_codec(name='json'), StdlibJsonCodec)
+
+        if orjson is not None:
+            self.assertIsInstance(create_codec(), OrjsonCodec)
+            self.assertIsInstance(create_codec(name='orjson'), OrjsonCodec)
+
+        with self.assertRaises(ValueError):
+            create_codec(name='other')
+
+    def test_should_fall_back_to_stdlib_when_orjson_is_not_available(self):
+        with patch.dict('sys.modules', {'orjson': None}):
+            self.assertIsInstance(create_codec(), StdlibJsonCodec)
+
+            with self.assertRaises(ImportError):
+                create_codec(name='orjson')
+
+    def test_should_use_default_codec(self):
+        with patch('client_cli.json_codec.CODEC', StdlibJsonCodec()):
+            self.assertDictEqual(json_codec.loads('{"a":1}'), {'a': 1})
+            self.assertEqual(json_codec.dumps({'a': 1}), '{"a":1}')
+            self.assertEqual(json_codec.dumps({'a': 1}, pretty=True), '{\n  "a": 1\n}')
+
+    @unittest.skipIf(orjson is None, 'orjson is not available')
+    def test_should_produce_the_same_output_with_all_codecs(self):
+        values = [
+            mock_data.METADATA,
+            mock_data.ENTRIES,
+            {'a': None, 'b': True, 'c': 1.5, 'd': 'ü文件', 'e': [], 'f': {}, 'g': [{'h': -1}]},
+            dict(mock_data.METADATA, checksum=2 ** 256 - 1),
+        ]
+
+        for value in values:
+            for pretty in [False, True]:
+                self.assertEqual(
+                    OrjsonCodec().dumps(value, pretty=pretty),
+                    StdlibJsonCodec().dumps(value, pretty=pretty)
+                )
+
+    @unittest.skipIf(orjson is None, 'orjson is not available')
+    def test_should_detect_long_numbers_across_scan_chunks(self):
+        checksum = 2 ** 64 + 1
+        for offset in range(-25, 5):
+            padding = 'x' * (json_codec.SCAN_CHUNK_SIZE + offset)
+            document = '{{"a":"{}","b":{}}}'.format(padding, checksum)
+
+            for data in [document, document.encode('utf-8')]:
+                self.assertEqual(OrjsonCodec().loads(data)['b'], checksum, offset)
+                self.assertIsInstance(OrjsonCodec().loads(data)['b'], int, offset)
+
+    def test_should_encode_and_decode_large_integers_exactly(self):
+        checksum = 2 ** 256 - 1
+        entity = dict(mock_data.METADATA['content_changed']['/some/path/01'], checksum=checksum)
+        metadata = dict(mock_data.METADATA, content_changed={'/some/path/01': entity})
+        document = json.dumps(metadata)
+
+        for codec in [StdlibJsonCodec()] + ([OrjsonCodec()] if orjson is not None else []):
+            for data in [document, document.encode('utf-8')]:
+                decoded = codec.loads(data)
+                self.assertEqual(decoded['content_changed']['/some/path/01']['checksum'], checksum, codec.name)
+                self.assertIsInstance(decoded['content_changed']['/some/path/01']['checksum'], int, codec.name)
+
+            self.assertDictEqual(json.loads(codec.dumps(metadata)), metadata, codec.name)
+            self.assertDictEqual(json.loads(codec.dumps(metadata, pretty=True)), metadata, codec.name)
+            self.assertNotIn('\n', codec.dumps(metadata))
+
+            with patch('client_cli.json_codec.CODEC', codec):
+                rendered = JsonWriter().render_dataset_metadata_changes(metadata=codec.loads(document))
+                self.assertDictEqual(json.loads(rendered), metadata, codec.name)
+
+    def assert_valid_codec(self, codec):
+        values = [mock_data.METADATA, mock_data.ENTRIES, {'a': None, 'b': True, 'c': 1.5, 'd': 'ü'}, [], 42]
+
+        for value in values:
+            self.assertEqual(codec.loads(codec.dumps(value)), value)
+            self.assertEqual(codec.loads(codec.dumps(value, pretty=True)), value)
+            self.assertEqual(codec.loads(codec.dumps(value).encode('utf-8')), value)
+            self.assertNotIn('\n', codec.dumps(value))
+
+        self.assertEqual(codec.dumps({'a': 1, 'b': [1, 2]}), '{"a":1,"b":[1,2]}')
+
+        for invalid in ['', '{', b'{"a": }']:
+            with self.assertRaises(json.JSONDecodeError):
+                codec.loads(invalid)
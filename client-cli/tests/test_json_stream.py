@@ -0,0 +1,108 @@
+import io
+import json
+import tracemalloc
+import unittest
+from json import JSONDecodeError
+from unittest.mock import patch
+
+from client_cli import json_codec, json_stream
+from client_cli.render.flatten import dataset_metadata
+from tests.mocks import mock_data
+
+
+class JsonStreamSpec(unittest.TestCase):
+
+    @unittest.skipUnless(json_stream.is_available(), 'ijson is not available')
+    def test_should_decode_requested_subtrees_incrementally(self):
+        document = {
+            'a': {'x': 1, 'y': [1, None, {'z': 1.5}]},
+            'b': {'c': {'d.e': {'f': 'g'}, 'h': None}, 'i': 'j'},
+            'k': 42,
+        }
+
+        for source in [json.dumps(document).encode('utf-8'), io.BytesIO(json.dumps(document).encode('utf-8'))]:
+            self.assertListEqual(
+                list(json_stream.iter_items(source=source, subtrees=['b.c', 'a', 'k', 'other'])),
+                [('a', 'x', 1), ('a', 'y', [1, None, {'z': 1.5}]), ('b.c', 'd.e', {'f': 'g'}), ('b.c', 'h', None)]
+            )
+
+        self.assertListEqual(
+            list(json_stream.iter_items(source=json.dumps(document).encode('utf-8'), subtrees=['b.c'])),
+            [('b.c', 'd.e', {'f': 'g'}), ('b.c', 'h', None)]
+        )
+
+        self.assertListEqual(list(json_stream.iter_items(source=b'{}', subtrees=['a'])), [])
+        self.assertListEqual(list(json_stream.iter_items(source=b'{}', subtrees=['a', 'b'])), [])
+
+    @unittest.skipUnless(json_stream.is_available(), 'ijson is not available')
+    def test_should_decode_large_integers_exactly(self):
+        checksum = 2 ** 256 - 1
+        document = {
+            'a': {'/tmp/file': {'checksum': checksum, 'size': 1, 'ratio': 0.5, 'values': [checksum, 1.5e3]}},
+            'b': {'c': checksum},
+        }
+        encoded = json.dumps(document).encode('utf-8')
+
+        for subtrees in [['a'], ['a', 'b']]:
+            items = list(json_stream.iter_items(source=encoded, subtrees=subtrees))
+            self.assertListEqual(items, list(json_stream.document_items(document=document, subtrees=subtrees)))
+
+            entity = items[0][2]
+            self.assertEqual(entity['checksum'], checksum)
+            self.assertIsInstance(entity['checksum'], int)
+            self.assertIsInstance(entity['ratio'], float)
+            self.assertIsInstance(entity['values'][1], float)
+
+    @unittest.skipUnless(json_stream.is_available(), 'ijson is not available')
+    def test_should_fail_to_decode_invalid_documents(self):
+        for invalid in [b'', b'{', b'{"a": {"b": }}']:
+            for subtrees in [['a'], ['a', 'b']]:
+                with self.assertRaises(JSONDecodeError):
+                    list(json_stream.iter_items(source=invalid, subtrees=subtrees))
+
+    def test_should_retrieve_requested_subtrees_from_decoded_documents(self):
+        document = {'a': {'x': 1}, 'b': {'c': {'d': 2}}, 'e': None}
+
+        self.assertListEqual(
+            list(json_stream.document_items(document=document, subtrees=['b.c', 'a', 'e', 'a.x', 'other'])),
+            [('b.c', 'd', 2), ('a', 'x', 1)]
+        )
+
+    def test_should_check_if_incremental_decoding_is_available(self):
+        with patch.dict('sys.modules', {'ijson': None}):
+            self.assertFalse(json_stream.is_available())
+
+    @unittest.skipUnless(json_stream.is_available(), 'ijson is not available')
+    def test_should_use_less_memory_when_decoding_subtrees_incrementally(self):
+        entity = mock_data.METADATA['content_changed']['/some/path/01']
+        metadata = {
+            'content_changed': {
+                '/some/path/{}'.format(i): dict(entity, path='/some/path/{}'.format(i), size=i) for i in range(5000)
+            },
+            'metadata_changed': {},
+            'filesystem': {
+                'entities': {'/some/path/{}'.format(i): {'entity_state': 'new'} for i in range(5000)}
+            },
+        }
+        document = json.dumps(metadata).encode('utf-8')
+        del metadata
+
+        def decoded():
+            return dataset_metadata.filesystem(json_codec.loads(document))
+
+        def streamed():
+            return dataset_metadata.stream_filesystem(
+                json_stream.iter_items(source=io.BytesIO(document), subtrees=dataset_metadata.SUBTREES_FILESYSTEM)
+            )
+
+        peaks = {}
+        for name, items in [('decoded', decoded), ('streamed', streamed)]:
+            tracemalloc.start()
+            count = sum(1 for _ in items())
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            self.assertEqual(count, 5000)
+            peaks[name] = peak
+
+        self.assertLess(peaks['streamed'] * 10, peaks['decoded'])
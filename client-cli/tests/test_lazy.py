@@ -0,0 +1,42 @@
+import unittest
+
+from client_cli.lazy import Lazy
+
+
+class LazySpec(unittest.TestCase):
+
+    def test_should_create_underlying_object_on_first_access(self):
+        created = []
+
+        def factory():
+            created.append({'a': 1})
+            return created[-1]
+
+        lazy = Lazy(factory=factory)
+
+        self.assertFalse(lazy.is_created)
+        self.assertEqual(len(created), 0)
+
+        self.assertEqual(lazy.get('a'), 1)
+        self.assertListEqual(list(lazy.keys()), ['a'])
+
+        self.assertTrue(lazy.is_created)
+        self.assertEqual(len(created), 1)
+        self.assertIs(lazy.underlying, created[0])
+
+    def test_should_recreate_underlying_object_after_reset(self):
+        created = []
+
+        def factory():
+            created.append({'a': len(created)})
+            return created[-1]
+
+        lazy = Lazy(factory=factory)
+
+        self.assertEqual(lazy.get('a'), 0)
+        lazy.reset()
+        self.assertFalse(lazy.is_created)
+        self.assertEqual(len(created), 1)
+
+        self.assertEqual(lazy.get('a'), 1)
+        self.assertEqual(len(created), 2)
@@ -1,3 +1,5 @@
+import subprocess
+import sys
 import unittest
 from unittest.mock import patch
 
@@ -6,8 +8,11 @@ import click
 from client_cli.__main__ import cli
 from client_cli.api.default_client_api import DefaultClientApi
 from client_cli.api.endpoint_context import CustomHttpsContext, DefaultHttpsContext
+from client_cli.api.inactive_init_api import InactiveInitApi
+from client_cli.render.csv_writer import CsvWriter
 from client_cli.render.default_writer import DefaultWriter
 from client_cli.render.json_writer import JsonWriter
+from client_cli.render.ndjson_writer import NdjsonWriter
 from tests.cli.cli_runner import Runner
 
 
@@ -34,8 +39,8 @@ class MainSpec(unittest.TestCase):
         @click.pass_context
         def assert_valid_context(ctx):
             self.assertTrue(
-                isinstance(ctx.obj.api, DefaultClientApi),
-                'Expected [{}] but [{}] found'.format(DefaultClientApi, type(ctx.obj.api))
+                isinstance(ctx.obj.api.underlying, DefaultClientApi),
+                'Expected [{}] but [{}] found'.format(DefaultClientApi, type(ctx.obj.api.underlying))
             )
 
             self.assertTrue(
@@ -97,7 +102,8 @@ class MainSpec(unittest.TestCase):
             format='[%(asctime)-15s] [%(levelname)s] [%(name)-5s]: %(message)s',
             level='DEBUG'
         )
-        mock_create_pem.assert_called_once()
+        mock_create_pem.assert_not_called()
+        mock_is_active.assert_not_called()
 
     @patch('client_cli.api.default_client_api.DefaultClientApi.is_active')
     @patch('client_cli.__main__.load_api_token')
@@ -111,8 +117,8 @@ class MainSpec(unittest.TestCase):
         @click.pass_context
         def assert_valid_context(ctx):
             self.assertTrue(
-                isinstance(ctx.obj.api, DefaultClientApi),
-                'Expected [{}] but [{}] found'.format(DefaultClientApi, type(ctx.obj.api))
+                isinstance(ctx.obj.api.underlying, DefaultClientApi),
+                'Expected [{}] but [{}] found'.format(DefaultClientApi, type(ctx.obj.api.underlying))
             )
 
             self.assertTrue(
@@ -165,7 +171,147 @@ class MainSpec(unittest.TestCase):
             format='[%(asctime)-15s] [%(levelname)s] [%(name)-5s]: %(message)s',
             level='INFO'
         )
-        mock_create_pem.assert_called_once()
+        mock_create_pem.assert_not_called()
+        mock_is_active.assert_not_called()
+
+    @patch('client_cli.__main__.load_api_token')
+    @patch('client_cli.__main__.load_client_config')
+    def test_should_support_output_formats(self, mock_load_config, mock_load_api_token):
+        mock_load_config.return_value = MockConfig()
+        mock_load_api_token.return_value = 'test-token'
+
+        @click.command(name='assert')
+        @click.pass_context
+        def assert_valid_context(ctx):
+            click.echo(type(ctx.obj.rendering).__name__)
+
+        cli.add_command(assert_valid_context)
+
+        runner = Runner(cli)
+
+        for args, expected in [
+            (['--output', 'table'], DefaultWriter),
+            (['--output', 'json'], JsonWriter),
+            (['--output', 'NDJSON'], NdjsonWriter),
+            (['--output', 'csv'], CsvWriter),
+            (['--output', 'tsv'], CsvWriter),
+            (['--json', '--output', 'json'], JsonWriter),
+        ]:
+            result = runner.invoke(args=args + ['assert'])
+            self.assertEqual(result.exit_code, 0, result.output or result.exc_info)
+            self.assertEqual(result.output.strip(), expected.__name__)
+
+        result = runner.invoke(args=['--json', '--output', 'ndjson', 'assert'])
+        self.assertEqual(result.exit_code, 2, result.output)
+        self.assertIn('Specifying "--json" with "--output ndjson" is not supported', result.output)
+
+    @patch('client_cli.__main__.load_api_token')
+    @patch('client_cli.__main__.load_client_config')
+    def test_should_configure_local_data(self, mock_load_config, mock_load_api_token):
+        mock_load_config.return_value = MockConfig()
+        mock_load_api_token.return_value = 'test-token'
+
+        @click.command(name='assert')
+        @click.pass_context
+        def assert_valid_context(ctx):
+            self.assertFalse(ctx.obj.metadata_cache.is_created)
+            self.assertFalse(ctx.obj.entry_catalog.is_created)
+            self.assertFalse(ctx.obj.path_index.is_created)
+            click.echo(
+                '{},{},{}'.format(
+                    ctx.obj.metadata_cache.enabled,
+                    ctx.obj.metadata_cache.max_size,
+                    ctx.obj.entry_catalog.enabled
+                )
+            )
+            self.assertIsNone(ctx.obj.metadata_cache.underlying._connection)  # pylint: disable=protected-access
+            self.assertIsNone(ctx.obj.entry_catalog.underlying._connection)  # pylint: disable=protected-access
+            self.assertIsNone(ctx.obj.path_index.underlying._connection)  # pylint: disable=protected-access
+
+        cli.add_command(assert_valid_context)
+
+        runner = Runner(cli)
+
+        for args, expected in [
+            ([], 'True,{},True'.format(512 * 1024 * 1024)),
+            (['--no-cache'], 'False,{},False'.format(512 * 1024 * 1024)),
+            (['--cache-size', '16'], 'True,{},True'.format(16 * 1024 * 1024)),
+        ]:
+            result = runner.invoke(args=args + ['assert'])
+            self.assertEqual(result.exit_code, 0, result.output or result.exc_info)
+            self.assertEqual(result.output.strip(), expected)
+
+    @patch('client_cli.api.default_client_api.DefaultClientApi.is_active')
+    @patch('client_cli.__main__.load_api_token')
+    @patch('client_cli.__main__.load_client_config')
+    def test_should_check_if_api_is_active_only_once(self, mock_load_config, mock_load_api_token, mock_is_active):
+        mock_load_config.return_value = MockConfig(context_enabled=False)
+        mock_load_api_token.return_value = 'test-token'
+        mock_is_active.return_value = True
+
+        @click.command(name='assert')
+        @click.pass_context
+        def assert_valid_context(ctx):
+            self.assertFalse(ctx.obj.api.is_created)
+            self.assertFalse(ctx.obj.init.is_created)
+
+            self.assertTrue(ctx.obj.api.is_active())
+            self.assertTrue(ctx.obj.api.is_active())
+            self.assertTrue(isinstance(ctx.obj.init.underlying, InactiveInitApi))
+
+            self.assertTrue(ctx.obj.api.is_created)
+            self.assertTrue(ctx.obj.init.is_created)
+
+        cli.add_command(assert_valid_context)
+
+        runner = Runner(cli)
+        result = runner.invoke(args=['assert'])
+
+        self.assertEqual(result.exit_code, 0, result.output or result.exc_info)
+
+        mock_is_active.assert_called_once()
+
+    def test_should_load_cli_within_startup_budget(self):
+        startup_budget_us = 1_000_000
+
+        heavy_modules = [
+            'client_cli.cli.backup',
+            'client_cli.cli.bootstrap',
+            'client_cli.cli.maintenance',
+            'client_cli.cli.service',
+            'pexpect',
+            'psutil',
+            'tqdm',
+            'pyparsing',
+            'terminaltables',
+            'cryptography',
+            'sseclient',
+            'hurry.filesize',
+            'pyhocon',
+        ]
+
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', 'import client_cli.__main__'],
+            capture_output=True,
+            check=True
+        )
+
+        imports = {}
+        for line in result.stderr.decode('utf-8').splitlines():
+            if line.startswith('import time:') and '|' in line and 'cumulative' not in line:
+                _, cumulative, name = line[len('import time:'):].split('|')
+                imports[name.strip()] = int(cumulative)
+
+        self.assertIn('client_cli.__main__', imports)
+
+        for module in heavy_modules:
+            self.assertNotIn(module, imports, 'Module [{}] loaded on CLI startup'.format(module))
+
+        self.assertLess(
+            imports['client_cli.__main__'],
+            startup_budget_us,
+            'CLI startup took [{}us]; budget is [{}us]'.format(imports['client_cli.__main__'], startup_budget_us)
+        )
 
 
 class MockConfig: